@@ -11,4 +11,6 @@ from keras.src.dtype_policies.dtype_policy import DTypePolicy
 from keras.src.dtype_policies.dtype_policy import FloatDTypePolicy
 from keras.src.dtype_policies.dtype_policy import QuantizedDTypePolicy
 from keras.src.dtype_policies.dtype_policy import QuantizedFloat8DTypePolicy
+from keras.src.dtype_policies.dtype_policy import QuantizedInt4DTypePolicy
+from keras.src.dtype_policies.dtype_policy import QuantizedInt8DTypePolicy
 from keras.src.dtype_policies.dtype_policy_map import DTypePolicyMap
@@ -73,6 +73,14 @@ from keras.src.metrics.probabilistic_metrics import Poisson
 from keras.src.metrics.probabilistic_metrics import (
     SparseCategoricalCrossentropy,
 )
+from keras.src.metrics.quantile_metrics import AbsoluteErrorQuantiles
+from keras.src.metrics.quantile_metrics import Quantiles
+from keras.src.metrics.ranking_metrics import NDCG
+from keras.src.metrics.ranking_metrics import MeanReciprocalRank
+from keras.src.metrics.ranking_metrics import RecallAtK
+from keras.src.metrics.ranking_metrics import mean_reciprocal_rank
+from keras.src.metrics.ranking_metrics import ndcg
+from keras.src.metrics.ranking_metrics import recall_at_k
 from keras.src.metrics.reduction_metrics import Mean
 from keras.src.metrics.reduction_metrics import MeanMetricWrapper
 from keras.src.metrics.reduction_metrics import Sum
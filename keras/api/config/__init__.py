@@ -5,11 +5,14 @@ since your modifications would be overwritten.
 """
 
 from keras.src.backend.config import backend
+from keras.src.backend.config import disable_compilation_cache
 from keras.src.backend.config import disable_flash_attention
+from keras.src.backend.config import enable_compilation_cache
 from keras.src.backend.config import enable_flash_attention
 from keras.src.backend.config import epsilon
 from keras.src.backend.config import floatx
 from keras.src.backend.config import image_data_format
+from keras.src.backend.config import is_compilation_cache_enabled
 from keras.src.backend.config import is_flash_attention_enabled
 from keras.src.backend.config import set_epsilon
 from keras.src.backend.config import set_floatx
@@ -46,7 +46,9 @@ from keras.src.losses.losses import mean_absolute_error
 from keras.src.losses.losses import mean_absolute_percentage_error
 from keras.src.losses.losses import mean_squared_error
 from keras.src.losses.losses import mean_squared_logarithmic_error
+from keras.src.losses.losses import nce_loss
 from keras.src.losses.losses import poisson
+from keras.src.losses.losses import sampled_softmax_loss
 from keras.src.losses.losses import sparse_categorical_crossentropy
 from keras.src.losses.losses import squared_hinge
 from keras.src.losses.losses import tversky
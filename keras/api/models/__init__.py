@@ -8,5 +8,6 @@ from keras.src.models.cloning import clone_model
 from keras.src.models.model import Model
 from keras.src.models.model import model_from_json
 from keras.src.models.sequential import Sequential
+from keras.src.models.stacking import stack_models
 from keras.src.saving.saving_api import load_model
 from keras.src.saving.saving_api import save_model
@@ -24,6 +24,7 @@ from keras.src.ops.nn import hard_silu
 from keras.src.ops.nn import hard_silu as hard_swish
 from keras.src.ops.nn import hard_tanh
 from keras.src.ops.nn import leaky_relu
+from keras.src.ops.nn import linear_sparse_categorical_crossentropy
 from keras.src.ops.nn import log_sigmoid
 from keras.src.ops.nn import log_softmax
 from keras.src.ops.nn import max_pool
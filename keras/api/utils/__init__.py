@@ -10,6 +10,7 @@ from keras.src.backend.common.global_state import clear_session
 from keras.src.backend.common.keras_tensor import is_keras_tensor
 from keras.src.backend.common.variables import standardize_dtype
 from keras.src.layers.preprocessing.feature_space import FeatureSpace
+from keras.src.layers.rnn.rnn_streamer import RNNStreamer
 from keras.src.ops.operation_utils import get_source_inputs
 from keras.src.saving.object_registration import CustomObjectScope
 from keras.src.saving.object_registration import (
@@ -15,6 +15,9 @@ _IMAGE_DATA_FORMAT = "channels_last"
 # Default backend: TensorFlow.
 _BACKEND = "tensorflow"
 
+# Directory of the on-disk cache of compiled functions, if enabled.
+_COMPILATION_CACHE_DIR = None
+
 
 @keras_export(["keras.config.floatx", "keras.backend.floatx"])
 def floatx():
@@ -226,6 +229,91 @@ def is_flash_attention_enabled():
     return global_state.get_global_attribute("flash_attention", default=None)
 
 
+@keras_export("keras.config.enable_compilation_cache")
+def enable_compilation_cache(cache_dir=None):
+    """Enable the on-disk cache of compiled functions.
+
+    Compiling the train, test and predict functions of a large model can take
+    minutes, and is done again by every new process. With the compilation
+    cache enabled, the compiled functions are saved to disk and reused by the
+    next processes that compile the same functions, e.g. when a training job
+    restarts or when a new serving replica starts.
+
+    The cache is implemented by the backend: the persistent compilation cache
+    of JAX, the persistent XLA cache of TensorFlow (used when `jit_compile`
+    is enabled) and the FX graph cache of `torch.compile`. It has no effect
+    with the NumPy backend. It should be enabled before the first function
+    is compiled.
+
+    Args:
+        cache_dir: Directory of the cache. Defaults to
+            `~/.keras/compilation_cache/<backend>`.
+    """
+    global _COMPILATION_CACHE_DIR
+
+    if cache_dir is None:
+        cache_dir = os.path.join(keras_home(), "compilation_cache", backend())
+    cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+    os.makedirs(cache_dir, exist_ok=True)
+    _set_backend_compilation_cache(cache_dir)
+    _COMPILATION_CACHE_DIR = cache_dir
+
+
+@keras_export("keras.config.disable_compilation_cache")
+def disable_compilation_cache():
+    """Disable the on-disk cache of compiled functions.
+
+    See `keras.config.enable_compilation_cache()` for more details.
+    """
+    global _COMPILATION_CACHE_DIR
+
+    _set_backend_compilation_cache(None)
+    _COMPILATION_CACHE_DIR = None
+
+
+@keras_export("keras.config.is_compilation_cache_enabled")
+def is_compilation_cache_enabled():
+    """Checks whether the on-disk cache of compiled functions is enabled.
+
+    See `keras.config.enable_compilation_cache()` for more details.
+
+    Returns:
+        `True` if enabled, `False` otherwise.
+    """
+    return _COMPILATION_CACHE_DIR is not None
+
+
+def compilation_cache_dir():
+    # Private accessor for the compilation cache location.
+    return _COMPILATION_CACHE_DIR
+
+
+def _set_backend_compilation_cache(cache_dir):
+    if backend() == "jax":
+        import jax
+
+        jax.config.update("jax_compilation_cache_dir", cache_dir)
+    elif backend() == "tensorflow":
+        # The persistent cache of XLA is configured with a flag, which is read
+        # when XLA compiles its first function.
+        flags = [
+            flag
+            for flag in os.environ.get("TF_XLA_FLAGS", "").split()
+            if not flag.startswith("--tf_xla_persistent_cache_directory=")
+        ]
+        if cache_dir is not None:
+            flags.append(f"--tf_xla_persistent_cache_directory={cache_dir}")
+        os.environ["TF_XLA_FLAGS"] = " ".join(flags)
+    elif backend() == "torch":
+        from torch._inductor import config as inductor_config
+
+        if cache_dir is not None:
+            os.environ["TORCHINDUCTOR_CACHE_DIR"] = cache_dir
+            inductor_config.fx_graph_cache = True
+        else:
+            os.environ.pop("TORCHINDUCTOR_CACHE_DIR", None)
+
+
 def standardize_data_format(data_format):
     if data_format is None:
         return image_data_format()
@@ -228,6 +228,59 @@ class JaxDistributionLibTest(testing.TestCase):
             model.compile(loss="mse")
             model.fit(inputs, labels)
 
+    def test_e2e_data_parallel_model_with_sharded_optimizer_states(self):
+        inputs = np.random.normal(size=(32, 28, 28, 1))
+        labels = np.random.normal(size=(32, 10))
+        initial_weights = None
+        trained_weights = []
+        for shard_optimizer_states in (False, True):
+            distribution = distribution_lib.DataParallel(
+                devices=backend_dlib.list_devices(),
+                shard_optimizer_states=shard_optimizer_states,
+            )
+            with distribution.scope():
+                model = models.Sequential(
+                    [
+                        layers.Input(shape=[28, 28, 1]),
+                        layers.Flatten(),
+                        layers.Dense(units=200, activation="relu"),
+                        layers.Dense(units=10, use_bias=False),
+                    ]
+                )
+                if initial_weights is None:
+                    initial_weights = model.get_weights()
+                model.set_weights(initial_weights)
+                model.compile(loss="mse", optimizer="adam")
+                model.fit(
+                    inputs, labels, batch_size=16, shuffle=False, verbose=0
+                )
+            trained_weights.append(model.get_weights())
+
+        # The model variables stay replicated.
+        for weight in model.weights:
+            self.assertTrue(weight._value.sharding.is_fully_replicated)
+        # The optimizer variables are sharded along their first dimension
+        # divisible by the number of devices.
+        momentums = {
+            tuple(v.shape): v._value
+            for v in model.optimizer.variables
+            if v.path.endswith("momentum")
+        }
+        for shape, shard_shape in [
+            ((784, 200), (98, 200)),
+            ((200,), (25,)),
+            ((200, 10), (25, 10)),
+        ]:
+            self.assertEqual(
+                momentums[shape].sharding.shard_shape(shape), shard_shape
+            )
+        self.assertTrue(
+            model.optimizer.iterations._value.sharding.is_fully_replicated
+        )
+        # The training results are not affected.
+        for weight, sharded_weight in zip(*trained_weights):
+            self.assertAllClose(weight, sharded_weight, atol=1e-5)
+
     def test_e2e_model_parallel_model(self):
         shape = (4, 2)
         axis_names = ["batch", "model"]
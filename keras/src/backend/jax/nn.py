@@ -1,4 +1,5 @@
 import builtins
+import functools
 import math
 
 import jax
@@ -559,6 +560,157 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     return -jnp.sum(target * log_prob, axis=axis)
 
 
+def _linear_crossentropy_chunk_stats(x, y, kernel, bias, vocab_chunk_size):
+    # Online log-sum-exp over vocabulary chunks, so that at most
+    # `(tokens, vocab_chunk_size)` logits are live at once.
+    num_classes = kernel.shape[1]
+    max_logit = jnp.full(x.shape[:1], -jnp.inf, dtype="float32")
+    sum_exp = jnp.zeros(x.shape[:1], dtype="float32")
+    target_logit = jnp.zeros(x.shape[:1], dtype="float32")
+    for start in range(0, num_classes, vocab_chunk_size):
+        stop = min(start + vocab_chunk_size, num_classes)
+        logits = jnp.matmul(x, kernel[:, start:stop]) + bias[start:stop]
+        logits = logits.astype("float32")
+        new_max_logit = jnp.maximum(max_logit, jnp.max(logits, axis=-1))
+        sum_exp = sum_exp * jnp.exp(max_logit - new_max_logit) + jnp.sum(
+            jnp.exp(logits - new_max_logit[:, None]), axis=-1
+        )
+        max_logit = new_max_logit
+        local_y = y - start
+        in_chunk = (local_y >= 0) & (local_y < stop - start)
+        local_y = jnp.clip(local_y, 0, stop - start - 1)
+        target_logit += jnp.where(
+            in_chunk,
+            jnp.take_along_axis(logits, local_y[:, None], axis=-1)[:, 0],
+            0.0,
+        )
+    return max_logit + jnp.log(sum_exp), target_logit
+
+
+def _linear_crossentropy_chunk_grads(
+    x, y, kernel, bias, log_normalizer, upstream, vocab_chunk_size
+):
+    num_classes = kernel.shape[1]
+    dx = jnp.zeros(x.shape, dtype="float32")
+    dkernel, dbias = [], []
+    for start in range(0, num_classes, vocab_chunk_size):
+        stop = min(start + vocab_chunk_size, num_classes)
+        kernel_chunk = kernel[:, start:stop]
+        logits = jnp.matmul(x, kernel_chunk) + bias[start:stop]
+        probs = jnp.exp(logits.astype("float32") - log_normalizer[:, None])
+        one_hot = (y - start)[:, None] == jnp.arange(stop - start)[None, :]
+        dlogits = (probs - one_hot) * upstream[:, None]
+        dx += jnp.matmul(dlogits, kernel_chunk.T.astype("float32"))
+        dkernel.append(jnp.matmul(x.T.astype("float32"), dlogits))
+        dbias.append(jnp.sum(dlogits, axis=0))
+    return dx, jnp.concatenate(dkernel, axis=1), jnp.concatenate(dbias)
+
+
+def _chunk_tokens(x, token_chunk_size):
+    num_tokens = x.shape[0]
+    num_chunks = -(-num_tokens // token_chunk_size)
+    padding = num_chunks * token_chunk_size - num_tokens
+    x = jnp.pad(x, [(0, padding)] + [(0, 0)] * (x.ndim - 1))
+    return jnp.reshape(x, (num_chunks, token_chunk_size) + x.shape[1:])
+
+
+@functools.partial(jax.custom_vjp, nondiff_argnums=(4, 5))
+def _linear_crossentropy(
+    x, y, kernel, bias, token_chunk_size, vocab_chunk_size
+):
+    loss, _ = _linear_crossentropy_fwd(
+        x, y, kernel, bias, token_chunk_size, vocab_chunk_size
+    )
+    return loss
+
+
+def _linear_crossentropy_fwd(
+    x, y, kernel, bias, token_chunk_size, vocab_chunk_size
+):
+    num_tokens = x.shape[0]
+    log_normalizer, target_logit = lax.map(
+        lambda args: _linear_crossentropy_chunk_stats(
+            args[0], args[1], kernel, bias, vocab_chunk_size
+        ),
+        (
+            _chunk_tokens(x, token_chunk_size),
+            _chunk_tokens(y, token_chunk_size),
+        ),
+    )
+    log_normalizer = jnp.reshape(log_normalizer, (-1,))[:num_tokens]
+    target_logit = jnp.reshape(target_logit, (-1,))[:num_tokens]
+    loss = log_normalizer - target_logit
+    return loss, (x, y, kernel, bias, log_normalizer)
+
+
+def _linear_crossentropy_bwd(token_chunk_size, vocab_chunk_size, res, g):
+    x, y, kernel, bias, log_normalizer = res
+    num_tokens = x.shape[0]
+
+    def step(carry, args):
+        dkernel, dbias = carry
+        dx_chunk, dkernel_chunk, dbias_chunk = _linear_crossentropy_chunk_grads(
+            *args[:2], kernel, bias, *args[2:], vocab_chunk_size
+        )
+        return (dkernel + dkernel_chunk, dbias + dbias_chunk), dx_chunk
+
+    # Padded tokens have a zero upstream gradient and do not contribute.
+    (dkernel, dbias), dx = lax.scan(
+        step,
+        (
+            jnp.zeros(kernel.shape, dtype="float32"),
+            jnp.zeros(bias.shape, dtype="float32"),
+        ),
+        (
+            _chunk_tokens(x, token_chunk_size),
+            _chunk_tokens(y, token_chunk_size),
+            _chunk_tokens(log_normalizer, token_chunk_size),
+            _chunk_tokens(g.astype("float32"), token_chunk_size),
+        ),
+    )
+    dx = jnp.reshape(dx, (-1, x.shape[-1]))[:num_tokens]
+    return (
+        dx.astype(x.dtype),
+        None,
+        dkernel.astype(kernel.dtype),
+        dbias.astype(bias.dtype),
+    )
+
+
+_linear_crossentropy.defvjp(_linear_crossentropy_fwd, _linear_crossentropy_bwd)
+
+
+def linear_sparse_categorical_crossentropy(
+    target,
+    inputs,
+    kernel,
+    bias=None,
+    token_chunk_size=1024,
+    vocab_chunk_size=32768,
+):
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    target = jnp.array(target, dtype="int32")
+    if len(target.shape) == len(inputs.shape) and target.shape[-1] == 1:
+        target = jnp.squeeze(target, axis=-1)
+    dtype = backend.result_type(inputs.dtype, kernel.dtype)
+    inputs = cast(inputs, dtype)
+    kernel = cast(kernel, dtype)
+    if bias is None:
+        bias = jnp.zeros(kernel.shape[-1:], dtype=dtype)
+    bias = cast(bias, dtype)
+    batch_shape = inputs.shape[:-1]
+    loss = _linear_crossentropy(
+        jnp.reshape(inputs, (-1, inputs.shape[-1])),
+        jnp.reshape(target, (-1,)),
+        kernel,
+        bias,
+        token_chunk_size,
+        vocab_chunk_size,
+    )
+    return jnp.reshape(loss, batch_shape).astype(dtype)
+
+
 def binary_crossentropy(target, output, from_logits=False):
     target = jnp.array(target)
     output = jnp.array(output)
@@ -8,11 +8,71 @@ by skipping conditionals entirely.
 
 import jax
 from jax import numpy as jnp
+from jax.experimental import sparse as jax_sparse
 
 from keras.src.optimizers import base_optimizer
 
 
 class JaxOptimizer(base_optimizer.BaseOptimizer):
+    def assign_add(self, variable, value):
+        if _is_scatterable(value):
+            # Scatter the entries instead of adding the densified `value`, so
+            # that the update is proportional to the number of entries.
+            variable.assign(_scatter_add(variable.value, value))
+        else:
+            super().assign_add(variable, value)
+
+    def assign_sub(self, variable, value):
+        if _is_scatterable(value):
+            variable.assign(_scatter_add(variable.value, -value))
+        else:
+            super().assign_sub(variable, value)
+
+    def _backend_update_step(self, grads, trainable_variables, learning_rate):
+        if not self._supports_row_sparse_updates():
+            # Within `jit`, most ops cannot take a `BCOO`, since they call
+            # `sum_duplicates()` without a static `nse`.
+            grads = [
+                grad.todense() if _is_traced_sparse(grad) else grad
+                for grad in grads
+            ]
+        super()._backend_update_step(grads, trainable_variables, learning_rate)
+
+    def _get_row_sparse_gradient(self, gradient):
+        if not (
+            isinstance(gradient, jax_sparse.BCOO)
+            and gradient.n_batch == 0
+            and gradient.n_sparse == 1
+        ):
+            return None
+        gradient = gradient.sum_duplicates(nse=gradient.nse)
+        # Padding entries have an out of bounds index, they are dropped in
+        # `_assign_rows()`.
+        return gradient.indices[:, 0], gradient.data
+
+    def _make_row_sparse_gradient(self, gradient, indices, values):
+        # The indices come from `_get_row_sparse_gradient()`, so they are
+        # unique apart from the out of bounds padding entries.
+        return jax_sparse.BCOO(
+            (values, jnp.expand_dims(indices, 1)),
+            shape=gradient.shape,
+            unique_indices=True,
+        )
+
+    def _gather_rows(self, variable, indices):
+        return jnp.take(variable.value, indices, axis=0, mode="clip")
+
+    def _assign_rows(self, variable, indices, rows):
+        # A sparse delta is added rather than a dense value assigned, so that
+        # only the touched rows are updated.
+        delta = jnp.subtract(rows, self._gather_rows(variable, indices))
+        self.assign_add(
+            variable,
+            jax_sparse.BCOO(
+                (delta, jnp.expand_dims(indices, 1)), shape=variable.shape
+            ),
+        )
+
     def _backend_apply_gradients(self, grads, trainable_variables):
         if self.gradient_accumulation_steps:
             is_update_step = (
@@ -29,7 +89,9 @@ class JaxOptimizer(base_optimizer.BaseOptimizer):
             # processing steps, so we need to ensure the correct mapping between
             # `self._accumulated_gradients` and `trainable_variables`
             acc_grads = [
-                self._accumulated_gradients[self._get_variable_index(v)]
+                self._accumulated_gradients[
+                    self._trainable_variables_indices[self._var_key(v)]
+                ]
                 for v in trainable_variables
             ]
 
@@ -49,9 +111,11 @@ class JaxOptimizer(base_optimizer.BaseOptimizer):
 
             # Apply clipping and weight decay.
             grads = self._clip_gradients(grads)
-            self._apply_weight_decay(trainable_variables)
+            self._apply_weight_decay(
+                self._apply_lazy_weight_decay(grads, trainable_variables)
+            )
 
-            self._backend_update_step(
+            self._update_step_with_flat_buckets(
                 grads, trainable_variables, self.learning_rate
             )
             new_trainable_vars = jax.lax.cond(
@@ -77,9 +141,11 @@ class JaxOptimizer(base_optimizer.BaseOptimizer):
         else:
             # Apply clipping and weight decay.
             grads = self._clip_gradients(grads)
-            self._apply_weight_decay(trainable_variables)
+            self._apply_weight_decay(
+                self._apply_lazy_weight_decay(grads, trainable_variables)
+            )
 
-            self._backend_update_step(
+            self._update_step_with_flat_buckets(
                 grads, trainable_variables, self.learning_rate
             )
 
@@ -110,3 +176,19 @@ class JaxOptimizer(base_optimizer.BaseOptimizer):
                     )
 
         self._iterations.assign_add(1)
+
+
+def _is_traced_sparse(x):
+    return isinstance(x, jax_sparse.BCOO) and isinstance(
+        x.data, jax.core.Tracer
+    )
+
+
+def _is_scatterable(x):
+    return isinstance(x, jax_sparse.BCOO) and x.n_batch == 0
+
+
+def _scatter_add(x, sparse):
+    indices = tuple(sparse.indices[:, i] for i in range(sparse.n_sparse))
+    # Padding entries have out of bounds indices, they are dropped.
+    return x.at[indices].add(sparse.data.astype(x.dtype), mode="drop")
@@ -211,12 +211,211 @@ def cudnn_ok(*args, **kwargs):
     return False
 
 
-def lstm(*args, **kwargs):
-    raise NotImplementedError
+def lstm(
+    inputs,
+    initial_state_h,
+    initial_state_c,
+    mask,
+    kernel,
+    recurrent_kernel,
+    bias,
+    activation,
+    recurrent_activation,
+    return_sequences=False,
+    go_backwards=False,
+    unroll=False,
+    time_major=False,
+    zero_output_for_mask=False,
+):
+    """Fused LSTM loop.
+
+    The input projection of every timestep is computed upfront as a single
+    matmul, so that the `lax.scan` body only contains the recurrent matmul
+    and the gate activations.
+    """
+    kernel, recurrent_kernel, bias = _get_fused_weights(
+        kernel, recurrent_kernel, bias
+    )
+    inputs, mask = _prepare_fused_inputs(inputs, mask, time_major, go_backwards)
+
+    # (timesteps, batch, 4 * units)
+    projected_inputs = jnp.matmul(inputs, kernel)
+    if bias is not None:
+        projected_inputs = projected_inputs + bias
+
+    def _step(states, current_input):
+        h_tm1, c_tm1 = states
+        if mask is not None:
+            z, mask_t = current_input
+        else:
+            z = current_input
+        z = z + jnp.matmul(h_tm1, recurrent_kernel)
+        z0, z1, z2, z3 = jnp.split(z, 4, axis=-1)
+        i = recurrent_activation(z0)
+        f = recurrent_activation(z1)
+        c = f * c_tm1 + i * activation(z2)
+        o = recurrent_activation(z3)
+        h = o * activation(c)
+        if mask is not None:
+            output = _masked_output(h, h_tm1, mask_t, zero_output_for_mask)
+            h = jnp.where(mask_t, h, h_tm1)
+            c = jnp.where(mask_t, c, c_tm1)
+        else:
+            output = h
+        return (h, c), output if return_sequences else None
+
+    scan_xs = (projected_inputs, mask) if mask is not None else projected_inputs
+    (h, c), outputs = lax.scan(
+        _step,
+        (initial_state_h, initial_state_c),
+        scan_xs,
+        unroll=bool(unroll),
+    )
+    last_output = _fused_last_output(
+        h, outputs, mask, return_sequences, zero_output_for_mask
+    )
+    outputs = _format_fused_outputs(
+        outputs, last_output, return_sequences, time_major
+    )
+    return last_output, outputs, [h, c]
+
+
+def gru(
+    inputs,
+    initial_state,
+    mask,
+    kernel,
+    recurrent_kernel,
+    bias,
+    activation,
+    recurrent_activation,
+    return_sequences=False,
+    go_backwards=False,
+    unroll=False,
+    time_major=False,
+    reset_after=True,
+    zero_output_for_mask=False,
+):
+    """Fused GRU loop.
+
+    The input projection of every timestep is computed upfront as a single
+    matmul, so that the `lax.scan` body only contains the recurrent matmul
+    and the gate activations.
+    """
+    kernel, recurrent_kernel, bias = _get_fused_weights(
+        kernel, recurrent_kernel, bias
+    )
+    inputs, mask = _prepare_fused_inputs(inputs, mask, time_major, go_backwards)
+
+    input_bias, recurrent_bias = None, None
+    if bias is not None:
+        if reset_after:
+            input_bias, recurrent_bias = bias[0], bias[1]
+        else:
+            input_bias = bias
+
+    # (timesteps, batch, 3 * units)
+    projected_inputs = jnp.matmul(inputs, kernel)
+    if input_bias is not None:
+        projected_inputs = projected_inputs + input_bias
+    units = recurrent_kernel.shape[0]
+
+    def _step(h_tm1, current_input):
+        if mask is not None:
+            matrix_x, mask_t = current_input
+        else:
+            matrix_x = current_input
+        x_z, x_r, x_h = jnp.split(matrix_x, 3, axis=-1)
+        if reset_after:
+            matrix_inner = jnp.matmul(h_tm1, recurrent_kernel)
+            if recurrent_bias is not None:
+                matrix_inner = matrix_inner + recurrent_bias
+        else:
+            matrix_inner = jnp.matmul(h_tm1, recurrent_kernel[:, : 2 * units])
+        recurrent_z = matrix_inner[:, :units]
+        recurrent_r = matrix_inner[:, units : 2 * units]
+        z = recurrent_activation(x_z + recurrent_z)
+        r = recurrent_activation(x_r + recurrent_r)
+        if reset_after:
+            recurrent_h = r * matrix_inner[:, 2 * units :]
+        else:
+            recurrent_h = jnp.matmul(
+                r * h_tm1, recurrent_kernel[:, 2 * units :]
+            )
+        hh = activation(x_h + recurrent_h)
+        h = z * h_tm1 + (1 - z) * hh
+        if mask is not None:
+            output = _masked_output(h, h_tm1, mask_t, zero_output_for_mask)
+            h = jnp.where(mask_t, h, h_tm1)
+        else:
+            output = h
+        return h, output if return_sequences else None
+
+    scan_xs = (projected_inputs, mask) if mask is not None else projected_inputs
+    h, outputs = lax.scan(_step, initial_state, scan_xs, unroll=bool(unroll))
+    last_output = _fused_last_output(
+        h, outputs, mask, return_sequences, zero_output_for_mask
+    )
+    outputs = _format_fused_outputs(
+        outputs, last_output, return_sequences, time_major
+    )
+    return last_output, outputs, [h]
+
+
+def _get_fused_weights(kernel, recurrent_kernel, bias):
+    from keras.src.backend.jax.core import Variable
+
+    if isinstance(kernel, Variable):
+        kernel = kernel.value
+    if isinstance(recurrent_kernel, Variable):
+        recurrent_kernel = recurrent_kernel.value
+    if isinstance(bias, Variable):
+        bias = bias.value
+    return kernel, recurrent_kernel, bias
+
+
+def _prepare_fused_inputs(inputs, mask, time_major, go_backwards):
+    # Fused kernels always iterate over time-major inputs, in processing
+    # order, with a `(batch, 1)` boolean mask per timestep.
+    if not time_major:
+        inputs = jnp.swapaxes(inputs, 0, 1)
+    if mask is not None:
+        if mask.dtype != "bool":
+            mask = mask.astype("bool")
+        if not time_major:
+            mask = jnp.swapaxes(mask, 0, 1)
+        mask = jnp.expand_dims(mask, axis=-1)
+    if go_backwards:
+        inputs = jnp.flip(inputs, axis=0)
+        if mask is not None:
+            mask = jnp.flip(mask, axis=0)
+    return inputs, mask
+
+
+def _masked_output(h, h_tm1, mask_t, zero_output_for_mask):
+    if zero_output_for_mask:
+        return jnp.where(mask_t, h, jnp.zeros_like(h))
+    # The previous output is the previous hidden state.
+    return jnp.where(mask_t, h, h_tm1)
 
 
-def gru(*args, **kwargs):
-    raise NotImplementedError
+def _fused_last_output(
+    h, outputs, mask, return_sequences, zero_output_for_mask
+):
+    if return_sequences:
+        return outputs[-1]
+    if mask is not None and zero_output_for_mask:
+        return jnp.where(mask[-1], h, jnp.zeros_like(h))
+    return h
+
+
+def _format_fused_outputs(outputs, last_output, return_sequences, time_major):
+    # Match the return format of `rnn()`.
+    if not return_sequences:
+        return jnp.expand_dims(last_output, axis=0 if time_major else 1)
+    if not time_major:
+        return jnp.swapaxes(outputs, 0, 1)
+    return outputs
 
 
 def unstack(x, axis=0):
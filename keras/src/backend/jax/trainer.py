@@ -3,6 +3,7 @@ import itertools
 
 import jax
 import numpy as np
+from jax.experimental import sparse as jax_sparse
 
 from keras.src import backend
 from keras.src import callbacks as callbacks_module
@@ -25,6 +26,10 @@ class JAXTrainer(base_trainer.Trainer):
         self.predict_function = None
         self._jax_state_synced = True
 
+        # The rows of the current batch that are not padding, see the
+        # `pad_batches` argument of `compile()`.
+        self._valid_rows = None
+
     def compute_loss_and_updates(
         self,
         trainable_variables,
@@ -49,6 +54,8 @@ class JAXTrainer(base_trainer.Trainer):
             return_losses=True,
             **kwargs,
         )
+        if self._valid_rows is not None:
+            y_pred = self._mask_padded_rows(y_pred)
         if losses:
             # Make forward pass losses available to compute_loss.
             self._losses_override.clear()
@@ -92,19 +99,30 @@ class JAXTrainer(base_trainer.Trainer):
             metrics_variables,
         ) = state
         x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
-        grad_fn = jax.value_and_grad(
-            self.compute_loss_and_updates, has_aux=True
-        )
-        (loss, aux), grads = grad_fn(
+        micro_batch_size = self._micro_batch_size
+        if micro_batch_size and tree.flatten(x)[0].shape[0] > micro_batch_size:
+            return self._micro_batch_train_step(state, x, y, sample_weight)
+        args = (
             trainable_variables,
             non_trainable_variables,
             metrics_variables,
             x,
             y,
             sample_weight,
-            training=True,
-            optimizer_variables=optimizer_variables,
         )
+        kwargs = {"training": True, "optimizer_variables": optimizer_variables}
+        num_sparse_gradient_rows = self._count_sparse_gradient_rows(
+            *args, **kwargs
+        )
+        if num_sparse_gradient_rows:
+            (loss, aux), grads = self._row_sparse_value_and_grad(
+                num_sparse_gradient_rows, *args, **kwargs
+            )
+        else:
+            grad_fn = jax.value_and_grad(
+                self.compute_loss_and_updates, has_aux=True
+            )
+            (loss, aux), grads = grad_fn(*args, **kwargs)
         (unscaled_loss, y_pred, non_trainable_variables, metrics_variables) = (
             aux
         )
@@ -116,6 +134,125 @@ class JAXTrainer(base_trainer.Trainer):
             optimizer_variables, grads, trainable_variables
         )
 
+        logs, metrics_variables = self._update_metrics_variables(
+            metrics_variables, unscaled_loss, x, y, y_pred, sample_weight
+        )
+
+        state = self._enforce_jax_state_sharding(
+            trainable_variables,
+            non_trainable_variables,
+            optimizer_variables,
+            metrics_variables,
+        )
+        return logs, state
+
+    def _micro_batch_train_step(self, state, x, y, sample_weight):
+        """Runs a train step by accumulating the gradients of micro-batches.
+
+        The batch is split into `batch_size // micro_batch_size` strided
+        micro-batches, which are iterated over with `lax.scan`, plus a last
+        micro-batch with the remaining samples. The gradients are summed
+        into a single buffer per variable, weighted by the relative size of
+        each micro-batch, and the optimizer is applied once.
+        """
+        (
+            trainable_variables,
+            non_trainable_variables,
+            optimizer_variables,
+            metrics_variables,
+        ) = state
+        batch_size = tree.flatten(x)[0].shape[0]
+        micro_batch_size = self._micro_batch_size
+        num_micro_batches, remainder = divmod(batch_size, micro_batch_size)
+        grad_fn = jax.value_and_grad(
+            self.compute_loss_and_updates, has_aux=True
+        )
+
+        def micro_batch_step(carry, data):
+            grads, non_trainable_variables, metrics_variables = carry
+            x, y, sample_weight = data
+            (_, aux), micro_batch_grads = grad_fn(
+                trainable_variables,
+                non_trainable_variables,
+                metrics_variables,
+                x,
+                y,
+                sample_weight,
+                training=True,
+                optimizer_variables=optimizer_variables,
+            )
+            (
+                unscaled_loss,
+                y_pred,
+                non_trainable_variables,
+                metrics_variables,
+            ) = aux
+            logs, metrics_variables = self._update_metrics_variables(
+                metrics_variables, unscaled_loss, x, y, y_pred, sample_weight
+            )
+            weight = tree.flatten(x)[0].shape[0] / batch_size
+            grads = [g + mg * weight for g, mg in zip(grads, micro_batch_grads)]
+            return (grads, non_trainable_variables, metrics_variables), logs
+
+        def split(t):
+            # Strided micro-batches keep the samples of a batch sharded
+            # across devices evenly distributed in every micro-batch.
+            if t is None:
+                return None
+            t = t[: num_micro_batches * micro_batch_size]
+            t = t.reshape((micro_batch_size, num_micro_batches) + t.shape[1:])
+            return jax.numpy.swapaxes(t, 0, 1)
+
+        carry = (
+            [jax.numpy.zeros_like(v) for v in trainable_variables],
+            non_trainable_variables,
+            metrics_variables,
+        )
+        carry, logs = jax.lax.scan(
+            micro_batch_step,
+            carry,
+            tree.map_structure(split, (x, y, sample_weight)),
+        )
+        logs = tree.map_structure(lambda t: t[-1], logs)
+        if remainder:
+            carry, logs = micro_batch_step(
+                carry,
+                tree.map_structure(
+                    lambda t: None if t is None else t[-remainder:],
+                    (x, y, sample_weight),
+                ),
+            )
+        grads, non_trainable_variables, metrics_variables = carry
+
+        (
+            trainable_variables,
+            optimizer_variables,
+        ) = self.optimizer.stateless_apply(
+            optimizer_variables, grads, trainable_variables
+        )
+        state = self._enforce_jax_state_sharding(
+            trainable_variables,
+            non_trainable_variables,
+            optimizer_variables,
+            metrics_variables,
+        )
+        return logs, state
+
+    def _update_metrics_variables(
+        self, metrics_variables, unscaled_loss, x, y, y_pred, sample_weight
+    ):
+        """Statelessly updates the loss tracker and the compiled metrics."""
+        num_samples = tree.flatten(x)[0].shape[0]
+        if self._valid_rows is not None:
+            valid = self._valid_rows.astype(backend.floatx())
+            num_samples = jax.numpy.sum(valid)
+            y_pred = self._mask_padded_rows(y_pred)
+            if sample_weight is None:
+                sample_weight = valid
+            else:
+                sample_weight = tree.map_structure(
+                    lambda w: w * _expand_to_rank(valid, w.ndim), sample_weight
+                )
         with backend.StatelessScope(
             state_mapping=[
                 (ref_v, v)
@@ -123,9 +260,17 @@ class JAXTrainer(base_trainer.Trainer):
             ]
         ) as scope:
             self._loss_tracker.update_state(
-                unscaled_loss, sample_weight=tree.flatten(x)[0].shape[0]
+                unscaled_loss, sample_weight=num_samples
             )
+            padded_compile_metrics = (
+                self._valid_rows is not None
+                and self._compile_metrics is not None
+            )
+            if padded_compile_metrics:
+                self._compile_metrics._valid_rows = valid
             logs = self.compute_metrics(x, y, y_pred, sample_weight)
+            if padded_compile_metrics:
+                self._compile_metrics._valid_rows = None
 
         new_metrics_variables = []
         for ref_v in self.metrics_variables:
@@ -133,15 +278,134 @@ class JAXTrainer(base_trainer.Trainer):
             if new_v is None:
                 new_v = ref_v.value
             new_metrics_variables.append(new_v)
-        metrics_variables = new_metrics_variables
+        return logs, new_metrics_variables
+
+    def _mask_padded_rows(self, y_pred):
+        """Merges the validity mask of a padded batch into `y_pred` masks."""
+
+        def mask(t):
+            if t is None:
+                return None
+            valid = self._valid_rows
+            t_mask = backend.get_keras_mask(t)
+            if t_mask is not None:
+                valid = jax.numpy.logical_and(
+                    t_mask, _expand_to_rank(valid, t_mask.ndim)
+                )
+            backend.set_keras_mask(t, valid)
+            return t
 
-        state = self._enforce_jax_state_sharding(
-            trainable_variables,
-            non_trainable_variables,
-            optimizer_variables,
-            metrics_variables,
+        return tree.map_structure(mask, y_pred)
+
+    def _check_padding_is_row_independent(self):
+        """Rejects the layers whose training outputs mix rows of a batch."""
+        from keras.src.layers.normalization.batch_normalization import (
+            BatchNormalization,
         )
-        return logs, state
+
+        for layer in self._flatten_layers():
+            if isinstance(layer, BatchNormalization):
+                raise ValueError(
+                    "`pad_batches=True` is not supported in `fit()` for "
+                    "models with layers that compute statistics over the "
+                    "batch, since the padded rows would be included. "
+                    f"Received a model with layer '{layer.name}' of type "
+                    f"{layer.__class__.__name__}. Use `pad_batches=False` "
+                    "for training."
+                )
+
+    def _unpack_padded_batch(self, step_function):
+        """Makes the validity mask of padded batches available to a step."""
+
+        def padded_step_function(state, data):
+            if not isinstance(data, _PaddedBatch):
+                return step_function(state, data)
+            self._valid_rows = data.valid
+            try:
+                return step_function(state, data.data)
+            finally:
+                self._valid_rows = None
+
+        return padded_step_function
+
+    def _count_sparse_gradient_rows(self, *args, **kwargs):
+        """Counts the rows looked up by `Embedding(sparse_gradient=True)`.
+
+        The counters of the embeddings variables are incremented by the
+        lookups of the forward pass, which is traced once with
+        `jax.eval_shape()` for this purpose.
+
+        Returns:
+            A dict mapping the index of each trainable variable with a
+            row-sparse gradient to its number of looked up rows. Variables
+            also used as a whole (e.g. by `Embedding(reverse=True)`) keep a
+            dense gradient and are not included.
+        """
+        variables = {
+            i: variable
+            for i, variable in enumerate(self.trainable_variables)
+            if hasattr(variable, "_num_sparse_gradient_rows")
+        }
+        if not variables:
+            return {}
+        for variable in variables.values():
+            variable._num_sparse_gradient_rows = 0
+        jax.eval_shape(lambda: self.compute_loss_and_updates(*args, **kwargs))
+        return {
+            i: variable._num_sparse_gradient_rows
+            for i, variable in variables.items()
+            if 0 < variable._num_sparse_gradient_rows < variable.shape[0]
+        }
+
+    def _row_sparse_value_and_grad(self, num_rows, *args, **kwargs):
+        """Computes the loss and gradients with row-sparse embeddings grads.
+
+        `jax.grad` can only return a dense gradient for the embeddings
+        matrix. Instead, a zero "delta" is added to the rows looked up by
+        `Embedding(sparse_gradient=True)`, and the matrix itself is not
+        differentiated. The gradient of the deltas holds the gradient of
+        each looked up row, so the row-sparse `BCOO` gradient is built from
+        it and the looked up indices, without any work proportional to the
+        size of the matrix.
+        """
+        trainable_variables, args = args[0], args[1:]
+        variables = self.trainable_variables
+        deltas = {
+            i: jax.numpy.zeros(
+                (n,) + tuple(variables[i].shape[1:]), dtype=variables[i].dtype
+            )
+            for i, n in num_rows.items()
+        }
+
+        def loss_fn(trainable_variables, deltas):
+            for i, delta in deltas.items():
+                variables[i]._sparse_gradient_lookups = _SparseGradientLookups(
+                    delta
+                )
+            try:
+                loss, aux = self.compute_loss_and_updates(
+                    trainable_variables, *args, **kwargs
+                )
+                indices = {
+                    i: variables[i]._sparse_gradient_lookups.get_indices()
+                    for i in deltas
+                }
+            finally:
+                for i in deltas:
+                    variables[i]._sparse_gradient_lookups = None
+            return loss, (aux, indices)
+
+        grad_fn = jax.value_and_grad(loss_fn, argnums=(0, 1), has_aux=True)
+        (loss, (aux, indices)), (grads, delta_grads) = grad_fn(
+            trainable_variables, deltas
+        )
+        grads = list(grads)
+        for i, delta_grad in delta_grads.items():
+            grads[i] = jax_sparse.BCOO(
+                (delta_grad, jax.numpy.expand_dims(indices[i], 1)),
+                shape=variables[i].shape,
+            ).sum_duplicates(nse=delta_grad.shape[0])
+        return (loss, aux), grads
 
     def test_step(self, state, data):
         (
@@ -163,24 +427,9 @@ class JAXTrainer(base_trainer.Trainer):
             aux
         )
 
-        with backend.StatelessScope(
-            state_mapping=[
-                (ref_v, v)
-                for ref_v, v in zip(self.metrics_variables, metrics_variables)
-            ]
-        ) as scope:
-            self._loss_tracker.update_state(
-                unscaled_loss, sample_weight=tree.flatten(x)[0].shape[0]
-            )
-            logs = self.compute_metrics(x, y, y_pred, sample_weight)
-
-        new_metrics_variables = []
-        for ref_v in self.metrics_variables:
-            new_v = scope.get_current_value(ref_v)
-            if new_v is None:
-                new_v = ref_v.value
-            new_metrics_variables.append(new_v)
-        metrics_variables = new_metrics_variables
+        logs, metrics_variables = self._update_metrics_variables(
+            metrics_variables, unscaled_loss, x, y, y_pred, sample_weight
+        )
 
         (
             trainable_variables,
@@ -224,6 +473,15 @@ class JAXTrainer(base_trainer.Trainer):
         return outputs, non_trainable_variables
 
     def _make_function(self, step_function, concatenate_outputs=False):
+        if (
+            self.steps_per_execution > 1
+            and self.fused_steps_per_execution
+            and not self.run_eagerly
+            and self.jit_compile
+        ):
+            return self._make_fused_function(
+                step_function, concatenate_outputs=concatenate_outputs
+            )
         if self.steps_per_execution > 1:
             if concatenate_outputs:
 
@@ -274,6 +532,53 @@ class JAXTrainer(base_trainer.Trainer):
 
         return iterator_step
 
+    def _make_fused_function(self, step_function, concatenate_outputs=False):
+        def fused_step(state, data):
+            data = tree.map_structure(
+                lambda *t: None if t[0] is None else jax.numpy.stack(t), *data
+            )
+
+            def body(state, data):
+                outputs, state = step_function(state, data)
+                return state, outputs
+
+            state, outputs = jax.lax.scan(body, state, data)
+            if concatenate_outputs:
+                outputs = tree.map_structure(
+                    lambda t: t.reshape((-1,) + t.shape[2:]), outputs
+                )
+            else:
+                outputs = tree.map_structure(lambda t: t[-1], outputs)
+            return outputs, state
+
+        # Predict does not donate its state, since it is not updated.
+        fused_step = jax.jit(
+            fused_step, donate_argnums=() if concatenate_outputs else 0
+        )
+
+        def get_shapes(data):
+            return [None if t is None else t.shape for t in tree.flatten(data)]
+
+        def iterator_step(state, iterator):
+            data = list(itertools.islice(iterator, self.steps_per_execution))
+            if not data:
+                raise StopIteration
+            shapes = get_shapes(data[0])
+            if len(data) > 1 and all(get_shapes(d) == shapes for d in data):
+                return fused_step(state, data)
+
+            outputs = []
+            for single_step_data in data:
+                step_outputs, state = step_function(state, single_step_data)
+                outputs.append(step_outputs)
+            if concatenate_outputs:
+                return tree.map_structure(
+                    lambda *t: jax.numpy.concatenate(t), *outputs
+                ), state
+            return outputs[-1], state
+
+        return iterator_step
+
     def make_train_function(self, force=False):
         if self.train_function is not None and not force:
             return
@@ -282,9 +587,11 @@ class JAXTrainer(base_trainer.Trainer):
             # so that jax will reuse the memory buffer for outputs.
             # This will reduce the memory usage of the training function by
             # half.
-            train_step = jax.jit(self.train_step, donate_argnums=0)
+            train_step = jax.jit(
+                self._unpack_padded_batch(self.train_step), donate_argnums=0
+            )
         else:
-            train_step = self.train_step
+            train_step = self._unpack_padded_batch(self.train_step)
 
         step_function = self._make_function(train_step)
 
@@ -298,9 +605,11 @@ class JAXTrainer(base_trainer.Trainer):
             # so that jax will reuse the memory buffer for outputs.
             # This will reduce the memory usage of the training function by
             # half.
-            test_step = jax.jit(self.test_step, donate_argnums=0)
+            test_step = jax.jit(
+                self._unpack_padded_batch(self.test_step), donate_argnums=0
+            )
         else:
-            test_step = self.test_step
+            test_step = self._unpack_padded_batch(self.test_step)
 
         step_function = self._make_function(test_step)
 
@@ -310,15 +619,32 @@ class JAXTrainer(base_trainer.Trainer):
         if self.predict_function is not None and not force:
             return self.predict_function
 
-        def predict_step(state, data):
-            outputs, non_trainable_variables = self.predict_step(state, data)
-            return outputs, (state[0], non_trainable_variables)
+        def predict_step(trainable_variables, non_trainable_variables, data):
+            state = (trainable_variables, non_trainable_variables)
+            if isinstance(data, _PaddedBatch):
+                outputs, non_trainable_variables = self.predict_step(
+                    state, data.data
+                )
+                outputs = _PaddedBatch(outputs, data.valid)
+            else:
+                outputs, non_trainable_variables = self.predict_step(
+                    state, data
+                )
+            return outputs, non_trainable_variables
 
         if not self.run_eagerly and self.jit_compile:
-            predict_step = jax.jit(predict_step)
+            # Only the non-trainable variables are updated and donated. The
+            # trainable variables are not returned, which would copy them.
+            predict_step = jax.jit(predict_step, donate_argnums=1)
+
+        def one_predict_step(state, data):
+            outputs, non_trainable_variables = predict_step(
+                state[0], state[1], data
+            )
+            return outputs, (state[0], non_trainable_variables)
 
         _step_function = self._make_function(
-            predict_step, concatenate_outputs=True
+            one_predict_step, concatenate_outputs=True
         )
 
         def step_function(state, iterator):
@@ -346,8 +672,18 @@ class JAXTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        micro_batch_size=None,
     ):
         self._assert_compile_called("fit")
+        self._set_micro_batch_size(micro_batch_size)
+        self.jax_state_sync()
+        if self.pad_batches and micro_batch_size is not None:
+            raise ValueError(
+                "Argument `micro_batch_size` is not supported with "
+                "`pad_batches=True`."
+            )
+        if self.pad_batches:
+            self._check_padding_is_row_independent()
         # TODO: respect compiled trainable state
         self._eval_epoch_iterator = None
         if validation_split and validation_data is None:
@@ -380,6 +716,7 @@ class JAXTrainer(base_trainer.Trainer):
         )
 
         self._symbolic_build(iterator=epoch_iterator)
+        epoch_iterator.pad_batches = self.pad_batches
         epoch_iterator.reset()
 
         # Container that configures and calls callbacks.
@@ -405,6 +742,7 @@ class JAXTrainer(base_trainer.Trainer):
             callbacks.on_epoch_begin(epoch)
 
             self._jax_state_synced = True
+            last_step = last_logged_step = -1
             with epoch_iterator.catch_stop_iteration():
                 for step, iterator in epoch_iterator:
                     # Callbacks
@@ -439,12 +777,18 @@ class JAXTrainer(base_trainer.Trainer):
                         "metrics_variables": metrics_variables,
                     }
                     # Dispatch callbacks. This takes care of async dispatch.
-                    callbacks.on_train_batch_end(step, logs)
+                    last_step = step
+                    if step - last_logged_step >= self.log_every_n_steps:
+                        callbacks.on_train_batch_end(step, logs)
+                        last_logged_step = step
 
                     if self.stop_training:
                         # Stop training if a callback has set
                         # this flag in on_(train_)batch_end.
                         break
+            # The last batch of the epoch is always reported.
+            if last_step > last_logged_step:
+                callbacks.on_train_batch_end(last_step, logs)
 
             # Reattach state to the model (if not already done by a callback).
             # NOTE: doing this after each step would be a big performance
@@ -520,6 +864,7 @@ class JAXTrainer(base_trainer.Trainer):
         **kwargs,
     ):
         self._assert_compile_called("evaluate")
+        self.jax_state_sync()
         # TODO: respect compiled trainable state
         use_cached_eval_dataset = kwargs.pop("_use_cached_eval_dataset", False)
         if kwargs:
@@ -540,6 +885,7 @@ class JAXTrainer(base_trainer.Trainer):
             )
 
         self._symbolic_build(iterator=epoch_iterator)
+        epoch_iterator.pad_batches = self.pad_batches
         epoch_iterator.reset()
 
         # Container that configures and calls callbacks.
@@ -615,8 +961,49 @@ class JAXTrainer(base_trainer.Trainer):
 
     @traceback_utils.filter_traceback
     def predict(
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
+    ):
+        batches = self._predict_batches(
+            x,
+            batch_size=batch_size,
+            verbose=verbose,
+            steps=steps,
+            callbacks=callbacks,
+        )
+        if output_path is not None:
+            return self._write_predict_outputs(batches, output_path)
+
+        def append_to_outputs(batch_outputs, outputs):
+            if outputs is None:
+                outputs = tree.map_structure(
+                    lambda batch_output: [batch_output],
+                    batch_outputs,
+                )
+            else:
+                tree.map_structure_up_to(
+                    batch_outputs,
+                    lambda output, batch_output: output.append(batch_output),
+                    outputs,
+                    batch_outputs,
+                )
+            return outputs
+
+        outputs = None
+        for batch_outputs in batches:
+            outputs = append_to_outputs(batch_outputs, outputs)
+        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
+
+    def _predict_batches(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
+        """Yields the outputs of each execution of the predict function."""
+        self.jax_state_sync()
         # Create an iterator that yields batches of input data.
         epoch_iterator = JAXEpochIterator(
             x=x,
@@ -636,7 +1023,8 @@ class JAXTrainer(base_trainer.Trainer):
                 with backend.StatelessScope():
                     self(x)
                 break
-            epoch_iterator.reset()
+        epoch_iterator.pad_batches = self.pad_batches
+        epoch_iterator.reset()
         # Container that configures and calls callbacks.
         if not isinstance(callbacks, callbacks_module.CallbackList):
             callbacks = callbacks_module.CallbackList(
@@ -654,57 +1042,52 @@ class JAXTrainer(base_trainer.Trainer):
         self.stop_predicting = False
         callbacks.on_predict_begin()
 
-        def append_to_outputs(batch_outputs, outputs):
-            if outputs is None:
-                outputs = tree.map_structure(
-                    lambda batch_output: [batch_output],
-                    batch_outputs,
-                )
-            else:
-                tree.map_structure_up_to(
-                    batch_outputs,
-                    lambda output, batch_output: output.append(batch_output),
-                    outputs,
-                    batch_outputs,
-                )
-            return outputs
-
         self._jax_state_synced = True
-        outputs = None
         non_trainable_variables = None
-        with epoch_iterator.catch_stop_iteration():
-            for step, iterator in epoch_iterator:
-                callbacks.on_predict_batch_begin(step)
-                if self._jax_state_synced:
-                    # The state may have been synced by a callback.
-                    state = self._get_jax_state(
-                        trainable_variables=True,
-                        non_trainable_variables=True,
+        try:
+            with epoch_iterator.catch_stop_iteration():
+                for step, iterator in epoch_iterator:
+                    callbacks.on_predict_batch_begin(step)
+                    if self._jax_state_synced:
+                        # The state may have been synced by a callback.
+                        state = self._get_jax_state(
+                            trainable_variables=True,
+                            non_trainable_variables=True,
+                        )
+                        self._purge_model_variables(
+                            non_trainable_variables=True
+                        )
+                        self._jax_state_synced = False
+                    else:
+                        state = (state[0], non_trainable_variables)
+                    batch_outputs, non_trainable_variables = (
+                        self.predict_function(state, iterator)
                     )
-                    self._purge_model_variables(non_trainable_variables=True)
-                    self._jax_state_synced = False
-                else:
-                    state = (state[0], non_trainable_variables)
-                batch_outputs, non_trainable_variables = self.predict_function(
-                    state, iterator
-                )
-                outputs = append_to_outputs(batch_outputs, outputs)
-
-                # Dispatch callbacks. This takes care of async dispatch.
-                callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                    if isinstance(batch_outputs, _PaddedBatch):
+                        valid = np.asarray(batch_outputs.valid)
+                        batch_outputs = tree.map_structure(
+                            lambda t: t[valid], batch_outputs.data
+                        )
 
-                if self.stop_predicting:
-                    break
+                    # Dispatch callbacks. This takes care of async dispatch.
+                    callbacks.on_predict_batch_end(
+                        step, {"outputs": batch_outputs}
+                    )
+                    yield batch_outputs
 
-        self._jax_state = {
-            # I wouldn't recommend modifying non-trainable model state
-            # during predict(), but it's allowed.
-            "non_trainable_variables": non_trainable_variables,
-        }
-        self.jax_state_sync()
+                    if self.stop_predicting:
+                        break
+        finally:
+            # Reattach the state to the model, even if the caller stops
+            # consuming the outputs early.
+            self._jax_state = {
+                # I wouldn't recommend modifying non-trainable model state
+                # during predict(), but it's allowed.
+                "non_trainable_variables": non_trainable_variables,
+            }
+            self.jax_state_sync()
+            self._jax_state = None
         callbacks.on_predict_end()
-        self._jax_state = None
-        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
 
     def train_on_batch(
         self,
@@ -728,7 +1111,9 @@ class JAXTrainer(base_trainer.Trainer):
             )
 
         def data():
-            yield _distribute_data((x, y, sample_weight))
+            yield _distribute_data(
+                data_adapter_utils.pack_x_y_sample_weight(x, y, sample_weight)
+            )
 
         # Maybe build model
         self._symbolic_build(data_batch=next(data()))
@@ -736,14 +1121,12 @@ class JAXTrainer(base_trainer.Trainer):
         self.make_train_function()
 
         # Train step
-        state = self._get_jax_state(
+        state = self._get_on_batch_state(
             trainable_variables=True,
             non_trainable_variables=True,
             optimizer_variables=True,
             metrics_variables=True,
-            purge_model_variables=False,
         )
-        self._jax_state_synced = False
         logs, state = self.train_function(state, data())
 
         # State sync
@@ -753,13 +1136,12 @@ class JAXTrainer(base_trainer.Trainer):
             optimizer_variables,
             metrics_variables,
         ) = state
-        self._jax_state = {
-            "trainable_variables": trainable_variables,
-            "non_trainable_variables": non_trainable_variables,
-            "optimizer_variables": optimizer_variables,
-            "metrics_variables": metrics_variables,
-        }
-        self.jax_state_sync()
+        self._set_on_batch_state(
+            trainable_variables=trainable_variables,
+            non_trainable_variables=non_trainable_variables,
+            optimizer_variables=optimizer_variables,
+            metrics_variables=metrics_variables,
+        )
 
         # Format return values
         logs = tree.map_structure(lambda x: np.array(x), logs)
@@ -777,7 +1159,9 @@ class JAXTrainer(base_trainer.Trainer):
         self._assert_compile_called("test_on_batch")
 
         def data():
-            yield _distribute_data((x, y, sample_weight))
+            yield _distribute_data(
+                data_adapter_utils.pack_x_y_sample_weight(x, y, sample_weight)
+            )
 
         # Maybe build model
         self._symbolic_build(data_batch=next(data()))
@@ -785,23 +1169,20 @@ class JAXTrainer(base_trainer.Trainer):
         self.make_test_function()
 
         # Test step
-        state = self._get_jax_state(
+        state = self._get_on_batch_state(
             trainable_variables=True,
             non_trainable_variables=True,
             metrics_variables=True,
-            purge_model_variables=False,
         )
-        self._jax_state_synced = False
         logs, state = self.test_function(state, data())
 
         # State sync
         trainable_variables, non_trainable_variables, metrics_variables = state
-        self._jax_state = {
-            "trainable_variables": trainable_variables,
-            "non_trainable_variables": non_trainable_variables,
-            "metrics_variables": metrics_variables,
-        }
-        self.jax_state_sync()
+        self._set_on_batch_state(
+            trainable_variables=trainable_variables,
+            non_trainable_variables=non_trainable_variables,
+            metrics_variables=metrics_variables,
+        )
 
         # Format return values.
         logs = tree.map_structure(lambda x: np.array(x), logs)
@@ -817,13 +1198,10 @@ class JAXTrainer(base_trainer.Trainer):
         self._record_training_state_sharding_spec()
         self.make_predict_function()
 
-        state = self._get_jax_state(
+        state = self._get_on_batch_state(
             trainable_variables=True,
             non_trainable_variables=True,
-            metrics_variables=False,
-            purge_model_variables=False,
         )
-        self._jax_state_synced = False
 
         def data():
             yield (x,)
@@ -831,13 +1209,58 @@ class JAXTrainer(base_trainer.Trainer):
         batch_outputs, non_trainable_variables = self.predict_function(
             state, data()
         )
-        self._jax_state = {
-            "non_trainable_variables": non_trainable_variables,
-        }
-        self.jax_state_sync()
+        self._set_on_batch_state(
+            non_trainable_variables=non_trainable_variables,
+        )
         batch_outputs = tree.map_structure(lambda x: np.array(x), batch_outputs)
         return batch_outputs
 
+    def warmup(self, input_spec, batch_sizes=None, target_spec=None):
+        # The warmup restores the variables once done, so it must neither
+        # start from nor leave behind a deferred state.
+        self.jax_state_sync()
+        defer_state_sync = self.defer_state_sync
+        self.defer_state_sync = False
+        try:
+            super().warmup(
+                input_spec, batch_sizes=batch_sizes, target_spec=target_spec
+            )
+        finally:
+            self.defer_state_sync = defer_state_sync
+
+    def _get_on_batch_state(self, **kinds):
+        """Returns the state used by a `*_on_batch()` call.
+
+        Without `defer_state_sync`, the state is read from the variables.
+        Otherwise, the state kept by the previous call is reused, and the
+        variables are only read when there is no such state. Their values are
+        then copied, since the state is donated to the step functions: the
+        variables must stay readable until `jax_state_sync()`.
+        """
+        if not self.defer_state_sync:
+            self._jax_state_synced = False
+            return self._get_jax_state(**kinds)
+        if not getattr(self, "_jax_state", None) or self._jax_state_synced:
+            self._jax_state = {}
+        self._jax_state_synced = False
+        state = []
+        for kind, requested in kinds.items():
+            if not requested:
+                continue
+            if kind not in self._jax_state:
+                (values,) = self._get_jax_state(**{kind: True})
+                self._jax_state[kind] = [jax.numpy.copy(v) for v in values]
+            # The model tracks `_jax_state`, which wraps the lists.
+            state.append(list(self._jax_state[kind]))
+        return tuple(state)
+
+    def _set_on_batch_state(self, **state):
+        if self.defer_state_sync:
+            self._jax_state.update(state)
+        else:
+            self._jax_state = state
+            self.jax_state_sync()
+
     def jax_state_sync(self):
         if not getattr(self, "_jax_state", None) or self._jax_state_synced:
             return
@@ -1001,23 +1424,93 @@ def _distribute_data(data, layouts=None):
     return tree.map_structure(jax.device_put, data)
 
 
+class _SparseGradientLookups:
+    """The lookups of an `Embedding(sparse_gradient=True)` in a train step.
+
+    Each lookup reads its rows from the embeddings matrix without gradient,
+    and adds the next slice of `delta` to them. The gradient of `delta` is
+    therefore the gradient of the looked up rows.
+    """
+
+    def __init__(self, delta):
+        self.delta = delta
+        self.indices = []
+        self.num_rows = 0
+
+    def lookup(self, embeddings, inputs):
+        indices = jax.numpy.reshape(inputs, (-1,))
+        start = self.num_rows
+        self.num_rows += indices.shape[0]
+        self.indices.append(indices)
+        rows = jax.numpy.take(
+            jax.lax.stop_gradient(backend.convert_to_tensor(embeddings)),
+            indices,
+            axis=0,
+        )
+        rows = rows + self.delta[start : self.num_rows]
+        return jax.numpy.reshape(rows, inputs.shape + rows.shape[1:])
+
+    def get_indices(self):
+        if self.num_rows != self.delta.shape[0]:
+            raise ValueError(
+                "The lookups of an `Embedding` layer with "
+                "`sparse_gradient=True` changed between two traces of the "
+                f"train step: {self.num_rows} rows were looked up instead "
+                f"of {self.delta.shape[0]}."
+            )
+        return jax.numpy.concatenate(self.indices)
+
+
+class _PaddedBatch(collections.namedtuple("_PaddedBatch", ["data", "valid"])):
+    """A batch padded by `JAXEpochIterator`, with its rows validity mask."""
+
+
+def _expand_to_rank(x, rank):
+    return x.reshape(x.shape + (1,) * (rank - x.ndim))
+
+
+def _pad_batches(iterator):
+    """Pads the batches to the largest batch size seen so far."""
+    batch_size = 0
+    for data in iterator:
+        num_samples = tree.flatten(data)[0].shape[0]
+        batch_size = max(batch_size, num_samples)
+
+        def pad(t):
+            if t is None or num_samples == batch_size:
+                return t
+            padding = [(0, batch_size - num_samples)] + [(0, 0)] * (t.ndim - 1)
+            return np.pad(t, padding)
+
+        yield _PaddedBatch(
+            tree.map_structure(pad, data), np.arange(batch_size) < num_samples
+        )
+
+
 class JAXEpochIterator(EpochIterator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Set by the trainer once the model is built on an unpadded batch.
+        self.pad_batches = False
+
     def __next__(self):
         return next(self._epoch_iterator)
 
     def _get_iterator(self):
+        iterator = self.data_adapter.get_jax_iterator()
+        if self.pad_batches:
+            iterator = _pad_batches(iterator)
+
         distribution = distribution_lib.distribution()
         if distribution is not None:
-            return self._get_distributed_iterator(distribution)
+            return self._get_distributed_iterator(iterator, distribution)
 
-        return self._prefetch_numpy_iterator(
-            self.data_adapter.get_jax_iterator()
-        )
+        return self._prefetch_numpy_iterator(iterator)
 
-    def _get_distributed_iterator(self, distribution):
+    def _get_distributed_iterator(self, iterator, distribution):
         """Lazily compute layouts to reduce host to device transfer latency."""
         layouts = None
-        for data in self.data_adapter.get_jax_iterator():
+        for data in iterator:
             if layouts is None:
                 layouts = tree.map_structure(
                     lambda d: jax_distribution_lib._to_jax_layout(
@@ -85,7 +85,7 @@ def vectorized_map(function, elements):
         output_store = []
         for index in range(batch_size):
             output_store.append(function([x[index] for x in elements]))
-        return np.stack(output_store)
+        return tree.map_structure(lambda *xs: np.stack(xs), *output_store)
 
 
 # Shape / dtype inference util
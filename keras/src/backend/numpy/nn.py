@@ -601,6 +601,55 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     return -np.sum(target * log_prob, axis=axis)
 
 
+def linear_sparse_categorical_crossentropy(
+    target,
+    inputs,
+    kernel,
+    bias=None,
+    token_chunk_size=1024,
+    vocab_chunk_size=32768,
+):
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    target = np.array(target, dtype="int32")
+    if len(target.shape) == len(inputs.shape) and target.shape[-1] == 1:
+        target = np.squeeze(target, axis=-1)
+    dtype = backend.result_type(inputs.dtype, kernel.dtype)
+    inputs = inputs.astype(dtype)
+    kernel = kernel.astype(dtype)
+    if bias is None:
+        bias = np.zeros(kernel.shape[-1:], dtype=dtype)
+    bias = convert_to_tensor(bias, dtype=dtype)
+    x = np.reshape(inputs, (-1, inputs.shape[-1]))
+    y = np.reshape(target, (-1,))
+    num_classes = kernel.shape[1]
+    losses = []
+    for token_start in range(0, x.shape[0], token_chunk_size):
+        x_chunk = x[token_start : token_start + token_chunk_size]
+        y_chunk = y[token_start : token_start + token_chunk_size]
+        # Online log-sum-exp over vocabulary chunks, so that at most
+        # `(token_chunk_size, vocab_chunk_size)` logits are live at once.
+        max_logit = np.full(y_chunk.shape, -np.inf, dtype="float32")
+        sum_exp = np.zeros(y_chunk.shape, dtype="float32")
+        target_logit = np.zeros(y_chunk.shape, dtype="float32")
+        for start in range(0, num_classes, vocab_chunk_size):
+            stop = min(start + vocab_chunk_size, num_classes)
+            logits = (
+                np.matmul(x_chunk, kernel[:, start:stop]) + bias[start:stop]
+            )
+            logits = logits.astype("float32")
+            new_max_logit = np.maximum(max_logit, np.max(logits, axis=-1))
+            sum_exp = sum_exp * np.exp(max_logit - new_max_logit) + np.sum(
+                np.exp(logits - new_max_logit[:, None]), axis=-1
+            )
+            max_logit = new_max_logit
+            rows = np.nonzero((y_chunk >= start) & (y_chunk < stop))[0]
+            target_logit[rows] = logits[rows, y_chunk[rows] - start]
+        losses.append(max_logit + np.log(sum_exp) - target_logit)
+    loss = np.concatenate(losses) if losses else np.zeros((0,), "float32")
+    return np.reshape(loss, inputs.shape[:-1]).astype(dtype)
+
+
 def binary_crossentropy(target, output, from_logits=False):
     target = np.array(target)
     output = np.array(output)
@@ -165,13 +165,54 @@ class NumpyTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        micro_batch_size=None,
     ):
         raise NotImplementedError("fit not implemented for NumPy backend.")
 
     @traceback_utils.filter_traceback
     def predict(
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
+    ):
+        batches = self._predict_batches(
+            x,
+            batch_size=batch_size,
+            verbose=verbose,
+            steps=steps,
+            callbacks=callbacks,
+        )
+        if output_path is not None:
+            return self._write_predict_outputs(batches, output_path)
+
+        def append_to_outputs(batch_outputs, outputs):
+            if outputs is None:
+                outputs = tree.map_structure(
+                    lambda batch_output: [batch_output],
+                    batch_outputs,
+                )
+            else:
+                tree.map_structure_up_to(
+                    batch_outputs,
+                    lambda output, batch_output: output.append(batch_output),
+                    outputs,
+                    batch_outputs,
+                )
+            return outputs
+
+        outputs = None
+        for batch_outputs in batches:
+            outputs = append_to_outputs(batch_outputs, outputs)
+        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
+
+    def _predict_batches(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
+        """Yields the outputs of each execution of the predict function."""
         # Create an iterator that yields batches of input data.
         epoch_iterator = EpochIterator(
             x=x,
@@ -193,34 +234,17 @@ class NumpyTrainer(base_trainer.Trainer):
                 model=self,
             )
 
-        def append_to_outputs(batch_outputs, outputs):
-            if outputs is None:
-                outputs = tree.map_structure(
-                    lambda batch_output: [batch_output],
-                    batch_outputs,
-                )
-            else:
-                tree.map_structure_up_to(
-                    batch_outputs,
-                    lambda output, batch_output: output.append(batch_output),
-                    outputs,
-                    batch_outputs,
-                )
-            return outputs
-
         self.make_predict_function()
         self.stop_predicting = False
         callbacks.on_predict_begin()
-        outputs = None
         for step, data in epoch_iterator:
             callbacks.on_predict_batch_begin(step)
             batch_outputs = self.predict_function(data)
-            outputs = append_to_outputs(batch_outputs, outputs)
             callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+            yield batch_outputs
             if self.stop_predicting:
                 break
         callbacks.on_predict_end()
-        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
 
     @traceback_utils.filter_traceback
     def evaluate(
@@ -725,6 +725,152 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     return result
 
 
+def _linear_crossentropy_chunk_stats(x, y, kernel, bias, vocab_chunk_size):
+    # Online log-sum-exp over vocabulary chunks, so that at most
+    # `(tokens, vocab_chunk_size)` logits are live at once.
+    num_classes = kernel.shape[1]
+    max_logit = tf.fill(tf.shape(y), float("-inf"))
+    sum_exp = tf.zeros(tf.shape(y))
+    target_logit = tf.zeros(tf.shape(y))
+    for start in range(0, num_classes, vocab_chunk_size):
+        stop = min(start + vocab_chunk_size, num_classes)
+        logits = tf.matmul(x, kernel[:, start:stop]) + bias[start:stop]
+        logits = tf.cast(logits, "float32")
+        new_max_logit = tf.maximum(max_logit, tf.reduce_max(logits, axis=-1))
+        sum_exp = sum_exp * tf.exp(max_logit - new_max_logit) + tf.reduce_sum(
+            tf.exp(logits - new_max_logit[:, None]), axis=-1
+        )
+        max_logit = new_max_logit
+        local_y = y - start
+        in_chunk = (local_y >= 0) & (local_y < stop - start)
+        local_y = tf.clip_by_value(local_y, 0, stop - start - 1)
+        target_logit += tf.where(
+            in_chunk, tf.gather(logits, local_y, batch_dims=1), 0.0
+        )
+    return max_logit + tf.math.log(sum_exp), target_logit
+
+
+def _linear_crossentropy_chunk_grads(
+    x, y, kernel, bias, log_normalizer, upstream, vocab_chunk_size
+):
+    num_classes = kernel.shape[1]
+    dx = tf.zeros(tf.shape(x))
+    dkernel, dbias = [], []
+    for start in range(0, num_classes, vocab_chunk_size):
+        stop = min(start + vocab_chunk_size, num_classes)
+        kernel_chunk = kernel[:, start:stop]
+        logits = tf.matmul(x, kernel_chunk) + bias[start:stop]
+        probs = tf.exp(tf.cast(logits, "float32") - log_normalizer[:, None])
+        one_hot = tf.one_hot(y - start, stop - start)
+        dlogits = (probs - one_hot) * upstream[:, None]
+        dx += tf.matmul(
+            dlogits, tf.cast(kernel_chunk, "float32"), transpose_b=True
+        )
+        dkernel.append(
+            tf.matmul(tf.cast(x, "float32"), dlogits, transpose_a=True)
+        )
+        dbias.append(tf.reduce_sum(dlogits, axis=0))
+    return dx, tf.concat(dkernel, axis=1), tf.concat(dbias, axis=0)
+
+
+def linear_sparse_categorical_crossentropy(
+    target,
+    inputs,
+    kernel,
+    bias=None,
+    token_chunk_size=1024,
+    vocab_chunk_size=32768,
+):
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    target = tf.cast(tf.convert_to_tensor(target), "int32")
+    if len(target.shape) == len(inputs.shape) and target.shape[-1] == 1:
+        target = tf.squeeze(target, axis=-1)
+    dtype = backend.result_type(inputs.dtype, kernel.dtype)
+    inputs = cast(inputs, dtype)
+    kernel = cast(kernel, dtype)
+    if bias is None:
+        bias = tf.zeros(kernel.shape[-1:], dtype=dtype)
+    bias = cast(bias, dtype)
+    batch_shape = tf.shape(inputs)[:-1]
+    y = tf.reshape(target, (-1,))
+
+    def chunk_tokens(x):
+        num_tokens = tf.shape(x)[0]
+        num_chunks = (num_tokens + token_chunk_size - 1) // token_chunk_size
+        padding = num_chunks * token_chunk_size - num_tokens
+        x = tf.pad(x, [[0, padding]] + [[0, 0]] * (len(x.shape) - 1))
+        return tf.reshape(
+            x,
+            tf.concat([[num_chunks, token_chunk_size], tf.shape(x)[1:]], 0),
+        )
+
+    @tf.custom_gradient
+    def fused_crossentropy(x, kernel, bias):
+        num_tokens = tf.shape(x)[0]
+        log_normalizer, target_logit = tf.map_fn(
+            lambda args: _linear_crossentropy_chunk_stats(
+                args[0], args[1], kernel, bias, vocab_chunk_size
+            ),
+            (chunk_tokens(x), chunk_tokens(y)),
+            fn_output_signature=(tf.float32, tf.float32),
+        )
+        log_normalizer = tf.reshape(log_normalizer, (-1,))[:num_tokens]
+        target_logit = tf.reshape(target_logit, (-1,))[:num_tokens]
+
+        def grad(upstream):
+            x_chunks = chunk_tokens(x)
+            y_chunks = chunk_tokens(y)
+            log_normalizer_chunks = chunk_tokens(log_normalizer)
+            # Padded tokens have a zero upstream gradient and do not
+            # contribute.
+            upstream_chunks = chunk_tokens(tf.cast(upstream, "float32"))
+            num_chunks = tf.shape(x_chunks)[0]
+
+            def step(i, dx, dkernel, dbias):
+                dx_chunk, dkernel_chunk, dbias_chunk = (
+                    _linear_crossentropy_chunk_grads(
+                        x_chunks[i],
+                        y_chunks[i],
+                        kernel,
+                        bias,
+                        log_normalizer_chunks[i],
+                        upstream_chunks[i],
+                        vocab_chunk_size,
+                    )
+                )
+                return (
+                    i + 1,
+                    dx.write(i, dx_chunk),
+                    dkernel + dkernel_chunk,
+                    dbias + dbias_chunk,
+                )
+
+            _, dx, dkernel, dbias = tf.while_loop(
+                lambda i, *_: i < num_chunks,
+                step,
+                (
+                    tf.constant(0),
+                    tf.TensorArray(tf.float32, size=num_chunks),
+                    tf.zeros(kernel.shape),
+                    tf.zeros(bias.shape),
+                ),
+            )
+            dx = tf.reshape(dx.stack(), (-1, x.shape[-1]))[:num_tokens]
+            return (
+                tf.cast(dx, x.dtype),
+                tf.cast(dkernel, kernel.dtype),
+                tf.cast(dbias, bias.dtype),
+            )
+
+        return log_normalizer - target_logit, grad
+
+    loss = fused_crossentropy(
+        tf.reshape(inputs, (-1, inputs.shape[-1])), kernel, bias
+    )
+    return tf.cast(tf.reshape(loss, batch_shape), dtype)
+
+
 def binary_crossentropy(target, output, from_logits=False):
     """Binary crossentropy between an output tensor and a target tensor.
 
@@ -20,6 +20,12 @@ class TFOptimizer(KerasAutoTrackable, base_optimizer.BaseOptimizer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._distribution_strategy = tf.distribute.get_strategy()
+        if self.use_flat_buffers and tf.distribute.has_strategy():
+            raise ValueError(
+                "`use_flat_buffers=True` is not supported with a "
+                "`tf.distribute` strategy. Received: "
+                f"strategy={self._distribution_strategy}"
+            )
 
     def add_variable_from_reference(
         self, reference_variable, name=None, initializer="zeros"
@@ -71,6 +77,29 @@ class TFOptimizer(KerasAutoTrackable, base_optimizer.BaseOptimizer):
         else:
             variable.assign_sub(value)
 
+    def _get_row_sparse_gradient(self, gradient):
+        if not isinstance(gradient, tf.IndexedSlices):
+            return None
+        indices, positions = tf.unique(gradient.indices)
+        values = tf.math.unsorted_segment_sum(
+            gradient.values, positions, tf.shape(indices)[0]
+        )
+        return indices, values
+
+    def _make_row_sparse_gradient(self, gradient, indices, values):
+        return tf.IndexedSlices(values, indices, gradient.dense_shape)
+
+    def _gather_rows(self, variable, indices):
+        if isinstance(variable, backend.Variable):
+            variable = variable.value
+        return tf.gather(variable, indices)
+
+    def _assign_rows(self, variable, indices, rows):
+        self.assign(variable, tf.IndexedSlices(rows, indices))
+
+    def _assign_sub_rows(self, variable, indices, rows):
+        self.assign_sub(variable, tf.IndexedSlices(rows, indices))
+
     def _var_key(self, variable):
         if isinstance(variable, backend.Variable):
             variable = variable.value  # Convert to tf.Variable
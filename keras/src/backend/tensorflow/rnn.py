@@ -460,7 +460,10 @@ def gru(
     unroll=False,
     time_major=False,
     reset_after=True,
+    zero_output_for_mask=False,
 ):
+    # cuDNN always outputs zeros for masked timesteps, so
+    # `zero_output_for_mask` has no effect here.
     cudnn_supported = cudnn_ok(
         activation,
         recurrent_activation,
@@ -821,7 +824,10 @@ def lstm(
     go_backwards=False,
     unroll=False,
     time_major=False,
+    zero_output_for_mask=False,
 ):
+    # cuDNN always outputs zeros for masked timesteps, so
+    # `zero_output_for_mask` has no effect here.
     cudnn_supported = cudnn_ok(
         activation, recurrent_activation, unroll, use_bias=bias is not None
     )
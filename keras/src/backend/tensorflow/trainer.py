@@ -49,6 +49,11 @@ class TensorFlowTrainer(base_trainer.Trainer):
 
     def train_step(self, data):
         x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
+        micro_batch_size = self._micro_batch_size
+        if micro_batch_size and self.trainable_weights:
+            batch_size = tree.flatten(x)[0].shape[0]
+            if batch_size is None or batch_size > micro_batch_size:
+                return self._micro_batch_train_step(x, y, sample_weight)
 
         # Forward pass
         with tf.GradientTape() as tape:
@@ -81,6 +86,110 @@ class TensorFlowTrainer(base_trainer.Trainer):
 
         return self.compute_metrics(x, y, y_pred, sample_weight=sample_weight)
 
+    def _micro_batch_train_step(self, x, y, sample_weight):
+        """Runs a train step by accumulating the gradients of micro-batches.
+
+        The batch is split into `batch_size // micro_batch_size` strided
+        micro-batches, which are iterated over with a `tf.while_loop`, plus
+        a last micro-batch with the remaining samples. The gradients are
+        summed into a single buffer per variable, weighted by the relative
+        size of each micro-batch, and the optimizer is applied once.
+        """
+        batch_size = tree.flatten(x)[0].shape[0]
+        if batch_size is None:
+            batch_size = tf.shape(tree.flatten(x)[0])[0]
+        micro_batch_size = self._micro_batch_size
+        num_micro_batches = batch_size // micro_batch_size
+        num_full_samples = num_micro_batches * micro_batch_size
+        trainable_weights = self.trainable_weights
+        # Indices of the weights that the loss does not depend on, found
+        # when the micro-batch step is traced.
+        unconnected = set()
+
+        def micro_batch_gradients(x, y, sample_weight):
+            size = tf.shape(tree.flatten(x)[0])[0]
+            with tf.GradientTape() as tape:
+                if self._call_has_training_arg:
+                    y_pred = self(x, training=True)
+                else:
+                    y_pred = self(x)
+                loss = self._compute_loss(
+                    x=x,
+                    y=y,
+                    y_pred=y_pred,
+                    sample_weight=sample_weight,
+                    training=True,
+                )
+                self._loss_tracker.update_state(loss, sample_weight=size)
+                if self.optimizer is not None:
+                    loss = self.optimizer.scale_loss(loss)
+            gradients = tape.gradient(loss, trainable_weights)
+            self.compute_metrics(x, y, y_pred, sample_weight=sample_weight)
+            weight = tf.cast(size, "float32") / tf.cast(batch_size, "float32")
+            weighted_gradients = []
+            for i, (g, v) in enumerate(zip(gradients, trainable_weights)):
+                if g is None:
+                    unconnected.add(i)
+                    g = tf.zeros(v.shape, v.dtype)
+                g = tf.convert_to_tensor(g)
+                weighted_gradients.append(g * tf.cast(weight, g.dtype))
+            return weighted_gradients
+
+        def get_micro_batch(t, i):
+            # Strided micro-batches keep the samples of a batch sharded
+            # across devices evenly distributed in every micro-batch.
+            if t is None:
+                return None
+            feature_shape = t.shape[1:]
+            t = tf.reshape(
+                t[:num_full_samples],
+                tf.concat(
+                    [[micro_batch_size, num_micro_batches], tf.shape(t)[1:]],
+                    axis=0,
+                ),
+            )
+            t = tf.gather(t, i, axis=1)
+            t.set_shape(
+                tf.TensorShape([micro_batch_size]).concatenate(feature_shape)
+            )
+            return t
+
+        def body(i, gradients):
+            micro_batch = tree.map_structure(
+                lambda t: get_micro_batch(t, i), (x, y, sample_weight)
+            )
+            micro_gradients = micro_batch_gradients(*micro_batch)
+            return i + 1, [g + mg for g, mg in zip(gradients, micro_gradients)]
+
+        def remainder_step(gradients):
+            micro_batch = tree.map_structure(
+                lambda t: None if t is None else t[num_full_samples:],
+                (x, y, sample_weight),
+            )
+            micro_gradients = micro_batch_gradients(*micro_batch)
+            return [g + mg for g, mg in zip(gradients, micro_gradients)]
+
+        _, gradients = tf.while_loop(
+            lambda i, _: i < num_micro_batches,
+            body,
+            (0, [tf.zeros(v.shape, v.dtype) for v in trainable_weights]),
+        )
+        if isinstance(batch_size, int):
+            if batch_size > num_full_samples:
+                gradients = remainder_step(gradients)
+        else:
+            gradients = tf.cond(
+                batch_size > num_full_samples,
+                lambda: remainder_step(gradients),
+                lambda: gradients,
+            )
+        gradients = [
+            None if i in unconnected else g for i, g in enumerate(gradients)
+        ]
+        self.optimizer.apply_gradients(zip(gradients, trainable_weights))
+
+        return self.get_metrics_result()
+
     def test_step(self, data):
         x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
         if self._call_has_training_arg:
@@ -304,8 +413,10 @@ class TensorFlowTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        micro_batch_size=None,
     ):
         self._assert_compile_called("fit")
+        self._set_micro_batch_size(micro_batch_size)
         # TODO: respect compiled trainable state
         self._eval_epoch_iterator = None
         if validation_split and validation_data is None:
@@ -362,13 +473,20 @@ class TensorFlowTrainer(base_trainer.Trainer):
         for epoch in range(initial_epoch, epochs):
             self.reset_metrics()
             callbacks.on_epoch_begin(epoch)
+            last_step = last_logged_step = -1
             with epoch_iterator.catch_stop_iteration():
                 for step, iterator in epoch_iterator:
                     callbacks.on_train_batch_begin(step)
                     logs = self.train_function(iterator)
-                    callbacks.on_train_batch_end(step, logs)
+                    last_step = step
+                    if step - last_logged_step >= self.log_every_n_steps:
+                        callbacks.on_train_batch_end(step, logs)
+                        last_logged_step = step
                     if self.stop_training:
                         break
+            # The last batch of the epoch is always reported.
+            if last_step > last_logged_step:
+                callbacks.on_train_batch_end(last_step, logs)
 
             # Override with model metrics instead of last step logs if needed.
             epoch_logs = dict(self._get_metrics_result_or_logs(logs))
@@ -491,8 +609,51 @@ class TensorFlowTrainer(base_trainer.Trainer):
 
     @traceback_utils.filter_traceback
     def predict(
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
+    ):
+        batches = self._predict_batches(
+            x,
+            batch_size=batch_size,
+            verbose=verbose,
+            steps=steps,
+            callbacks=callbacks,
+        )
+        if output_path is not None:
+            return self._write_predict_outputs(batches, output_path)
+
+        def append_to_outputs(batch_outputs, outputs):
+            if outputs is None:
+                outputs = tree.map_structure(
+                    lambda batch_output: [batch_output],
+                    batch_outputs,
+                )
+            else:
+                tree.map_structure_up_to(
+                    batch_outputs,
+                    lambda output, batch_output: output.append(batch_output),
+                    outputs,
+                    batch_outputs,
+                )
+            return outputs
+
+        outputs = None
+        for batch_outputs in batches:
+            outputs = append_to_outputs(batch_outputs, outputs)
+        outputs = tree.map_structure_up_to(
+            batch_outputs, potentially_ragged_concat, outputs
+        )
+        return tree.map_structure(convert_to_np_if_not_ragged, outputs)
+
+    def _predict_batches(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
+        """Yields the outputs of each execution of the predict function."""
         # Create an iterator that yields batches of input data.
         epoch_iterator = TFEpochIterator(
             x=x,
@@ -515,21 +676,6 @@ class TensorFlowTrainer(base_trainer.Trainer):
                 model=self,
             )
 
-        def append_to_outputs(batch_outputs, outputs):
-            if outputs is None:
-                outputs = tree.map_structure(
-                    lambda batch_output: [batch_output],
-                    batch_outputs,
-                )
-            else:
-                tree.map_structure_up_to(
-                    batch_outputs,
-                    lambda output, batch_output: output.append(batch_output),
-                    outputs,
-                    batch_outputs,
-                )
-            return outputs
-
         def get_data(iterator):
             """Returns data for the next execution."""
             data = []
@@ -551,21 +697,16 @@ class TensorFlowTrainer(base_trainer.Trainer):
         self.make_predict_function()
         self.stop_predicting = False
         callbacks.on_predict_begin()
-        outputs = None
         with epoch_iterator.catch_stop_iteration():
             for step, iterator in epoch_iterator:
                 callbacks.on_predict_batch_begin(step)
                 data = get_data(iterator)
                 batch_outputs = self.predict_function(data)
-                outputs = append_to_outputs(batch_outputs, outputs)
                 callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                yield batch_outputs
                 if self.stop_predicting:
                     break
         callbacks.on_predict_end()
-        outputs = tree.map_structure_up_to(
-            batch_outputs, potentially_ragged_concat, outputs
-        )
-        return tree.map_structure(convert_to_np_if_not_ragged, outputs)
 
     def train_on_batch(
         self,
@@ -593,7 +734,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
         self.make_train_function()
 
         def data():
-            yield (x, y, sample_weight)
+            yield data_adapter_utils.pack_x_y_sample_weight(x, y, sample_weight)
 
         logs = self.train_function(data())
         logs = tree.map_structure(lambda x: np.array(x), logs)
@@ -611,7 +752,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
         self._assert_compile_called("test_on_batch")
 
         def data():
-            yield (x, y, sample_weight)
+            yield data_adapter_utils.pack_x_y_sample_weight(x, y, sample_weight)
 
         # Maybe build model
         self._maybe_symbolic_build(data_batch=(x, y, sample_weight))
@@ -0,0 +1,171 @@
+"""!!!DO NOT USE!!!
+
+Distribution related class for Torch backend.
+
+Only data parallelism is supported: each process holds a full replica of the
+model, and the gradients are averaged across processes with
+`torch.distributed` at each training step.
+"""
+
+import torch
+import torch.distributed as dist
+
+
+def list_devices(device_type=None):
+    """Return all the available devices based on the device type.
+
+    In a multi-process setting, one device is returned per process, since
+    each process drives a single replica of the model.
+
+    Args:
+        device_type: string of `"cpu"` or `"gpu"`. Defaults to `"gpu"` if
+            available when device_type is not provided. Otherwise will
+            return the `"cpu"` devices.
+
+    Return:
+        List of devices that are available for distribute computation.
+    """
+    device_type = device_type.lower() if device_type else None
+    if device_type is None:
+        device_type = "gpu" if torch.cuda.is_available() else "cpu"
+    if dist.is_available() and dist.is_initialized():
+        return [f"{device_type}:{i}" for i in range(dist.get_world_size())]
+    if device_type == "gpu":
+        return [f"gpu:{i}" for i in range(torch.cuda.device_count())]
+    return ["cpu:0"]
+
+
+def distribute_variable(value, layout):
+    """Create a distributed variable for Torch.
+
+    Since only data parallelism is supported, variables are replicated on
+    every process and the value is returned unchanged.
+    """
+    _check_replicated(layout)
+    return value
+
+
+def distribute_tensor(tensor, layout):
+    """Distribute the tensor based on the layout.
+
+    Since only data parallelism is supported, tensors are replicated on
+    every process and the tensor is returned unchanged.
+    """
+    _check_replicated(layout)
+    return tensor
+
+
+def distribute_data_input(per_process_batch, layout):
+    """Distribute the input data with the corresponding layout.
+
+    Each process trains on its own shard of the data, so the per-process
+    batch is returned unchanged.
+    """
+    return per_process_batch
+
+
+def initialize(job_addresses, num_processes, process_id):
+    """Initialize the default `torch.distributed` process group.
+
+    When the arguments are `None`, they are read from the environment
+    variables set by `torchrun` (`MASTER_ADDR`, `MASTER_PORT`, `WORLD_SIZE`
+    and `RANK`). The `"gloo"` backend is used on CPU and `"nccl"` on GPU.
+    """
+    if job_addresses and "," in job_addresses:
+        # When user provide all the job addresses, we will split and get the
+        # first one, which is the coordinator.
+        job_addresses = job_addresses.split(",")
+        # Do a sanity check to make sure the number of addresses also match
+        # the num_processes.
+        if num_processes is not None and num_processes != len(job_addresses):
+            raise ValueError(
+                f"The provided job_addresses {job_addresses} has "
+                f"{len(job_addresses)} jobs, but num_processes is "
+                f"{num_processes}"
+            )
+        coordinator_address = job_addresses[0]
+    else:
+        coordinator_address = job_addresses
+
+    init_method = "env://"
+    if coordinator_address:
+        init_method = f"tcp://{coordinator_address}"
+    dist.init_process_group(
+        backend="nccl" if torch.cuda.is_available() else "gloo",
+        init_method=init_method,
+        world_size=num_processes if num_processes is not None else -1,
+        rank=process_id if process_id is not None else -1,
+    )
+
+
+def num_processes():
+    """Return the number of processes for the current distribution setting."""
+    if dist.is_available() and dist.is_initialized():
+        return dist.get_world_size()
+    return 1
+
+
+def process_id():
+    """Return the current process ID for the distribution setting."""
+    if dist.is_available() and dist.is_initialized():
+        return dist.get_rank()
+    return 0
+
+
+def all_reduce_gradients(gradients):
+    """Average the gradients across processes, in place.
+
+    The gradients are flattened into a single buffer so that each training
+    step only runs one collective operation. Sparse gradients, e.g. from an
+    `Embedding` layer with `sparse_gradient=True`, are densified first since
+    each process updates different rows.
+
+    Args:
+        gradients: List of gradient tensors, or `None` for the variables
+            without gradient. All the processes must pass the same shapes.
+
+    Returns:
+        The list of averaged gradients, where the sparse gradients are
+        replaced by dense ones.
+    """
+    gradients = [
+        g.to_dense() if g is not None and g.is_sparse else g for g in gradients
+    ]
+    tensors = [g for g in gradients if g is not None]
+    if not tensors:
+        return gradients
+    buffer = torch.cat([t.reshape(-1) for t in tensors])
+    dist.all_reduce(buffer, op=dist.ReduceOp.SUM)
+    buffer /= dist.get_world_size()
+    offset = 0
+    for t in tensors:
+        t.copy_(buffer[offset : offset + t.numel()].view_as(t))
+        offset += t.numel()
+    return gradients
+
+
+def broadcast_variables(variables, source_process_id=0):
+    """Copy the values of the variables of a process to all the processes.
+
+    This is used to start the training from the same values on every
+    replica.
+
+    Args:
+        variables: List of `keras.Variable` instances. All the processes must
+            pass the same shapes.
+        source_process_id: ID of the process whose values are broadcasted.
+            Defaults to `0`.
+    """
+    with torch.no_grad():
+        for variable in variables:
+            dist.broadcast(variable.value, src=source_process_id)
+
+
+def _check_replicated(layout):
+    axes = getattr(layout, "axes", None) or ()
+    if any(axis is not None for axis in axes):
+        raise ValueError(
+            "The PyTorch backend only supports data parallel distribution, "
+            f"where variables and tensors are replicated. Received: "
+            f"layout={layout}"
+        )
@@ -0,0 +1,177 @@
+"""Test for distribution_lib.py."""
+
+import os
+import socket
+
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import optimizers
+from keras.src import testing
+from keras.src import utils
+from keras.src.backend import distribution_lib as backend_dlib
+from keras.src.distribution import distribution_lib
+from keras.src.trainers import data_adapters
+
+NUM_PROCESSES = 2
+
+
+def _get_model():
+    model = models.Sequential(
+        [layers.Input(shape=(3,)), layers.Dense(4), layers.Dense(1)]
+    )
+    model.compile(optimizer=optimizers.SGD(learning_rate=0.1), loss="mse")
+    return model
+
+
+def _get_data():
+    rng = np.random.default_rng(0)
+    x = rng.random((16, 3)).astype("float32")
+    y = rng.random((16, 1)).astype("float32")
+    return x, y
+
+
+def _train_data_parallel(process_id, port, output_dir):
+    distribution_lib.initialize(f"localhost:{port}", NUM_PROCESSES, process_id)
+    distribution_lib.set_distribution(distribution_lib.DataParallel())
+    # Each process creates different initial values, and `fit()` starts
+    # from the values of the first process.
+    utils.set_random_seed(process_id)
+    model = _get_model()
+    np.save(
+        os.path.join(output_dir, f"initial_{process_id}.npy"),
+        np.concatenate([np.ravel(w) for w in model.get_weights()]),
+    )
+    x, y = _get_data()
+    model.fit(x, y, batch_size=8, epochs=1, shuffle=False, verbose=0)
+    np.save(
+        os.path.join(output_dir, f"final_{process_id}.npy"),
+        np.concatenate([np.ravel(w) for w in model.get_weights()]),
+    )
+
+
+@pytest.mark.skipif(
+    backend.backend() != "torch",
+    reason="Backend specific test",
+)
+class TorchDistributionLibTest(testing.TestCase):
+    def test_single_process(self):
+        self.assertEqual(backend_dlib.num_processes(), 1)
+        self.assertEqual(backend_dlib.process_id(), 0)
+        self.assertEqual(backend_dlib.list_devices("cpu"), ["cpu:0"])
+        self.assertFalse(distribution_lib.DataParallel()._is_multi_process)
+
+    def test_distribute_data(self):
+        import torch
+
+        distribution = distribution_lib.DataParallel()
+        distribution._num_process = NUM_PROCESSES
+        distribution._process_id = 1
+        distribution._is_multi_process = True
+        x, y = _get_data()
+        x = x[:15]
+        y = y[:15]
+
+        with distribution.scope():
+            # The last sample is dropped, and each process gets half of the
+            # global batch.
+            adapter = data_adapters.get_data_adapter(x, y, batch_size=4)
+            self.assertEqual(adapter.batch_size, 2)
+            self.assertEqual(adapter.num_batches, 4)
+            batches = list(adapter.get_numpy_iterator())
+            self.assertAllClose(batches[0][0], x[7:9])
+
+            dataloader = torch.utils.data.DataLoader(
+                torch.utils.data.TensorDataset(
+                    torch.from_numpy(x), torch.from_numpy(y)
+                ),
+                batch_size=4,
+            )
+            adapter = data_adapters.get_data_adapter(dataloader)
+            self.assertEqual(adapter.batch_size, 2)
+            self.assertEqual(adapter.num_batches, 4)
+            batches = list(adapter.get_numpy_iterator())
+            self.assertAllClose(batches[0][0], x[1:4:2])
+
+            with self.assertRaisesRegex(ValueError, "divisible"):
+                data_adapters.get_data_adapter(x, y, batch_size=5)
+
+    def test_model_parallel_rejects_dataloader(self):
+        import torch
+
+        device_mesh = distribution_lib.DeviceMesh((1,), ["data"], ["cpu:0"])
+        distribution = distribution_lib.ModelParallel(
+            layout_map=distribution_lib.LayoutMap(device_mesh)
+        )
+        x, y = _get_data()
+        dataloader = torch.utils.data.DataLoader(
+            torch.utils.data.TensorDataset(torch.from_numpy(x)), batch_size=4
+        )
+        with self.assertRaisesRegex(ValueError, "DataParallel"):
+            distribution.distribute_dataset(dataloader)
+
+    def test_all_reduce_sparse_gradients(self):
+        import torch
+        import torch.distributed as dist
+
+        with socket.socket() as s:
+            s.bind(("localhost", 0))
+            port = s.getsockname()[1]
+        dist.init_process_group(
+            "gloo", init_method=f"tcp://localhost:{port}", world_size=1, rank=0
+        )
+        try:
+            dense = torch.ones((2, 3))
+            sparse = torch.sparse_coo_tensor(
+                torch.tensor([[0, 2]]), torch.ones((2, 2)), (4, 2)
+            )
+            gradients = backend_dlib.all_reduce_gradients([dense, None, sparse])
+        finally:
+            dist.destroy_process_group()
+        self.assertIsNone(gradients[1])
+        self.assertAllClose(gradients[0], np.ones((2, 3)))
+        self.assertFalse(gradients[2].is_sparse)
+        self.assertAllClose(gradients[2], [[1, 1], [0, 0], [1, 1], [0, 0]])
+
+    def test_data_parallel_fit(self):
+        import torch.multiprocessing
+
+        with socket.socket() as s:
+            s.bind(("localhost", 0))
+            port = s.getsockname()[1]
+        output_dir = self.get_temp_dir()
+        torch.multiprocessing.spawn(
+            _train_data_parallel,
+            args=(port, output_dir),
+            nprocs=NUM_PROCESSES,
+        )
+
+        def load(name):
+            return np.load(os.path.join(output_dir, f"{name}.npy"))
+
+        self.assertNotAllClose(load("initial_0"), load("initial_1"))
+        self.assertAllClose(load("final_0"), load("final_1"))
+
+        # Each step trains on the samples of both processes: the first 8
+        # samples are on process 0 and the last 8 ones on process 1.
+        utils.set_random_seed(0)
+        model = _get_model()
+        x, y = _get_data()
+        order = np.concatenate(
+            [
+                np.arange(0, 4),
+                np.arange(8, 12),
+                np.arange(4, 8),
+                np.arange(12, 16),
+            ]
+        )
+        model.fit(
+            x[order], y[order], batch_size=8, epochs=1, shuffle=False, verbose=0
+        )
+        self.assertAllClose(
+            np.concatenate([np.ravel(w) for w in model.get_weights()]),
+            load("final_0"),
+        )
@@ -12,9 +12,7 @@ from keras.src.backend.torch.numpy import pad
 
 
 def _segment_reduction_fn(data, segment_ids, reduction_method, num_segments):
-    num_repeats = torch.prod(
-        torch.tensor(data.shape[1:], device=get_device())
-    ).long()
+    num_repeats = math.prod(data.shape[1:])
     # To use `scatter_add` in torch, we need to replicate `segment_ids` into the
     # shape of `data`.
     segment_ids = (
@@ -681,6 +681,133 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     return -torch.sum(target * log_prob, dim=axis)
 
 
+def _linear_crossentropy_chunk_logits(x, kernel, bias, vocab_chunk_size):
+    num_classes = kernel.shape[1]
+    for start in range(0, num_classes, vocab_chunk_size):
+        stop = min(start + vocab_chunk_size, num_classes)
+        kernel_chunk = kernel[:, start:stop]
+        logits = torch.matmul(x, kernel_chunk) + bias[start:stop]
+        yield start, stop, kernel_chunk, logits.float()
+
+
+class _LinearCrossentropy(torch.autograd.Function):
+    @staticmethod
+    def forward(ctx, x, y, kernel, bias, token_chunk_size, vocab_chunk_size):
+        log_normalizers, losses = [], []
+        for x_chunk, y_chunk in zip(
+            torch.split(x, token_chunk_size), torch.split(y, token_chunk_size)
+        ):
+            # Online log-sum-exp over vocabulary chunks, so that at most
+            # `(token_chunk_size, vocab_chunk_size)` logits are live at once.
+            max_logit = torch.full(
+                y_chunk.shape, -float("inf"), device=x.device
+            )
+            sum_exp = torch.zeros(y_chunk.shape, device=x.device)
+            target_logit = torch.zeros(y_chunk.shape, device=x.device)
+            for start, stop, _, logits in _linear_crossentropy_chunk_logits(
+                x_chunk, kernel, bias, vocab_chunk_size
+            ):
+                new_max_logit = torch.maximum(
+                    max_logit, torch.amax(logits, dim=-1)
+                )
+                sum_exp = sum_exp * torch.exp(
+                    max_logit - new_max_logit
+                ) + torch.sum(torch.exp(logits - new_max_logit[:, None]), -1)
+                max_logit = new_max_logit
+                local_y = y_chunk - start
+                in_chunk = (local_y >= 0) & (local_y < stop - start)
+                local_y = torch.clip(local_y, 0, stop - start - 1)
+                target_logit += torch.where(
+                    in_chunk,
+                    torch.gather(logits, 1, local_y[:, None])[:, 0],
+                    0.0,
+                )
+            log_normalizer = max_logit + torch.log(sum_exp)
+            log_normalizers.append(log_normalizer)
+            losses.append(log_normalizer - target_logit)
+        log_normalizer = torch.cat(log_normalizers)
+        ctx.save_for_backward(x, y, kernel, bias, log_normalizer)
+        ctx.token_chunk_size = token_chunk_size
+        ctx.vocab_chunk_size = vocab_chunk_size
+        return torch.cat(losses)
+
+    @staticmethod
+    def backward(ctx, upstream):
+        x, y, kernel, bias, log_normalizer = ctx.saved_tensors
+        token_chunk_size = ctx.token_chunk_size
+        dx = []
+        dkernel = torch.zeros(kernel.shape, device=x.device)
+        dbias = torch.zeros(bias.shape, device=x.device)
+        for x_chunk, y_chunk, log_normalizer_chunk, upstream_chunk in zip(
+            torch.split(x, token_chunk_size),
+            torch.split(y, token_chunk_size),
+            torch.split(log_normalizer, token_chunk_size),
+            torch.split(upstream.float(), token_chunk_size),
+        ):
+            dx_chunk = torch.zeros(x_chunk.shape, device=x.device)
+            for (
+                start,
+                stop,
+                kernel_chunk,
+                logits,
+            ) in _linear_crossentropy_chunk_logits(
+                x_chunk, kernel, bias, ctx.vocab_chunk_size
+            ):
+                dlogits = torch.exp(logits - log_normalizer_chunk[:, None])
+                local_y = y_chunk - start
+                in_chunk = (local_y >= 0) & (local_y < stop - start)
+                rows = torch.nonzero(in_chunk)[:, 0]
+                dlogits[rows, local_y[rows]] -= 1.0
+                dlogits = dlogits * upstream_chunk[:, None]
+                dx_chunk += torch.matmul(dlogits, kernel_chunk.T.float())
+                dkernel[:, start:stop] += torch.matmul(
+                    x_chunk.T.float(), dlogits
+                )
+                dbias[start:stop] += torch.sum(dlogits, dim=0)
+            dx.append(dx_chunk)
+        return (
+            torch.cat(dx).to(x.dtype),
+            None,
+            dkernel.to(kernel.dtype),
+            dbias.to(bias.dtype),
+            None,
+            None,
+        )
+
+
+def linear_sparse_categorical_crossentropy(
+    target,
+    inputs,
+    kernel,
+    bias=None,
+    token_chunk_size=1024,
+    vocab_chunk_size=32768,
+):
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    target = convert_to_tensor(target, dtype=torch.long)
+    if len(target.shape) == len(inputs.shape) and target.shape[-1] == 1:
+        target = torch.squeeze(target, dim=-1)
+    dtype = backend.result_type(inputs.dtype, kernel.dtype)
+    inputs = cast(inputs, dtype)
+    kernel = cast(kernel, dtype)
+    if bias is None:
+        bias = torch.zeros(
+            kernel.shape[-1:], dtype=kernel.dtype, device=kernel.device
+        )
+    bias = cast(bias, dtype)
+    batch_shape = inputs.shape[:-1]
+    loss = _LinearCrossentropy.apply(
+        torch.reshape(inputs, (-1, inputs.shape[-1])),
+        torch.reshape(target, (-1,)),
+        kernel,
+        bias,
+        token_chunk_size,
+        vocab_chunk_size,
+    )
+    return cast(torch.reshape(loss, batch_shape), dtype)
+
+
 def binary_crossentropy(target, output, from_logits=False):
     target = convert_to_tensor(target)
     output = convert_to_tensor(output)
@@ -1,11 +1,17 @@
+import contextlib
+
 import torch
 
+from keras.src import ops
 from keras.src import optimizers
 from keras.src.optimizers.base_optimizer import BaseOptimizer
 from keras.src.utils import torch_utils
 
 
 class TorchOptimizer(BaseOptimizer):
+    # Set by `_conditional_updates()`.
+    _update_condition = None
+
     def __new__(cls, *args, **kwargs):
         # Import locally to avoid circular imports.
         from keras.src.backend.torch.optimizers import torch_adadelta
@@ -34,12 +40,125 @@ class TorchOptimizer(BaseOptimizer):
             return OPTIMIZERS[cls](*args, **kwargs)
         return super().__new__(cls)
 
+    @contextlib.contextmanager
+    def _conditional_updates(self, condition):
+        """Keeps the old values of the variables if `condition` is `False`.
+
+        Each assignment selects between the new and the old value of the
+        variable, so that a step can be discarded without a host sync or a
+        copy of the variables.
+        """
+        self._update_condition = condition
+        try:
+            yield
+        finally:
+            self._update_condition = None
+
+    def assign(self, variable, value):
+        if self._update_condition is not None:
+            value = ops.where(self._update_condition, value, variable)
+        super().assign(variable, value)
+
+    def assign_add(self, variable, value):
+        if self._update_condition is not None:
+            value = ops.where(self._update_condition, value, 0)
+        super().assign_add(variable, value)
+
+    def assign_sub(self, variable, value):
+        if self._update_condition is not None:
+            value = ops.where(self._update_condition, value, 0)
+        super().assign_sub(variable, value)
+
+    @torch_utils.no_grad
+    def _backend_update_step(self, grads, trainable_variables, learning_rate):
+        if not self._supports_row_sparse_updates():
+            grads = [
+                grad.to_dense() if _is_sparse(grad) else grad for grad in grads
+            ]
+        super()._backend_update_step(grads, trainable_variables, learning_rate)
+
+    def _get_row_sparse_gradient(self, gradient):
+        if not (_is_sparse(gradient) and gradient.sparse_dim() == 1):
+            return None
+        gradient = gradient.coalesce()
+        return gradient.indices()[0], gradient.values()
+
+    def _make_row_sparse_gradient(self, gradient, indices, values):
+        return torch.sparse_coo_tensor(
+            torch.unsqueeze(indices, 0),
+            values,
+            gradient.shape,
+            is_coalesced=True,
+        )
+
+    def _gather_rows(self, variable, indices):
+        return torch.index_select(variable.value, 0, indices)
+
+    def _assign_rows(self, variable, indices, rows):
+        if self._update_condition is not None:
+            rows = torch.where(
+                self._update_condition,
+                rows,
+                self._gather_rows(variable, indices),
+            )
+        variable.value.index_copy_(0, indices, rows)
+
+    @torch_utils.no_grad
+    def _update_step_with_flat_buckets(
+        self, grads, trainable_variables, learning_rate
+    ):
+        super()._update_step_with_flat_buckets(
+            grads, trainable_variables, learning_rate
+        )
+
+    @torch_utils.no_grad
+    def _make_flat_buckets(self, variables):
+        slot_variables = super()._make_flat_buckets(variables)
+        # Back the model variables with views into the buckets, so that the
+        # buckets are the persistent storage of the variables.
+        for bucket, members in zip(
+            self._flat_buckets, self._flat_bucket_members
+        ):
+            sizes = self._flat_bucket_segments[self._var_key(bucket)][1]
+            values = torch.split(bucket._value, sizes.tolist())
+            for variable, value in zip(members, values):
+                value = value.view(variable.shape)
+                value.copy_(variable._value)
+                variable._value.data = value
+        self._flat_buckets_alias_variables = True
+        return slot_variables
+
+    @torch_utils.no_grad
+    def _unpack_flat_buckets(self):
+        if self._flat_buckets is None or self._flat_buckets_are_variables():
+            return
+        for bucket, members in zip(
+            self._flat_buckets, self._flat_bucket_members
+        ):
+            sizes = self._flat_bucket_segments[self._var_key(bucket)][1]
+            values = torch.split(bucket.value, sizes.tolist())
+            torch._foreach_copy_(
+                [v.value for v in members],
+                [x.view(v.shape) for x, v in zip(values, members)],
+            )
+
+    @torch_utils.no_grad
+    def _apply_lazy_weight_decay(self, grads, variables):
+        return super()._apply_lazy_weight_decay(grads, variables)
+
     @torch_utils.no_grad
     def _apply_weight_decay(self, variables):
         if self.weight_decay is None:
             return
 
+        factor = 1 - self.weight_decay * self._get_current_learning_rate()
+        if self._update_condition is not None:
+            factor = torch.where(self._update_condition, factor, 1.0)
         torch._foreach_mul_(
             [v.value for v in variables if self._use_weight_decay(v)],
-            1 - self.weight_decay * self._get_current_learning_rate(),
+            factor,
         )
+
+
+def _is_sparse(x):
+    return isinstance(x, torch.Tensor) and x.is_sparse
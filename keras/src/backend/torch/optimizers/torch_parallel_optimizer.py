@@ -1,5 +1,6 @@
 import torch
 
+from keras.src.backend.torch.optimizers import torch_optimizer
 from keras.src.optimizers.base_optimizer import BaseOptimizer
 from keras.src.utils import torch_utils
 
@@ -7,6 +8,36 @@ from keras.src.utils import torch_utils
 class TorchParallelOptimizer(BaseOptimizer):
     @torch_utils.no_grad
     def _backend_update_step(self, grads, trainable_variables, learning_rate):
+        if (
+            getattr(self, "use_8bit_states", False)
+            or self._update_condition is not None
+        ):
+            # Block-quantized states are updated one variable at a time, as
+            # are conditional updates, which go through `assign()`.
+            return super()._backend_update_step(
+                grads, trainable_variables, learning_rate
+            )
+        if any(torch_optimizer._is_sparse(grad) for grad in grads):
+            if not self._supports_row_sparse_updates():
+                grads = [
+                    grad.to_dense()
+                    if torch_optimizer._is_sparse(grad)
+                    else grad
+                    for grad in grads
+                ]
+            else:
+                # Row-sparse gradients are applied one variable at a time,
+                # through the sparse path of `update_step`.
+                dense_grads, dense_variables = [], []
+                for grad, variable in zip(grads, trainable_variables):
+                    if torch_optimizer._is_sparse(grad):
+                        self.update_step(grad, variable, learning_rate)
+                    else:
+                        dense_grads.append(grad)
+                        dense_variables.append(variable)
+                if not dense_grads:
+                    return
+                grads, trainable_variables = dense_grads, dense_variables
         self._parallel_update_step(
             grads,
             trainable_variables,
@@ -8,6 +8,8 @@ from keras.src import backend
 from keras.src import callbacks as callbacks_module
 from keras.src import optimizers as optimizers_module
 from keras.src import tree
+from keras.src.backend.torch import distribution_lib as torch_distribution_lib
+from keras.src.distribution import distribution_lib
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import array_slicing
 from keras.src.trainers.data_adapters import data_adapter_utils
@@ -38,6 +40,9 @@ class TorchTrainer(base_trainer.Trainer):
 
     def train_step(self, data):
         x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
+        micro_batch_size = self._micro_batch_size
+        if micro_batch_size and tree.flatten(x)[0].shape[0] > micro_batch_size:
+            return self._micro_batch_train_step(x, y, sample_weight)
 
         # Compute predictions
         if self._call_has_training_arg:
@@ -69,12 +74,83 @@ class TorchTrainer(base_trainer.Trainer):
 
             # Update weights
             with torch.no_grad():
+                gradients = self._all_reduce_gradients(gradients)
                 self.optimizer.apply(gradients, trainable_weights)
         else:
             warnings.warn("The model does not have any trainable weights.")
 
         return self.compute_metrics(x, y, y_pred, sample_weight=sample_weight)
 
+    def _micro_batch_train_step(self, x, y, sample_weight):
+        """Runs a train step by accumulating the gradients of micro-batches.
+
+        The batch is split into `batch_size // micro_batch_size` strided
+        micro-batches plus a last micro-batch with the remaining samples.
+        The backward pass of each micro-batch accumulates into the `grad`
+        of the weights, weighted by the relative size of the micro-batch,
+        and the optimizer is applied once.
+        """
+        batch_size = tree.flatten(x)[0].shape[0]
+        micro_batch_size = self._micro_batch_size
+        num_micro_batches, remainder = divmod(batch_size, micro_batch_size)
+
+        def get_micro_batch(t, i):
+            if t is None:
+                return None
+            if i == num_micro_batches:
+                return t[-remainder:]
+            t = t[: num_micro_batches * micro_batch_size]
+            t = t.reshape(micro_batch_size, num_micro_batches, *t.shape[1:])
+            return t[:, i]
+
+        self.zero_grad()
+        for i in range(num_micro_batches + (1 if remainder else 0)):
+            micro_x, micro_y, micro_sample_weight = tree.map_structure(
+                lambda t: get_micro_batch(t, i), (x, y, sample_weight)
+            )
+            size = tree.flatten(micro_x)[0].shape[0]
+            if self._call_has_training_arg:
+                y_pred = self(micro_x, training=True)
+            else:
+                y_pred = self(micro_x)
+            loss = self._compute_loss(
+                x=micro_x,
+                y=micro_y,
+                y_pred=y_pred,
+                sample_weight=micro_sample_weight,
+                training=True,
+            )
+            self._loss_tracker.update_state(loss, sample_weight=size)
+            if self.trainable_weights:
+                if self.optimizer is not None:
+                    loss = self.optimizer.scale_loss(loss)
+                (loss * (size / batch_size)).backward()
+            logs = self.compute_metrics(
+                micro_x, micro_y, y_pred, sample_weight=micro_sample_weight
+            )
+
+        if self.trainable_weights:
+            trainable_weights = self.trainable_weights[:]
+            gradients = [v.value.grad for v in trainable_weights]
+            with torch.no_grad():
+                gradients = self._all_reduce_gradients(gradients)
+                self.optimizer.apply(gradients, trainable_weights)
+        else:
+            warnings.warn("The model does not have any trainable weights.")
+        return logs
+
+    def _is_data_parallel(self):
+        distribution = distribution_lib.distribution()
+        return isinstance(
+            distribution, distribution_lib.DataParallel
+        ) and getattr(distribution, "_is_multi_process", False)
+
+    def _all_reduce_gradients(self, gradients):
+        """Averages the gradients across processes with data parallelism."""
+        if not self._is_data_parallel():
+            return gradients
+        return torch_distribution_lib.all_reduce_gradients(gradients)
+
     def test_step(self, data):
         (
             x,
@@ -182,11 +258,13 @@ class TorchTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        micro_batch_size=None,
     ):
         if not self.compiled:
             raise ValueError(
                 "You must call `compile()` before calling `fit()`."
             )
+        self._set_micro_batch_size(micro_batch_size)
 
         # TODO: respect compiled trainable state
         self._eval_epoch_iterator = None
@@ -222,6 +300,9 @@ class TorchTrainer(base_trainer.Trainer):
 
         self._symbolic_build(iterator=epoch_iterator)
         epoch_iterator.reset()
+        if self._is_data_parallel():
+            # Start all the replicas from the variables of the first process.
+            torch_distribution_lib.broadcast_variables(self.variables)
 
         # Container that configures and calls callbacks.
         if not isinstance(callbacks, callbacks_module.CallbackList):
@@ -250,6 +331,7 @@ class TorchTrainer(base_trainer.Trainer):
             self.train()
 
             logs = {}
+            last_step = last_logged_step = -1
             for step, data in epoch_iterator:
                 # Callbacks
                 callbacks.on_train_batch_begin(step)
@@ -257,9 +339,15 @@ class TorchTrainer(base_trainer.Trainer):
                 logs = self.train_function(data)
 
                 # Callbacks
-                callbacks.on_train_batch_end(step, logs)
+                last_step = step
+                if step - last_logged_step >= self.log_every_n_steps:
+                    callbacks.on_train_batch_end(step, logs)
+                    last_logged_step = step
                 if self.stop_training:
                     break
+            # The last batch of the epoch is always reported.
+            if last_step > last_logged_step:
+                callbacks.on_train_batch_end(last_step, logs)
 
             # Override with model metrics instead of last step logs if needed.
             epoch_logs = dict(self._get_metrics_result_or_logs(logs))
@@ -384,8 +472,49 @@ class TorchTrainer(base_trainer.Trainer):
 
     @traceback_utils.filter_traceback
     def predict(
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
+    ):
+        batches = self._predict_batches(
+            x,
+            batch_size=batch_size,
+            verbose=verbose,
+            steps=steps,
+            callbacks=callbacks,
+        )
+        if output_path is not None:
+            return self._write_predict_outputs(batches, output_path)
+
+        def append_to_outputs(batch_outputs, outputs):
+            if outputs is None:
+                outputs = tree.map_structure(
+                    lambda batch_output: [batch_output],
+                    batch_outputs,
+                )
+            else:
+                tree.map_structure_up_to(
+                    batch_outputs,
+                    lambda output, batch_output: output.append(batch_output),
+                    outputs,
+                    batch_outputs,
+                )
+            return outputs
+
+        outputs = None
+        for batch_outputs in batches:
+            outputs = append_to_outputs(batch_outputs, outputs)
+        outputs = tree.map_structure(backend.convert_to_numpy, outputs)
+        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
+
+    def _predict_batches(
         self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
     ):
+        """Yields the outputs of each execution of the predict function."""
         # Create an iterator that yields batches of input data.
         epoch_iterator = TorchEpochIterator(
             x=x,
@@ -407,38 +536,20 @@ class TorchTrainer(base_trainer.Trainer):
                 model=self,
             )
 
-        def append_to_outputs(batch_outputs, outputs):
-            if outputs is None:
-                outputs = tree.map_structure(
-                    lambda batch_output: [batch_output],
-                    batch_outputs,
-                )
-            else:
-                tree.map_structure_up_to(
-                    batch_outputs,
-                    lambda output, batch_output: output.append(batch_output),
-                    outputs,
-                    batch_outputs,
-                )
-            return outputs
-
         # Switch the torch Module back to testing mode.
         self.eval()
 
         self.make_predict_function()
         self.stop_predicting = False
         callbacks.on_predict_begin()
-        outputs = None
         for step, data in epoch_iterator:
             callbacks.on_predict_batch_begin(step)
             batch_outputs = self.predict_function(data)
-            outputs = append_to_outputs(batch_outputs, outputs)
             callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+            yield batch_outputs
             if self.stop_predicting:
                 break
         callbacks.on_predict_end()
-        outputs = tree.map_structure(backend.convert_to_numpy, outputs)
-        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
 
     def train_on_batch(
         self,
@@ -461,7 +572,7 @@ class TorchTrainer(base_trainer.Trainer):
                 y, class_weight
             )
 
-        data = (x, y, sample_weight)
+        data = data_adapter_utils.pack_x_y_sample_weight(x, y, sample_weight)
 
         # Maybe build model
         self._symbolic_build(data_batch=data)
@@ -482,7 +593,7 @@ class TorchTrainer(base_trainer.Trainer):
     ):
         self._assert_compile_called("test_on_batch")
 
-        data = (x, y, sample_weight)
+        data = data_adapter_utils.pack_x_y_sample_weight(x, y, sample_weight)
 
         # Maybe build model
         self._symbolic_build(data_batch=data)
@@ -184,22 +184,22 @@ class CallbackList(Callback):
             self._on_predict_batch_end(batch, logs)
 
     def _on_batch_end(self, batch, logs=None):
-        logs = python_utils.pythonify_logs(logs)
+        logs = python_utils.LazyLogs(logs)
         for callback in self.callbacks:
             callback.on_batch_end(batch, logs=logs)
 
     def _on_train_batch_end(self, batch, logs=None):
-        logs = python_utils.pythonify_logs(logs)
+        logs = python_utils.LazyLogs(logs)
         for callback in self.callbacks:
             callback.on_train_batch_end(batch, logs=logs)
 
     def _on_test_batch_end(self, batch, logs=None):
-        logs = python_utils.pythonify_logs(logs)
+        logs = python_utils.LazyLogs(logs)
         for callback in self.callbacks:
             callback.on_test_batch_end(batch, logs=logs)
 
     def _on_predict_batch_end(self, batch, logs=None):
-        logs = python_utils.pythonify_logs(logs)
+        logs = python_utils.LazyLogs(logs)
         for callback in self.callbacks:
             callback.on_predict_batch_end(batch, logs=logs)
 
@@ -348,11 +348,12 @@ class Distribution:
 
         Args:
             dataset: the original global dataset instance. Only
-            `tf.data.Dataset` is supported at the moment.
+            `tf.data.Dataset` is supported at the moment, as well as
+            `torch.utils.data.DataLoader` with the PyTorch backend.
 
         Returns:
-            a sharded `tf.data.Dataset` instance, which will produce data for
-            the current local worker/process.
+            a sharded dataset instance of the same type, which will produce
+            data for the current local worker/process.
         """
         raise NotImplementedError()
 
@@ -382,14 +383,41 @@ class DataParallel(Distribution):
     will be used to detect any available devices and create a 1D mesh from
     them.
 
+    With the PyTorch backend, each process holds a replica of the model and
+    the gradients are averaged across processes with `torch.distributed` at
+    each training step. Call `keras.distribution.initialize()` first, e.g.
+    in a script launched with `torchrun --nproc_per_node=4 train.py`, which
+    uses the `"gloo"` backend to train on the cores of a CPU host. Only
+    arrays, `torch.utils.data.DataLoader` and `tf.data.Dataset` inputs
+    are supported, and each process trains on a different shard of them.
+    The batch size is global: each process uses `batch_size / num_processes`
+    samples per step. The metrics are not reduced across processes: the
+    logs of `fit()` and `evaluate()` only report the metrics of the shard
+    of the current process.
+
     Args:
         device_mesh: Optional `DeviceMesh` instance.
         devices: Optional list of devices.
         auto_shard_dataset: Automatically shard the dataset amongst processes.
             Defaults to true.
+        shard_optimizer_states: If `True`, the variables created by the
+            optimizer (e.g. momentums) are sharded along the data parallel
+            axis instead of being replicated on every device, in the spirit
+            of ZeRO stage 1. Each device then only updates its shard of
+            the optimizer state, and the updated model variables are
+            all-gathered. This reduces the optimizer memory per device by
+            the number of replicas. Each optimizer variable is sharded along
+            its first dimension divisible by the number of replicas, and
+            replicated if there is none. Defaults to `False`.
     """
 
-    def __init__(self, device_mesh=None, devices=None, auto_shard_dataset=True):
+    def __init__(
+        self,
+        device_mesh=None,
+        devices=None,
+        auto_shard_dataset=True,
+        shard_optimizer_states=False,
+    ):
         if device_mesh:
             self._initialize_with_device_mesh(device_mesh)
         elif devices:
@@ -403,6 +431,7 @@ class DataParallel(Distribution):
         self._process_id = distribution_lib.process_id()
         self._is_multi_process = self._num_process > 1
         self._auto_shard_dataset = auto_shard_dataset
+        self._shard_optimizer_states = shard_optimizer_states
 
     def _initialize_with_device_mesh(self, device_mesh):
         if not isinstance(device_mesh, DeviceMesh):
@@ -444,6 +473,12 @@ class DataParallel(Distribution):
 
     def get_variable_layout(self, variable):
         variable_shard_spec = [None] * len(variable.shape)
+        if self._shard_optimizer_states and _in_optimizer_scope():
+            num_replicas = self.device_mesh.shape[0]
+            for i, dim in enumerate(variable.shape):
+                if dim >= num_replicas and dim % num_replicas == 0:
+                    variable_shard_spec[i] = self._batch_dim_name
+                    break
         return TensorLayout(variable_shard_spec, self.device_mesh)
 
     def get_tensor_layout(self, path):
@@ -451,6 +486,9 @@ class DataParallel(Distribution):
         return None
 
     def distribute_dataset(self, dataset):
+        if _is_torch_dataloader(dataset):
+            return self._distribute_torch_dataloader(dataset)
+
         from tensorflow.python.data.experimental.ops import (
             distribute as tf_data_distribute,
         )
@@ -487,6 +525,90 @@ class DataParallel(Distribution):
         )
         return distributed_dataset.prefetch(tf.data.AUTOTUNE)
 
+    def _distribute_torch_dataloader(self, dataloader):
+        import torch
+
+        if not self._is_multi_process or not self._auto_shard_dataset:
+            return dataloader
+
+        if (
+            isinstance(dataloader.dataset, torch.utils.data.IterableDataset)
+            or dataloader.batch_size is None
+        ):
+            raise ValueError(
+                "Only a `torch.utils.data.DataLoader` over a map-style "
+                "dataset and with a `batch_size` can be sharded. Shard the "
+                "data in each process instead, and pass "
+                "`auto_shard_dataset=False` to the distribution."
+            )
+        if dataloader.batch_size % self._num_process:
+            raise ValueError(
+                "The batch size of the input `DataLoader` should be "
+                "divisible by the number of processes. Received: "
+                f"batch_size={dataloader.batch_size}, "
+                f"num_processes={self._num_process}"
+            )
+        # Every process draws the same permutation for a given epoch, and
+        # keeps its own subset of it. The last samples are dropped so that
+        # all the processes run the same number of steps.
+        sampler = torch.utils.data.DistributedSampler(
+            dataloader.dataset,
+            num_replicas=self._num_process,
+            rank=self._process_id,
+            shuffle=isinstance(
+                dataloader.sampler, torch.utils.data.RandomSampler
+            ),
+            drop_last=True,
+        )
+        return torch.utils.data.DataLoader(
+            dataloader.dataset,
+            batch_size=dataloader.batch_size // self._num_process,
+            sampler=sampler,
+            num_workers=dataloader.num_workers,
+            collate_fn=dataloader.collate_fn,
+            pin_memory=dataloader.pin_memory,
+            drop_last=dataloader.drop_last,
+            timeout=dataloader.timeout,
+            worker_init_fn=dataloader.worker_init_fn,
+        )
+
+    def _distribute_arrays(self, arrays, batch_size):
+        """Returns the shard of the arrays of the current process.
+
+        Args:
+            arrays: Nested structure of arrays with the same first dimension.
+            batch_size: The global batch size, or `None`.
+
+        Returns:
+            A tuple `(arrays, batch_size)` with the sharded arrays and the
+            batch size of the current process.
+        """
+        from keras.src import tree
+        from keras.src.trainers.data_adapters import array_slicing
+
+        if not self._is_multi_process or not self._auto_shard_dataset:
+            return arrays, batch_size
+
+        if batch_size is not None:
+            if batch_size % self._num_process:
+                raise ValueError(
+                    "The batch size should be divisible by the number of "
+                    f"processes. Received: batch_size={batch_size}, "
+                    f"num_processes={self._num_process}"
+                )
+            batch_size //= self._num_process
+        num_samples = tree.flatten(arrays)[0].shape[0]
+        # The last samples are dropped so that all the processes run the same
+        # number of steps.
+        shard_size = num_samples // self._num_process
+        start = self._process_id * shard_size
+        sliceables = array_slicing.convert_to_sliceable(arrays)
+        arrays = tree.map_structure(
+            lambda x: None if x is None else x[start : start + shard_size],
+            sliceables,
+        )
+        return arrays, batch_size
+
 
 @keras_export("keras.distribution.ModelParallel")
 class ModelParallel(Distribution):
@@ -606,6 +728,13 @@ class ModelParallel(Distribution):
         return self._layout_map[path]
 
     def distribute_dataset(self, dataset):
+        if _is_torch_dataloader(dataset):
+            raise ValueError(
+                "`ModelParallel` does not support sharding a "
+                "`torch.utils.data.DataLoader`. Use the `DataParallel` "
+                "distribution with the PyTorch backend instead."
+            )
+
         from tensorflow.python.data.experimental.ops import (
             distribute as tf_data_distribute,
         )
@@ -802,6 +931,26 @@ class LayoutMap(collections.abc.MutableMapping):
 LayoutMap.get.__doc__ = LayoutMap.__getitem__.__doc__
 
 
+def _is_torch_dataloader(x):
+    for parent in type(x).__mro__:
+        if parent.__name__ == "DataLoader" and "torch.utils.data" in str(
+            parent.__module__
+        ):
+            return True
+    return False
+
+
+def _in_optimizer_scope():
+    """Whether the variables being created belong to an optimizer."""
+    from keras.src.optimizers.base_optimizer import BaseOptimizer
+
+    name_scope_stack = global_state.get_global_attribute("name_scope_stack")
+    return any(
+        isinstance(scope.caller, BaseOptimizer)
+        for scope in name_scope_stack or []
+    )
+
+
 @keras_export("keras.distribution.distribute_tensor")
 def distribute_tensor(tensor, layout):
     """Change the layout of a Tensor value in the jit function execution.
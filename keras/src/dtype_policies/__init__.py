@@ -6,6 +6,8 @@ from keras.src.dtype_policies.dtype_policy import DTypePolicy
 from keras.src.dtype_policies.dtype_policy import FloatDTypePolicy
 from keras.src.dtype_policies.dtype_policy import QuantizedDTypePolicy
 from keras.src.dtype_policies.dtype_policy import QuantizedFloat8DTypePolicy
+from keras.src.dtype_policies.dtype_policy import QuantizedInt4DTypePolicy
+from keras.src.dtype_policies.dtype_policy import QuantizedInt8DTypePolicy
 from keras.src.dtype_policies.dtype_policy_map import DTypePolicyMap
 
 ALL_OBJECTS = {
@@ -13,6 +15,8 @@ ALL_OBJECTS = {
     FloatDTypePolicy,
     QuantizedDTypePolicy,
     QuantizedFloat8DTypePolicy,
+    QuantizedInt4DTypePolicy,
+    QuantizedInt8DTypePolicy,
     DTypePolicyMap,
 }
 ALL_OBJECTS_DICT = {cls.__name__: cls for cls in ALL_OBJECTS}
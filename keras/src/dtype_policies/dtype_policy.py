@@ -3,7 +3,7 @@ from keras.src import ops
 from keras.src.api_export import keras_export
 from keras.src.backend.common import global_state
 
-QUANTIZATION_MODES = ("int8", "float8")
+QUANTIZATION_MODES = ("int8", "float8", "int4")
 
 
 @keras_export(
@@ -256,6 +256,50 @@ class QuantizedDTypePolicy(DTypePolicy):
             )
 
 
+@keras_export("keras.dtype_policies.QuantizedInt8DTypePolicy")
+class QuantizedInt8DTypePolicy(QuantizedDTypePolicy):
+    """Dtype policy for int8 quantization with optional static input scales.
+
+    By default, int8 layers quantize their inputs dynamically, computing an
+    input scale from the absolute maximum of the inputs at every call. With
+    `static_inputs=True`, layers that support it (`Dense` and `EinsumDense`)
+    instead use a fixed, per-tensor input scale stored in an `inputs_scale`
+    variable, typically calibrated with
+    `Model.quantize("int8", calibration_data=...)`.
+
+    Args:
+        mode: The quantization mode. Must be `"int8"`.
+        source_name: The name of the source dtype policy, e.g. `"float32"`.
+            Defaults to the global dtype policy.
+        static_inputs: Whether the input scales are static. Defaults to
+            `False`.
+    """
+
+    def __init__(self, mode, source_name=None, static_inputs=False):
+        super().__init__(mode=mode, source_name=source_name)
+        if mode != "int8":
+            raise ValueError(
+                "`QuantizedInt8DTypePolicy` only supports mode='int8'. "
+                f"Received: mode={mode}"
+            )
+        self._static_inputs = bool(static_inputs)
+
+    @property
+    def static_inputs(self):
+        """Whether the layers use static (calibrated) input scales."""
+        return self._static_inputs
+
+    def __eq__(self, other):
+        if super().__eq__(other) is False:
+            return False
+        return self._static_inputs == other._static_inputs
+
+    def get_config(self):
+        config = super().get_config()
+        config.update({"static_inputs": self.static_inputs})
+        return config
+
+
 @keras_export("keras.dtype_policies.QuantizedFloat8DTypePolicy")
 class QuantizedFloat8DTypePolicy(QuantizedDTypePolicy):
     default_amax_history_length = 1024
@@ -288,6 +332,50 @@ class QuantizedFloat8DTypePolicy(QuantizedDTypePolicy):
         return config
 
 
+@keras_export("keras.dtype_policies.QuantizedInt4DTypePolicy")
+class QuantizedInt4DTypePolicy(QuantizedDTypePolicy):
+    """Dtype policy for weight-only int4 quantization.
+
+    Weights are quantized symmetrically to 4 bits and stored two values per
+    int8 byte. They are dequantized to the compute dtype inside the layer's
+    call, right before the matmul.
+
+    Args:
+        mode: The quantization mode. Must be `"int4"`.
+        source_name: The name of the source dtype policy, e.g. `"float32"`.
+            Defaults to the global dtype policy.
+        group_size: The number of consecutive weights along the reduction
+            axis sharing a scale. If `None`, a single scale is used per output
+            channel. Defaults to `None`.
+    """
+
+    def __init__(self, mode, source_name=None, group_size=None):
+        super().__init__(mode=mode, source_name=source_name)
+        if group_size is not None and (
+            not isinstance(group_size, int) or group_size < 1
+        ):
+            raise ValueError(
+                "`group_size` must be `None` or a positive integer. "
+                f"Received: group_size={group_size}"
+            )
+        self._group_size = group_size
+
+    @property
+    def group_size(self):
+        """The number of weights sharing a scale, or `None`."""
+        return self._group_size
+
+    def __eq__(self, other):
+        if super().__eq__(other) is False:
+            return False
+        return self._group_size == other._group_size
+
+    def get_config(self):
+        config = super().get_config()
+        config.update({"group_size": self.group_size})
+        return config
+
+
 @keras_export(
     [
         "keras.config.set_dtype_policy",
@@ -354,5 +442,7 @@ def _get_quantized_dtype_policy_by_str(policy):
         return QuantizedDTypePolicy(mode, source_name)
     elif policy.startswith("float8"):
         return QuantizedFloat8DTypePolicy(mode, source_name)
+    elif policy.startswith("int4"):
+        return QuantizedInt4DTypePolicy(mode, source_name)
     else:
         raise NotImplementedError
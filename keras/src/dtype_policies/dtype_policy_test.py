@@ -7,6 +7,8 @@ from keras.src.dtype_policies.dtype_policy import DTypePolicy
 from keras.src.dtype_policies.dtype_policy import FloatDTypePolicy
 from keras.src.dtype_policies.dtype_policy import QuantizedDTypePolicy
 from keras.src.dtype_policies.dtype_policy import QuantizedFloat8DTypePolicy
+from keras.src.dtype_policies.dtype_policy import QuantizedInt4DTypePolicy
+from keras.src.dtype_policies.dtype_policy import QuantizedInt8DTypePolicy
 from keras.src.dtype_policies.dtype_policy import dtype_policy
 from keras.src.dtype_policies.dtype_policy import set_dtype_policy
 from keras.src.testing import test_case
@@ -477,6 +479,44 @@ class QuantizedDTypePolicyTest(test_case.TestCase):
         if mode == "float8":
             self.assertEqual(copied_policy.amax_history_length, 123)
 
+    def test_serialization_for_int4(self):
+        policy = QuantizedInt4DTypePolicy(
+            mode="int4", source_name="mixed_bfloat16", group_size=128
+        )
+        config = serialize(policy)
+        reloaded_policy = deserialize(config)
+        self.assertEqual(policy, reloaded_policy)
+        self.assertEqual(reloaded_policy.group_size, 128)
+
+        # Test `dtype_policies.get`
+        self.assertEqual(get(config), policy)
+        policy = get("int4_from_float32")
+        self.assertIsInstance(policy, QuantizedInt4DTypePolicy)
+        self.assertIsNone(policy.group_size)
+        self.assertNotEqual(
+            policy,
+            QuantizedInt4DTypePolicy("int4", "float32", group_size=64),
+        )
+
+        with self.assertRaisesRegex(ValueError, "must be `None` or a positive"):
+            QuantizedInt4DTypePolicy("int4", "float32", group_size=0)
+
+    def test_serialization_for_static_int8(self):
+        policy = QuantizedInt8DTypePolicy(
+            mode="int8", source_name="mixed_bfloat16", static_inputs=True
+        )
+        config = serialize(policy)
+        reloaded_policy = deserialize(config)
+        self.assertEqual(policy, reloaded_policy)
+        self.assertTrue(reloaded_policy.static_inputs)
+        self.assertEqual(get(config), policy)
+        self.assertNotEqual(
+            policy, QuantizedInt8DTypePolicy("int8", "mixed_bfloat16")
+        )
+
+        with self.assertRaisesRegex(ValueError, "only supports mode='int8'"):
+            QuantizedInt8DTypePolicy("int4", "float32")
+
     def test_serialization_for_float8(self):
         policy = QuantizedFloat8DTypePolicy(
             mode="float8", source_name="mixed_float16"
@@ -511,6 +551,7 @@ class QuantizedDTypePolicyTest(test_case.TestCase):
     @parameterized.named_parameters(
         ("int8_from_mixed_bfloat16", "int8_from_mixed_bfloat16"),
         ("float8_from_mixed_bfloat16", "float8_from_mixed_bfloat16"),
+        ("int4_from_mixed_bfloat16", "int4_from_mixed_bfloat16"),
     )
     def test_get_quantized_dtype_policy_by_str(self, name):
         from keras.src.dtype_policies.dtype_policy import (
@@ -22,6 +22,7 @@ from keras.src.layers.convolutional.depthwise_conv2d import DepthwiseConv2D
 from keras.src.layers.convolutional.separable_conv1d import SeparableConv1D
 from keras.src.layers.convolutional.separable_conv2d import SeparableConv2D
 from keras.src.layers.core.dense import Dense
+from keras.src.layers.core.dense_crossentropy import DenseCrossentropy
 from keras.src.layers.core.einsum_dense import EinsumDense
 from keras.src.layers.core.embedding import Embedding
 from keras.src.layers.core.identity import Identity
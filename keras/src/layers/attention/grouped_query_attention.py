@@ -1,12 +1,19 @@
 import math
 
 from keras.src import constraints
+from keras.src import dtype_policies
 from keras.src import initializers
 from keras.src import ops
 from keras.src import regularizers
 from keras.src.api_export import keras_export
 from keras.src.backend.config import is_flash_attention_enabled
 from keras.src.layers.activations.softmax import Softmax
+from keras.src.layers.attention.multi_head_attention import (
+    _int8_query_key_product,
+)
+from keras.src.layers.attention.multi_head_attention import (
+    _int8_scores_value_product,
+)
 from keras.src.layers.core.einsum_dense import EinsumDense
 from keras.src.layers.layer import Layer
 from keras.src.layers.regularization.dropout import Dropout
@@ -181,9 +188,14 @@ class GroupedQueryAttention(Layer):
         )
         self._value_dense.build(value_shape)
 
-        self._softmax = Softmax(axis=-1, dtype=self.dtype_policy)
+        # Softmax and dropout have no weights, so they never use a quantized
+        # dtype policy.
+        dtype = self.dtype_policy
+        if self.quantization_mode is not None:
+            dtype = self.compute_dtype
+        self._softmax = Softmax(axis=-1, dtype=dtype)
         self._dropout_layer = Dropout(
-            rate=self.dropout, dtype=self.dtype_policy, seed=self.seed
+            rate=self.dropout, dtype=dtype, seed=self.seed
         )
 
         self._dot_product_equation = "bquh,bkuh->buqk"
@@ -199,6 +211,8 @@ class GroupedQueryAttention(Layer):
         self._output_dense.build(
             (None, None, self.num_query_heads, self.head_dim)
         )
+        if self.quantization_mode is not None:
+            self._is_quantized = True
         self.built = True
 
     def _get_common_kwargs_for_sublayer(self):
@@ -385,9 +399,15 @@ class GroupedQueryAttention(Layer):
                 " attention scores."
             )
 
+        # The int8 attention products are only used by quantized layers.
+        use_int8_attention = (
+            self.quantization_mode == "int8" and not self._flash_attention
+        )
+
         # Determine whether to use dot-product attention
         use_dot_product_attention = not (
-            self.dropout > 0.0
+            use_int8_attention
+            or self.dropout > 0.0
             or self._return_attention_scores
             or (len(query.shape) != 4)
         )
@@ -426,9 +446,12 @@ class GroupedQueryAttention(Layer):
         )
         # Take the dot product between "query" and "key" to get the raw
         # attention scores.
-        scores = ops.einsum(
-            self._dot_product_equation, query, key
-        )  # (batch_dim, query_heads, target_seq_len, source_seq_len)
+        if use_int8_attention:
+            scores = _int8_query_key_product(query, key, self.compute_dtype)
+        else:
+            scores = ops.einsum(
+                self._dot_product_equation, query, key
+            )  # (batch_dim, query_heads, target_seq_len, source_seq_len)
         scores = self._masked_softmax(scores, attention_mask=attention_mask)
         # This is actually dropping out entire tokens to attend to, which might
         # seem a bit unusual, but is taken from the original Transformer paper.
@@ -436,7 +459,12 @@ class GroupedQueryAttention(Layer):
             scores_dropout = self._dropout_layer(scores, training=training)
         else:
             scores_dropout = scores
-        output = ops.einsum(self._combine_equation, scores_dropout, value)
+        if use_int8_attention:
+            output = _int8_scores_value_product(
+                scores_dropout, value, self.compute_dtype
+            )
+        else:
+            output = ops.einsum(self._combine_equation, scores_dropout, value)
         return output, scores
 
     def _masked_softmax(self, scores, attention_mask=None):
@@ -453,6 +481,42 @@ class GroupedQueryAttention(Layer):
                 )
         return self._softmax(scores, mask=attention_mask)
 
+    def quantize(self, mode, type_check=True):
+        # Prevent quantization of the subclasses
+        if type_check and (type(self) is not GroupedQueryAttention):
+            raise self._not_implemented_error(self.quantize)
+        if mode not in ("int8", "int4"):
+            raise self._quantization_mode_error(mode)
+
+        for layer in (
+            self._query_dense,
+            self._key_dense,
+            self._value_dense,
+            self._output_dense,
+        ):
+            if layer.quantization_mode is None:
+                layer.quantize(mode, type_check=type_check)
+        self._is_quantized = True
+
+        # Set new dtype policy
+        if self.dtype_policy.quantization_mode is None:
+            policy = dtype_policies.get(f"{mode}_from_{self.dtype_policy.name}")
+            self.dtype_policy = policy
+
+    def _quantization_mode_error(self, mode):
+        return NotImplementedError(
+            "Invalid quantization mode. Expected one of ('int8', 'int4'). "
+            f"Received: quantization_mode={mode}"
+        )
+
+    def _int8_call(self, *args, **kwargs):
+        # The int8 attention products are dispatched in `_compute_attention`.
+        return self.call(*args, **kwargs)
+
+    def _int4_call(self, *args, **kwargs):
+        # Only the projections are quantized to int4 (weight-only).
+        return self.call(*args, **kwargs)
+
     def compute_output_shape(
         self,
         query_shape,
@@ -359,6 +359,22 @@ class GroupedQueryAttentionTest(testing.TestCase):
             self.assertAllClose(output, expected_output, atol=1e-2)
             self.assertAllClose(scores, expected_score, atol=1e-2)
 
+    def test_quantize_int8(self):
+        query = np.random.random((2, 4, 8)).astype("float32")
+        value = np.random.random((2, 6, 8)).astype("float32")
+        layer = layers.GroupedQueryAttention(
+            num_query_heads=4, num_key_value_heads=2, head_dim=4
+        )
+        y_float = layer(query, value)
+        layer.quantize("int8")
+
+        self.assertEqual(layer.dtype_policy.name, "int8_from_float32")
+        self.assertDType(layer._key_dense._kernel, "int8")
+        y_quantized, scores = layer(query, value, return_attention_scores=True)
+        self.assertEqual(scores.shape, (2, 4, 4, 6))
+        self.assertAllClose(y_float, y_quantized, atol=0.05)
+        self.assertAllClose(y_float, layer(query, value), atol=0.05)
+
     def test_flash_attention_with_errors(self):
         if backend.backend() in ("numpy", "tensorflow"):
             pytest.skip(
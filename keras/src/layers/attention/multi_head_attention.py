@@ -5,8 +5,10 @@ import numpy as np
 
 from keras.src import backend
 from keras.src import constraints
+from keras.src import dtype_policies
 from keras.src import initializers
 from keras.src import ops
+from keras.src import quantizers
 from keras.src import regularizers
 from keras.src.api_export import keras_export
 from keras.src.backend.config import is_flash_attention_enabled
@@ -300,6 +302,8 @@ class MultiHeadAttention(Layer):
         )
         output_dense_input_shape[-1] = self._value_dim
         self._output_dense.build(tuple(output_dense_input_shape))
+        if self.quantization_mode is not None:
+            self._is_quantized = True
         self.built = True
 
     @property
@@ -391,9 +395,14 @@ class MultiHeadAttention(Layer):
                 attn_scores_rank - len(self._attention_axes), attn_scores_rank
             )
         )
-        self._softmax = Softmax(axis=norm_axes, dtype=self.dtype_policy)
+        # Softmax and dropout have no weights, so they never use a quantized
+        # dtype policy.
+        dtype = self.dtype_policy
+        if self.quantization_mode is not None:
+            dtype = self.compute_dtype
+        self._softmax = Softmax(axis=norm_axes, dtype=dtype)
         self._dropout_layer = Dropout(
-            rate=self._dropout, dtype=self.dtype_policy, seed=self.seed
+            rate=self._dropout, dtype=dtype, seed=self.seed
         )
 
     def _masked_softmax(self, attention_scores, attention_mask=None):
@@ -449,6 +458,15 @@ class MultiHeadAttention(Layer):
                 " attention scores."
             )
 
+        if (
+            self.quantization_mode == "int8"
+            and not self._flash_attention
+            and len(query.shape) == 4
+        ):
+            return self._int8_compute_attention(
+                query, key, value, attention_mask, training
+            )
+
         # Determine whether to use dot-product attention
         use_dot_product_attention = not (
             self._dropout > 0.0
@@ -541,13 +559,13 @@ class MultiHeadAttention(Layer):
         #   H = `size_per_head`
 
         # `query` = [B, T, N ,H]
-        query = self._query_dense.call(query)
+        query = self._call_sublayer(self._query_dense, query)
 
         # `key` = [B, S, N, H]
-        key = self._key_dense.call(key)
+        key = self._call_sublayer(self._key_dense, key)
 
         # `value` = [B, S, N, H]
-        value = self._value_dense.call(value)
+        value = self._call_sublayer(self._value_dense, value)
         attention_output, attention_scores = self._compute_attention(
             query,
             key,
@@ -555,12 +573,96 @@ class MultiHeadAttention(Layer):
             attention_mask,
             training,
         )
-        attention_output = self._output_dense.call(attention_output)
+        attention_output = self._call_sublayer(
+            self._output_dense, attention_output
+        )
 
         if return_attention_scores:
             return attention_output, attention_scores
         return attention_output
 
+    def _call_sublayer(self, layer, inputs):
+        # The projections are called with `call()` to skip the overhead of
+        # `Layer.__call__()`, so quantized sublayers are dispatched here.
+        if layer.quantization_mode is not None:
+            return layer.quantized_call(inputs)
+        return layer.call(inputs)
+
+    def quantize(self, mode, type_check=True):
+        # Prevent quantization of the subclasses
+        if type_check and (type(self) is not MultiHeadAttention):
+            raise self._not_implemented_error(self.quantize)
+        if mode not in ("int8", "int4"):
+            raise self._quantization_mode_error(mode)
+
+        for layer in (
+            self._query_dense,
+            self._key_dense,
+            self._value_dense,
+            self._output_dense,
+        ):
+            if layer.quantization_mode is None:
+                layer.quantize(mode, type_check=type_check)
+        self._is_quantized = True
+
+        # Set new dtype policy
+        if self.dtype_policy.quantization_mode is None:
+            policy = dtype_policies.get(f"{mode}_from_{self.dtype_policy.name}")
+            self.dtype_policy = policy
+
+    def _quantization_mode_error(self, mode):
+        return NotImplementedError(
+            "Invalid quantization mode. Expected one of ('int8', 'int4'). "
+            f"Received: quantization_mode={mode}"
+        )
+
+    def _int8_call(self, *args, **kwargs):
+        # The int8 attention products are dispatched in `_compute_attention`.
+        return self.call(*args, **kwargs)
+
+    def _int4_call(self, *args, **kwargs):
+        # Only the projections are quantized to int4 (weight-only).
+        return self.call(*args, **kwargs)
+
+    def _int8_compute_attention(
+        self,
+        query,
+        key,
+        value,
+        attention_mask=None,
+        training=None,
+    ):
+        """Computes the attention products with int8 operands.
+
+        Used in place of the default path of `_compute_attention` for rank 4
+        inputs when the layer is quantized to int8. The query-key and
+        probabilities-value products are computed as int8 einsums with int32
+        accumulation. Queries and keys are quantized with one scale per token
+        and head, the attention probabilities with one scale per query token
+        and head, and values with one scale per channel and head.
+
+        Rounding has no gradient, so this path is meant for inference.
+        """
+        query = ops.multiply(
+            query, ops.cast(self._inverse_sqrt_key_dim, query.dtype)
+        )
+        attention_scores = _int8_query_key_product(
+            query, key, self.compute_dtype
+        )
+        attention_scores = self._masked_softmax(
+            attention_scores, attention_mask
+        )
+        if self._dropout > 0.0:
+            final_attn_scores = self._dropout_layer(
+                attention_scores, training=training
+            )
+        else:
+            final_attn_scores = attention_scores
+        attention_output = _int8_scores_value_product(
+            final_attn_scores, value, self.compute_dtype
+        )
+        return attention_output, attention_scores
+
     def _compute_attention_mask(
         self,
         query,
@@ -716,6 +818,29 @@ class MultiHeadAttention(Layer):
         return output_spec
 
 
+def _int8_query_key_product(query, key, compute_dtype):
+    """Computes `einsum("btnh,bsnh->bnts", query, key)` in int8."""
+    query, query_scale = quantizers.abs_max_quantize(query, axis=-1)
+    key, key_scale = quantizers.abs_max_quantize(key, axis=-1)
+    scores = ops.cast(ops.einsum("btnh,bsnh->bnts", query, key), compute_dtype)
+    # `query_scale` = [B, N, T, 1], `key_scale` = [B, N, 1, S]
+    query_scale = ops.transpose(query_scale, (0, 2, 1, 3))
+    key_scale = ops.transpose(key_scale, (0, 2, 3, 1))
+    return ops.divide(scores, ops.multiply(query_scale, key_scale))
+
+
+def _int8_scores_value_product(scores, value, compute_dtype):
+    """Computes `einsum("bnts,bsnh->btnh", scores, value)` in int8."""
+    scores, scores_scale = quantizers.abs_max_quantize(scores, axis=-1)
+    value, value_scale = quantizers.abs_max_quantize(value, axis=1)
+    outputs = ops.cast(
+        ops.einsum("bnts,bsnh->btnh", scores, value), compute_dtype
+    )
+    # `scores_scale` = [B, T, N, 1], `value_scale` = [B, 1, N, H]
+    scores_scale = ops.transpose(scores_scale, (0, 2, 1, 3))
+    return ops.divide(outputs, ops.multiply(scores_scale, value_scale))
+
+
 def _index_to_einsum_variable(i):
     """Converts an index to a einsum variable name.
 
@@ -588,6 +588,67 @@ class MultiHeadAttentionTest(testing.TestCase):
         self.assertDType(layer._key_dense._kernel, "int8")
         self.assertDType(layer._value_dense._kernel, "int8")
 
+    @parameterized.named_parameters(
+        ("no_dropout", 0.0),
+        ("dropout", 0.1),
+    )
+    def test_quantize_int8(self, dropout):
+        query = np.random.random((2, 4, 8)).astype("float32")
+        value = np.random.random((2, 6, 8)).astype("float32")
+        layer = layers.MultiHeadAttention(
+            num_heads=2, key_dim=4, dropout=dropout
+        )
+        y_float = layer(query, value)
+        layer.quantize("int8")
+
+        # The projections and the attention products are quantized.
+        self.assertEqual(layer.dtype_policy.name, "int8_from_float32")
+        self.assertEqual(layer._softmax.dtype_policy.name, "float32")
+        self.assertDType(layer._query_dense._kernel, "int8")
+        self.assertDType(layer._output_dense._kernel, "int8")
+        y_quantized = layer(query, value)
+        self.assertAllClose(y_float, y_quantized, atol=0.05)
+        y_quantized, scores = layer(query, value, return_attention_scores=True)
+        self.assertEqual(scores.shape, (2, 2, 4, 6))
+        self.assertAllClose(y_float, y_quantized, atol=0.05)
+
+        with self.assertRaisesRegex(ValueError, "already quantized"):
+            layer.quantize("int8")
+
+        # Try saving and reloading the model
+        inputs = layers.Input((4, 8))
+        outputs = layer(inputs, inputs)
+        model = models.Model(inputs, outputs)
+        temp_filepath = os.path.join(self.get_temp_dir(), "quantized.keras")
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertAllClose(
+            model.predict(query, verbose=0), new_model.predict(query, verbose=0)
+        )
+
+    def test_quantize_invalid_mode(self):
+        layer = layers.MultiHeadAttention(num_heads=2, key_dim=4)
+        layer.build((2, 4, 8), (2, 4, 8))
+        with self.assertRaises(NotImplementedError):
+            layer.quantize("float8")
+
+    @parameterized.named_parameters(("int8", "int8"), ("int4", "int4"))
+    def test_model_quantize(self, mode):
+        # `Model.quantize` only quantizes the projections of the layer.
+        query = np.random.random((2, 4, 8)).astype("float32")
+        inputs = layers.Input((4, 8))
+        outputs = layers.MultiHeadAttention(num_heads=2, key_dim=4)(
+            inputs, inputs
+        )
+        model = models.Model(inputs, outputs)
+        y_float = model.predict(query, verbose=0)
+        model.quantize(mode)
+        mha = model.layers[-1]
+        self.assertIsNone(mha.quantization_mode)
+        self.assertEqual(mha._value_dense.quantization_mode, mode)
+        y_quantized = model.predict(query, verbose=0)
+        self.assertAllClose(y_float, y_quantized, atol=0.1)
+
     def test_flash_attention_with_errors(self):
         if backend.backend() in ("numpy", "tensorflow"):
             pytest.skip(
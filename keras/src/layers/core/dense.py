@@ -103,9 +103,10 @@ class Dense(Layer):
         input_dim = input_shape[-1]
         if self.quantization_mode:
             self.quantized_build(input_shape, mode=self.quantization_mode)
-        if self.quantization_mode != "int8":
-            # If the layer is quantized to int8, `self._kernel` will be added
-            # in `self._int8_build`. Therefore, we skip it here.
+        if self.quantization_mode not in ("int8", "int4"):
+            # If the layer is quantized to int8 or int4, `self._kernel` will be
+            # added in `self._int8_build` or `self._int4_build`. Therefore, we
+            # skip it here.
             self._kernel = self.add_weight(
                 name="kernel",
                 shape=(input_dim, self.units),
@@ -134,11 +135,14 @@ class Dense(Layer):
             raise AttributeError(
                 "You must build the layer before accessing `kernel`."
             )
-        if self.lora_enabled:
-            return self._kernel + ops.matmul(
-                self.lora_kernel_a, self.lora_kernel_b
+        kernel = self._kernel
+        if self.quantization_mode == "int4":
+            kernel = quantizers.unpack_int4(
+                kernel, self._orig_kernel_shape[0], axis=0
             )
-        return self._kernel
+        if self.lora_enabled:
+            return kernel + ops.matmul(self.lora_kernel_a, self.lora_kernel_b)
+        return kernel
 
     def call(self, inputs, training=None):
         x = ops.matmul(inputs, self.kernel)
@@ -200,8 +204,10 @@ class Dense(Layer):
         if self.use_bias:
             target_variables.append(self.bias)
         if self.quantization_mode is not None:
-            if self.quantization_mode == "int8":
+            if self.quantization_mode in ("int8", "int4"):
                 target_variables.append(kernel_scale)
+                if self._has_static_inputs_scale():
+                    target_variables.append(self.inputs_scale)
             elif self.quantization_mode == "float8":
                 target_variables.append(self.inputs_scale)
                 target_variables.append(self.inputs_amax_history)
@@ -226,8 +232,10 @@ class Dense(Layer):
         if self.use_bias:
             target_variables.append(self.bias)
         if self.quantization_mode is not None:
-            if self.quantization_mode == "int8":
+            if self.quantization_mode in ("int8", "int4"):
                 target_variables.append(self.kernel_scale)
+                if self._has_static_inputs_scale():
+                    target_variables.append(self.inputs_scale)
             elif self.quantization_mode == "float8":
                 target_variables.append(self.inputs_scale)
                 target_variables.append(self.inputs_amax_history)
@@ -298,7 +306,7 @@ class Dense(Layer):
                 f"Expected: {[v.name for v in all_vars]}"
             )
 
-    # Quantization-related (int8 and float8) methods
+    # Quantization-related (int8, float8 and int4) methods
 
     def quantized_build(self, input_shape, mode):
         if mode == "int8":
@@ -307,6 +315,10 @@ class Dense(Layer):
             self._int8_build(kernel_shape)
         elif mode == "float8":
             self._float8_build()
+        elif mode == "int4":
+            input_dim = input_shape[-1]
+            kernel_shape = (input_dim, self.units)
+            self._int4_build(kernel_shape)
         else:
             raise self._quantization_mode_error(mode)
 
@@ -330,8 +342,24 @@ class Dense(Layer):
             initializer=kernel_scale_initializer,
             trainable=False,
         )
+        if getattr(self.dtype_policy, "static_inputs", False):
+            self._int8_static_inputs_build()
         self._is_quantized = True
 
+    def _int8_static_inputs_build(self, inputs_scale_initializer="ones"):
+        # A single calibrated scale replaces the per-call input scales
+        self.inputs_scale = self.add_weight(
+            name="inputs_scale",
+            shape=(),
+            initializer=inputs_scale_initializer,
+            trainable=False,
+        )
+
+    def _has_static_inputs_scale(self):
+        return self.quantization_mode == "int8" and getattr(
+            self.dtype_policy, "static_inputs", False
+        )
+
     def _float8_build(self):
         from keras.src.dtype_policies import QuantizedFloat8DTypePolicy
 
@@ -383,7 +411,38 @@ class Dense(Layer):
         self.outputs_grad_amax_history.overwrite_with_gradient = True
         self._is_quantized = True
 
+    def _int4_build(
+        self,
+        kernel_shape,
+        kernel_initializer="zeros",
+        kernel_scale_initializer="ones",
+    ):
+        # The kernel is packed along the input dimension, two int4 values per
+        # int8 byte, with one scale per group of `group_size` inputs and unit.
+        group_size = getattr(self.dtype_policy, "group_size", None)
+        input_dim = kernel_shape[0]
+        num_groups = quantizers.int4_num_groups(input_dim, group_size)
+        self._orig_kernel_shape = tuple(kernel_shape)
+        self._kernel = self.add_weight(
+            name="kernel",
+            shape=((input_dim + 1) // 2, self.units),
+            initializer=kernel_initializer,
+            dtype="int8",
+            trainable=False,
+        )
+        self.kernel_scale = self.add_weight(
+            name="kernel_scale",
+            shape=(num_groups, self.units),
+            initializer=kernel_scale_initializer,
+            trainable=False,
+        )
+        self._is_quantized = True
+
     def _int8_call(self, inputs, training=None):
+        static_inputs_scale = None
+        if self._has_static_inputs_scale():
+            static_inputs_scale = ops.convert_to_tensor(self.inputs_scale)
+
         @ops.custom_gradient
         def matmul_with_inputs_gradient(inputs, kernel, kernel_scale):
             def grad_fn(*args, upstream=None):
@@ -396,7 +455,14 @@ class Dense(Layer):
                 inputs_grad = ops.matmul(upstream, ops.transpose(float_kernel))
                 return (inputs_grad, None, None)
 
-            inputs, inputs_scale = self.inputs_quantizer(inputs)
+            if static_inputs_scale is None:
+                inputs, inputs_scale = self.inputs_quantizer(inputs)
+            else:
+                inputs, inputs_scale = quantizers.quantize_with_scale(
+                    inputs,
+                    static_inputs_scale,
+                    value_range=self.inputs_quantizer.value_range,
+                )
             x = ops.matmul(inputs, kernel)
             # De-scale outputs
             x = ops.cast(x, self.compute_dtype)
@@ -418,6 +484,27 @@ class Dense(Layer):
             x = self.activation(x)
         return x
 
+    def _int4_call(self, inputs, training=None):
+        # Weight-only quantization: the kernel is unpacked and dequantized
+        # right before the matmul, which XLA fuses on JAX and TensorFlow.
+        kernel = quantizers.dequantize_int4(
+            self._kernel,
+            self.kernel_scale,
+            self._orig_kernel_shape[0],
+            axis=0,
+            dtype=self.compute_dtype,
+        )
+        x = ops.matmul(inputs, kernel)
+        if self.lora_enabled:
+            lora_x = ops.matmul(inputs, self.lora_kernel_a)
+            lora_x = ops.matmul(lora_x, self.lora_kernel_b)
+            x = ops.add(x, lora_x)
+        if self.bias is not None:
+            x = ops.add(x, self.bias)
+        if self.activation is not None:
+            x = self.activation(x)
+        return x
+
     def _float8_call(self, inputs, training=None):
         if self.lora_enabled:
             raise NotImplementedError(
@@ -527,6 +614,16 @@ class Dense(Layer):
             self._int8_build(kernel_shape, kernel_value, kernel_scale)
         elif mode == "float8":
             self._float8_build()
+        elif mode == "int4":
+            # Quantize `self._kernel` to packed int4 with group-wise scales
+            kernel_value, kernel_scale = quantizers.quantize_int4(
+                self._kernel,
+                axis=0,
+                group_size=getattr(self.dtype_policy, "group_size", None),
+            )
+            kernel_shape = tuple(self._kernel.shape)
+            del self._kernel
+            self._int4_build(kernel_shape, kernel_value, kernel_scale)
         else:
             raise self._quantization_mode_error(mode)
 
@@ -535,7 +632,55 @@ class Dense(Layer):
             policy = dtype_policies.get(f"{mode}_from_{self.dtype_policy.name}")
             self.dtype_policy = policy
 
+    def _freeze_int8_inputs_scale(self, inputs_amax):
+        """Replaces the dynamic input scales with a calibrated static one.
+
+        Args:
+            inputs_amax: The calibrated absolute maximum of the inputs.
+        """
+        if self.quantization_mode != "int8":
+            raise ValueError(
+                "Static input scales require an int8-quantized layer. "
+                f"Received: quantization_mode={self.quantization_mode}"
+            )
+        if self._has_static_inputs_scale():
+            raise ValueError(
+                f"Layer '{self.name}' already uses a static input scale."
+            )
+        inputs_scale = self.inputs_quantizer.value_range[1] / (
+            float(inputs_amax) + self.inputs_quantizer.epsilon
+        )
+        self._tracker.unlock()
+        self._int8_static_inputs_build(initializers.Constant(inputs_scale))
+        self._tracker.lock()
+        self.dtype_policy = dtype_policies.QuantizedInt8DTypePolicy(
+            "int8", self.dtype_policy._source_name, static_inputs=True
+        )
+
     def _get_kernel_with_merged_lora(self):
+        if self.quantization_mode == "int4":
+            kernel_value = self._kernel
+            kernel_scale = self.kernel_scale
+            if self.lora_enabled:
+                # Dequantize & quantize to merge lora weights into int4 kernel
+                # Note that this is a lossy compression
+                kernel_value = quantizers.dequantize_int4(
+                    kernel_value,
+                    kernel_scale,
+                    self._orig_kernel_shape[0],
+                    axis=0,
+                    dtype=self.variable_dtype,
+                )
+                kernel_value = ops.add(
+                    kernel_value,
+                    ops.matmul(self.lora_kernel_a, self.lora_kernel_b),
+                )
+                kernel_value, kernel_scale = quantizers.quantize_int4(
+                    kernel_value,
+                    axis=0,
+                    group_size=getattr(self.dtype_policy, "group_size", None),
+                )
+            return kernel_value, kernel_scale
         if self.dtype_policy.quantization_mode is not None:
             kernel_value = self._kernel
             kernel_scale = self.kernel_scale
@@ -0,0 +1,150 @@
+import numpy as np
+
+from keras.src import backend
+from keras.src import losses
+from keras.src import ops
+from keras.src.api_export import keras_export
+from keras.src.layers.core.dense import Dense
+
+
+@keras_export("keras.layers.DenseCrossentropy")
+class DenseCrossentropy(Dense):
+    """Output projection fused with a sparse categorical cross-entropy.
+
+    This layer holds the same weights as a `Dense` layer without activation.
+    When called with `targets`, it returns the cross-entropy of the
+    projected logits against the integer `targets` without ever
+    materializing the `(..., units)` logits, see
+    `keras.ops.linear_sparse_categorical_crossentropy`. This is mostly useful
+    for the output layer of language models with very large vocabularies.
+    When called without `targets`, it returns the logits like `Dense`.
+
+    With `num_sampled`, the loss is approximated during training with a
+    candidate sampling loss (see `keras.losses.sampled_softmax_loss` and
+    `keras.losses.nce_loss`), whose cost scales with `num_sampled` instead of
+    `units`. The full cross-entropy is still returned outside of training.
+
+    Args:
+        units: Positive integer, the number of classes.
+        use_bias: Boolean, whether the layer uses a bias vector.
+        token_chunk_size: Number of tokens processed at once when computing
+            the loss. Defaults to `1024`.
+        vocab_chunk_size: Number of classes processed at once when computing
+            the loss. Defaults to `32768`.
+        num_sampled: Optional number of candidate classes sampled per batch
+            during training. Defaults to `None`, which computes the full
+            cross-entropy.
+        sampled_loss: The candidate sampling loss used when `num_sampled` is
+            set, either `"softmax"` or `"nce"`. Defaults to `"softmax"`.
+        sampler: The candidate distribution used when `num_sampled` is set.
+            Either `"log_uniform"`, `"uniform"` or a list of `units` class
+            counts. Defaults to `"log_uniform"`.
+        seed: A Python integer to use as random seed for the sampler.
+        **kwargs: Other arguments of `Dense`, except `activation`.
+
+    Input shape:
+        N-D tensor with shape: `(batch_size, ..., input_dim)`, and optionally
+        integer `targets` of shape `(batch_size, ...)`.
+
+    Output shape:
+        With `targets`, the loss of each token, of shape `(batch_size, ...)`.
+        Otherwise, the logits of shape `(batch_size, ..., units)`.
+
+    Example:
+
+    ```python
+    class LanguageModel(keras.Model):
+        def __init__(self, vocab_size, **kwargs):
+            super().__init__(**kwargs)
+            self.embedding = keras.layers.Embedding(vocab_size, 512)
+            self.head = keras.layers.DenseCrossentropy(vocab_size)
+
+        def call(self, token_ids, targets=None):
+            return self.head(self.embedding(token_ids), targets)
+
+        def compute_loss(self, x, y, y_pred, sample_weight=None, **kwargs):
+            return keras.ops.mean(self(x, y))
+    ```
+    """
+
+    def __init__(
+        self,
+        units,
+        use_bias=True,
+        token_chunk_size=1024,
+        vocab_chunk_size=32768,
+        num_sampled=None,
+        sampled_loss="softmax",
+        sampler="log_uniform",
+        seed=None,
+        **kwargs,
+    ):
+        if kwargs.get("activation") is not None:
+            raise ValueError(
+                "`DenseCrossentropy` does not support an activation. "
+                f"Received: activation={kwargs['activation']}"
+            )
+        kwargs.pop("activation", None)
+        super().__init__(units, use_bias=use_bias, **kwargs)
+        if sampled_loss not in ("softmax", "nce"):
+            raise ValueError(
+                "Argument `sampled_loss` must be one of 'softmax' or 'nce'. "
+                f"Received: sampled_loss={sampled_loss}"
+            )
+        self.token_chunk_size = token_chunk_size
+        self.vocab_chunk_size = vocab_chunk_size
+        self.num_sampled = num_sampled
+        self.sampled_loss = sampled_loss
+        if not isinstance(sampler, str):
+            # Keep the class counts serializable.
+            sampler = np.asarray(sampler).tolist()
+        self.sampler = sampler
+        self.seed = seed
+        if num_sampled is not None:
+            self.seed_generator = backend.random.SeedGenerator(seed)
+
+    def call(self, inputs, targets=None, training=None):
+        if targets is None:
+            return super().call(inputs, training=training)
+        if training and self.num_sampled is not None:
+            if self.sampled_loss == "nce":
+                loss_fn = losses.nce_loss
+            else:
+                loss_fn = losses.sampled_softmax_loss
+            return loss_fn(
+                targets,
+                inputs,
+                self.kernel,
+                bias=self.bias,
+                num_sampled=self.num_sampled,
+                sampler=self.sampler,
+                seed=self.seed_generator,
+            )
+        return ops.linear_sparse_categorical_crossentropy(
+            targets,
+            inputs,
+            self.kernel,
+            bias=self.bias,
+            token_chunk_size=self.token_chunk_size,
+            vocab_chunk_size=self.vocab_chunk_size,
+        )
+
+    def compute_output_shape(self, inputs_shape, targets_shape=None):
+        if targets_shape is None:
+            return super().compute_output_shape(inputs_shape)
+        return tuple(inputs_shape[:-1])
+
+    def get_config(self):
+        config = super().get_config()
+        config.pop("activation")
+        config.update(
+            {
+                "token_chunk_size": self.token_chunk_size,
+                "vocab_chunk_size": self.vocab_chunk_size,
+                "num_sampled": self.num_sampled,
+                "sampled_loss": self.sampled_loss,
+                "sampler": self.sampler,
+                "seed": self.seed,
+            }
+        )
+        return config
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import losses
+from keras.src import models
+from keras.src import ops
+from keras.src import optimizers
+from keras.src import testing
+
+
+class DenseCrossentropyTest(testing.TestCase):
+    @pytest.mark.requires_trainable_backend
+    def test_dense_crossentropy_basics(self):
+        self.run_layer_test(
+            layers.DenseCrossentropy,
+            init_kwargs={"units": 10, "vocab_chunk_size": 4},
+            input_shape=(2, 3, 5),
+            expected_output_shape=(2, 3, 10),
+            expected_num_trainable_weights=2,
+            expected_num_non_trainable_weights=0,
+            expected_num_seed_generators=0,
+            expected_num_losses=0,
+            supports_masking=True,
+        )
+
+    def test_activation_not_supported(self):
+        with self.assertRaisesRegex(ValueError, "does not support"):
+            layers.DenseCrossentropy(10, activation="softmax")
+
+    def test_matches_dense_and_crossentropy(self):
+        layer = layers.DenseCrossentropy(
+            20, token_chunk_size=3, vocab_chunk_size=6
+        )
+        inputs = np.random.normal(size=(4, 5, 8)).astype("float32")
+        targets = np.random.randint(0, 20, size=(4, 5))
+        logits = layer(inputs)
+        self.assertEqual(logits.shape, (4, 5, 20))
+        self.assertAllClose(
+            layer(inputs, targets),
+            losses.sparse_categorical_crossentropy(
+                targets, logits, from_logits=True
+            ),
+            atol=1e-5,
+        )
+
+    @pytest.mark.requires_trainable_backend
+    def test_gradients_match_dense_and_crossentropy(self):
+        if backend.backend() == "numpy":
+            self.skipTest("The numpy backend does not support training.")
+
+        class FusedModel(models.Model):
+            def __init__(self):
+                super().__init__()
+                self.head = layers.DenseCrossentropy(
+                    20, token_chunk_size=3, vocab_chunk_size=6
+                )
+
+            def call(self, inputs, targets=None):
+                return self.head(inputs, targets)
+
+            def compute_loss(self, x, y, y_pred, sample_weight=None, **kw):
+                return ops.mean(self(x, y))
+
+        inputs = np.random.normal(size=(8, 5, 8)).astype("float32")
+        targets = np.random.randint(0, 20, size=(8, 5))
+        fused = FusedModel()
+        fused(inputs)
+        reference = models.Sequential([layers.Dense(20)])
+        reference.build((None, 5, 8))
+        reference.set_weights(fused.get_weights())
+
+        fused.compile(optimizer=optimizers.SGD(1.0))
+        reference.compile(
+            optimizer=optimizers.SGD(1.0),
+            loss=losses.SparseCategoricalCrossentropy(from_logits=True),
+        )
+        fused.fit(inputs, targets, batch_size=8, verbose=0)
+        reference.fit(inputs, targets, batch_size=8, verbose=0)
+        for fused_weight, reference_weight in zip(
+            fused.get_weights(), reference.get_weights()
+        ):
+            self.assertAllClose(fused_weight, reference_weight, atol=1e-5)
+
+    @pytest.mark.requires_trainable_backend
+    def test_sampled_loss(self):
+        inputs = np.random.normal(size=(4, 5, 8)).astype("float32")
+        targets = np.random.randint(0, 20, size=(4, 5))
+        for sampled_loss in ("softmax", "nce"):
+            layer = layers.DenseCrossentropy(
+                20, num_sampled=6, sampled_loss=sampled_loss, seed=1
+            )
+            self.assertEqual(
+                layer(inputs, targets, training=True).shape, (4, 5)
+            )
+            # Outside of training, the full cross-entropy is returned.
+            self.assertAllClose(
+                layer(inputs, targets),
+                losses.sparse_categorical_crossentropy(
+                    targets, layer(inputs), from_logits=True
+                ),
+                atol=1e-5,
+            )
+        config = layer.get_config()
+        self.assertEqual(config["num_sampled"], 6)
+        self.assertEqual(config["sampled_loss"], "nce")
+        with self.assertRaisesRegex(ValueError, "sampled_loss"):
+            layers.DenseCrossentropy(20, num_sampled=6, sampled_loss="full")
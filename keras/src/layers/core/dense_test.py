@@ -6,6 +6,7 @@ from absl.testing import parameterized
 
 from keras.src import backend
 from keras.src import constraints
+from keras.src import dtype_policies
 from keras.src import layers
 from keras.src import models
 from keras.src import ops
@@ -331,7 +332,7 @@ class DenseTest(testing.TestCase):
         with self.assertRaisesRegex(ValueError, "lora is already enabled"):
             layer.enable_lora(rank=2)
 
-    # Test quantization-related (int8 and float8) methods
+    # Test quantization-related (int8, float8 and int4) methods
 
     def test_quantize_int8(self):
         layer = layers.Dense(units=16)
@@ -383,9 +384,100 @@ class DenseTest(testing.TestCase):
             backend.standardize_dtype(layer.kernel_scale.dtype), "float32"
         )
 
+    def test_quantize_int8_static_inputs(self):
+        layer = layers.Dense(units=16)
+        layer.build((None, 8))
+        x = np.random.random((2, 8))
+        y_float = layer(x)
+        layer.quantize("int8")
+        layer._freeze_int8_inputs_scale(np.max(np.abs(x)))
+
+        self.assertIsInstance(
+            layer.dtype_policy, dtype_policies.QuantizedInt8DTypePolicy
+        )
+        self.assertTrue(layer.dtype_policy.static_inputs)
+        self.assertEqual(layer.inputs_scale.shape, ())
+        y_quantized = layer(x)
+        mse = ops.mean(ops.square(y_float - y_quantized))
+        self.assertLess(mse, 1e-3)  # A weak correctness test
+
+        with self.assertRaisesRegex(ValueError, "already uses a static"):
+            layer._freeze_int8_inputs_scale(1.0)
+
+        # Try saving and reloading the model
+        model = models.Sequential([layer])
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.keras"
+        )
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertTrue(new_model.layers[0].dtype_policy.static_inputs)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+    @parameterized.named_parameters(
+        ("per_channel", None, 7),
+        ("grouped", 4, 8),
+    )
+    def test_quantize_int4(self, group_size, input_dim):
+        layer = layers.Dense(units=16)
+        layer.build((None, input_dim))
+        x = np.random.random((2, input_dim))
+        y_float = layer(x)
+        layer.dtype_policy = dtype_policies.QuantizedInt4DTypePolicy(
+            "int4", "float32", group_size=group_size
+        )
+
+        # Verify weights dtype and shapes: two values per int8 byte
+        num_groups = 1 if group_size is None else input_dim // group_size
+        self.assertEqual(backend.standardize_dtype(layer._kernel.dtype), "int8")
+        self.assertEqual(layer._kernel.shape, ((input_dim + 1) // 2, 16))
+        self.assertEqual(layer.kernel_scale.shape, (num_groups, 16))
+        self.assertEqual(layer.kernel.shape, (input_dim, 16))
+
+        # Try eager call and verify output correctness
+        y_quantized = layer(x)
+        mse = ops.mean(ops.square(y_float - y_quantized))
+        self.assertLess(mse, 1e-2)  # A weak correctness test
+
+        # Try saving and reloading the model
+        model = models.Sequential([layer])
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.keras"
+        )
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertEqual(
+            new_model.layers[0].dtype_policy.group_size, group_size
+        )
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+        # Try saving and reloading the model's weights only
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.weights.h5"
+        )
+        model.save_weights(temp_filepath)
+        new_model.load_weights(temp_filepath)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+        # Try lora
+        layer = layers.Dense(units=16)
+        layer.build((None, input_dim))
+        layer.enable_lora(4)
+        layer.quantize("int4")
+        _ = layer(x)
+
+        # Try building with quantized dtype policy
+        layer = layers.Dense(units=16, dtype="int4_from_mixed_bfloat16")
+        layer.build((None, input_dim))
+        self.assertEqual(backend.standardize_dtype(layer._kernel.dtype), "int8")
+        self.assertEqual(
+            backend.standardize_dtype(layer.kernel_scale.dtype), "float32"
+        )
+
     @parameterized.named_parameters(
         ("int8", "int8"),
         ("float8", "float8"),
+        ("int4", "int4"),
     )
     def test_quantize_on_unbuilt_layer(self, mode):
         layer = layers.Dense(units=2)
@@ -397,6 +489,7 @@ class DenseTest(testing.TestCase):
     @parameterized.named_parameters(
         ("int8", "int8"),
         ("float8", "float8"),
+        ("int4", "int4"),
     )
     def test_quantize_on_subclass(self, mode):
         class MyDense(layers.Dense):
@@ -412,12 +505,13 @@ class DenseTest(testing.TestCase):
     @parameterized.named_parameters(
         ("int8", "int8"),
         ("float8", "float8"),
+        ("int4", "int4"),
     )
     def test_quantize_when_already_quantized(self, mode):
         layer = layers.Dense(units=2)
         layer.build((None, 2))
         layer.quantize(mode)
-        for m in ["int8", "float8"]:
+        for m in ["int8", "float8", "int4"]:
             with self.assertRaisesRegex(
                 ValueError, "is already quantized with dtype_policy="
             ):
@@ -425,7 +519,7 @@ class DenseTest(testing.TestCase):
 
         layer = layers.Dense(units=2, dtype=f"{mode}_from_float32")
         layer.build((None, 2))
-        for m in ["int8", "float8"]:
+        for m in ["int8", "float8", "int4"]:
             with self.assertRaisesRegex(
                 ValueError, "is already quantized with dtype_policy="
             ):
@@ -434,6 +528,7 @@ class DenseTest(testing.TestCase):
     @parameterized.named_parameters(
         ("int8", "int8_from_float32", 3),
         ("float8", "float8_from_float32", 8),
+        ("int4", "int4_from_float32", 3),
     )
     @pytest.mark.skipif(testing.tensorflow_uses_gpu(), reason="Segfault")
     def test_quantize_by_setting_dtype_policy(
@@ -479,6 +574,7 @@ class DenseTest(testing.TestCase):
     @parameterized.named_parameters(
         ("int8", "int8_from_mixed_bfloat16", 1, 2),
         ("float8", "float8_from_mixed_bfloat16", 8, 0),
+        ("int4", "int4_from_mixed_bfloat16", 1, 2),
     )
     @pytest.mark.requires_trainable_backend
     @pytest.mark.skipif(testing.tensorflow_uses_gpu(), reason="Segfault")
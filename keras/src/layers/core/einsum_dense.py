@@ -158,9 +158,10 @@ class EinsumDense(Layer):
         # We use `self._dtype_policy` to check to avoid issues in torch dynamo
         if self.quantization_mode is not None:
             self.quantized_build(input_shape, mode=self.quantization_mode)
-        if self.quantization_mode != "int8":
-            # If the layer is quantized to int8, `self._kernel` will be added
-            # in `self._int8_build`. Therefore, we skip it here.
+        if self.quantization_mode not in ("int8", "int4"):
+            # If the layer is quantized to int8 or int4, `self._kernel` will be
+            # added in `self._int8_build` or `self._int4_build`. Therefore, we
+            # skip it here.
             self._kernel = self.add_weight(
                 name="kernel",
                 shape=tuple(kernel_shape),
@@ -192,11 +193,16 @@ class EinsumDense(Layer):
             raise AttributeError(
                 "You must build the layer before accessing `kernel`."
             )
-        if self.lora_enabled:
-            return self._kernel + ops.matmul(
-                self.lora_kernel_a, self.lora_kernel_b
+        kernel = self._kernel
+        if self.quantization_mode == "int4":
+            kernel = quantizers.unpack_int4(
+                kernel,
+                self._orig_kernel_shape[self._int4_pack_axis],
+                axis=self._int4_pack_axis,
             )
-        return self._kernel
+        if self.lora_enabled:
+            return kernel + ops.matmul(self.lora_kernel_a, self.lora_kernel_b)
+        return kernel
 
     def compute_output_shape(self, _):
         return self.full_output_shape
@@ -256,8 +262,10 @@ class EinsumDense(Layer):
         if self.bias is not None:
             target_variables.append(self.bias)
         if self.quantization_mode is not None:
-            if self.quantization_mode == "int8":
+            if self.quantization_mode in ("int8", "int4"):
                 target_variables.append(kernel_scale)
+                if self._has_static_inputs_scale():
+                    target_variables.append(self.inputs_scale)
             elif self.quantization_mode == "float8":
                 target_variables.append(self.inputs_scale)
                 target_variables.append(self.inputs_amax_history)
@@ -282,8 +290,10 @@ class EinsumDense(Layer):
         if self.bias is not None:
             target_variables.append(self.bias)
         if self.quantization_mode is not None:
-            if self.quantization_mode == "int8":
+            if self.quantization_mode in ("int8", "int4"):
                 target_variables.append(self.kernel_scale)
+                if self._has_static_inputs_scale():
+                    target_variables.append(self.inputs_scale)
             elif self.quantization_mode == "float8":
                 target_variables.append(self.inputs_scale)
                 target_variables.append(self.inputs_amax_history)
@@ -358,7 +368,7 @@ class EinsumDense(Layer):
                 f"Expected: {[v.name for v in all_vars]}"
             )
 
-    # Quantization-related (int8 and float8) methods
+    # Quantization-related (int8, float8 and int4) methods
 
     def quantized_build(self, input_shape, mode):
         if mode == "int8":
@@ -372,6 +382,15 @@ class EinsumDense(Layer):
             self._int8_build(kernel_shape)
         elif mode == "float8":
             self._float8_build()
+        elif mode == "int4":
+            shape_data = _analyze_einsum_string(
+                self.equation,
+                self.bias_axes,
+                input_shape,
+                self.partial_output_shape,
+            )
+            kernel_shape, _, _ = shape_data
+            self._int4_build(kernel_shape)
         else:
             raise self._quantization_mode_error(mode)
 
@@ -417,8 +436,24 @@ class EinsumDense(Layer):
             initializer=kernel_scale_initializer,
             trainable=False,
         )
+        if getattr(self.dtype_policy, "static_inputs", False):
+            self._int8_static_inputs_build()
         self._is_quantized = True
 
+    def _int8_static_inputs_build(self, inputs_scale_initializer="ones"):
+        # A single calibrated scale replaces the per-call input scales
+        self.inputs_scale = self.add_weight(
+            name="inputs_scale",
+            shape=(),
+            initializer=inputs_scale_initializer,
+            trainable=False,
+        )
+
+    def _has_static_inputs_scale(self):
+        return self.quantization_mode == "int8" and getattr(
+            self.dtype_policy, "static_inputs", False
+        )
+
     def _float8_build(self):
         from keras.src.dtype_policies import QuantizedFloat8DTypePolicy
 
@@ -470,7 +505,49 @@ class EinsumDense(Layer):
         self.outputs_grad_amax_history.overwrite_with_gradient = True
         self._is_quantized = True
 
+    def _int4_build(
+        self,
+        kernel_shape,
+        kernel_initializer="zeros",
+        kernel_scale_initializer="ones",
+    ):
+        # The kernel is packed along its first reduced axis, two int4 values
+        # per int8 byte, with one scale per group of `group_size` values along
+        # that axis.
+        kernel_reduced_axes = _analyze_quantization_info(
+            self.equation, self.input_spec.ndim
+        )[1]
+        self._int4_pack_axis = kernel_reduced_axes[0]
+        self._orig_kernel_shape = tuple(kernel_shape)
+        group_size = getattr(self.dtype_policy, "group_size", None)
+        packed_shape = list(kernel_shape)
+        packed_shape[self._int4_pack_axis] = (
+            kernel_shape[self._int4_pack_axis] + 1
+        ) // 2
+        kernel_scale_shape = list(kernel_shape)
+        kernel_scale_shape[self._int4_pack_axis] = quantizers.int4_num_groups(
+            kernel_shape[self._int4_pack_axis], group_size
+        )
+        self._kernel = self.add_weight(
+            name="kernel",
+            shape=packed_shape,
+            initializer=kernel_initializer,
+            dtype="int8",
+            trainable=False,
+        )
+        self.kernel_scale = self.add_weight(
+            name="kernel_scale",
+            shape=kernel_scale_shape,
+            initializer=kernel_scale_initializer,
+            trainable=False,
+        )
+        self._is_quantized = True
+
     def _int8_call(self, inputs, training=None):
+        static_inputs_scale = None
+        if self._has_static_inputs_scale():
+            static_inputs_scale = ops.convert_to_tensor(self.inputs_scale)
+
         @ops.custom_gradient
         def einsum_with_inputs_gradient(inputs, kernel, kernel_scale):
             def grad_fn(*args, upstream=None):
@@ -499,20 +576,28 @@ class EinsumDense(Layer):
                 )
                 return (inputs_grad, None, None)
 
-            inputs, inputs_scale = self.inputs_quantizer(inputs)
-            x = ops.einsum(self.equation, inputs, kernel)
-            # Deal with `inputs_scale`
-            inputs_scale = ops.transpose(
-                inputs_scale, self._input_transpose_axes
-            )
-            if self._input_expand_axes:
-                inputs_scale = ops.expand_dims(
-                    inputs_scale, axis=self._input_expand_axes
+            if static_inputs_scale is None:
+                inputs, inputs_scale = self.inputs_quantizer(inputs)
+            else:
+                inputs, inputs_scale = quantizers.quantize_with_scale(
+                    inputs,
+                    static_inputs_scale,
+                    value_range=self.inputs_quantizer.value_range,
                 )
-            if self._input_squeeze_axes:
-                inputs_scale = ops.squeeze(
-                    inputs_scale, axis=self._input_squeeze_axes
+            x = ops.einsum(self.equation, inputs, kernel)
+            # Deal with `inputs_scale`, a scalar if static
+            if static_inputs_scale is None:
+                inputs_scale = ops.transpose(
+                    inputs_scale, self._input_transpose_axes
                 )
+                if self._input_expand_axes:
+                    inputs_scale = ops.expand_dims(
+                        inputs_scale, axis=self._input_expand_axes
+                    )
+                if self._input_squeeze_axes:
+                    inputs_scale = ops.squeeze(
+                        inputs_scale, axis=self._input_squeeze_axes
+                    )
             # De-scale outputs
             x = ops.cast(x, self.compute_dtype)
             x = ops.divide(x, ops.multiply(inputs_scale, kernel_scale))
@@ -533,6 +618,27 @@ class EinsumDense(Layer):
             x = self.activation(x)
         return x
 
+    def _int4_call(self, inputs, training=None):
+        # Weight-only quantization: the kernel is unpacked and dequantized
+        # right before the einsum, which XLA fuses on JAX and TensorFlow.
+        kernel = quantizers.dequantize_int4(
+            self._kernel,
+            self.kernel_scale,
+            self._orig_kernel_shape[self._int4_pack_axis],
+            axis=self._int4_pack_axis,
+            dtype=self.compute_dtype,
+        )
+        x = ops.einsum(self.equation, inputs, kernel)
+        if self.lora_enabled:
+            lora_x = ops.einsum(self.equation, inputs, self.lora_kernel_a)
+            lora_x = ops.matmul(lora_x, self.lora_kernel_b)
+            x = ops.add(x, lora_x)
+        if self.bias is not None:
+            x += self.bias
+        if self.activation is not None:
+            x = self.activation(x)
+        return x
+
     def _float8_call(self, inputs, training=None):
         if self.lora_enabled:
             raise NotImplementedError(
@@ -665,6 +771,20 @@ class EinsumDense(Layer):
             self._int8_build(kernel_shape, kernel_value, kernel_scale)
         elif mode == "float8":
             self._float8_build()
+        elif mode == "int4":
+            # Quantize `self._kernel` to packed int4 along its first reduced
+            # axis with group-wise scales
+            kernel_reduced_axes = _analyze_quantization_info(
+                self.equation, self.input_spec.ndim
+            )[1]
+            kernel_value, kernel_scale = quantizers.quantize_int4(
+                self._kernel,
+                axis=kernel_reduced_axes[0],
+                group_size=getattr(self.dtype_policy, "group_size", None),
+            )
+            kernel_shape = tuple(self._kernel.shape)
+            del self._kernel
+            self._int4_build(kernel_shape, kernel_value, kernel_scale)
         else:
             raise self._quantization_mode_error(mode)
 
@@ -673,7 +793,55 @@ class EinsumDense(Layer):
             policy = dtype_policies.get(f"{mode}_from_{self.dtype_policy.name}")
             self.dtype_policy = policy
 
+    def _freeze_int8_inputs_scale(self, inputs_amax):
+        """Replaces the dynamic input scales with a calibrated static one.
+
+        Args:
+            inputs_amax: The calibrated absolute maximum of the inputs.
+        """
+        if self.quantization_mode != "int8":
+            raise ValueError(
+                "Static input scales require an int8-quantized layer. "
+                f"Received: quantization_mode={self.quantization_mode}"
+            )
+        if self._has_static_inputs_scale():
+            raise ValueError(
+                f"Layer '{self.name}' already uses a static input scale."
+            )
+        inputs_scale = self.inputs_quantizer.value_range[1] / (
+            float(inputs_amax) + self.inputs_quantizer.epsilon
+        )
+        self._tracker.unlock()
+        self._int8_static_inputs_build(initializers.Constant(inputs_scale))
+        self._tracker.lock()
+        self.dtype_policy = dtype_policies.QuantizedInt8DTypePolicy(
+            "int8", self.dtype_policy._source_name, static_inputs=True
+        )
+
     def _get_kernel_with_merged_lora(self):
+        if self.quantization_mode == "int4":
+            kernel_value = self._kernel
+            kernel_scale = self.kernel_scale
+            if self.lora_enabled:
+                # Dequantize & quantize to merge lora weights into int4 kernel
+                # Note that this is a lossy compression
+                kernel_value = quantizers.dequantize_int4(
+                    kernel_value,
+                    kernel_scale,
+                    self._orig_kernel_shape[self._int4_pack_axis],
+                    axis=self._int4_pack_axis,
+                    dtype=self.variable_dtype,
+                )
+                kernel_value = ops.add(
+                    kernel_value,
+                    ops.matmul(self.lora_kernel_a, self.lora_kernel_b),
+                )
+                kernel_value, kernel_scale = quantizers.quantize_int4(
+                    kernel_value,
+                    axis=self._int4_pack_axis,
+                    group_size=getattr(self.dtype_policy, "group_size", None),
+                )
+            return kernel_value, kernel_scale
         if self.dtype_policy.quantization_mode is not None:
             kernel_value = self._kernel
             kernel_scale = self.kernel_scale
@@ -6,6 +6,7 @@ from absl.testing import parameterized
 
 from keras.src import backend
 from keras.src import constraints
+from keras.src import dtype_policies
 from keras.src import layers
 from keras.src import models
 from keras.src import ops
@@ -380,7 +381,7 @@ class EinsumDenseTest(testing.TestCase):
             supports_masking=False,
         )
 
-    # Test quantization-related (int8 and float8) methods
+    # Test quantization-related (int8, float8 and int4) methods
 
     def test_quantize_int8(self):
         layer = layers.EinsumDense(
@@ -483,9 +484,93 @@ class EinsumDenseTest(testing.TestCase):
         mse = ops.mean(ops.square(y_float - y_quantized))
         self.assertLess(mse, 1e-3)  # A weak correctness test
 
+    def test_quantize_int8_static_inputs(self):
+        layer = layers.EinsumDense(
+            equation="ab,bcd->acd",
+            output_shape=(8, 32),
+            bias_axes="d",
+        )
+        layer.build((None, 3))
+        x = np.random.random((2, 3))
+        y_float = layer(x)
+        layer.quantize("int8")
+        layer._freeze_int8_inputs_scale(np.max(np.abs(x)))
+
+        self.assertIsInstance(
+            layer.dtype_policy, dtype_policies.QuantizedInt8DTypePolicy
+        )
+        self.assertTrue(layer.dtype_policy.static_inputs)
+        self.assertEqual(layer.inputs_scale.shape, ())
+        y_quantized = layer(x)
+        mse = ops.mean(ops.square(y_float - y_quantized))
+        self.assertLess(mse, 1e-3)  # A weak correctness test
+
+        with self.assertRaisesRegex(ValueError, "already uses a static"):
+            layer._freeze_int8_inputs_scale(1.0)
+
+        # Try saving and reloading the model
+        model = models.Sequential([layer])
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.keras"
+        )
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertTrue(new_model.layers[0].dtype_policy.static_inputs)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+    @parameterized.named_parameters(
+        ("per_channel", None, 3),
+        ("grouped", 2, 4),
+    )
+    def test_quantize_int4(self, group_size, input_dim):
+        layer = layers.EinsumDense(
+            equation="ab,bcd->acd",
+            output_shape=(8, 32),
+            bias_axes="d",
+        )
+        layer.build((None, input_dim))
+        x = np.random.random((2, input_dim))
+        y_float = layer(x)
+        layer.dtype_policy = dtype_policies.QuantizedInt4DTypePolicy(
+            "int4", "float32", group_size=group_size
+        )
+
+        # Verify weights dtype and shapes: two values per int8 byte
+        num_groups = 1 if group_size is None else input_dim // group_size
+        self.assertEqual(backend.standardize_dtype(layer._kernel.dtype), "int8")
+        self.assertEqual(layer._kernel.shape, ((input_dim + 1) // 2, 8, 32))
+        self.assertEqual(layer.kernel_scale.shape, (num_groups, 8, 32))
+        self.assertEqual(layer.kernel.shape, (input_dim, 8, 32))
+
+        # Try eager call and verify output correctness
+        y_quantized = layer(x)
+        mse = ops.mean(ops.square(y_float - y_quantized))
+        self.assertLess(mse, 1e-2)  # A weak correctness test
+
+        # Try saving and reloading the model
+        model = models.Sequential([layer])
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.keras"
+        )
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+        # Try lora
+        layer = layers.EinsumDense(
+            equation="ab,bcd->acd",
+            output_shape=(8, 32),
+            bias_axes="d",
+        )
+        layer.build((None, input_dim))
+        layer.enable_lora(2)
+        layer.quantize("int4")
+        _ = layer(x)
+
     @parameterized.named_parameters(
         ("int8", "int8"),
         ("float8", "float8"),
+        ("int4", "int4"),
     )
     def test_quantize_on_unbuilt_layer(self, mode):
         layer = layers.EinsumDense(
@@ -501,6 +586,7 @@ class EinsumDenseTest(testing.TestCase):
     @parameterized.named_parameters(
         ("int8", "int8"),
         ("float8", "float8"),
+        ("int4", "int4"),
     )
     def test_quantize_on_subclass(self, mode):
         class MyEinsumDense(layers.EinsumDense):
@@ -520,6 +606,7 @@ class EinsumDenseTest(testing.TestCase):
     @parameterized.named_parameters(
         ("int8", "int8"),
         ("float8", "float8"),
+        ("int4", "int4"),
     )
     def test_quantize_when_already_quantized(self, mode):
         layer = layers.EinsumDense(
@@ -529,7 +616,7 @@ class EinsumDenseTest(testing.TestCase):
         )
         layer.build((None, 3))
         layer.quantize(mode)
-        for m in ["int8", "float8"]:
+        for m in ["int8", "float8", "int4"]:
             with self.assertRaisesRegex(
                 ValueError, "is already quantized with dtype_policy="
             ):
@@ -542,7 +629,7 @@ class EinsumDenseTest(testing.TestCase):
             dtype=f"{mode}_from_float32",
         )
         layer.build((None, 3))
-        for m in ["int8", "float8"]:
+        for m in ["int8", "float8", "int4"]:
             with self.assertRaisesRegex(
                 ValueError, "is already quantized with dtype_policy="
             ):
@@ -551,6 +638,7 @@ class EinsumDenseTest(testing.TestCase):
     @parameterized.named_parameters(
         ("int8", "int8_from_float32", 3),
         ("float8", "float8_from_float32", 8),
+        ("int4", "int4_from_float32", 3),
     )
     def test_quantize_by_setting_dtype_policy(
         self, policy, expected_num_variables
@@ -603,6 +691,7 @@ class EinsumDenseTest(testing.TestCase):
     @parameterized.named_parameters(
         ("int8", "int8_from_mixed_bfloat16", 1, 2),
         ("float8", "float8_from_mixed_bfloat16", 8, 0),
+        ("int4", "int4_from_mixed_bfloat16", 1, 2),
     )
     @pytest.mark.requires_trainable_backend
     def test_quantize_dtype_argument(
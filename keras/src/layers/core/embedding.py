@@ -1,3 +1,4 @@
+import math
 import warnings
 
 from keras.src import backend
@@ -65,12 +66,33 @@ class Embedding(Layer):
             computation cost of fine-tuning large embedding layers.
             You can also enable LoRA on an existing
             `Embedding` layer by calling `layer.enable_lora(rank)`.
+        sparse_gradient: Boolean. If `True`, the gradient of the embeddings
+            matrix is row-sparse, i.e. it only holds the rows that were
+            looked up, and optimizers with a row-sparse update path (e.g.
+            `SGD`, `Adagrad` or `Adam(lazy_updates=True)`) only update those
+            rows. This makes training with large vocabularies much faster.
+            On the TensorFlow backend, the gradient is always an
+            `IndexedSlices`. On the JAX backend, the `fit()` training step
+            differentiates the looked up rows instead of the embeddings
+            matrix, and builds a row-sparse `BCOO` gradient from them. The
+            embeddings matrix must only be used through this layer, and
+            `embeddings_regularizer` is not supported. Defaults to `False`.
+
+    Call arguments:
+        inputs: The tensor inputs to the layer.
+        reverse: Boolean. If `True`, the layer is used as the (tied) output
+            projection of a language model: `inputs` are floating-point
+            tensors of shape `(..., output_dim)`, and they are projected back
+            onto the vocabulary with the transposed embeddings matrix.
+            Defaults to `False`.
 
     Input shape:
         2D tensor with shape: `(batch_size, input_length)`.
+        With `reverse=True`, a tensor with shape `(..., output_dim)`.
 
     Output shape:
         3D tensor with shape: `(batch_size, input_length, output_dim)`.
+        With `reverse=True`, a tensor with shape `(..., input_dim)`.
     """
 
     def __init__(
@@ -83,6 +105,7 @@ class Embedding(Layer):
         mask_zero=False,
         weights=None,
         lora_rank=None,
+        sparse_gradient=False,
         **kwargs,
     ):
         input_length = kwargs.pop("input_length", None)
@@ -101,6 +124,12 @@ class Embedding(Layer):
         self.autocast = False
         self.lora_rank = lora_rank
         self.lora_enabled = False
+        self.sparse_gradient = sparse_gradient
+        if sparse_gradient and self.embeddings_regularizer is not None:
+            raise ValueError(
+                "`sparse_gradient=True` is not supported with an "
+                "`embeddings_regularizer`, which has a dense gradient."
+            )
 
         if weights is not None:
             self.build()
@@ -113,7 +142,7 @@ class Embedding(Layer):
             return
         if self.quantization_mode is not None:
             self.quantized_build(input_shape, mode=self.quantization_mode)
-        if self.quantization_mode != "int8":
+        if self.quantization_mode not in ("int8", "int4"):
             self._embeddings = self.add_weight(
                 shape=(self.input_dim, self.output_dim),
                 initializer=self.embeddings_initializer,
@@ -122,32 +151,88 @@ class Embedding(Layer):
                 constraint=self.embeddings_constraint,
                 trainable=True,
             )
+            if self.sparse_gradient:
+                # Upper bound of the number of rows of the gradient, counted
+                # during the forward pass, see `_sparse_gradient_lookup()`.
+                self._embeddings._num_sparse_gradient_rows = 0
         self.built = True
         if self.lora_rank:
             self.enable_lora(self.lora_rank)
 
     @property
     def embeddings(self):
+        embeddings = self._embeddings
+        if self.quantization_mode == "int4":
+            embeddings = quantizers.unpack_int4(
+                embeddings, self.output_dim, axis=-1
+            )
         if self.lora_enabled:
-            return self._embeddings + ops.matmul(
+            return embeddings + ops.matmul(
                 self.lora_embeddings_a, self.lora_embeddings_b
             )
-        return self._embeddings
+        return embeddings
 
-    def call(self, inputs):
+    def call(self, inputs, reverse=False):
+        use_sparse_gradient = (
+            self.sparse_gradient
+            and self.quantization_mode is None
+            and not self.lora_enabled
+        )
+        if reverse:
+            if use_sparse_gradient:
+                # The projection has a gradient on every row.
+                self._count_sparse_gradient_rows()
+            inputs = ops.cast(inputs, dtype=self.compute_dtype)
+            embeddings = ops.cast(self.embeddings, dtype=self.compute_dtype)
+            return ops.matmul(inputs, ops.transpose(embeddings))
         if inputs.dtype != "int32" and inputs.dtype != "int64":
             inputs = ops.cast(inputs, "int32")
-        outputs = ops.take(self.embeddings, inputs, axis=0)
+        if use_sparse_gradient:
+            outputs = self._sparse_gradient_lookup(inputs)
+        else:
+            outputs = ops.take(self.embeddings, inputs, axis=0)
         return ops.cast(outputs, dtype=self.compute_dtype)
 
+    def _sparse_gradient_lookup(self, inputs):
+        if backend.backend() == "torch":
+            import torch
+
+            return torch.nn.functional.embedding(
+                backend.convert_to_tensor(inputs).long(),
+                self._embeddings.value,
+                sparse=True,
+            )
+        self._count_sparse_gradient_rows(inputs)
+        lookups = getattr(self._embeddings, "_sparse_gradient_lookups", None)
+        if lookups is not None:
+            # JAX train step, see `JAXTrainer._row_sparse_value_and_grad()`.
+            return lookups.lookup(self.embeddings, inputs)
+        return ops.take(self.embeddings, inputs, axis=0)
+
+    def _count_sparse_gradient_rows(self, inputs=None):
+        # Only needed on JAX, where the shapes are always static.
+        if backend.backend() != "jax":
+            return
+        if inputs is None:
+            num_rows = self.input_dim
+        else:
+            num_rows = math.prod(inputs.shape)
+        self._embeddings._num_sparse_gradient_rows += num_rows
+
     def compute_mask(self, inputs, mask=None):
         if not self.mask_zero:
             return None
         return ops.not_equal(inputs, 0)
 
-    def compute_output_shape(self, input_shape):
+    def compute_output_shape(self, input_shape, reverse=False):
+        if reverse:
+            return (*input_shape[:-1], self.input_dim)
         return (*input_shape, self.output_dim)
 
+    def compute_output_spec(self, inputs, reverse=False):
+        output_shape = self.compute_output_shape(inputs.shape, reverse=reverse)
+        return backend.KerasTensor(output_shape, dtype=self.compute_dtype)
+
     def enable_lora(
         self, rank, a_initializer="he_uniform", b_initializer="zeros"
     ):
@@ -163,8 +248,7 @@ class Embedding(Layer):
             )
         if self.lora_enabled:
             raise ValueError(
-                "lora is already enabled. "
-                "This can only be done once per layer."
+                "lora is already enabled. This can only be done once per layer."
             )
         self._tracker.unlock()
         self.lora_embeddings_a = self.add_weight(
@@ -195,7 +279,7 @@ class Embedding(Layer):
         )
         target_variables = [embeddings_value]
         if self.quantization_mode is not None:
-            if self.quantization_mode == "int8":
+            if self.quantization_mode in ("int8", "int4"):
                 target_variables.append(embeddings_scale)
             else:
                 raise self._quantization_mode_error(self.quantization_mode)
@@ -212,7 +296,7 @@ class Embedding(Layer):
         # default ordering will change after quantization
         target_variables = [self._embeddings]
         if self.quantization_mode is not None:
-            if self.quantization_mode == "int8":
+            if self.quantization_mode in ("int8", "int4"):
                 target_variables.append(self.embeddings_scale)
             else:
                 raise self._quantization_mode_error(self.quantization_mode)
@@ -245,6 +329,8 @@ class Embedding(Layer):
             ),
             "mask_zero": self.mask_zero,
         }
+        if self.sparse_gradient:
+            config["sparse_gradient"] = self.sparse_gradient
         if self.lora_rank:
             config["lora_rank"] = self.lora_rank
         return {**base_config, **config}
@@ -283,17 +369,19 @@ class Embedding(Layer):
                 f"Expected: {[v.name for v in all_vars]}"
             )
 
-    """Quantization-related (int8) methods"""
+    """Quantization-related (int8 and int4) methods"""
 
     def _quantization_mode_error(self, mode):
         return NotImplementedError(
-            "Invalid quantization mode. Expected 'int8'. "
+            "Invalid quantization mode. Expected one of ('int8', 'int4'). "
             f"Received: quantization_mode={mode}"
         )
 
     def quantized_build(self, input_shape, mode):
         if mode == "int8":
             self._int8_build()
+        elif mode == "int4":
+            self._int4_build()
         else:
             raise self._quantization_mode_error(mode)
 
@@ -318,14 +406,45 @@ class Embedding(Layer):
             initializer=embeddings_scale_initializer,
             trainable=False,
         )
+        # Only used when projecting onto the vocabulary (`reverse=True`).
+        self.inputs_quantizer = quantizers.AbsMaxQuantizer(axis=-1)
+        self._is_quantized = True
+
+    def _int4_build(
+        self,
+        embeddings_initializer="zeros",
+        embeddings_scale_initializer="ones",
+    ):
+        # The embeddings are packed along `output_dim`, two int4 values per
+        # int8 byte, so that a lookup only unpacks the gathered rows. Each row
+        # has one scale per group of `group_size` values.
+        group_size = getattr(self.dtype_policy, "group_size", None)
+        self._embeddings = self.add_weight(
+            name="embeddings",
+            shape=(self.input_dim, (self.output_dim + 1) // 2),
+            initializer=embeddings_initializer,
+            dtype="int8",
+            trainable=False,
+        )
+        self.embeddings_scale = self.add_weight(
+            name="embeddings_scale",
+            shape=(
+                self.input_dim,
+                quantizers.int4_num_groups(self.output_dim, group_size),
+            ),
+            initializer=embeddings_scale_initializer,
+            trainable=False,
+        )
         self._is_quantized = True
 
     def quantized_call(self, *args, **kwargs):
-        if self.quantization_mode != "int8":
+        if self.quantization_mode not in ("int8", "int4"):
             raise self._quantization_mode_error(self.quantization_mode)
         return super().quantized_call(*args, **kwargs)
 
-    def _int8_call(self, inputs, training=None):
+    def _int8_call(self, inputs, reverse=False, training=None):
+        if reverse:
+            return self._int8_reverse_call(inputs)
         # We cannot update quantized self._embeddings, so the custom gradient is
         # not needed
         if backend.standardize_dtype(inputs.dtype) not in ("int32", "int64"):
@@ -343,6 +462,76 @@ class Embedding(Layer):
             outputs = ops.add(outputs, lora_outputs)
         return outputs
 
+    def _int8_reverse_call(self, inputs):
+        # The embeddings are quantized per row, which is exactly a per output
+        # channel scale for the transposed projection. This lets us run an
+        # int8 x int8 matmul without dequantizing the embeddings.
+        @ops.custom_gradient
+        def matmul_with_inputs_gradient(inputs, embeddings, embeddings_scale):
+            def grad_fn(*args, upstream=None):
+                if upstream is None:
+                    (upstream,) = args
+                float_embeddings = ops.divide(
+                    ops.cast(embeddings, dtype=self.compute_dtype),
+                    ops.expand_dims(embeddings_scale, axis=-1),
+                )
+                inputs_grad = ops.matmul(upstream, float_embeddings)
+                return (inputs_grad, None, None)
+
+            inputs, inputs_scale = self.inputs_quantizer(inputs)
+            x = ops.matmul(inputs, ops.transpose(embeddings))
+            # De-scale outputs
+            x = ops.cast(x, self.compute_dtype)
+            x = ops.divide(x, ops.multiply(inputs_scale, embeddings_scale))
+            return x, grad_fn
+
+        inputs = ops.cast(inputs, dtype=self.compute_dtype)
+        x = matmul_with_inputs_gradient(
+            inputs,
+            ops.convert_to_tensor(self._embeddings),
+            ops.convert_to_tensor(self.embeddings_scale),
+        )
+        if self.lora_enabled:
+            lora_x = ops.matmul(inputs, ops.transpose(self.lora_embeddings_b))
+            lora_x = ops.matmul(lora_x, ops.transpose(self.lora_embeddings_a))
+            x = ops.add(x, lora_x)
+        return x
+
+    def _int4_call(self, inputs, reverse=False, training=None):
+        if reverse:
+            inputs = ops.cast(inputs, dtype=self.compute_dtype)
+            embeddings = quantizers.dequantize_int4(
+                self._embeddings,
+                self.embeddings_scale,
+                self.output_dim,
+                axis=-1,
+                dtype=self.compute_dtype,
+            )
+            x = ops.matmul(inputs, ops.transpose(embeddings))
+            if self.lora_enabled:
+                lora_x = ops.matmul(
+                    inputs, ops.transpose(self.lora_embeddings_b)
+                )
+                lora_x = ops.matmul(
+                    lora_x, ops.transpose(self.lora_embeddings_a)
+                )
+                x = ops.add(x, lora_x)
+            return x
+        if backend.standardize_dtype(inputs.dtype) not in ("int32", "int64"):
+            inputs = ops.cast(inputs, "int32")
+        outputs = quantizers.dequantize_int4(
+            ops.take(self._embeddings, inputs, axis=0),
+            ops.take(self.embeddings_scale, inputs, axis=0),
+            self.output_dim,
+            axis=-1,
+            dtype=self.compute_dtype,
+        )
+        if self.lora_enabled:
+            lora_outputs = ops.take(self.lora_embeddings_a, inputs, axis=0)
+            lora_outputs = ops.matmul(lora_outputs, self.lora_embeddings_b)
+            outputs = ops.add(outputs, lora_outputs)
+        return outputs
+
     def quantize(self, mode, type_check=True):
         # Prevent quantization of the subclasses
         if type_check and (type(self) is not Embedding):
@@ -359,6 +548,15 @@ class Embedding(Layer):
             # Utilize a lambda expression as an initializer to prevent adding a
             # large constant to the computation graph.
             self._int8_build(embeddings_value, embeddings_scale)
+        elif mode == "int4":
+            # Quantize `self._embeddings` to packed int4 with group-wise scales
+            embeddings_value, embeddings_scale = quantizers.quantize_int4(
+                self._embeddings,
+                axis=-1,
+                group_size=getattr(self.dtype_policy, "group_size", None),
+            )
+            del self._embeddings
+            self._int4_build(embeddings_value, embeddings_scale)
         else:
             raise self._quantization_mode_error(mode)
 
@@ -368,6 +566,29 @@ class Embedding(Layer):
             self.dtype_policy = policy
 
     def _get_embeddings_with_merged_lora(self):
+        if self.quantization_mode == "int4":
+            embeddings_value = self._embeddings
+            embeddings_scale = self.embeddings_scale
+            if self.lora_enabled:
+                # Dequantize & quantize to merge lora weights into embeddings
+                # Note that this is a lossy compression
+                embeddings_value = quantizers.dequantize_int4(
+                    embeddings_value,
+                    embeddings_scale,
+                    self.output_dim,
+                    axis=-1,
+                    dtype=self.variable_dtype,
+                )
+                embeddings_value = ops.add(
+                    embeddings_value,
+                    ops.matmul(self.lora_embeddings_a, self.lora_embeddings_b),
+                )
+                embeddings_value, embeddings_scale = quantizers.quantize_int4(
+                    embeddings_value,
+                    axis=-1,
+                    group_size=getattr(self.dtype_policy, "group_size", None),
+                )
+            return embeddings_value, embeddings_scale
         if self.dtype_policy.quantization_mode is not None:
             embeddings_value = self._embeddings
             embeddings_scale = self.embeddings_scale
@@ -6,9 +6,11 @@ from absl.testing import parameterized
 
 from keras.src import backend
 from keras.src import constraints
+from keras.src import dtype_policies
 from keras.src import layers
 from keras.src import models
 from keras.src import ops
+from keras.src import optimizers
 from keras.src import saving
 from keras.src.export import export_lib
 from keras.src.testing import test_case
@@ -115,6 +117,147 @@ class EmbeddingTest(test_case.TestCase):
         layer.build((None, 2))
         self.assertIsInstance(layer.embeddings.constraint, constraints.NonNeg)
 
+    @parameterized.parameters("sgd", "adagrad", "adam", "adafactor")
+    @pytest.mark.requires_trainable_backend
+    def test_sparse_gradient(self, optimizer):
+        x = np.random.randint(0, 50, size=(16, 3))
+        y = np.random.normal(size=(16, 1))
+        initial_weights = None
+        trained_weights = []
+        for sparse_gradient in (False, True):
+            model = models.Sequential(
+                [
+                    layers.Input((3,), dtype="int32"),
+                    layers.Embedding(100, 4, sparse_gradient=sparse_gradient),
+                    layers.Flatten(),
+                    layers.Dense(1),
+                ]
+            )
+            if initial_weights is None:
+                initial_weights = model.get_weights()
+            model.set_weights(initial_weights)
+            model.compile(optimizer=optimizer, loss="mse")
+            model.fit(x, y, batch_size=4, shuffle=False, verbose=0)
+            trained_weights.append(model.get_weights())
+        for weight, sparse_weight in zip(*trained_weights):
+            self.assertAllClose(weight, sparse_weight, atol=1e-6)
+
+    @pytest.mark.requires_trainable_backend
+    def test_sparse_gradient_lazy_updates(self):
+        x = np.random.randint(0, 50, size=(16, 3))
+        y = np.random.normal(size=(16, 1))
+        model = models.Sequential(
+            [
+                layers.Input((3,), dtype="int32"),
+                layers.Embedding(100, 4, sparse_gradient=True),
+                layers.Flatten(),
+                layers.Dense(1),
+            ]
+        )
+        model.compile(optimizer=optimizers.Adam(lazy_updates=True), loss="mse")
+        embeddings = backend.convert_to_numpy(model.layers[0].embeddings)
+        model.fit(x[:4], y[:4], verbose=0)
+        model.fit(x[4:], y[4:], batch_size=4, shuffle=False, verbose=0)
+
+        # The rows looked up in the first batch only are not updated anymore
+        # by the next ones.
+        first_rows = np.setdiff1d(x[:4], x[4:])
+        before = backend.convert_to_numpy(model.layers[0].embeddings)
+        model.fit(x[4:], y[4:], batch_size=4, shuffle=False, verbose=0)
+        after = backend.convert_to_numpy(model.layers[0].embeddings)
+        self.assertAllClose(after[first_rows], before[first_rows])
+        self.assertNotAllClose(after[x[4:]], before[x[4:]])
+        # The rows never looked up keep their initial value.
+        untouched = np.setdiff1d(np.arange(100), x)
+        self.assertAllClose(after[untouched], embeddings[untouched])
+
+    @parameterized.named_parameters(
+        ("clipnorm", {"clipnorm": 0.1}),
+        ("global_clipnorm", {"global_clipnorm": 0.1}),
+        ("clipvalue", {"clipvalue": 0.01}),
+    )
+    @pytest.mark.requires_trainable_backend
+    def test_sparse_gradient_with_clipping(self, clip_kwargs):
+        x = np.random.randint(0, 50, size=(16, 3))
+        y = np.random.normal(size=(16, 1))
+        initial_weights = None
+        trained_weights = []
+        for sparse_gradient in (False, True):
+            model = models.Sequential(
+                [
+                    layers.Input((3,), dtype="int32"),
+                    layers.Embedding(100, 4, sparse_gradient=sparse_gradient),
+                    layers.Flatten(),
+                    layers.Dense(1),
+                ]
+            )
+            if initial_weights is None:
+                initial_weights = model.get_weights()
+            model.set_weights(initial_weights)
+            model.compile(optimizer=optimizers.Adam(**clip_kwargs), loss="mse")
+            model.fit(x, y, batch_size=4, shuffle=False, verbose=0)
+            trained_weights.append(model.get_weights())
+        for weight, sparse_weight in zip(*trained_weights):
+            self.assertAllClose(weight, sparse_weight, atol=1e-6)
+
+    @pytest.mark.requires_trainable_backend
+    def test_sparse_gradient_with_flat_buffers(self):
+        x = np.random.randint(0, 50, size=(16, 3))
+        y = np.random.normal(size=(16, 1))
+        initial_weights = None
+        trained_weights = []
+        for use_flat_buffers in (False, True):
+            model = models.Sequential(
+                [
+                    layers.Input((3,), dtype="int32"),
+                    layers.Embedding(100, 4, sparse_gradient=True),
+                    layers.Flatten(),
+                    layers.Dense(2),
+                    layers.Dense(1),
+                ]
+            )
+            if initial_weights is None:
+                initial_weights = model.get_weights()
+            model.set_weights(initial_weights)
+            optimizer = optimizers.Adam(
+                lazy_updates=True, use_flat_buffers=use_flat_buffers
+            )
+            model.compile(optimizer=optimizer, loss="mse")
+            model.fit(x, y, batch_size=4, shuffle=False, verbose=0)
+            trained_weights.append(model.get_weights())
+        # The embeddings are kept out of the flat bucket of the dense layers.
+        self.assertLen(optimizer._flat_buckets, 1)
+        self.assertLen(optimizer._flat_bucket_members[0], 4)
+        for weight, flat_weight in zip(*trained_weights):
+            self.assertAllClose(weight, flat_weight, atol=1e-6)
+
+    @pytest.mark.requires_trainable_backend
+    def test_sparse_gradient_with_lazy_weight_decay(self):
+        # Only the rows 0 to 9 of the embeddings are looked up.
+        x = np.random.randint(0, 10, size=(16, 3))
+        y = np.random.normal(size=(16, 1))
+        model = models.Sequential(
+            [
+                layers.Input((3,), dtype="int32"),
+                layers.Embedding(100, 4, sparse_gradient=True),
+                layers.Flatten(),
+                layers.Dense(1),
+            ]
+        )
+        initial_embeddings = model.layers[0].embeddings.numpy()
+        optimizer = optimizers.AdamW(weight_decay=0.1, lazy_updates=True)
+        model.compile(optimizer=optimizer, loss="mse")
+        model.fit(x, y, batch_size=4, shuffle=False, verbose=0)
+        embeddings = model.layers[0].embeddings.numpy()
+        self.assertAllClose(embeddings[10:], initial_embeddings[10:])
+        self.assertNotAllClose(embeddings[:10], initial_embeddings[:10])
+
+    def test_sparse_gradient_with_regularizer(self):
+        with self.assertRaisesRegex(ValueError, "embeddings_regularizer"):
+            layers.Embedding(
+                10, 2, sparse_gradient=True, embeddings_regularizer="l2"
+            )
+
     @pytest.mark.requires_trainable_backend
     def test_enable_lora(self):
         layer = layers.Embedding(10, 16)
@@ -212,7 +355,7 @@ class EmbeddingTest(test_case.TestCase):
         with self.assertRaisesRegex(ValueError, "lora is already enabled"):
             layer.enable_lora(rank=2)
 
-    # Test quantization-related (int8) methods
+    # Test quantization-related (int8 and int4) methods
 
     def test_quantize_int8(self):
         layer = layers.Embedding(10, 16)
@@ -267,6 +410,51 @@ class EmbeddingTest(test_case.TestCase):
             backend.standardize_dtype(layer.embeddings_scale.dtype), "float32"
         )
 
+    @parameterized.named_parameters(
+        ("per_channel", None, 7),
+        ("grouped", 4, 16),
+    )
+    def test_quantize_int4(self, group_size, output_dim):
+        layer = layers.Embedding(10, output_dim)
+        layer.build()
+        x = np.random.randint(0, 9, size=(64, 3))
+        y_float = layer(x)
+        layer.dtype_policy = dtype_policies.QuantizedInt4DTypePolicy(
+            "int4", "float32", group_size=group_size
+        )
+
+        # Verify weights dtype and shapes: two values per int8 byte
+        num_groups = 1 if group_size is None else output_dim // group_size
+        self.assertEqual(
+            backend.standardize_dtype(layer._embeddings.dtype), "int8"
+        )
+        self.assertEqual(layer._embeddings.shape, (10, (output_dim + 1) // 2))
+        self.assertEqual(layer.embeddings_scale.shape, (10, num_groups))
+        self.assertEqual(layer.embeddings.shape, (10, output_dim))
+
+        # Try eager call and verify output correctness
+        y_quantized = layer(x)
+        mse = ops.mean(ops.square(y_float - y_quantized))
+        self.assertLess(mse, 1e-3)  # A weak correctness test
+        hidden = np.random.random((4, output_dim)).astype("float32")
+        self.assertEqual(layer(hidden, reverse=True).shape, (4, 10))
+
+        # Try saving and reloading the model
+        model = models.Sequential([layer])
+        temp_filepath = os.path.join(
+            self.get_temp_dir(), "quantized_model.keras"
+        )
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertAllClose(model.predict(x), new_model.predict(x))
+
+        # Try lora
+        layer = layers.Embedding(10, output_dim)
+        layer.build()
+        layer.enable_lora(4)
+        layer.quantize("int4")
+        _ = layer(x)
+
     @pytest.mark.requires_trainable_backend
     def test_quantize_dtype_argument(self):
         self.run_layer_test(
@@ -332,6 +520,7 @@ class EmbeddingTest(test_case.TestCase):
 
     @parameterized.named_parameters(
         ("int8", "int8_from_float32", 2),
+        ("int4", "int4_from_float32", 2),
     )
     def test_quantize_by_setting_dtype_policy(
         self, policy, expected_num_variables
@@ -452,6 +641,55 @@ class EmbeddingTest(test_case.TestCase):
                 len(model.non_trainable_weights),
             )
 
+    def test_reverse(self):
+        layer = layers.Embedding(10, 16)
+        x = np.random.randint(0, 9, size=(4, 3))
+        hidden = layer(x)
+        logits = layer(hidden, reverse=True)
+        self.assertEqual(logits.shape, (4, 3, 10))
+        self.assertAllClose(
+            logits,
+            np.matmul(
+                backend.convert_to_numpy(hidden),
+                backend.convert_to_numpy(layer.embeddings).T,
+            ),
+        )
+        self.assertEqual(
+            layer.compute_output_shape((4, 3, 16), True), (4, 3, 10)
+        )
+        symbolic = layer(layers.Input((3, 16)), reverse=True)
+        self.assertEqual(symbolic.shape, (None, 3, 10))
+
+        # The int8 reverse projection also uses quantized inputs.
+        layer.quantize("int8")
+        logits_quantized = layer(hidden, reverse=True)
+        self.assertAllClose(logits, logits_quantized, atol=0.05)
+
+    @pytest.mark.requires_trainable_backend
+    def test_reverse_quantized_gradient(self):
+        layer = layers.Embedding(10, 16)
+        layer.build()
+        layer.quantize("int8")
+        layer.enable_lora(2)
+        hidden = layers.Input((3, 16))
+        model = models.Model(hidden, layer(hidden, reverse=True))
+        model.compile(optimizer="sgd", loss="mse")
+        init_lora_b = backend.convert_to_numpy(layer.lora_embeddings_b)
+        model.fit(
+            np.random.random((8, 3, 16)),
+            np.random.random((8, 3, 10)),
+            verbose=0,
+        )
+        self.assertGreater(
+            np.max(
+                np.abs(
+                    backend.convert_to_numpy(layer.lora_embeddings_b)
+                    - init_lora_b
+                )
+            ),
+            0.0,
+        )
+
     def test_weights_constructor_arg(self):
         layer = layers.Embedding(3, 4, weights=np.ones((3, 4)))
         self.assertAllClose(layer.embeddings.numpy(), np.ones((3, 4)))
@@ -1181,7 +1181,7 @@ class Layer(BackendLayer, Operation, KerasSaveable):
         for layer in self._layers:
             layer._clear_losses()
 
-    # Quantization-related (int8 and float8) methods
+    # Quantization-related (int8, float8 and int4) methods
 
     def quantized_build(self, input_shape, mode):
         raise self._not_implemented_error(self.quantized_build)
@@ -1221,6 +1221,8 @@ class Layer(BackendLayer, Operation, KerasSaveable):
             return self._int8_call(*args, **kwargs)
         elif self.quantization_mode == "float8":
             return self._float8_call(*args, **kwargs)
+        elif self.quantization_mode == "int4":
+            return self._int4_call(*args, **kwargs)
         else:
             raise self._quantization_mode_error(self.quantization_mode)
 
@@ -1230,6 +1232,9 @@ class Layer(BackendLayer, Operation, KerasSaveable):
     def _float8_call(self, *args, **kwargs):
         raise self._not_implemented_error(self._float8_call)
 
+    def _int4_call(self, *args, **kwargs):
+        raise self._not_implemented_error(self._int4_call)
+
     def _not_implemented_error(self, attr, msg=None):
         if callable(attr):
             attr_name = attr.__name__
@@ -433,7 +433,9 @@ class GRU(RNN):
             `True` is `"after"` (default and cuDNN compatible).
         use_cudnn: Whether to use a cuDNN-backed implementation. `"auto"` will
             attempt to use cuDNN when feasible, and will fallback to the
-            default implementation if not.
+            default implementation if not. With the JAX and NumPy backends,
+            a fused implementation that precomputes the input projections
+            of all timesteps is used instead of cuDNN.
 
     Call arguments:
         inputs: A 3D tensor, with shape `(batch, timesteps, feature)`.
@@ -541,7 +543,7 @@ class GRU(RNN):
         if self.use_cudnn in ("auto", True):
             if not self.recurrent_dropout:
                 try:
-                    if self.dropout:
+                    if training and self.dropout:
                         dp_mask = self.cell.get_dropout_mask(sequences[:, 0, :])
                         dp_mask = ops.expand_dims(dp_mask, axis=1)
                         dp_mask = ops.broadcast_to(
@@ -566,6 +568,7 @@ class GRU(RNN):
                         return_sequences=self.return_sequences,
                         go_backwards=self.go_backwards,
                         unroll=self.unroll,
+                        zero_output_for_mask=self.zero_output_for_mask,
                         reset_after=self.cell.reset_after,
                     )
                     # We disable jit_compile for the model in this case,
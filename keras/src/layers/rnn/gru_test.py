@@ -309,3 +309,45 @@ class GRUTest(testing.TestCase):
             ),
             output,
         )
+
+    @parameterized.product(
+        return_sequences=[True, False],
+        go_backwards=[True, False],
+        zero_output_for_mask=[True, False],
+        use_mask=[True, False],
+        reset_after=[True, False],
+    )
+    def test_fused_matches_default_implementation(
+        self,
+        return_sequences,
+        go_backwards,
+        zero_output_for_mask,
+        use_mask,
+        reset_after,
+    ):
+        sequence = np.random.random((2, 5, 3)).astype("float32")
+        mask = None
+        if use_mask:
+            mask = np.array(
+                [
+                    [True, True, False, True, False],
+                    [True, False, False, True, True],
+                ]
+            )
+        kwargs = {
+            "units": 4,
+            "return_sequences": return_sequences,
+            "return_state": True,
+            "go_backwards": go_backwards,
+            "zero_output_for_mask": zero_output_for_mask,
+            "reset_after": reset_after,
+        }
+        fused_layer = layers.GRU(use_cudnn="auto", **kwargs)
+        default_layer = layers.GRU(use_cudnn=False, **kwargs)
+        fused_layer.build(sequence.shape)
+        default_layer.build(sequence.shape)
+        default_layer.set_weights(fused_layer.get_weights())
+        fused_outputs = fused_layer(sequence, mask=mask)
+        default_outputs = default_layer(sequence, mask=mask)
+        for fused_output, default_output in zip(fused_outputs, default_outputs):
+            self.assertAllClose(fused_output, default_output)
@@ -414,7 +414,9 @@ class LSTM(RNN):
             Unrolling is only suitable for short sequences.
         use_cudnn: Whether to use a cuDNN-backed implementation. `"auto"` will
             attempt to use cuDNN when feasible, and will fallback to the
-            default implementation if not.
+            default implementation if not. With the JAX and NumPy backends,
+            a fused implementation that precomputes the input projections
+            of all timesteps is used instead of cuDNN.
 
     Call arguments:
         inputs: A 3D tensor, with shape `(batch, timesteps, feature)`.
@@ -520,7 +522,7 @@ class LSTM(RNN):
         if self.use_cudnn in ("auto", True):
             if not self.recurrent_dropout:
                 try:
-                    if self.dropout:
+                    if training and self.dropout:
                         dp_mask = self.cell.get_dropout_mask(sequences[:, 0, :])
                         dp_mask = ops.expand_dims(dp_mask, axis=1)
                         dp_mask = ops.broadcast_to(
@@ -547,6 +549,7 @@ class LSTM(RNN):
                         return_sequences=self.return_sequences,
                         go_backwards=self.go_backwards,
                         unroll=self.unroll,
+                        zero_output_for_mask=self.zero_output_for_mask,
                     )
                     # We disable jit_compile for the model in this case,
                     # since cuDNN ops aren't XLA compatible.
@@ -294,3 +294,38 @@ class LSTMTest(testing.TestCase):
             np.array([[0.10056866, 0.10056866], [0.31006062, 0.31006062]]),
             output,
         )
+
+    @parameterized.product(
+        return_sequences=[True, False],
+        go_backwards=[True, False],
+        zero_output_for_mask=[True, False],
+        use_mask=[True, False],
+    )
+    def test_fused_matches_default_implementation(
+        self, return_sequences, go_backwards, zero_output_for_mask, use_mask
+    ):
+        sequence = np.random.random((2, 5, 3)).astype("float32")
+        mask = None
+        if use_mask:
+            mask = np.array(
+                [
+                    [True, True, False, True, False],
+                    [True, False, False, True, True],
+                ]
+            )
+        kwargs = {
+            "units": 4,
+            "return_sequences": return_sequences,
+            "return_state": True,
+            "go_backwards": go_backwards,
+            "zero_output_for_mask": zero_output_for_mask,
+        }
+        fused_layer = layers.LSTM(use_cudnn="auto", **kwargs)
+        default_layer = layers.LSTM(use_cudnn=False, **kwargs)
+        fused_layer.build(sequence.shape)
+        default_layer.build(sequence.shape)
+        default_layer.set_weights(fused_layer.get_weights())
+        fused_outputs = fused_layer(sequence, mask=mask)
+        default_outputs = default_layer(sequence, mask=mask)
+        for fused_output, default_output in zip(fused_outputs, default_outputs):
+            self.assertAllClose(fused_output, default_output)
@@ -378,6 +378,73 @@ class RNN(Layer):
                 initial_state = self.get_initial_state(
                     batch_size=ops.shape(sequences)[0]
                 )
+        output, states = self._call_with_states(
+            sequences, initial_state, mask=mask, training=training
+        )
+
+        if self.stateful:
+            for self_state, state in zip(
+                tree.flatten(self.states), tree.flatten(states)
+            ):
+                self_state.assign(state)
+
+        if self.return_state:
+            return output, *states
+        return output
+
+    def streaming_call(self, sequences, states, mask=None, training=False):
+        """Processes one chunk of a stream with explicit states.
+
+        This lets you run a RNN over a sequence that arrives chunk by chunk
+        (e.g. live audio), by feeding the states returned for one chunk as
+        the input states of the next chunk. Unlike `call()`, the new states
+        are always returned (regardless of `return_state`), and the state
+        variables of a `stateful` layer are left untouched, so that many
+        independent streams can share the same layer.
+
+        The layer must already be built.
+
+        Args:
+            sequences: A 3-D tensor with shape
+                `(batch_size, chunk_timesteps, features)`.
+            states: List of state tensors for each sample of the batch, as
+                returned by `get_initial_state()` or by a previous call to
+                `streaming_call()`.
+            mask: Optional binary tensor of shape
+                `(batch_size, chunk_timesteps)`.
+            training: Python boolean indicating whether the layer should
+                behave in training mode or in inference mode.
+
+        Returns:
+            A tuple `(output, new_states)`. `output` is the output sequence
+            of the chunk if `return_sequences=True`, or its last output
+            otherwise.
+        """
+        if not self.built:
+            raise ValueError(
+                f"To call streaming_call, {self.__class__.__name__} must be "
+                "built (i.e. its variables must have been already created). "
+                "You can build it by calling it on some data."
+            )
+        if self.go_backwards:
+            raise ValueError(
+                "`streaming_call()` does not support `go_backwards=True`, "
+                "since the chunks of a stream are processed in order."
+            )
+        sequences = backend.convert_to_tensor(
+            sequences, dtype=self.compute_dtype
+        )
+        if self.compute_dtype != self.variable_dtype:
+            # Mirror the autocasting of `Layer.__call__` for mixed dtypes.
+            with backend.AutocastScope(self.compute_dtype):
+                return self._call_with_states(
+                    sequences, states, mask=mask, training=training
+                )
+        return self._call_with_states(
+            sequences, states, mask=mask, training=training
+        )
+
+    def _call_with_states(self, sequences, initial_state, mask, training):
         # RNN expect the states in a list, even if single state.
         if not tree.is_nested(initial_state):
             initial_state = [initial_state]
@@ -412,20 +479,11 @@ class RNN(Layer):
         )
         self._maybe_reset_dropout_masks(self.cell)
 
-        if self.stateful:
-            for self_state, state in zip(
-                tree.flatten(self.states), tree.flatten(states)
-            ):
-                self_state.assign(state)
-
         if self.return_sequences:
             output = outputs
         else:
             output = last_output
-
-        if self.return_state:
-            return output, *states
-        return output
+        return output, states
 
     def _maybe_config_dropout_masks(self, cell, input_sequence, input_state):
         state = (
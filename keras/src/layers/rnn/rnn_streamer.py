@@ -0,0 +1,296 @@
+from keras.src import backend
+from keras.src import ops
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.layers.layer import Layer
+from keras.src.layers.rnn.bidirectional import Bidirectional
+from keras.src.layers.rnn.rnn import RNN
+
+
+@keras_export("keras.utils.RNNStreamer")
+class RNNStreamer:
+    """Runs a stack of recurrent layers over many independent streams.
+
+    `RNNStreamer` is meant for low-latency inference on sequences that arrive
+    chunk by chunk, such as live audio sessions. It keeps the recurrent
+    states of every open stream in a fixed-size state table (one slot per
+    stream), so that chunks coming from many independent streams can be
+    batched together in a single call. The per-chunk step function is
+    compiled once (with `jax.jit` on JAX and `tf.function` on TensorFlow),
+    and only the slots that are part of a call are read and updated.
+
+    Processing a sequence chunk by chunk gives the same outputs as processing
+    the whole sequence at once, as long as every non-recurrent layer of the
+    stack operates independently on each timestep (e.g. `Dense`).
+
+    Args:
+        layers: A `Sequential` model or a list of built layers, applied in
+            order. The stack must contain at least one `RNN` layer (e.g.
+            `LSTM` or `GRU`). `Bidirectional` layers and RNN layers with
+            `go_backwards=True` are not supported, since they need the
+            whole sequence.
+        num_slots: Maximum number of streams that can be open at the same
+            time.
+        jit_compile: Whether to compile the step function. Only relevant
+            with the JAX and TensorFlow backends. Defaults to `True`.
+
+    Example:
+
+    ```python
+    model = keras.Sequential([
+        keras.Input((None, 16)),
+        keras.layers.LSTM(32, return_sequences=True),
+        keras.layers.Dense(8),
+    ])
+    streamer = keras.utils.RNNStreamer(model, num_slots=128)
+
+    slot_a = streamer.open_stream()
+    slot_b = streamer.open_stream()
+    # `chunks` has shape `(2, chunk_timesteps, 16)`: one chunk per stream.
+    outputs = streamer.step([slot_a, slot_b], chunks)
+    ...
+    streamer.close_stream(slot_a)
+    ```
+    """
+
+    def __init__(self, layers, num_slots, jit_compile=True):
+        from keras.src.models import Functional
+        from keras.src.models import Sequential
+
+        if isinstance(layers, Sequential):
+            layers = layers.layers
+        elif isinstance(layers, Functional):
+            raise ValueError(
+                "`RNNStreamer` only supports `Sequential` models or lists of "
+                f"layers. Received a functional model: {layers}"
+            )
+        elif isinstance(layers, Layer):
+            layers = [layers]
+        layers = list(layers)
+        for layer in layers:
+            if not isinstance(layer, Layer) or not layer.built:
+                raise ValueError(
+                    "All layers passed to `RNNStreamer` must be built. "
+                    f"Received: {layer}"
+                )
+            if isinstance(layer, Bidirectional):
+                raise ValueError(
+                    "`RNNStreamer` does not support `Bidirectional` layers, "
+                    "since they need the whole sequence. "
+                    f"Received: {layer}"
+                )
+            if isinstance(layer, RNN) and layer.go_backwards:
+                raise ValueError(
+                    "`RNNStreamer` does not support RNN layers with "
+                    f"`go_backwards=True`. Received: {layer}"
+                )
+        if not any(isinstance(layer, RNN) for layer in layers):
+            raise ValueError(
+                "`RNNStreamer` requires at least one `RNN` layer. "
+                f"Received: layers={layers}"
+            )
+        if not isinstance(num_slots, int) or num_slots < 1:
+            raise ValueError(
+                "Argument `num_slots` must be a positive integer. "
+                f"Received: num_slots={num_slots}"
+            )
+
+        self.layers = layers
+        self.num_slots = num_slots
+        self.jit_compile = jit_compile
+        self._rnn_layers = [layer for layer in layers if isinstance(layer, RNN)]
+        self._trainable_variables = []
+        self._non_trainable_variables = []
+        for layer in layers:
+            self._trainable_variables.extend(layer.trainable_variables)
+            self._non_trainable_variables.extend(layer.non_trainable_variables)
+
+        # The state table holds, for each RNN layer, the flat list of its
+        # states with a leading `num_slots` dimension.
+        self._state_structures = []
+        self._state_table = []
+        for layer in self._rnn_layers:
+            states = layer.get_initial_state(num_slots)
+            self._state_structures.append(states)
+            self._state_table.append(tree.flatten(states))
+        self._open_slots = set()
+        self._free_slots = list(range(num_slots - 1, -1, -1))
+        self._step_function = self._make_step_function()
+
+    def open_stream(self):
+        """Opens a new stream and returns its slot index.
+
+        The states of the stream are set to the initial states of the layers.
+        """
+        if not self._free_slots:
+            raise ValueError(
+                f"All {self.num_slots} slots of the `RNNStreamer` are in use. "
+                "Close a stream with `close_stream()` or create the "
+                "`RNNStreamer` with a larger `num_slots`."
+            )
+        slot = self._free_slots.pop()
+        self._open_slots.add(slot)
+        self.reset_stream(slot)
+        return slot
+
+    def close_stream(self, slot):
+        """Closes a stream, freeing its slot for a new stream."""
+        self._check_open_slots([slot])
+        self._open_slots.remove(slot)
+        self._free_slots.append(slot)
+
+    def reset_stream(self, slot):
+        """Resets the states of an open stream to their initial values."""
+        self._check_open_slots([slot])
+        self.set_state(
+            slot, [layer.get_initial_state(1) for layer in self._rnn_layers]
+        )
+
+    def get_state(self, slot):
+        """Returns the states of an open stream.
+
+        Returns:
+            A list with one entry per RNN layer of the stack, holding the
+            states of that layer (with a leading batch dimension of 1) as
+            NumPy arrays.
+        """
+        self._check_open_slots([slot])
+        states = []
+        for structure, flat_states in zip(
+            self._state_structures, self._state_table
+        ):
+            flat_states = [
+                backend.convert_to_numpy(s[slot : slot + 1])
+                for s in flat_states
+            ]
+            states.append(tree.pack_sequence_as(structure, flat_states))
+        return states
+
+    def set_state(self, slot, states):
+        """Sets the states of an open stream.
+
+        Args:
+            slot: Slot index of the stream.
+            states: A list with one entry per RNN layer of the stack, in the
+                format returned by `get_state()`.
+        """
+        self._check_open_slots([slot])
+        if len(states) != len(self._rnn_layers):
+            raise ValueError(
+                f"Expected states for {len(self._rnn_layers)} RNN layers. "
+                f"Received states for {len(states)} layers."
+            )
+        indices = ops.convert_to_tensor([[slot]], dtype="int32")
+        for i, layer_states in enumerate(states):
+            flat_states = []
+            for s, new_s in zip(
+                self._state_table[i], tree.flatten(layer_states)
+            ):
+                new_s = ops.reshape(new_s, (1,) + tuple(s.shape[1:]))
+                flat_states.append(
+                    ops.scatter_update(s, indices, ops.cast(new_s, s.dtype))
+                )
+            self._state_table[i] = flat_states
+
+    def step(self, slots, inputs, mask=None):
+        """Processes one chunk for each of the given streams.
+
+        Args:
+            slots: List of slot indices of open streams, one per sample of
+                `inputs`.
+            inputs: Chunks to process, with shape
+                `(len(slots), chunk_timesteps, features)`.
+            mask: Optional binary tensor of shape
+                `(len(slots), chunk_timesteps)`, applied to every RNN layer.
+
+        Returns:
+            The outputs of the last layer for the chunks.
+        """
+        slots = [int(slot) for slot in slots]
+        self._check_open_slots(slots)
+        if len(set(slots)) != len(slots):
+            raise ValueError(
+                f"Each stream can only appear once per step. Received: {slots}"
+            )
+        slots = ops.convert_to_tensor(slots, dtype="int32")
+        inputs = ops.convert_to_tensor(inputs)
+        if mask is not None:
+            mask = ops.convert_to_tensor(mask, dtype="bool")
+        outputs, self._state_table = self._step_function(
+            [v.value for v in self._trainable_variables],
+            [v.value for v in self._non_trainable_variables],
+            self._state_table,
+            slots,
+            inputs,
+            mask,
+        )
+        return outputs
+
+    def _check_open_slots(self, slots):
+        for slot in slots:
+            if slot not in self._open_slots:
+                raise ValueError(
+                    f"Slot {slot} is not an open stream. Open a stream with "
+                    "`open_stream()` first."
+                )
+
+    def _stateless_step(
+        self,
+        trainable_variables,
+        non_trainable_variables,
+        state_table,
+        slots,
+        inputs,
+        mask=None,
+    ):
+        mapping = list(
+            zip(self._trainable_variables, trainable_variables)
+        ) + list(zip(self._non_trainable_variables, non_trainable_variables))
+        indices = ops.expand_dims(slots, axis=-1)
+        new_state_table = []
+        with backend.StatelessScope(state_mapping=mapping):
+            x = inputs
+            for layer in self.layers:
+                if not isinstance(layer, RNN):
+                    if layer._call_has_training_arg:
+                        x = layer(x, training=False)
+                    else:
+                        x = layer(x)
+                    continue
+                i = len(new_state_table)
+                flat_states = [
+                    ops.take(s, slots, axis=0) for s in state_table[i]
+                ]
+                states = tree.pack_sequence_as(
+                    self._state_structures[i], flat_states
+                )
+                x, new_states = layer.streaming_call(x, states, mask=mask)
+                new_state_table.append(
+                    [
+                        ops.scatter_update(s, indices, ops.cast(new_s, s.dtype))
+                        for s, new_s in zip(
+                            state_table[i], tree.flatten(new_states)
+                        )
+                    ]
+                )
+        return x, new_state_table
+
+    def _make_step_function(self):
+        if backend.backend() == "jax" and self.jit_compile:
+            import jax
+
+            # The state table is donated, so that it is updated in place.
+            return jax.jit(self._stateless_step, donate_argnums=2)
+        if backend.backend() == "tensorflow" and self.jit_compile:
+            import tensorflow as tf
+
+            return tf.function(self._stateless_step, reduce_retracing=True)
+        if backend.backend() == "torch":
+            import torch
+
+            def step_function(*args):
+                with torch.no_grad():
+                    return self._stateless_step(*args)
+
+            return step_function
+        return self._stateless_step
@@ -0,0 +1,123 @@
+import numpy as np
+
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.layers.rnn.rnn_streamer import RNNStreamer
+
+
+class RNNStreamerTest(testing.TestCase):
+    def _get_model(self):
+        return models.Sequential(
+            [
+                layers.Input((None, 3)),
+                layers.LSTM(4, return_sequences=True),
+                layers.Dense(5),
+                layers.GRU(2, return_sequences=True),
+            ]
+        )
+
+    def test_chunks_match_full_sequence(self):
+        model = self._get_model()
+        sequences = np.random.random((3, 8, 3)).astype("float32")
+        expected = model.predict(sequences, verbose=0)
+
+        streamer = RNNStreamer(model, num_slots=4)
+        slots = [streamer.open_stream() for _ in range(3)]
+        outputs = []
+        for start in range(0, 8, 2):
+            outputs.append(
+                streamer.step(slots, sequences[:, start : start + 2])
+            )
+        outputs = np.concatenate([np.asarray(o) for o in outputs], axis=1)
+        self.assertAllClose(outputs, expected, atol=1e-5)
+
+    def test_interleaved_streams(self):
+        model = self._get_model()
+        sequence_a = np.random.random((1, 4, 3)).astype("float32")
+        sequence_b = np.random.random((1, 4, 3)).astype("float32")
+        expected_a = model.predict(sequence_a, verbose=0)
+        expected_b = model.predict(sequence_b, verbose=0)
+
+        streamer = RNNStreamer(model, num_slots=2)
+        slot_a = streamer.open_stream()
+        slot_b = streamer.open_stream()
+        output_a1 = streamer.step([slot_a], sequence_a[:, :2])
+        output_b1 = streamer.step([slot_b], sequence_b[:, :3])
+        outputs = streamer.step(
+            [slot_b, slot_a],
+            np.concatenate([sequence_b[:, 3:], sequence_a[:, 2:3]], axis=0),
+        )
+        output_a2 = streamer.step([slot_a], sequence_a[:, 3:])
+        self.assertAllClose(output_a1, expected_a[:, :2], atol=1e-5)
+        self.assertAllClose(output_b1, expected_b[:, :3], atol=1e-5)
+        self.assertAllClose(outputs[:1], expected_b[:, 3:], atol=1e-5)
+        self.assertAllClose(outputs[1:], expected_a[:, 2:3], atol=1e-5)
+        self.assertAllClose(output_a2, expected_a[:, 3:], atol=1e-5)
+
+    def test_slot_reuse_and_state(self):
+        model = self._get_model()
+        sequence = np.random.random((1, 4, 3)).astype("float32")
+        expected = model.predict(sequence, verbose=0)
+
+        streamer = RNNStreamer(model, num_slots=1)
+        slot = streamer.open_stream()
+        streamer.step([slot], sequence[:, :2])
+        states = streamer.get_state(slot)
+        self.assertLen(states, 2)
+        self.assertEqual(states[0][0].shape, (1, 4))
+        self.assertEqual(states[1][0].shape, (1, 2))
+
+        # A closed slot is reset when reopened.
+        streamer.close_stream(slot)
+        slot = streamer.open_stream()
+        self.assertAllClose(streamer.get_state(slot)[0][0], np.zeros((1, 4)))
+        output = streamer.step([slot], sequence)
+        self.assertAllClose(output, expected, atol=1e-5)
+
+        # Restoring a saved state resumes the stream.
+        streamer.set_state(slot, states)
+        output = streamer.step([slot], sequence[:, 2:])
+        self.assertAllClose(output, expected[:, 2:], atol=1e-5)
+
+    def test_masking(self):
+        model = self._get_model()
+        sequences = np.random.random((2, 4, 3)).astype("float32")
+        mask = np.array([[True, False, True, True], [True, True, True, False]])
+        expected = model.layers[0](sequences, mask=mask)
+        expected = model.layers[1](expected)
+        expected = model.layers[2](expected, mask=mask)
+
+        streamer = RNNStreamer(model, num_slots=2)
+        slots = [streamer.open_stream() for _ in range(2)]
+        output_1 = streamer.step(slots, sequences[:, :2], mask=mask[:, :2])
+        output_2 = streamer.step(slots, sequences[:, 2:], mask=mask[:, 2:])
+        self.assertAllClose(
+            np.concatenate([output_1, output_2], axis=1), expected, atol=1e-5
+        )
+
+    def test_errors(self):
+        model = self._get_model()
+        with self.assertRaisesRegex(ValueError, "`Bidirectional` layers"):
+            bidirectional = layers.Bidirectional(layers.LSTM(2))
+            bidirectional.build((None, 4, 3))
+            RNNStreamer([bidirectional], num_slots=1)
+        with self.assertRaisesRegex(ValueError, "go_backwards"):
+            lstm = layers.LSTM(2, go_backwards=True)
+            lstm.build((None, 4, 3))
+            RNNStreamer([lstm], num_slots=1)
+        with self.assertRaisesRegex(ValueError, "at least one `RNN` layer"):
+            RNNStreamer(
+                models.Sequential([layers.Input((3,)), layers.Dense(2)]),
+                num_slots=1,
+            )
+
+        streamer = RNNStreamer(model, num_slots=1)
+        slot = streamer.open_stream()
+        with self.assertRaisesRegex(ValueError, "slots of the `RNNStreamer`"):
+            streamer.open_stream()
+        with self.assertRaisesRegex(ValueError, "only appear once"):
+            streamer.step([slot, slot], np.zeros((2, 1, 3)))
+        streamer.close_stream(slot)
+        with self.assertRaisesRegex(ValueError, "is not an open stream"):
+            streamer.step([slot], np.zeros((1, 1, 3)))
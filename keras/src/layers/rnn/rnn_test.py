@@ -383,4 +383,27 @@ class RNNTest(testing.TestCase):
         layer = layers.RNN(OneStateRNNCell(2), return_sequences=False)
         self.run_class_serialization_test(layer)
 
+    def test_streaming_call(self):
+        sequence = np.arange(24).reshape((2, 4, 3)).astype("float32")
+        layer = layers.RNN(
+            TwoStatesRNNCell(2), return_sequences=True, stateful=True
+        )
+        expected = layer(sequence)
+        layer.reset_state()
+
+        states = layer.get_initial_state(2)
+        output_1, states = layer.streaming_call(sequence[:, :3], states)
+        output_2, states = layer.streaming_call(sequence[:, 3:], states)
+        self.assertAllClose(
+            ops.concatenate([output_1, output_2], axis=1), expected
+        )
+        self.assertLen(states, 2)
+        # Stateful layers' state variables are left untouched.
+        self.assertAllClose(layer.states[0], np.zeros((2, 2)))
+
+        layer = layers.RNN(OneStateRNNCell(2), go_backwards=True)
+        layer.build(sequence.shape)
+        with self.assertRaisesRegex(ValueError, "go_backwards"):
+            layer.streaming_call(sequence, layer.get_initial_state(2))
+
     # TODO: test masking
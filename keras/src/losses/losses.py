@@ -1,7 +1,9 @@
+import math
 import warnings
 
 from keras.src import backend
 from keras.src import ops
+from keras.src import random
 from keras.src import tree
 from keras.src.api_export import keras_export
 from keras.src.losses.loss import Loss
@@ -2590,3 +2592,247 @@ def circle(
     circle_loss = ops.softplus(p_loss + n_loss)
     backend.set_keras_mask(circle_loss, circle_loss > 0)
     return circle_loss
+
+
+def _sample_candidates(sampler, num_sampled, num_classes, seed=None):
+    """Samples candidate classes with replacement.
+
+    Returns the sampled classes and a function returning the log of the
+    expected count of given classes among the samples.
+    """
+    if isinstance(sampler, str) and sampler == "uniform":
+        sampled = random.randint((num_sampled,), 0, num_classes, seed=seed)
+
+        def log_probs(classes):
+            return ops.full(ops.shape(classes), -math.log(num_classes))
+
+    elif isinstance(sampler, str) and sampler == "log_uniform":
+        # Zipfian distribution: P(c) = log((c + 2) / (c + 1)) / log(V + 1),
+        # which suits classes sorted by decreasing frequency.
+        log_range = math.log(num_classes + 1.0)
+        sampled = ops.exp(random.uniform((num_sampled,), seed=seed) * log_range)
+        sampled = ops.clip(ops.floor(sampled) - 1.0, 0, num_classes - 1)
+        sampled = ops.cast(sampled, "int32")
+
+        def log_probs(classes):
+            classes = ops.cast(classes, "float32")
+            return ops.log(ops.log1p(1.0 / (classes + 1.0)) / log_range)
+
+    elif isinstance(sampler, str):
+        raise ValueError(
+            "Argument `sampler` must be one of 'uniform', 'log_uniform' or "
+            f"a list of class counts. Received: sampler={sampler}"
+        )
+    else:
+        # Unigram distribution proportional to the given class counts,
+        # sampled by inverting its cumulative distribution.
+        counts = ops.cast(sampler, "float32")
+        if tuple(counts.shape) != (num_classes,):
+            raise ValueError(
+                "When `sampler` is a list of class counts, it must have "
+                f"`num_classes={num_classes}` entries. "
+                f"Received: len(sampler)={counts.shape[0]}"
+            )
+        cumulative_counts = ops.cumsum(counts)
+        total = cumulative_counts[-1]
+        sampled = ops.searchsorted(
+            cumulative_counts,
+            random.uniform((num_sampled,), seed=seed) * total,
+            side="right",
+        )
+        sampled = ops.cast(ops.clip(sampled, 0, num_classes - 1), "int32")
+
+        def log_probs(classes):
+            return ops.log(ops.take(counts, classes) / total)
+
+    def log_expected_count(classes):
+        return log_probs(classes) + math.log(num_sampled)
+
+    return sampled, log_expected_count
+
+
+def _sampled_logits(
+    y_true,
+    inputs,
+    kernel,
+    bias,
+    num_sampled,
+    sampler,
+    remove_accidental_hits,
+    seed,
+):
+    inputs = ops.convert_to_tensor(inputs)
+    kernel = ops.convert_to_tensor(kernel, dtype=inputs.dtype)
+    y_true = ops.cast(y_true, "int32")
+    if len(y_true.shape) == len(inputs.shape) and y_true.shape[-1] == 1:
+        y_true = ops.squeeze(y_true, axis=-1)
+    batch_shape = ops.shape(inputs)[:-1]
+    inputs = ops.reshape(inputs, (-1, inputs.shape[-1]))
+    y_true = ops.reshape(y_true, (-1,))
+    num_classes = kernel.shape[-1]
+
+    sampled, log_expected_count = _sample_candidates(
+        sampler, num_sampled, num_classes, seed=seed
+    )
+    true_kernel = ops.transpose(ops.take(kernel, y_true, axis=1))
+    true_logits = ops.sum(inputs * true_kernel, axis=-1)
+    sampled_logits = ops.matmul(inputs, ops.take(kernel, sampled, axis=1))
+    if bias is not None:
+        bias = ops.convert_to_tensor(bias, dtype=inputs.dtype)
+        true_logits = true_logits + ops.take(bias, y_true)
+        sampled_logits = sampled_logits + ops.take(bias, sampled)
+    # Correct for the sampling probabilities of the candidates.
+    true_logits = true_logits - ops.cast(
+        log_expected_count(y_true), inputs.dtype
+    )
+    sampled_logits = sampled_logits - ops.cast(
+        log_expected_count(sampled), inputs.dtype
+    )
+    if remove_accidental_hits:
+        accidental_hits = ops.equal(
+            ops.expand_dims(y_true, -1), ops.expand_dims(sampled, 0)
+        )
+        sampled_logits = ops.where(
+            accidental_hits, ops.cast(-1e9, inputs.dtype), sampled_logits
+        )
+    return true_logits, sampled_logits, batch_shape
+
+
+@keras_export("keras.losses.sampled_softmax_loss")
+def sampled_softmax_loss(
+    y_true,
+    inputs,
+    kernel,
+    bias=None,
+    num_sampled=64,
+    sampler="log_uniform",
+    remove_accidental_hits=True,
+    seed=None,
+):
+    """Computes the sampled softmax loss of a linear classifier.
+
+    This is a fast approximation of
+    `sparse_categorical_crossentropy(y_true, inputs @ kernel + bias,
+    from_logits=True)` for a large number of classes: the softmax is only
+    computed over the true class and `num_sampled` candidate classes drawn
+    from `sampler`, with logits corrected by the expected count of each
+    candidate. The cost scales with `num_sampled` instead of the number of
+    classes. It should only be used for training, the full cross-entropy
+    should be used for evaluation.
+
+    Args:
+        y_true: The integer class labels, with the shape of `inputs` without
+            its last dimension.
+        inputs: The inputs of the classifier, of shape `(..., input_dim)`.
+        kernel: The classifier kernel, of shape `(input_dim, num_classes)`.
+        bias: Optional classifier bias of shape `(num_classes,)`.
+        num_sampled: The number of candidate classes sampled for the whole
+            batch. Defaults to `64`.
+        sampler: The candidate distribution. Either `"log_uniform"` (Zipfian,
+            for classes sorted by decreasing frequency), `"uniform"`, or a
+            list of `num_classes` class counts for a unigram distribution.
+            Candidates are sampled with replacement. Defaults to
+            `"log_uniform"`.
+        remove_accidental_hits: Whether to mask sampled candidates that are
+            equal to the true class. Defaults to `True`.
+        seed: A Python integer or a `keras.random.SeedGenerator` instance
+            used to sample the candidates.
+
+    Returns:
+        The sampled softmax loss of each sample, with the shape of `inputs`
+        without its last dimension.
+
+    Example:
+
+    >>> inputs = keras.random.normal((8, 16))
+    >>> kernel = keras.random.normal((16, 100000))
+    >>> y_true = keras.random.randint((8,), 0, 100000)
+    >>> keras.losses.sampled_softmax_loss(
+    ...     y_true, inputs, kernel, num_sampled=128, seed=1
+    ... ).shape
+    (8,)
+    """
+    true_logits, sampled_logits, batch_shape = _sampled_logits(
+        y_true,
+        inputs,
+        kernel,
+        bias,
+        num_sampled,
+        sampler,
+        remove_accidental_hits,
+        seed,
+    )
+    logits = ops.concatenate(
+        [ops.expand_dims(true_logits, -1), sampled_logits], axis=-1
+    )
+    loss = ops.logsumexp(logits, axis=-1) - true_logits
+    return ops.reshape(loss, batch_shape)
+
+
+@keras_export("keras.losses.nce_loss")
+def nce_loss(
+    y_true,
+    inputs,
+    kernel,
+    bias=None,
+    num_sampled=64,
+    sampler="log_uniform",
+    remove_accidental_hits=True,
+    seed=None,
+):
+    """Computes the noise-contrastive estimation loss of a linear classifier.
+
+    The classifier is trained to tell the true class apart from
+    `num_sampled` noise classes drawn from `sampler`, with independent
+    logistic regressions on the logits corrected by the expected count of
+    each class. The cost scales with `num_sampled` instead of the number of
+    classes. It should only be used for training.
+
+    Args:
+        y_true: The integer class labels, with the shape of `inputs` without
+            its last dimension.
+        inputs: The inputs of the classifier, of shape `(..., input_dim)`.
+        kernel: The classifier kernel, of shape `(input_dim, num_classes)`.
+        bias: Optional classifier bias of shape `(num_classes,)`.
+        num_sampled: The number of noise classes sampled for the whole batch.
+            Defaults to `64`.
+        sampler: The noise distribution. Either `"log_uniform"` (Zipfian,
+            for classes sorted by decreasing frequency), `"uniform"`, or a
+            list of `num_classes` class counts for a unigram distribution.
+            Classes are sampled with replacement. Defaults to
+            `"log_uniform"`.
+        remove_accidental_hits: Whether to mask sampled classes that are
+            equal to the true class. Defaults to `True`.
+        seed: A Python integer or a `keras.random.SeedGenerator` instance
+            used to sample the noise classes.
+
+    Returns:
+        The NCE loss of each sample, with the shape of `inputs` without its
+        last dimension.
+
+    Example:
+
+    >>> inputs = keras.random.normal((8, 16))
+    >>> kernel = keras.random.normal((16, 100000))
+    >>> y_true = keras.random.randint((8,), 0, 100000)
+    >>> keras.losses.nce_loss(
+    ...     y_true, inputs, kernel, num_sampled=128, seed=1
+    ... ).shape
+    (8,)
+    """
+    true_logits, sampled_logits, batch_shape = _sampled_logits(
+        y_true,
+        inputs,
+        kernel,
+        bias,
+        num_sampled,
+        sampler,
+        remove_accidental_hits,
+        seed,
+    )
+    # Masked accidental hits have a large negative logit and contribute
+    # nothing to the loss.
+    loss = ops.softplus(-true_logits) + ops.sum(
+        ops.softplus(sampled_logits), axis=-1
+    )
+    return ops.reshape(loss, batch_shape)
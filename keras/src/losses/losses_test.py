@@ -1741,3 +1741,107 @@ class CircleTest(testing.TestCase):
         circle_loss = losses.Circle(dtype="bfloat16")
         loss = circle_loss(self.y_true, self.y_pred)
         self.assertDType(loss, "bfloat16")
+
+
+class SampledLossesTest(testing.TestCase):
+    def setup(self):
+        rng = np.random.default_rng(0)
+        self.inputs = rng.normal(size=(6, 8)).astype("float32")
+        self.kernel = rng.normal(size=(8, 50)).astype("float32")
+        self.bias = rng.normal(size=(50,)).astype("float32")
+        self.y_true = np.array([0, 3, 7, 7, 20, 49])
+
+    def _expected_logits(self, sampler, num_sampled, seed):
+        sampled, log_expected_count = losses._sample_candidates(
+            sampler, num_sampled, 50, seed=seed
+        )
+        sampled = np.asarray(sampled)
+        logits = self.inputs @ self.kernel + self.bias
+        true_logits = logits[np.arange(6), self.y_true] - np.asarray(
+            log_expected_count(self.y_true)
+        )
+        sampled_logits = logits[:, sampled] - np.asarray(
+            log_expected_count(sampled)
+        )
+        hits = self.y_true[:, None] == sampled[None, :]
+        sampled_logits = np.where(hits, -1e9, sampled_logits)
+        return true_logits, sampled_logits
+
+    def test_sampled_softmax_loss(self):
+        self.setup()
+        for sampler in ("uniform", "log_uniform", list(range(1, 51))):
+            loss = losses.sampled_softmax_loss(
+                self.y_true,
+                self.inputs,
+                self.kernel,
+                self.bias,
+                num_sampled=10,
+                sampler=sampler,
+                seed=3,
+            )
+            true_logits, sampled_logits = self._expected_logits(sampler, 10, 3)
+            logits = np.concatenate([true_logits[:, None], sampled_logits], 1)
+            max_logits = np.max(logits, axis=1)
+            expected = (
+                np.log(np.sum(np.exp(logits - max_logits[:, None]), axis=1))
+                + max_logits
+                - true_logits
+            )
+            self.assertAllClose(loss, expected, atol=1e-4)
+
+    def test_nce_loss(self):
+        self.setup()
+        loss = losses.nce_loss(
+            self.y_true[:, None],
+            self.inputs,
+            self.kernel,
+            self.bias,
+            num_sampled=10,
+            sampler="uniform",
+            seed=3,
+        )
+        true_logits, sampled_logits = self._expected_logits("uniform", 10, 3)
+        expected = np.log1p(np.exp(-true_logits)) + np.sum(
+            np.log1p(np.exp(sampled_logits)), axis=1
+        )
+        self.assertAllClose(loss, expected, atol=1e-4)
+
+    def test_samplers(self):
+        sampled, _ = losses._sample_candidates("log_uniform", 10000, 1000, 1)
+        sampled = np.asarray(sampled)
+        self.assertTrue(np.all((sampled >= 0) & (sampled < 1000)))
+        # P(0) = log(2) / log(1001) ~= 0.1.
+        self.assertAllClose(np.mean(sampled == 0), 0.1, atol=0.02)
+
+        counts = np.zeros((10,))
+        counts[[2, 5]] = [1.0, 3.0]
+        sampled, log_expected_count = losses._sample_candidates(
+            counts, 1000, 10, 1
+        )
+        sampled = np.asarray(sampled)
+        self.assertEqual(set(np.unique(sampled)), {2, 5})
+        self.assertAllClose(np.mean(sampled == 5), 0.75, atol=0.05)
+        self.assertAllClose(
+            log_expected_count(np.array([5])), [np.log(750.0)], atol=1e-5
+        )
+
+    def test_accidental_hits(self):
+        self.setup()
+        # Only the true class can be sampled and all its hits are removed.
+        counts = np.zeros((50,))
+        counts[7] = 1.0
+        loss = losses.sampled_softmax_loss(
+            np.array([7, 7]), self.inputs[:2], self.kernel, sampler=counts
+        )
+        self.assertAllClose(loss, [0.0, 0.0])
+
+    def test_invalid_sampler(self):
+        self.setup()
+        with self.assertRaisesRegex(ValueError, "sampler"):
+            losses.sampled_softmax_loss(
+                self.y_true, self.inputs, self.kernel, sampler="zipf"
+            )
+        with self.assertRaisesRegex(ValueError, "num_classes=50"):
+            losses.nce_loss(
+                self.y_true, self.inputs, self.kernel, sampler=[1.0, 2.0]
+            )
@@ -38,6 +38,11 @@ from keras.src.metrics.probabilistic_metrics import Poisson
 from keras.src.metrics.probabilistic_metrics import (
     SparseCategoricalCrossentropy,
 )
+from keras.src.metrics.quantile_metrics import AbsoluteErrorQuantiles
+from keras.src.metrics.quantile_metrics import Quantiles
+from keras.src.metrics.ranking_metrics import NDCG
+from keras.src.metrics.ranking_metrics import MeanReciprocalRank
+from keras.src.metrics.ranking_metrics import RecallAtK
 from keras.src.metrics.reduction_metrics import Mean
 from keras.src.metrics.reduction_metrics import MeanMetricWrapper
 from keras.src.metrics.reduction_metrics import Sum
@@ -108,6 +113,13 @@ ALL_OBJECTS = {
     MeanIoU,
     OneHotIoU,
     OneHotMeanIoU,
+    # Ranking
+    RecallAtK,
+    NDCG,
+    MeanReciprocalRank,
+    # Quantiles
+    Quantiles,
+    AbsoluteErrorQuantiles,
 }
 ALL_OBJECTS_DICT = {cls.__name__: cls for cls in ALL_OBJECTS}
 ALL_OBJECTS_DICT.update(
@@ -34,9 +34,6 @@ class _ConfusionMatrixConditionCount(Metric):
         self.thresholds = metrics_utils.parse_init_thresholds(
             thresholds, default_threshold=0.5
         )
-        self._thresholds_distributed_evenly = (
-            metrics_utils.is_evenly_distributed_thresholds(self.thresholds)
-        )
         self.accumulator = self.add_variable(
             shape=(len(self.thresholds),),
             initializer=initializers.Zeros(),
@@ -53,15 +50,16 @@ class _ConfusionMatrixConditionCount(Metric):
                 Can be a tensor whose rank is either 0, or the same rank as
                 `y_true`, and must be broadcastable to `y_true`.
         """
+        variables, kwargs = self._confusion_matrix_update_args()
         return metrics_utils.update_confusion_matrix_variables(
-            {self._confusion_matrix_cond: self.accumulator},
-            y_true,
-            y_pred,
-            thresholds=self.thresholds,
-            thresholds_distributed_evenly=self._thresholds_distributed_evenly,
-            sample_weight=sample_weight,
+            variables, y_true, y_pred, sample_weight=sample_weight, **kwargs
         )
 
+    def _confusion_matrix_update_args(self):
+        return {self._confusion_matrix_cond: self.accumulator}, {
+            "thresholds": self.thresholds,
+        }
+
     def result(self):
         if len(self.thresholds) == 1:
             result = self.accumulator[0]
@@ -349,9 +347,6 @@ class Precision(Metric):
         self.thresholds = metrics_utils.parse_init_thresholds(
             thresholds, default_threshold=default_threshold
         )
-        self._thresholds_distributed_evenly = (
-            metrics_utils.is_evenly_distributed_thresholds(self.thresholds)
-        )
         self.true_positives = self.add_variable(
             shape=(len(self.thresholds),),
             initializer=initializers.Zeros(),
@@ -375,20 +370,21 @@ class Precision(Metric):
                 Can be a tensor whose rank is either 0, or the same rank as
                 `y_true`, and must be broadcastable to `y_true`.
         """
+        variables, kwargs = self._confusion_matrix_update_args()
         metrics_utils.update_confusion_matrix_variables(
-            {
-                metrics_utils.ConfusionMatrix.TRUE_POSITIVES: self.true_positives,  # noqa: E501
-                metrics_utils.ConfusionMatrix.FALSE_POSITIVES: self.false_positives,  # noqa: E501
-            },
-            y_true,
-            y_pred,
-            thresholds=self.thresholds,
-            thresholds_distributed_evenly=self._thresholds_distributed_evenly,
-            top_k=self.top_k,
-            class_id=self.class_id,
-            sample_weight=sample_weight,
+            variables, y_true, y_pred, sample_weight=sample_weight, **kwargs
         )
 
+    def _confusion_matrix_update_args(self):
+        return {
+            metrics_utils.ConfusionMatrix.TRUE_POSITIVES: self.true_positives,
+            metrics_utils.ConfusionMatrix.FALSE_POSITIVES: self.false_positives,
+        }, {
+            "thresholds": self.thresholds,
+            "top_k": self.top_k,
+            "class_id": self.class_id,
+        }
+
     def result(self):
         result = ops.divide_no_nan(
             self.true_positives,
@@ -493,9 +489,6 @@ class Recall(Metric):
         self.thresholds = metrics_utils.parse_init_thresholds(
             thresholds, default_threshold=default_threshold
         )
-        self._thresholds_distributed_evenly = (
-            metrics_utils.is_evenly_distributed_thresholds(self.thresholds)
-        )
         self.true_positives = self.add_variable(
             shape=(len(self.thresholds),),
             initializer=initializers.Zeros(),
@@ -519,20 +512,21 @@ class Recall(Metric):
                 Can be a tensor whose rank is either 0, or the same rank as
                 `y_true`, and must be broadcastable to `y_true`.
         """
+        variables, kwargs = self._confusion_matrix_update_args()
         metrics_utils.update_confusion_matrix_variables(
-            {
-                metrics_utils.ConfusionMatrix.TRUE_POSITIVES: self.true_positives,  # noqa: E501
-                metrics_utils.ConfusionMatrix.FALSE_NEGATIVES: self.false_negatives,  # noqa: E501
-            },
-            y_true,
-            y_pred,
-            thresholds=self.thresholds,
-            thresholds_distributed_evenly=self._thresholds_distributed_evenly,
-            top_k=self.top_k,
-            class_id=self.class_id,
-            sample_weight=sample_weight,
+            variables, y_true, y_pred, sample_weight=sample_weight, **kwargs
         )
 
+    def _confusion_matrix_update_args(self):
+        return {
+            metrics_utils.ConfusionMatrix.TRUE_POSITIVES: self.true_positives,
+            metrics_utils.ConfusionMatrix.FALSE_NEGATIVES: self.false_negatives,
+        }, {
+            "thresholds": self.thresholds,
+            "top_k": self.top_k,
+            "class_id": self.class_id,
+        }
+
     def result(self):
         result = ops.divide_no_nan(
             self.true_positives,
@@ -580,14 +574,12 @@ class SensitivitySpecificityBase(Metric):
         # Compute `num_thresholds` thresholds in [0, 1]
         if num_thresholds == 1:
             self.thresholds = [0.5]
-            self._thresholds_distributed_evenly = False
         else:
             thresholds = [
                 (i + 1) * 1.0 / (num_thresholds - 1)
                 for i in range(num_thresholds - 2)
             ]
             self.thresholds = [0.0] + thresholds + [1.0]
-            self._thresholds_distributed_evenly = True
 
         self.true_positives = self.add_variable(
             shape=(len(self.thresholds),),
@@ -620,21 +612,22 @@ class SensitivitySpecificityBase(Metric):
                 Can be a tensor whose rank is either 0, or the same rank as
                 `y_true`, and must be broadcastable to `y_true`.
         """
+        variables, kwargs = self._confusion_matrix_update_args()
         metrics_utils.update_confusion_matrix_variables(
-            {
-                metrics_utils.ConfusionMatrix.TRUE_POSITIVES: self.true_positives,  # noqa: E501
-                metrics_utils.ConfusionMatrix.TRUE_NEGATIVES: self.true_negatives,  # noqa: E501
-                metrics_utils.ConfusionMatrix.FALSE_POSITIVES: self.false_positives,  # noqa: E501
-                metrics_utils.ConfusionMatrix.FALSE_NEGATIVES: self.false_negatives,  # noqa: E501
-            },
-            y_true,
-            y_pred,
-            thresholds=self.thresholds,
-            thresholds_distributed_evenly=self._thresholds_distributed_evenly,
-            class_id=self.class_id,
-            sample_weight=sample_weight,
+            variables, y_true, y_pred, sample_weight=sample_weight, **kwargs
         )
 
+    def _confusion_matrix_update_args(self):
+        return {
+            metrics_utils.ConfusionMatrix.TRUE_POSITIVES: self.true_positives,
+            metrics_utils.ConfusionMatrix.TRUE_NEGATIVES: self.true_negatives,
+            metrics_utils.ConfusionMatrix.FALSE_POSITIVES: self.false_positives,
+            metrics_utils.ConfusionMatrix.FALSE_NEGATIVES: self.false_negatives,
+        }, {
+            "thresholds": self.thresholds,
+            "class_id": self.class_id,
+        }
+
     def reset_state(self):
         num_thresholds = len(self.thresholds)
         self.true_positives.assign(ops.zeros((num_thresholds,)))
@@ -1224,11 +1217,6 @@ class AUC(Metric):
             # If specified, use the supplied thresholds.
             self.num_thresholds = len(thresholds) + 2
             thresholds = sorted(thresholds)
-            self._thresholds_distributed_evenly = (
-                metrics_utils.is_evenly_distributed_thresholds(
-                    np.array([0.0] + thresholds + [1.0])
-                )
-            )
         else:
             if num_thresholds <= 1:
                 raise ValueError(
@@ -1243,7 +1231,6 @@ class AUC(Metric):
                 (i + 1) * 1.0 / (num_thresholds - 1)
                 for i in range(num_thresholds - 2)
             ]
-            self._thresholds_distributed_evenly = True
 
         # Add an endpoint "threshold" below zero and above one for either
         # threshold method to account for floating point imprecisions.
@@ -1373,22 +1360,27 @@ class AUC(Metric):
         if self._from_logits:
             y_pred = activations.sigmoid(y_pred)
 
+        variables, kwargs = self._confusion_matrix_update_args()
         metrics_utils.update_confusion_matrix_variables(
-            {
-                metrics_utils.ConfusionMatrix.TRUE_POSITIVES: self.true_positives,  # noqa: E501
-                metrics_utils.ConfusionMatrix.TRUE_NEGATIVES: self.true_negatives,  # noqa: E501
-                metrics_utils.ConfusionMatrix.FALSE_POSITIVES: self.false_positives,  # noqa: E501
-                metrics_utils.ConfusionMatrix.FALSE_NEGATIVES: self.false_negatives,  # noqa: E501
-            },
+            variables,
             y_true,
             y_pred,
-            self._thresholds,
-            thresholds_distributed_evenly=self._thresholds_distributed_evenly,
             sample_weight=sample_weight,
-            multi_label=self.multi_label,
             label_weights=label_weights,
+            **kwargs,
         )
 
+    def _confusion_matrix_update_args(self):
+        return {
+            metrics_utils.ConfusionMatrix.TRUE_POSITIVES: self.true_positives,
+            metrics_utils.ConfusionMatrix.TRUE_NEGATIVES: self.true_negatives,
+            metrics_utils.ConfusionMatrix.FALSE_POSITIVES: self.false_positives,
+            metrics_utils.ConfusionMatrix.FALSE_NEGATIVES: self.false_negatives,
+        }, {
+            "thresholds": self._thresholds,
+            "multi_label": self.multi_label,
+        }
+
     def interpolate_pr_auc(self):
         """Interpolation formula inspired by section 4 of Davis & Goadrich 2006.
 
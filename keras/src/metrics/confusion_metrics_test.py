@@ -539,6 +539,16 @@ class PrecisionTest(testing.TestCase):
         self.assertAlmostEqual(1, p_obj.true_positives)
         self.assertAlmostEqual(0, p_obj.false_positives)
 
+    def test_unsorted_thresholds(self):
+        p_obj = metrics.Precision(thresholds=[0.7, 0.2, 0.5, 0.2])
+        y_pred = np.array([0.2, 0.8, 0.6, 0.1, 0.5, 0.7])
+        y_true = np.array([0, 1, 0, 0, 1, 1])
+        result = p_obj(y_true, y_pred)
+        # Predictions must be strictly greater than the thresholds.
+        self.assertAllClose([1, 3, 2, 3], p_obj.true_positives)
+        self.assertAllClose([0, 1, 1, 1], p_obj.false_positives)
+        self.assertAllClose([1, 0.75, 2 / 3, 0.75], result)
+
 
 class RecallTest(testing.TestCase):
     def test_config(self):
@@ -1441,6 +1451,35 @@ class AUCTest(testing.TestCase):
         except ImportError as e:
             logging.warning(f"Cannot test special functions: {str(e)}")
 
+    def test_many_thresholds(self):
+        rng = np.random.default_rng(1337)
+        y_true = rng.integers(0, 2, size=(64, 3))
+        y_pred = rng.random((64, 3)).astype("float32")
+        sample_weight = rng.random((64,)).astype("float32")
+        auc_obj = metrics.AUC(num_thresholds=10000)
+        auc_obj.update_state(y_true, y_pred, sample_weight=sample_weight)
+
+        thresholds = np.array(auc_obj.thresholds, dtype="float32")
+        pred_is_pos = y_pred.reshape(1, -1) > thresholds.reshape(-1, 1)
+        label_is_pos = y_true.reshape(1, -1) == 1
+        weights = np.repeat(sample_weight, 3).reshape(1, -1)
+        self.assertAllClose(
+            auc_obj.true_positives,
+            np.sum(pred_is_pos * label_is_pos * weights, axis=1),
+        )
+        self.assertAllClose(
+            auc_obj.false_positives,
+            np.sum(pred_is_pos * ~label_is_pos * weights, axis=1),
+        )
+        self.assertAllClose(
+            auc_obj.true_negatives,
+            np.sum(~pred_is_pos * ~label_is_pos * weights, axis=1),
+        )
+        self.assertAllClose(
+            auc_obj.false_negatives,
+            np.sum(~pred_is_pos * label_is_pos * weights, axis=1),
+        )
+
 
 class MultiAUCTest(testing.TestCase):
     def setUp(self):
@@ -1688,3 +1727,30 @@ class MultiAUCTest(testing.TestCase):
         auc_obj(self.y_true_good, self.y_pred)
         auc_obj.reset_state()
         self.assertAllClose(auc_obj.true_positives, np.zeros((5, 2)))
+
+    def test_many_thresholds(self):
+        rng = np.random.default_rng(1337)
+        y_true = rng.integers(0, 2, size=(64, 3))
+        y_pred = rng.random((64, 3)).astype("float32")
+        auc_obj = metrics.AUC(num_thresholds=10000, multi_label=True)
+        auc_obj.update_state(y_true, y_pred)
+
+        thresholds = np.array(auc_obj.thresholds, dtype="float32")
+        pred_is_pos = y_pred[None, :, :] > thresholds[:, None, None]
+        label_is_pos = y_true[None, :, :] == 1
+        self.assertEqual(auc_obj.true_positives.shape, (10000, 3))
+        self.assertAllClose(
+            auc_obj.true_positives, np.sum(pred_is_pos * label_is_pos, axis=1)
+        )
+        self.assertAllClose(
+            auc_obj.false_positives,
+            np.sum(pred_is_pos * ~label_is_pos, axis=1),
+        )
+        self.assertAllClose(
+            auc_obj.true_negatives,
+            np.sum(~pred_is_pos * ~label_is_pos, axis=1),
+        )
+        self.assertAllClose(
+            auc_obj.false_negatives,
+            np.sum(~pred_is_pos * label_is_pos, axis=1),
+        )
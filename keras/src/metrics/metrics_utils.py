@@ -4,6 +4,7 @@ import numpy as np
 
 from keras.src import backend
 from keras.src import ops
+from keras.src import tree
 from keras.src.losses.loss import squeeze_or_expand_to_same_rank
 from keras.src.utils.python_utils import to_list
 
@@ -91,224 +92,12 @@ class AUCSummationMethod(Enum):
             )
 
 
-def _update_confusion_matrix_variables_optimized(
-    variables_to_update,
-    y_true,
-    y_pred,
-    thresholds,
-    multi_label=False,
-    sample_weights=None,
-    label_weights=None,
-    thresholds_with_epsilon=False,
-):
-    """Update confusion matrix variables with memory efficient alternative.
-
-    Note that the thresholds need to be evenly distributed within the list, eg,
-    the diff between consecutive elements are the same.
-
-    To compute TP/FP/TN/FN, we are measuring a binary classifier
-      C(t) = (predictions >= t)
-    at each threshold 't'. So we have
-      TP(t) = sum( C(t) * true_labels )
-      FP(t) = sum( C(t) * false_labels )
-
-    But, computing C(t) requires computation for each t. To make it fast,
-    observe that C(t) is a cumulative integral, and so if we have
-      thresholds = [t_0, ..., t_{n-1}];  t_0 < ... < t_{n-1}
-    where n = num_thresholds, and if we can compute the bucket function
-      B(i) = Sum( (predictions == t), t_i <= t < t{i+1} )
-    then we get
-      C(t_i) = sum( B(j), j >= i )
-    which is the reversed cumulative sum in ops.cumsum().
-
-    We can compute B(i) efficiently by taking advantage of the fact that
-    our thresholds are evenly distributed, in that
-      width = 1.0 / (num_thresholds - 1)
-      thresholds = [0.0, 1*width, 2*width, 3*width, ..., 1.0]
-    Given a prediction value p, we can map it to its bucket by
-      bucket_index(p) = floor( p * (num_thresholds - 1) )
-    so we can use ops.segment_sum() to update the buckets in one pass.
-
-    Consider following example:
-    y_true = [0, 0, 1, 1]
-    y_pred = [0.1, 0.5, 0.3, 0.9]
-    thresholds = [0.0, 0.5, 1.0]
-    num_buckets = 2   # [0.0, 1.0], (1.0, 2.0]
-    bucket_index(y_pred) = ops.floor(y_pred * num_buckets)
-                         = ops.floor([0.2, 1.0, 0.6, 1.8])
-                         = [0, 0, 0, 1]
-    # The meaning of this bucket is that if any of the label is true,
-    # then 1 will be added to the corresponding bucket with the index.
-    # Eg, if the label for 0.2 is true, then 1 will be added to bucket 0. If the
-    # label for 1.8 is true, then 1 will be added to bucket 1.
-    #
-    # Note the second item "1.0" is floored to 0, since the value need to be
-    # strictly larger than the bucket lower bound.
-    # In the implementation, we use ops.ceil() - 1 to achieve this.
-    tp_bucket_value = ops.segment_sum(true_labels, bucket_indices,
-                                                   num_segments=num_thresholds)
-                    = [1, 1, 0]
-    # For [1, 1, 0] here, it means there is 1 true value contributed by bucket
-    # 0, and 1 value contributed by bucket 1. When we aggregate them to
-    # together, the result become [a + b + c, b + c, c], since large thresholds
-    # will always contribute to the value for smaller thresholds.
-    true_positive = ops.cumsum(tp_bucket_value, reverse=True)
-                  = [2, 1, 0]
-
-    This implementation exhibits a run time and space complexity of O(T + N),
-    where T is the number of thresholds and N is the size of predictions.
-    Metrics that rely on standard implementation instead exhibit a complexity of
-    O(T * N).
-
-    Args:
-        variables_to_update: Dictionary with 'tp', 'fn', 'tn', 'fp' as valid
-            keys and corresponding variables to update as values.
-        y_true: A floating point `Tensor` whose shape matches `y_pred`. Will be
-            cast to `bool`.
-        y_pred: A floating point `Tensor` of arbitrary shape and whose values
-            are in the range `[0, 1]`.
-        thresholds: A sorted floating point `Tensor` with value in `[0, 1]`.
-            It need to be evenly distributed (the diff between each element need
-            to be the same).
-        multi_label: Optional boolean indicating whether multidimensional
-            prediction/labels should be treated as multilabel responses, or
-            flattened into a single label. When True, the values of
-            `variables_to_update` must have a second dimension equal to the
-            number of labels in y_true and y_pred, and those tensors must not be
-            RaggedTensors.
-        sample_weights: Optional `Tensor` whose rank is either 0, or the same
-            rank as `y_true`, and must be broadcastable to `y_true` (i.e., all
-            dimensions must be either `1`, or the same as the corresponding
-            `y_true` dimension).
-        label_weights: Optional tensor of non-negative weights for multilabel
-            data. The weights are applied when calculating TP, FP, FN, and TN
-            without explicit multilabel handling (i.e. when the data is to be
-            flattened).
-        thresholds_with_epsilon: Optional boolean indicating whether the leading
-            and tailing thresholds has any epsilon added for floating point
-            imprecisions.  It will change how we handle the leading and tailing
-            bucket.
-    """
-    num_thresholds = ops.shape(thresholds)[0]
-
-    if sample_weights is None:
-        sample_weights = 1.0
-    else:
-        sample_weights = ops.broadcast_to(
-            ops.cast(sample_weights, dtype=y_pred.dtype), ops.shape(y_pred)
-        )
-        if not multi_label:
-            sample_weights = ops.reshape(sample_weights, [-1])
-    if label_weights is None:
-        label_weights = 1.0
-    else:
-        label_weights = ops.expand_dims(label_weights, 0)
-        label_weights = ops.broadcast_to(label_weights, ops.shape(y_pred))
-        if not multi_label:
-            label_weights = ops.reshape(label_weights, [-1])
-    weights = ops.cast(
-        ops.multiply(sample_weights, label_weights), y_true.dtype
-    )
-
-    # We shouldn't need this, but in case there are predict value that is out of
-    # the range of [0.0, 1.0]
-    y_pred = ops.clip(y_pred, x_min=0.0, x_max=1.0)
-
-    y_true = ops.cast(ops.cast(y_true, "bool"), y_true.dtype)
-    if not multi_label:
-        y_true = ops.reshape(y_true, [-1])
-        y_pred = ops.reshape(y_pred, [-1])
-
-    true_labels = ops.multiply(y_true, weights)
-    false_labels = ops.multiply((1.0 - y_true), weights)
-
-    # Compute the bucket indices for each prediction value.
-    # Since the predict value has to be strictly greater than the thresholds,
-    # eg, buckets like [0, 0.5], (0.5, 1], and 0.5 belongs to first bucket.
-    # We have to use math.ceil(val) - 1 for the bucket.
-    bucket_indices = (
-        ops.ceil(y_pred * (ops.cast(num_thresholds, dtype=y_pred.dtype) - 1))
-        - 1
-    )
-
-    if thresholds_with_epsilon:
-        # In this case, the first bucket should actually take into account since
-        # the any prediction between [0.0, 1.0] should be larger than the first
-        # threshold. We change the bucket value from -1 to 0.
-        bucket_indices = ops.relu(bucket_indices)
-
-    bucket_indices = ops.cast(bucket_indices, "int32")
-
-    if multi_label:
-        # We need to run bucket segment sum for each of the label class. In the
-        # multi_label case, the rank of the label is 2. We first transpose it so
-        # that the label dim becomes the first and we can parallel run though
-        # them.
-        true_labels = ops.transpose(true_labels)
-        false_labels = ops.transpose(false_labels)
-        bucket_indices = ops.transpose(bucket_indices)
-
-        def gather_bucket(label_and_bucket_index):
-            label, bucket_index = (
-                label_and_bucket_index[0],
-                label_and_bucket_index[1],
-            )
-            return ops.segment_sum(
-                data=label,
-                segment_ids=bucket_index,
-                num_segments=num_thresholds,
-            )
-
-        tp_bucket_v = backend.vectorized_map(
-            gather_bucket,
-            (true_labels, bucket_indices),
-        )
-        fp_bucket_v = backend.vectorized_map(
-            gather_bucket, (false_labels, bucket_indices)
-        )
-        tp = ops.transpose(ops.flip(ops.cumsum(ops.flip(tp_bucket_v), axis=1)))
-        fp = ops.transpose(ops.flip(ops.cumsum(ops.flip(fp_bucket_v), axis=1)))
-    else:
-        tp_bucket_v = ops.segment_sum(
-            data=true_labels,
-            segment_ids=bucket_indices,
-            num_segments=num_thresholds,
-        )
-        fp_bucket_v = ops.segment_sum(
-            data=false_labels,
-            segment_ids=bucket_indices,
-            num_segments=num_thresholds,
-        )
-        tp = ops.flip(ops.cumsum(ops.flip(tp_bucket_v)))
-        fp = ops.flip(ops.cumsum(ops.flip(fp_bucket_v)))
-
-    # fn = sum(true_labels) - tp
-    # tn = sum(false_labels) - fp
-    if (
-        ConfusionMatrix.TRUE_NEGATIVES in variables_to_update
-        or ConfusionMatrix.FALSE_NEGATIVES in variables_to_update
-    ):
-        if multi_label:
-            total_true_labels = ops.sum(true_labels, axis=1)
-            total_false_labels = ops.sum(false_labels, axis=1)
-        else:
-            total_true_labels = ops.sum(true_labels)
-            total_false_labels = ops.sum(false_labels)
-
-    if ConfusionMatrix.TRUE_POSITIVES in variables_to_update:
-        variable = variables_to_update[ConfusionMatrix.TRUE_POSITIVES]
-        variable.assign(variable + tp)
-    if ConfusionMatrix.FALSE_POSITIVES in variables_to_update:
-        variable = variables_to_update[ConfusionMatrix.FALSE_POSITIVES]
-        variable.assign(variable + fp)
-    if ConfusionMatrix.TRUE_NEGATIVES in variables_to_update:
-        variable = variables_to_update[ConfusionMatrix.TRUE_NEGATIVES]
-        tn = total_false_labels - fp
-        variable.assign(variable + tn)
-    if ConfusionMatrix.FALSE_NEGATIVES in variables_to_update:
-        variable = variables_to_update[ConfusionMatrix.FALSE_NEGATIVES]
-        fn = total_true_labels - tp
-        variable.assign(variable + fn)
+def _assign_add(variables, value):
+    """Adds `value` to a variable, or to each variable of a list."""
+    if not isinstance(variables, (list, tuple)):
+        variables = [variables]
+    for variable in variables:
+        variable.assign(variable + value)
 
 
 def is_evenly_distributed_thresholds(thresholds):
@@ -365,14 +154,25 @@ def update_confusion_matrix_variables(
     If `sample_weight` is `None`, weights default to 1.
     Use weights of 0 to mask values.
 
+    Rather than comparing every prediction with every threshold, each
+    prediction is mapped to the bucket of the sorted thresholds it falls in
+    with a binary search, the weighted labels are summed per bucket with
+    `ops.segment_sum()`, and a reversed cumulative sum of the buckets gives
+    the counts for every threshold. This takes O(N * log(T) + T) time and
+    O(N + T) memory, where N is the size of predictions and T the number of
+    thresholds, instead of O(N * T).
+
     Args:
       variables_to_update: Dictionary with 'tp', 'fn', 'tn', 'fp' as valid keys
-        and corresponding variables to update as values.
+        and corresponding variables to update as values. A value can also be
+        a list of variables, which all receive the same update. This lets
+        several metrics share the computation of their confusion matrix.
       y_true: A `Tensor` whose shape matches `y_pred`. Will be cast to `bool`.
       y_pred: A floating point `Tensor` of arbitrary shape and whose values are
         in the range `[0, 1]`.
       thresholds: A float value, float tensor, python list, or tuple of float
-        thresholds in `[0, 1]`, or NEG_INF (used when top_k is set).
+        thresholds in `[0, 1]`, or NEG_INF (used when top_k is set). They
+        don't need to be sorted.
       top_k: Optional int, indicates that the positive labels should be limited
         to the top k predictions.
       class_id: Optional int, limits the prediction and labels to the class
@@ -391,10 +191,8 @@ def update_confusion_matrix_variables(
         data. The weights are applied when calculating TP, FP, FN, and TN
         without explicit multilabel handling (i.e. when the data is to be
         flattened).
-      thresholds_distributed_evenly: Boolean, whether the thresholds are evenly
-        distributed within the list. An optimized method will be used if this is
-        the case. See _update_confusion_matrix_variables_optimized() for more
-        details.
+      thresholds_distributed_evenly: Unused, kept for backwards compatibility.
+        All thresholds use the bucketed computation described above.
 
     Raises:
       ValueError: If `y_pred` and `y_true` have mismatched shapes, or if
@@ -419,30 +217,14 @@ def update_confusion_matrix_variables(
             f'Received: "{variables_to_update.keys()}"'
         )
 
-    variable_dtype = list(variables_to_update.values())[0].dtype
+    first_variable = tree.flatten(list(variables_to_update.values()))[0]
+    variable_dtype = first_variable.dtype
 
     y_true = ops.cast(y_true, dtype=variable_dtype)
     y_pred = ops.cast(y_pred, dtype=variable_dtype)
 
-    if thresholds_distributed_evenly:
-        # Check whether the thresholds has any leading or tailing epsilon added
-        # for floating point imprecision. The leading and tailing threshold will
-        # be handled bit differently as the corner case.  At this point,
-        # thresholds should be a list/array with more than 2 items, and ranged
-        # between [0, 1]. See is_evenly_distributed_thresholds() for more
-        # details.
-        thresholds_with_epsilon = thresholds[0] < 0.0 or thresholds[-1] > 1.0
-
-    thresholds = ops.convert_to_tensor(thresholds, dtype=variable_dtype)
-    num_thresholds = ops.shape(thresholds)[0]
-
-    if multi_label:
-        one_thresh = ops.equal(
-            np.array(1, dtype="int32"),
-            len(thresholds.shape),
-        )
-    else:
-        one_thresh = np.array(True, dtype="bool")
+    thresholds, unsort_indices = _sort_thresholds(thresholds, variable_dtype)
+    num_thresholds = thresholds.shape[0]
 
     invalid_keys = [
         key for key in variables_to_update if key not in list(ConfusionMatrix)
@@ -477,121 +259,111 @@ def update_confusion_matrix_variables(
         y_true = y_true[..., class_id, None]
         y_pred = y_pred[..., class_id, None]
 
-    if thresholds_distributed_evenly:
-        return _update_confusion_matrix_variables_optimized(
-            variables_to_update,
-            y_true,
-            y_pred,
-            thresholds,
-            multi_label=multi_label,
-            sample_weights=sample_weight,
-            label_weights=label_weights,
-            thresholds_with_epsilon=thresholds_with_epsilon,
+    weights = None
+    if sample_weight is not None:
+        weights = ops.broadcast_to(sample_weight, ops.shape(y_pred))
+    if label_weights is not None and not multi_label:
+        label_weights = ops.expand_dims(
+            ops.cast(label_weights, dtype=variable_dtype), 0
         )
-
-    if None in y_pred.shape:
-        pred_shape = ops.shape(y_pred)
-        num_predictions = pred_shape[0]
-        if len(y_pred.shape) == 1:
-            num_labels = 1
-        else:
-            num_labels = ops.cast(
-                ops.prod(ops.array(pred_shape[1:]), axis=0), "int32"
-            )
-        thresh_label_tile = ops.where(one_thresh, num_labels, 1)
-    else:
-        pred_shape = ops.shape(y_pred)
-        num_predictions = pred_shape[0]
-        if len(y_pred.shape) == 1:
-            num_labels = 1
+        label_weights = ops.broadcast_to(label_weights, ops.shape(y_pred))
+        if weights is None:
+            weights = label_weights
         else:
-            num_labels = np.prod(pred_shape[1:], axis=0).astype("int32")
-        thresh_label_tile = np.where(one_thresh, num_labels, 1)
-
-    # Reshape predictions and labels, adding a dim for thresholding.
-    if multi_label:
-        predictions_extra_dim = ops.expand_dims(y_pred, 0)
-        labels_extra_dim = ops.expand_dims(ops.cast(y_true, dtype="bool"), 0)
-    else:
-        # Flatten predictions and labels when not multilabel.
-        predictions_extra_dim = ops.reshape(y_pred, [1, -1])
-        labels_extra_dim = ops.reshape(ops.cast(y_true, dtype="bool"), [1, -1])
-
-    # Tile the thresholds for every prediction.
+            weights = ops.multiply(weights, label_weights)
+
+    # Bucket `i` holds the predictions greater than exactly `i` thresholds,
+    # i.e. the predictions that are positive for the thresholds `0..i-1`.
+    # NaN predictions are never positive.
+    flat_y_pred = ops.reshape(y_pred, [-1])
+    buckets = ops.searchsorted(thresholds, flat_y_pred, side="left")
+    buckets = ops.where(ops.isnan(flat_y_pred), 0, buckets)
+    num_buckets = num_thresholds + 1
     if multi_label:
-        thresh_pretile_shape = [num_thresholds, 1, -1]
-        thresh_tiles = [1, num_predictions, thresh_label_tile]
-        data_tiles = [num_thresholds, 1, 1]
+        # One set of buckets per label.
+        num_labels = first_variable.shape[1]
+        label_indices = ops.broadcast_to(
+            ops.arange(num_labels, dtype=buckets.dtype), ops.shape(y_pred)
+        )
+        buckets = buckets + ops.reshape(label_indices, [-1]) * num_buckets
     else:
-        thresh_pretile_shape = [num_thresholds, -1]
-        thresh_tiles = [1, num_predictions * num_labels]
-        data_tiles = [num_thresholds, 1]
+        num_labels = 1
 
-    thresh_tiled = ops.tile(
-        ops.reshape(thresholds, thresh_pretile_shape), thresh_tiles
+    label_is_pos = ops.cast(
+        ops.cast(ops.reshape(y_true, [-1]), "bool"), dtype=variable_dtype
     )
+    true_labels = label_is_pos
+    false_labels = 1.0 - label_is_pos
+    if weights is not None:
+        weights = ops.reshape(weights, [-1])
+        true_labels = ops.multiply(true_labels, weights)
+        false_labels = ops.multiply(false_labels, weights)
+
+    # Sum the true and false labels of every bucket in a single pass.
+    bucket_sums = ops.segment_sum(
+        ops.stack([true_labels, false_labels], axis=-1),
+        buckets,
+        num_segments=num_labels * num_buckets,
+    )
+    bucket_sums = ops.reshape(bucket_sums, (num_labels, num_buckets, 2))
 
-    # Tile the predictions for every threshold.
-    preds_tiled = ops.tile(predictions_extra_dim, data_tiles)
-
-    # Compare predictions and threshold.
-    pred_is_pos = ops.greater(preds_tiled, thresh_tiled)
+    def to_variable_layout(counts):
+        if multi_label:
+            # Thresholds first, then labels, like the variables.
+            counts = ops.transpose(counts, (1, 0, 2))
+        else:
+            counts = counts[0]
+        if unsort_indices is not None:
+            counts = ops.take(counts, unsort_indices, axis=0)
+        return counts
+
+    # The labels of the predictions above each threshold are the sums of the
+    # following buckets.
+    positives = ops.flip(ops.cumsum(ops.flip(bucket_sums, 1), axis=1), 1)
+    positives = to_variable_layout(positives[:, 1:])
+    if ConfusionMatrix.TRUE_POSITIVES in variables_to_update:
+        tp = positives[..., 0]
+        _assign_add(variables_to_update[ConfusionMatrix.TRUE_POSITIVES], tp)
+    if ConfusionMatrix.FALSE_POSITIVES in variables_to_update:
+        fp = positives[..., 1]
+        _assign_add(variables_to_update[ConfusionMatrix.FALSE_POSITIVES], fp)
 
-    # Tile labels by number of thresholds
-    label_is_pos = ops.tile(labels_extra_dim, data_tiles)
+    if (
+        ConfusionMatrix.TRUE_NEGATIVES in variables_to_update
+        or ConfusionMatrix.FALSE_NEGATIVES in variables_to_update
+    ):
+        # The labels of the other predictions are the sums of the previous
+        # buckets. They are not computed as totals minus positives to avoid
+        # floating point cancellations.
+        negatives = ops.cumsum(bucket_sums, axis=1)
+        negatives = to_variable_layout(negatives[:, :-1])
+    if ConfusionMatrix.TRUE_NEGATIVES in variables_to_update:
+        tn = negatives[..., 1]
+        _assign_add(variables_to_update[ConfusionMatrix.TRUE_NEGATIVES], tn)
+    if ConfusionMatrix.FALSE_NEGATIVES in variables_to_update:
+        fn = negatives[..., 0]
+        _assign_add(variables_to_update[ConfusionMatrix.FALSE_NEGATIVES], fn)
 
-    if sample_weight is not None:
-        sample_weight = ops.broadcast_to(
-            ops.cast(sample_weight, dtype=y_pred.dtype), ops.shape(y_pred)
-        )
-        weights_tiled = ops.tile(
-            ops.reshape(sample_weight, thresh_tiles), data_tiles
-        )
-    else:
-        weights_tiled = None
 
-    if label_weights is not None and not multi_label:
-        label_weights = ops.expand_dims(label_weights, 0)
-        label_weights = ops.broadcast_to(label_weights, ops.shape(y_pred))
-        label_weights_tiled = ops.tile(
-            ops.reshape(label_weights, thresh_tiles), data_tiles
-        )
-        if weights_tiled is None:
-            weights_tiled = label_weights_tiled
-        else:
-            weights_tiled = ops.multiply(weights_tiled, label_weights_tiled)
-
-    def weighted_assign_add(label, pred, weights, var):
-        label_and_pred = ops.cast(ops.logical_and(label, pred), dtype=var.dtype)
-        if weights is not None:
-            label_and_pred *= ops.cast(weights, dtype=var.dtype)
-        var.assign(var + ops.sum(label_and_pred, 1))
-
-    loop_vars = {
-        ConfusionMatrix.TRUE_POSITIVES: (label_is_pos, pred_is_pos),
-    }
-    update_tn = ConfusionMatrix.TRUE_NEGATIVES in variables_to_update
-    update_fp = ConfusionMatrix.FALSE_POSITIVES in variables_to_update
-    update_fn = ConfusionMatrix.FALSE_NEGATIVES in variables_to_update
-
-    if update_fn or update_tn:
-        pred_is_neg = ops.logical_not(pred_is_pos)
-        loop_vars[ConfusionMatrix.FALSE_NEGATIVES] = (label_is_pos, pred_is_neg)
-
-    if update_fp or update_tn:
-        label_is_neg = ops.logical_not(label_is_pos)
-        loop_vars[ConfusionMatrix.FALSE_POSITIVES] = (label_is_neg, pred_is_pos)
-        if update_tn:
-            loop_vars[ConfusionMatrix.TRUE_NEGATIVES] = (
-                label_is_neg,
-                pred_is_neg,
-            )
+def _sort_thresholds(thresholds, dtype):
+    """Sorts `thresholds` for `update_confusion_matrix_variables()`.
 
-    for matrix_cond, (label, pred) in loop_vars.items():
-        if matrix_cond in variables_to_update:
-            weighted_assign_add(
-                label, pred, weights_tiled, variables_to_update[matrix_cond]
-            )
+    Returns:
+        A tuple `(sorted_thresholds, unsort_indices)` where `unsort_indices`
+        restores the original order of the thresholds, `None` if they were
+        sorted already.
+    """
+    if backend.is_tensor(thresholds):
+        thresholds = ops.reshape(ops.cast(thresholds, dtype), [-1])
+        sort_indices = ops.argsort(thresholds)
+        return ops.take(thresholds, sort_indices), ops.argsort(sort_indices)
+    thresholds = np.reshape(np.asarray(thresholds, dtype=dtype), [-1])
+    unsort_indices = None
+    if np.any(thresholds[1:] < thresholds[:-1]):
+        sort_indices = np.argsort(thresholds, kind="stable")
+        thresholds = thresholds[sort_indices]
+        unsort_indices = np.argsort(sort_indices)
+    return ops.convert_to_tensor(thresholds), unsort_indices
 
 
 def _filter_top_k(x, k):
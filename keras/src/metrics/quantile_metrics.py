@@ -0,0 +1,243 @@
+import math
+
+from keras.src import backend
+from keras.src import initializers
+from keras.src import ops
+from keras.src.api_export import keras_export
+from keras.src.losses.loss import squeeze_or_expand_to_same_rank
+from keras.src.metrics.metric import Metric
+
+
+@keras_export("keras.metrics.Quantiles")
+class Quantiles(Metric):
+    """Computes approximate quantiles of a stream of values.
+
+    The values are accumulated in a fixed-size histogram with logarithmically
+    spaced buckets (a "DDSketch"). Every quantile is returned with a relative
+    error of at most `relative_accuracy`, regardless of the number of values
+    seen, and the memory of the metric does not grow with the number of
+    evaluated examples. Since the sketch only holds bucket counts, the states
+    of several replicas are merged by summing them.
+
+    Values whose magnitude is smaller than `min_value` are counted as `0`,
+    and values whose magnitude exceeds the range covered by the buckets are
+    counted in the outermost bucket. With the default arguments, magnitudes
+    between `1e-9` and about `5e8` are represented accurately.
+
+    Args:
+        quantiles: A float or a list of floats in `[0, 1]`, the quantiles to
+            compute. Defaults to `(0.5, 0.9, 0.99)`.
+        relative_accuracy: The maximum relative error of the returned
+            quantiles. Defaults to `0.01`.
+        num_buckets: The number of buckets used for each sign of the values.
+            Defaults to `2048`.
+        min_value: The smallest magnitude distinguished from `0`. Defaults
+            to `1e-9`.
+        name: (Optional) string name of the metric instance.
+        dtype: (Optional) data type of the metric result.
+
+    Example:
+
+    >>> m = keras.metrics.Quantiles(quantiles=[0.5, 1.0])
+    >>> m.update_state([1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> m.result()
+    array([3.0265815, 4.990075 ], dtype=float32)
+    """
+
+    def __init__(
+        self,
+        quantiles=(0.5, 0.9, 0.99),
+        relative_accuracy=0.01,
+        num_buckets=2048,
+        min_value=1e-9,
+        name="quantiles",
+        dtype=None,
+    ):
+        super().__init__(name=name, dtype=dtype)
+        if isinstance(quantiles, (int, float)):
+            quantiles = [quantiles]
+        quantiles = [float(q) for q in quantiles]
+        if not quantiles or not all(0.0 <= q <= 1.0 for q in quantiles):
+            raise ValueError(
+                "Argument `quantiles` should be a float or a non-empty list "
+                f"of floats in [0, 1]. Received: quantiles={quantiles}"
+            )
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(
+                "Argument `relative_accuracy` should be in (0, 1). "
+                f"Received: relative_accuracy={relative_accuracy}"
+            )
+        if not isinstance(num_buckets, int) or num_buckets < 1:
+            raise ValueError(
+                "Argument `num_buckets` should be a positive integer. "
+                f"Received: num_buckets={num_buckets}"
+            )
+        if min_value <= 0:
+            raise ValueError(
+                "Argument `min_value` should be positive. "
+                f"Received: min_value={min_value}"
+            )
+        self.quantiles = quantiles
+        self.relative_accuracy = relative_accuracy
+        self.num_buckets = num_buckets
+        self.min_value = min_value
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        # Buckets are ordered by value: negative buckets (from the largest
+        # magnitude to the smallest), the zero bucket, then positive buckets.
+        self.counts = self.add_variable(
+            shape=(2 * num_buckets + 1,),
+            initializer=initializers.Zeros(),
+            name="counts",
+        )
+
+    def _bucket_indices(self, values):
+        magnitudes = ops.abs(values)
+        # Positive bucket `i` holds the magnitudes in
+        # `(min_value * gamma ** (i - 1), min_value * gamma ** i]`.
+        indices = ops.ceil(
+            ops.log(ops.maximum(magnitudes, self.min_value) / self.min_value)
+            / math.log(self._gamma)
+        )
+        indices = ops.cast(ops.clip(indices, 0, self.num_buckets - 1), "int32")
+        zero_bucket = self.num_buckets
+        return ops.where(
+            magnitudes < self.min_value,
+            zero_bucket,
+            ops.where(
+                values > 0,
+                zero_bucket + 1 + indices,
+                zero_bucket - 1 - indices,
+            ),
+        )
+
+    def update_state(self, values, sample_weight=None):
+        dtype = self._dtype or backend.floatx()
+        mask = backend.get_keras_mask(values)
+        values = ops.cast(values, dtype)
+        if sample_weight is None:
+            sample_weight = ops.ones_like(values)
+        else:
+            sample_weight = ops.convert_to_tensor(sample_weight, dtype=dtype)
+            values, sample_weight = squeeze_or_expand_to_same_rank(
+                values, sample_weight
+            )
+            # Per-sample weights apply to all the values of the sample.
+            for _ in range(len(values.shape) - len(sample_weight.shape)):
+                sample_weight = ops.expand_dims(sample_weight, axis=-1)
+            sample_weight = ops.broadcast_to(sample_weight, ops.shape(values))
+        if mask is not None:
+            sample_weight = sample_weight * ops.cast(mask, dtype)
+        values = ops.reshape(values, (-1,))
+        sample_weight = ops.reshape(sample_weight, (-1,))
+        # NaNs are not counted.
+        sample_weight = ops.where(ops.isnan(values), 0.0, sample_weight)
+        values = ops.where(ops.isnan(values), 0.0, values)
+        counts = ops.segment_sum(
+            sample_weight,
+            self._bucket_indices(values),
+            num_segments=2 * self.num_buckets + 1,
+        )
+        self.counts.assign_add(ops.cast(counts, self.counts.dtype))
+
+    def result(self):
+        dtype = self._dtype or backend.floatx()
+        counts = ops.cast(self.counts, dtype)
+        cumulative_counts = ops.cumsum(counts)
+        total = cumulative_counts[-1]
+        ranks = ops.convert_to_tensor(self.quantiles, dtype=dtype) * total
+        # The first bucket whose cumulative count exceeds the rank, capped at
+        # the last non-empty bucket.
+        indices = ops.minimum(
+            ops.searchsorted(cumulative_counts, ranks, side="right"),
+            ops.searchsorted(
+                cumulative_counts, ops.expand_dims(total, 0), side="left"
+            ),
+        )
+        gamma = self._gamma
+        magnitudes = (
+            self.min_value
+            * 2.0
+            * ops.power(gamma, ops.arange(self.num_buckets, dtype=dtype))
+            / (gamma + 1.0)
+        )
+        bucket_values = ops.concatenate(
+            [-ops.flip(magnitudes, axis=0), ops.zeros((1,), dtype), magnitudes]
+        )
+        return ops.where(total > 0, ops.take(bucket_values, indices), 0.0)
+
+    def get_config(self):
+        return {
+            "quantiles": self.quantiles,
+            "relative_accuracy": self.relative_accuracy,
+            "num_buckets": self.num_buckets,
+            "min_value": self.min_value,
+            "name": self.name,
+            "dtype": self.dtype,
+        }
+
+
+@keras_export("keras.metrics.AbsoluteErrorQuantiles")
+class AbsoluteErrorQuantiles(Quantiles):
+    """Computes approximate quantiles of the absolute prediction error.
+
+    This metric sketches `abs(y_true - y_pred)` the same way as
+    `keras.metrics.Quantiles`, e.g. to track the median or the 99th
+    percentile of the error over a large evaluation set.
+
+    Args:
+        quantiles: A float or a list of floats in `[0, 1]`, the quantiles to
+            compute. Defaults to `(0.5, 0.9, 0.99)`.
+        relative_accuracy: The maximum relative error of the returned
+            quantiles. Defaults to `0.01`.
+        num_buckets: The number of buckets used for each sign of the values.
+            Defaults to `2048`.
+        min_value: The smallest magnitude distinguished from `0`. Defaults
+            to `1e-9`.
+        name: (Optional) string name of the metric instance.
+        dtype: (Optional) data type of the metric result.
+
+    Example:
+
+    >>> m = keras.metrics.AbsoluteErrorQuantiles(quantiles=0.5)
+    >>> m.update_state([[1.0], [2.0], [3.0]], [[1.5], [4.0], [2.0]])
+    >>> m.result()
+    array([1.0074234], dtype=float32)
+
+    Usage with `compile()` API:
+
+    ```python
+    model.compile(optimizer='sgd',
+                  loss='mse',
+                  metrics=[keras.metrics.AbsoluteErrorQuantiles()])
+    ```
+    """
+
+    def __init__(
+        self,
+        quantiles=(0.5, 0.9, 0.99),
+        relative_accuracy=0.01,
+        num_buckets=2048,
+        min_value=1e-9,
+        name="absolute_error_quantiles",
+        dtype=None,
+    ):
+        super().__init__(
+            quantiles=quantiles,
+            relative_accuracy=relative_accuracy,
+            num_buckets=num_buckets,
+            min_value=min_value,
+            name=name,
+            dtype=dtype,
+        )
+        # Metric should be minimized during optimization.
+        self._direction = "down"
+
+    def update_state(self, y_true, y_pred, sample_weight=None):
+        mask = backend.get_keras_mask(y_pred)
+        y_pred = ops.convert_to_tensor(y_pred)
+        y_true = ops.convert_to_tensor(y_true, dtype=y_pred.dtype)
+        y_true, y_pred = squeeze_or_expand_to_same_rank(y_true, y_pred)
+        errors = ops.abs(y_true - y_pred)
+        if mask is not None:
+            backend.set_keras_mask(errors, mask)
+        super().update_state(errors, sample_weight=sample_weight)
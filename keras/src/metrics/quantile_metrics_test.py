@@ -0,0 +1,88 @@
+import numpy as np
+
+from keras.src import testing
+from keras.src.metrics import quantile_metrics
+
+
+class QuantilesTest(testing.TestCase):
+    def test_config(self):
+        obj = quantile_metrics.Quantiles(
+            quantiles=[0.5], relative_accuracy=0.05, num_buckets=16, name="q"
+        )
+        self.assertEqual(obj.name, "q")
+        self.assertEqual(len(obj.variables), 1)
+        self.assertEqual(obj.variables[0].shape, (33,))
+        obj2 = quantile_metrics.Quantiles.from_config(obj.get_config())
+        self.assertEqual(obj2.quantiles, [0.5])
+        self.assertEqual(obj2.relative_accuracy, 0.05)
+        self.assertEqual(obj2.num_buckets, 16)
+
+    def test_relative_accuracy(self):
+        rng = np.random.default_rng(0)
+        values = np.concatenate(
+            [rng.lognormal(size=5000), -rng.lognormal(size=3000)]
+        ).astype("float32")
+        quantiles = [0.0, 0.1, 0.25, 0.5, 0.9, 0.99, 1.0]
+        obj = quantile_metrics.Quantiles(quantiles=quantiles)
+        for batch in np.split(values, 8):
+            obj.update_state(batch)
+        result = np.asarray(obj.result())
+        expected = np.quantile(values, quantiles, method="inverted_cdf")
+        self.assertAllClose(result, expected, rtol=0.0101)
+
+    def test_weighted(self):
+        obj = quantile_metrics.Quantiles(quantiles=[0.5])
+        obj.update_state([1.0, 10.0, 100.0], sample_weight=[1.0, 0.0, 3.0])
+        self.assertAllClose(obj.result(), [100.0], rtol=0.01)
+
+    def test_zeros_and_nans(self):
+        obj = quantile_metrics.Quantiles(quantiles=[0.0, 0.5, 1.0])
+        obj.update_state([0.0, 0.0, np.nan, 2.0])
+        self.assertAllClose(obj.result(), [0.0, 0.0, 2.0], rtol=0.01)
+
+    def test_empty(self):
+        obj = quantile_metrics.Quantiles()
+        self.assertAllClose(obj.result(), [0.0, 0.0, 0.0])
+
+    def test_merge_by_sum(self):
+        values = np.linspace(1.0, 100.0, 100).astype("float32")
+        obj = quantile_metrics.Quantiles(quantiles=[0.5, 0.9])
+        obj.update_state(values)
+        obj_a = quantile_metrics.Quantiles(quantiles=[0.5, 0.9])
+        obj_b = quantile_metrics.Quantiles(quantiles=[0.5, 0.9])
+        obj_a.update_state(values[::2])
+        obj_b.update_state(values[1::2])
+        obj_a.counts.assign(obj_a.counts + obj_b.counts)
+        self.assertAllClose(obj_a.result(), obj.result())
+
+    def test_invalid_args(self):
+        with self.assertRaisesRegex(ValueError, "quantiles"):
+            quantile_metrics.Quantiles(quantiles=[1.5])
+        with self.assertRaisesRegex(ValueError, "relative_accuracy"):
+            quantile_metrics.Quantiles(relative_accuracy=0.0)
+        with self.assertRaisesRegex(ValueError, "num_buckets"):
+            quantile_metrics.Quantiles(num_buckets=0)
+
+
+class AbsoluteErrorQuantilesTest(testing.TestCase):
+    def test_config(self):
+        obj = quantile_metrics.AbsoluteErrorQuantiles(quantiles=[0.99])
+        self.assertEqual(obj.name, "absolute_error_quantiles")
+        obj2 = quantile_metrics.AbsoluteErrorQuantiles.from_config(
+            obj.get_config()
+        )
+        self.assertEqual(obj2.quantiles, [0.99])
+
+    def test_unweighted(self):
+        obj = quantile_metrics.AbsoluteErrorQuantiles(quantiles=[0.5, 1.0])
+        y_true = np.array([[1.0], [2.0], [3.0]])
+        y_pred = np.array([[1.5], [4.0], [2.0]])
+        obj.update_state(y_true, y_pred)
+        self.assertAllClose(obj.result(), [1.0, 2.0], rtol=0.01)
+
+    def test_weighted(self):
+        obj = quantile_metrics.AbsoluteErrorQuantiles(quantiles=[0.0, 1.0])
+        y_true = np.array([[1.0, 1.0], [2.0, 2.0]])
+        y_pred = np.array([[2.0, 3.0], [6.0, 2.5]])
+        obj.update_state(y_true, y_pred, sample_weight=np.array([0.0, 1.0]))
+        self.assertAllClose(obj.result(), [0.5, 4.0], rtol=0.01)
@@ -0,0 +1,228 @@
+from keras.src import ops
+from keras.src.api_export import keras_export
+from keras.src.metrics import reduction_metrics
+
+
+def _top_k_relevance(y_true, y_pred, k):
+    """Returns the relevance of the `k` highest scored items of each query."""
+    y_pred = ops.convert_to_tensor(y_pred)
+    y_true = ops.convert_to_tensor(y_true, dtype=y_pred.dtype)
+    num_items = y_pred.shape[-1]
+    if k is None or (num_items is not None and k > num_items):
+        k = num_items
+    _, top_indices = ops.top_k(y_pred, k=k)
+    return y_true, ops.take_along_axis(y_true, top_indices, axis=-1), k
+
+
+def _check_k(k, allow_none=False):
+    if k is None and allow_none:
+        return
+    if not isinstance(k, int) or k < 1:
+        raise ValueError(
+            f"Argument `k` should be a positive integer. Received: k={k}"
+        )
+
+
+@keras_export("keras.metrics.recall_at_k")
+def recall_at_k(y_true, y_pred, k=10):
+    """Computes the fraction of relevant items ranked in the top `k`.
+
+    Items with a relevance (`y_true`) greater than zero are considered
+    relevant. Queries without any relevant item have a recall of `0`.
+
+    Args:
+        y_true: Tensor of relevance labels of shape `(..., num_items)`.
+        y_pred: Tensor of predicted scores of shape `(..., num_items)`.
+        k: Number of top scored items to consider. Defaults to `10`.
+
+    Returns:
+        Recall@k tensor of shape `(...)`.
+    """
+    y_true, top_relevance, _ = _top_k_relevance(y_true, y_pred, k)
+    hits = ops.sum(ops.cast(top_relevance > 0, y_true.dtype), axis=-1)
+    num_relevant = ops.sum(ops.cast(y_true > 0, y_true.dtype), axis=-1)
+    return ops.divide_no_nan(hits, num_relevant)
+
+
+@keras_export("keras.metrics.ndcg")
+def ndcg(y_true, y_pred, k=None):
+    """Computes the normalized discounted cumulative gain of a ranking.
+
+    Formula:
+
+    ```python
+    dcg = sum((2 ** relevance - 1) / log2(rank + 1))
+    ndcg = dcg / ideal_dcg
+    ```
+
+    where `rank` starts at 1 and the sum runs over the `k` highest scored
+    items, and `ideal_dcg` is the DCG of the best possible ranking. Queries
+    without any relevant item have an NDCG of `0`.
+
+    Args:
+        y_true: Tensor of graded relevance labels of shape `(..., num_items)`.
+        y_pred: Tensor of predicted scores of shape `(..., num_items)`.
+        k: (Optional) Number of top scored items to consider. Defaults to
+            `None`, which considers all items.
+
+    Returns:
+        NDCG tensor of shape `(...)`.
+    """
+    y_true, top_relevance, k = _top_k_relevance(y_true, y_pred, k)
+    ideal_relevance, _ = ops.top_k(y_true, k=k)
+    ranks = ops.arange(k, dtype=y_true.dtype) + 2.0
+    discounts = 1.0 / ops.log2(ranks)
+
+    def dcg(relevance):
+        gains = ops.power(2.0, relevance) - 1.0
+        return ops.sum(gains * discounts, axis=-1)
+
+    return ops.divide_no_nan(dcg(top_relevance), dcg(ideal_relevance))
+
+
+@keras_export("keras.metrics.mean_reciprocal_rank")
+def mean_reciprocal_rank(y_true, y_pred, k=None):
+    """Computes the reciprocal rank of the first relevant item.
+
+    Items with a relevance (`y_true`) greater than zero are considered
+    relevant. Queries without a relevant item in the top `k` have a
+    reciprocal rank of `0`.
+
+    Args:
+        y_true: Tensor of relevance labels of shape `(..., num_items)`.
+        y_pred: Tensor of predicted scores of shape `(..., num_items)`.
+        k: (Optional) Number of top scored items to consider. Defaults to
+            `None`, which considers all items.
+
+    Returns:
+        Reciprocal rank tensor of shape `(...)`.
+    """
+    y_true, top_relevance, k = _top_k_relevance(y_true, y_pred, k)
+    ranks = ops.arange(k, dtype=y_true.dtype) + 1.0
+    reciprocal_ranks = ops.cast(top_relevance > 0, y_true.dtype) / ranks
+    return ops.max(reciprocal_ranks, axis=-1)
+
+
+@keras_export("keras.metrics.RecallAtK")
+class RecallAtK(reduction_metrics.MeanMetricWrapper):
+    """Computes the mean fraction of relevant items ranked in the top `k`.
+
+    `y_true` holds the relevance of each candidate item and `y_pred` the
+    predicted scores, both of shape `(batch_size, num_items)`. Items with a
+    relevance greater than zero are considered relevant. The metric keeps a
+    running mean over queries, so its memory does not grow with the number
+    of evaluated examples.
+
+    Args:
+        k: Number of top scored items to consider. Defaults to `10`.
+        name: (Optional) string name of the metric instance.
+        dtype: (Optional) data type of the metric result.
+
+    Example:
+
+    >>> m = keras.metrics.RecallAtK(k=2)
+    >>> m.update_state([[0, 1, 1, 0], [1, 0, 0, 0]],
+    ...                [[0.9, 0.8, 0.1, 0.0], [0.2, 0.1, 0.3, 0.0]])
+    >>> m.result()
+    0.75
+
+    Usage with `compile()` API:
+
+    ```python
+    model.compile(optimizer='sgd',
+                  loss='binary_crossentropy',
+                  metrics=[keras.metrics.RecallAtK(k=10)])
+    ```
+    """
+
+    def __init__(self, k=10, name="recall_at_k", dtype=None):
+        _check_k(k)
+        super().__init__(fn=recall_at_k, name=name, dtype=dtype, k=k)
+        self.k = k
+        # Metric should be maximized during optimization.
+        self._direction = "up"
+
+    def get_config(self):
+        return {"name": self.name, "dtype": self.dtype, "k": self.k}
+
+
+@keras_export("keras.metrics.NDCG")
+class NDCG(reduction_metrics.MeanMetricWrapper):
+    """Computes the mean normalized discounted cumulative gain over queries.
+
+    `y_true` holds the graded relevance of each candidate item and `y_pred`
+    the predicted scores, both of shape `(batch_size, num_items)`.
+
+    Args:
+        k: (Optional) Number of top scored items to consider. Defaults to
+            `None`, which considers all items.
+        name: (Optional) string name of the metric instance.
+        dtype: (Optional) data type of the metric result.
+
+    Example:
+
+    >>> m = keras.metrics.NDCG()
+    >>> m.update_state([[0, 1, 0]], [[0.1, 0.2, 0.3]])
+    >>> m.result()
+    0.63092977
+
+    Usage with `compile()` API:
+
+    ```python
+    model.compile(optimizer='sgd',
+                  loss='binary_crossentropy',
+                  metrics=[keras.metrics.NDCG(k=10)])
+    ```
+    """
+
+    def __init__(self, k=None, name="ndcg", dtype=None):
+        _check_k(k, allow_none=True)
+        super().__init__(fn=ndcg, name=name, dtype=dtype, k=k)
+        self.k = k
+        # Metric should be maximized during optimization.
+        self._direction = "up"
+
+    def get_config(self):
+        return {"name": self.name, "dtype": self.dtype, "k": self.k}
+
+
+@keras_export("keras.metrics.MeanReciprocalRank")
+class MeanReciprocalRank(reduction_metrics.MeanMetricWrapper):
+    """Computes the mean reciprocal rank of the first relevant item.
+
+    `y_true` holds the relevance of each candidate item and `y_pred` the
+    predicted scores, both of shape `(batch_size, num_items)`. Items with a
+    relevance greater than zero are considered relevant.
+
+    Args:
+        k: (Optional) Number of top scored items to consider. Defaults to
+            `None`, which considers all items.
+        name: (Optional) string name of the metric instance.
+        dtype: (Optional) data type of the metric result.
+
+    Example:
+
+    >>> m = keras.metrics.MeanReciprocalRank()
+    >>> m.update_state([[0, 1, 0], [1, 0, 0]],
+    ...                [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]])
+    >>> m.result()
+    0.75
+
+    Usage with `compile()` API:
+
+    ```python
+    model.compile(optimizer='sgd',
+                  loss='binary_crossentropy',
+                  metrics=[keras.metrics.MeanReciprocalRank()])
+    ```
+    """
+
+    def __init__(self, k=None, name="mean_reciprocal_rank", dtype=None):
+        _check_k(k, allow_none=True)
+        super().__init__(fn=mean_reciprocal_rank, name=name, dtype=dtype, k=k)
+        self.k = k
+        # Metric should be maximized during optimization.
+        self._direction = "up"
+
+    def get_config(self):
+        return {"name": self.name, "dtype": self.dtype, "k": self.k}
@@ -0,0 +1,103 @@
+import numpy as np
+
+from keras.src import testing
+from keras.src.metrics import ranking_metrics
+
+
+def _brute_force_ndcg(y_true, y_pred, k):
+    order = np.argsort(-y_pred)[:k]
+    discounts = 1.0 / np.log2(np.arange(len(order)) + 2.0)
+    dcg = np.sum((2.0 ** y_true[order] - 1.0) * discounts)
+    ideal = np.sort(y_true)[::-1][:k]
+    ideal_dcg = np.sum((2.0**ideal - 1.0) * discounts)
+    return dcg / ideal_dcg if ideal_dcg > 0 else 0.0
+
+
+class RecallAtKTest(testing.TestCase):
+    def test_config(self):
+        obj = ranking_metrics.RecallAtK(k=3, name="r3", dtype="float32")
+        self.assertEqual(obj.name, "r3")
+        self.assertEqual(len(obj.variables), 2)
+        obj2 = ranking_metrics.RecallAtK.from_config(obj.get_config())
+        self.assertEqual(obj2.k, 3)
+        self.assertEqual(obj2.name, "r3")
+
+    def test_unweighted(self):
+        obj = ranking_metrics.RecallAtK(k=2)
+        y_true = np.array([[0, 1, 1, 0], [1, 0, 0, 0], [0, 0, 0, 0]])
+        y_pred = np.array(
+            [[0.9, 0.8, 0.1, 0.0], [0.2, 0.1, 0.3, 0.0], [0.1, 0.2, 0.3, 0.4]]
+        )
+        obj.update_state(y_true, y_pred)
+        self.assertAllClose(obj.result(), (0.5 + 1.0 + 0.0) / 3)
+
+    def test_weighted(self):
+        obj = ranking_metrics.RecallAtK(k=1)
+        y_true = np.array([[0, 1], [1, 0]])
+        y_pred = np.array([[0.1, 0.9], [0.9, 0.1]])
+        result = obj(y_true, y_pred, sample_weight=np.array([1.0, 3.0]))
+        self.assertAllClose(result, 1.0)
+        obj.reset_state()
+        y_pred = np.array([[0.1, 0.9], [0.1, 0.9]])
+        result = obj(y_true, y_pred, sample_weight=np.array([1.0, 3.0]))
+        self.assertAllClose(result, 0.25)
+
+    def test_k_larger_than_num_items(self):
+        obj = ranking_metrics.RecallAtK(k=10)
+        obj.update_state([[0, 1, 1]], [[0.3, 0.2, 0.1]])
+        self.assertAllClose(obj.result(), 1.0)
+
+    def test_invalid_k(self):
+        with self.assertRaisesRegex(ValueError, "positive integer"):
+            ranking_metrics.RecallAtK(k=0)
+
+
+class NDCGTest(testing.TestCase):
+    def test_config(self):
+        obj = ranking_metrics.NDCG(k=5, name="ndcg5")
+        obj2 = ranking_metrics.NDCG.from_config(obj.get_config())
+        self.assertEqual(obj2.k, 5)
+        self.assertEqual(obj2.name, "ndcg5")
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        y_true = rng.integers(0, 4, size=(16, 12)).astype("float32")
+        y_true[0] = 0.0
+        y_pred = rng.random((16, 12)).astype("float32")
+        for k in (None, 1, 5):
+            obj = ranking_metrics.NDCG(k=k)
+            obj.update_state(y_true, y_pred)
+            expected = np.mean(
+                [
+                    _brute_force_ndcg(t, p, k or 12)
+                    for t, p in zip(y_true, y_pred)
+                ]
+            )
+            self.assertAllClose(obj.result(), expected, atol=1e-5)
+
+    def test_perfect_ranking(self):
+        obj = ranking_metrics.NDCG(k=3)
+        obj.update_state([[3, 2, 0, 1]], [[0.9, 0.8, 0.1, 0.5]])
+        self.assertAllClose(obj.result(), 1.0)
+
+
+class MeanReciprocalRankTest(testing.TestCase):
+    def test_config(self):
+        obj = ranking_metrics.MeanReciprocalRank(k=3)
+        obj2 = ranking_metrics.MeanReciprocalRank.from_config(obj.get_config())
+        self.assertEqual(obj2.k, 3)
+        self.assertEqual(obj2.name, "mean_reciprocal_rank")
+
+    def test_unweighted(self):
+        obj = ranking_metrics.MeanReciprocalRank()
+        y_true = np.array([[0, 0, 1, 1], [1, 0, 0, 0], [0, 0, 0, 0]])
+        y_pred = np.array(
+            [[0.9, 0.8, 0.7, 0.1], [0.2, 0.1, 0.3, 0.0], [0.1, 0.2, 0.3, 0.4]]
+        )
+        obj.update_state(y_true, y_pred)
+        self.assertAllClose(obj.result(), (1 / 3 + 1 / 2 + 0.0) / 3)
+
+    def test_k(self):
+        obj = ranking_metrics.MeanReciprocalRank(k=2)
+        obj.update_state([[0, 0, 1]], [[0.9, 0.8, 0.7]])
+        self.assertAllClose(obj.result(), 0.0)
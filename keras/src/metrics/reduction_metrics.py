@@ -44,6 +44,17 @@ def reduce_to_samplewise_values(values, sample_weight, reduce_fn, dtype):
     return values, sample_weight
 
 
+def count_samples(values, sample_weight, dtype):
+    """Returns the (weighted) number of samples of samplewise values."""
+    if sample_weight is not None:
+        num_samples = ops.sum(sample_weight)
+    elif len(values.shape) >= 1:
+        num_samples = ops.shape(values)[0]
+    else:
+        num_samples = 1
+    return ops.cast(num_samples, dtype=dtype)
+
+
 @keras_export("keras.metrics.Sum")
 class Sum(Metric):
     """Compute the (weighted) sum of the given values.
@@ -140,13 +151,7 @@ class Mean(Metric):
             values, sample_weight, reduce_fn=ops.mean, dtype=self.dtype
         )
         self.total.assign_add(ops.sum(values))
-        if sample_weight is not None:
-            num_samples = ops.sum(sample_weight)
-        elif len(values.shape) >= 1:
-            num_samples = ops.shape(values)[0]
-        else:
-            num_samples = 1
-        self.count.assign_add(ops.cast(num_samples, dtype=self.dtype))
+        self.count.assign_add(count_samples(values, sample_weight, self.dtype))
 
     def reset_state(self):
         self.total.assign(0)
@@ -218,3 +223,56 @@ class MeanMetricWrapper(Mean):
         if "fn" in config:
             config = serialization_lib.deserialize_keras_object(config)
         return cls(**config)
+
+
+def update_mean_metric_wrappers(metrics, y_true, y_pred, sample_weight=None):
+    """Updates several `MeanMetricWrapper` metrics of the same dtype at once.
+
+    This is equivalent to calling `update_state()` on each metric, but the
+    mask of `y_pred` is applied to `sample_weight` only once, metrics wrapping
+    the same function with the same arguments share their values, and metrics
+    whose values have the same shape share their sample count.
+
+    Args:
+        metrics: A list of `MeanMetricWrapper` instances with the same dtype
+            which don't override `update_state()`.
+        y_true: The ground truth values.
+        y_pred: The predicted values.
+        sample_weight: Optional weighting of each example.
+    """
+    dtype = metrics[0].dtype
+    mask = backend.get_keras_mask(y_pred)
+    if sample_weight is not None and mask is not None:
+        sample_weight = losses.loss.apply_mask(
+            sample_weight, mask, dtype=dtype, reduction="sum"
+        )
+    updates = {}
+    counts = {}
+    for metric in metrics:
+        key = _get_fn_key(metric)
+        if key is None or key not in updates:
+            values = metric._fn(y_true, y_pred, **metric._fn_kwargs)
+            if not hasattr(values, "shape"):
+                values = ops.convert_to_tensor(values)
+            count_key = tuple(values.shape)
+            values, weights = reduce_to_samplewise_values(
+                values, sample_weight, reduce_fn=ops.mean, dtype=dtype
+            )
+            if count_key not in counts:
+                counts[count_key] = count_samples(values, weights, dtype)
+            update = (ops.sum(values), counts[count_key])
+            if key is not None:
+                updates[key] = update
+        else:
+            update = updates[key]
+        metric.total.assign_add(update[0])
+        metric.count.assign_add(update[1])
+
+
+def _get_fn_key(metric):
+    key = (metric._fn, tuple(sorted(metric._fn_kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
@@ -354,16 +354,41 @@ class Model(Trainer, base_trainer.Trainer, Layer):
             self, filepath, skip_mismatch=skip_mismatch, **kwargs
         )
 
-    def quantize(self, mode, **kwargs):
+    def quantize(
+        self,
+        mode,
+        calibration_data=None,
+        calibration_steps=None,
+        calibration_method="minmax",
+        **kwargs,
+    ):
         """Quantize the weights of the model.
 
         Note that the model must be built first before calling this method.
         `quantize` will recursively call `quantize(mode)` in all layers and
         will be skipped if the layer doesn't implement the function.
 
+        With `mode="int8"`, layers quantize their inputs dynamically by
+        default, computing an input scale at every call. Passing
+        `calibration_data` enables static quantization instead: the model is
+        first run on the calibration data to collect the range of the inputs
+        of each `Dense` and `EinsumDense` layer, and these layers then use a
+        fixed input scale, skipping the runtime reduction.
+
         Args:
-            mode: The mode of the quantization. Only 'int8' is supported at this
-                time.
+            mode: The mode of the quantization. One of `"int8"`, `"float8"`
+                or `"int4"`.
+            calibration_data: Optional representative input data, in any
+                format accepted by `predict()` (NumPy arrays, a
+                `tf.data.Dataset`, a generator or a `PyDataset`). Only
+                supported with `mode="int8"`.
+            calibration_steps: Number of batches of `calibration_data` to
+                run. Defaults to `None`, meaning all of `calibration_data`.
+            calibration_method: How to derive the input range from the
+                observed activations. One of `"minmax"` (maximum absolute
+                value), `"percentile"` (99.99th percentile of the absolute
+                values) or `"mse"` (range minimizing the quantization mean
+                squared error). Defaults to `"minmax"`.
         """
         from keras.src.dtype_policies import QUANTIZATION_MODES
 
@@ -378,6 +403,30 @@ class Model(Trainer, base_trainer.Trainer, Layer):
                 "Invalid quantization mode. "
                 f"Expected one of {QUANTIZATION_MODES}. Received: mode={mode}"
             )
+        inputs_amax = {}
+        if calibration_data is not None:
+            from keras.src.quantizers.calibration import calibrate_inputs_amax
+
+            if mode != "int8":
+                raise ValueError(
+                    "`calibration_data` is only supported with mode='int8'. "
+                    f"Received: mode={mode}"
+                )
+            calibrated_layers = [
+                layer
+                for layer in self._flatten_layers()
+                if hasattr(layer, "_freeze_int8_inputs_scale")
+            ]
+            amaxes = calibrate_inputs_amax(
+                self,
+                calibrated_layers,
+                calibration_data,
+                steps=calibration_steps,
+                method=calibration_method,
+            )
+            for layer, amax in zip(calibrated_layers, amaxes):
+                if amax is not None:
+                    inputs_amax[id(layer)] = amax
         mode_changed = False
         for layer in self._flatten_layers():
             list_of_sublayers = list(layer._flatten_layers())
@@ -387,6 +436,9 @@ class Model(Trainer, base_trainer.Trainer, Layer):
                     mode_changed = True
                 except NotImplementedError as e:
                     warnings.warn(str(e))
+                    continue
+                if id(layer) in inputs_amax:
+                    layer._freeze_int8_inputs_scale(inputs_amax[id(layer)])
         # We need to set these functions to `None` to remake them for changed
         # call function
         if mode_changed:
@@ -497,6 +549,96 @@ class Model(Trainer, base_trainer.Trainer, Layer):
 
         export_lib.export_model(self, filepath, verbose)
 
+    def as_function(self, jit=True, dtype=None):
+        """Returns a pure function running the model for inference.
+
+        The returned `function(params, inputs)` runs the forward pass of the
+        model (with `training=False`) on the given parameters, through
+        `stateless_call()`, and returns its outputs. It does not read nor
+        update the variables of the model, so it can be called concurrently
+        from several threads, e.g. in serving code. With `jit=True`, the
+        function is compiled by the backend (`jax.jit` with JAX,
+        `tf.function` with TensorFlow, `torch.compile` with PyTorch) the
+        first time it is called with new input shapes, and the Python
+        overhead of the layers is only paid at that time.
+
+        The parameters are a tuple `(trainable_values, non_trainable_values)`
+        of lists ordered like `model.trainable_variables` and
+        `model.non_trainable_variables`, as returned by `as_function()`.
+
+        Example:
+
+        ```python
+        function, params = model.as_function()
+        outputs = function(params, x)
+        ```
+
+        Args:
+            jit: Whether to compile the function. Defaults to `True`. Has no
+                effect with the NumPy backend.
+            dtype: Optional dtype to cast the floating point parameters to,
+                e.g. `"bfloat16"` to halve their memory. The function casts
+                them back to the dtypes of the variables when it is called.
+                Defaults to `None`, which keeps the dtypes of the variables.
+
+        Returns:
+            A tuple `(function, params)`, with `params` holding the current
+            values of the variables of the model.
+        """
+        if not self.built:
+            raise ValueError(
+                "The model must be built before calling `as_function()`. "
+                "Call the model on a batch of data or call `build()` first."
+            )
+
+        def get_values(variables):
+            values = [backend.convert_to_tensor(v) for v in variables]
+            if dtype is not None:
+                values = [
+                    (
+                        backend.cast(value, dtype)
+                        if backend.is_float_dtype(value.dtype)
+                        else value
+                    )
+                    for value in values
+                ]
+            return values
+
+        params = (
+            get_values(self.trainable_variables),
+            get_values(self.non_trainable_variables),
+        )
+
+        def function(params, inputs):
+            trainable_values, non_trainable_values = params
+            outputs, _ = self.stateless_call(
+                trainable_values, non_trainable_values, inputs, training=False
+            )
+            return outputs
+
+        if backend.backend() == "jax":
+            if jit:
+                import jax
+
+                function = jax.jit(function)
+        elif backend.backend() == "tensorflow":
+            if jit:
+                import tensorflow as tf
+
+                function = tf.function(
+                    function,
+                    jit_compile=base_trainer.model_supports_jit(self),
+                    reduce_retracing=True,
+                )
+        elif backend.backend() == "torch":
+            import torch
+
+            if jit:
+                function = torch.compile(function)
+            # The function is only used for inference.
+            function = torch.no_grad()(function)
+        return function, params
+
     @classmethod
     def from_config(cls, config, custom_objects=None):
         from keras.src.models.functional import Functional
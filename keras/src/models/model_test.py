@@ -8,6 +8,7 @@ from absl.testing import parameterized
 from keras.src import backend
 from keras.src import layers
 from keras.src import losses
+from keras.src import ops
 from keras.src import testing
 from keras.src import tree
 from keras.src.layers.core.input_layer import Input
@@ -833,6 +834,39 @@ class ModelTest(testing.TestCase):
         with self.assertRaisesRegex(ValueError, "Invalid quantization mode"):
             model.quantize("int7")
 
+    @parameterized.named_parameters(
+        ("minmax", "minmax"),
+        ("percentile", "percentile"),
+        ("mse", "mse"),
+    )
+    def test_quantize_with_calibration(self, method):
+        model = _get_model()
+        x1 = np.random.rand(2, 3)
+        x2 = np.random.rand(2, 3)
+        y_float = model((x1, x2))
+        model.quantize(
+            "int8",
+            calibration_data=[x1, x2],
+            calibration_steps=1,
+            calibration_method=method,
+        )
+        y_quantized = model((x1, x2))
+        self.assertAllClose(y_float, y_quantized, atol=0.05)
+
+        for layer in model._flatten_layers():
+            if isinstance(layer, (layers.Dense, layers.EinsumDense)):
+                self.assertTrue(layer.dtype_policy.static_inputs)
+                self.assertEqual(layer.inputs_scale.shape, ())
+                self.assertGreater(ops.convert_to_numpy(layer.inputs_scale), 0)
+
+    def test_quantize_with_calibration_invalid_args(self):
+        model = _get_model()
+        x = [np.random.rand(2, 3), np.random.rand(2, 3)]
+        with self.assertRaisesRegex(ValueError, "only supported with mode"):
+            model.quantize("float8", calibration_data=x)
+        with self.assertRaisesRegex(ValueError, "Invalid calibration method"):
+            model.quantize("int8", calibration_data=x, calibration_method="kl")
+
     @parameterized.named_parameters(
         ("int8", "int8"),
         ("float8", "float8"),
@@ -1217,3 +1251,35 @@ class ModelTest(testing.TestCase):
             ]
         )
         self.assertListEqual(hist_keys, ref_keys)
+
+    @parameterized.named_parameters(("jit", True), ("no_jit", False))
+    def test_as_function(self, jit):
+        if backend.backend() == "torch" and jit:
+            self.skipTest("`torch.compile` is not tested here.")
+        model = _get_model()
+        x = [np.random.rand(2, 3), np.random.rand(2, 3)]
+        function, params = model.as_function(jit=jit)
+        trainable_values, non_trainable_values = params
+        self.assertLen(trainable_values, len(model.trainable_variables))
+        self.assertLen(non_trainable_values, len(model.non_trainable_variables))
+        self.assertAllClose(function(params, x), model.predict(x), atol=1e-6)
+
+        # The function only depends on the given parameters.
+        zeros = [ops.zeros_like(value) for value in trainable_values]
+        self.assertAllClose(
+            function((zeros, non_trainable_values), x), np.zeros((2, 4))
+        )
+        self.assertAllClose(function(params, x), model.predict(x), atol=1e-6)
+
+    def test_as_function_dtype(self):
+        model = _get_model()
+        x = [np.random.rand(2, 3), np.random.rand(2, 3)]
+        function, params = model.as_function(jit=False, dtype="float16")
+        for value in params[0]:
+            self.assertEqual(backend.standardize_dtype(value.dtype), "float16")
+        outputs = function(params, x)
+        self.assertEqual(backend.standardize_dtype(outputs.dtype), "float32")
+        self.assertAllClose(outputs, model.predict(x), atol=1e-2, rtol=1e-2)
+
+        with self.assertRaisesRegex(ValueError, "must be built"):
+            Model().as_function()
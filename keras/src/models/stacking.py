@@ -0,0 +1,147 @@
+from keras.src import backend
+from keras.src import ops
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.models.model import Model
+from keras.src.utils import tracking
+
+
+@keras_export("keras.models.stack_models")
+def stack_models(models):
+    """Stacks structurally identical models to run them as a single model.
+
+    The variables of the models are stacked along a new leading axis, and
+    the returned model runs all of them at once with `keras.ops.vectorized_map`
+    (`jax.vmap` with JAX, `torch.vmap` with PyTorch and `tf.vectorized_map`
+    with TensorFlow). Calling or predicting with the stacked model therefore
+    runs a single compiled function instead of one per model, e.g. to serve
+    an ensemble.
+
+    The models must have the same class and the same variable shapes and
+    dtypes, e.g. models created by the same function and trained from
+    different initializations. The stacked model holds a copy of the
+    variables: later updates to the models are not reflected in it.
+
+    Example:
+
+    ```python
+    ensemble = keras.models.stack_models([model_1, model_2, model_3])
+    # Predictions of shape `(batch_size, 3, ...)`.
+    predictions = ensemble.predict(x)
+    mean_predictions = predictions.mean(axis=1)
+    ```
+
+    Args:
+        models: A list of built `Model` instances with the same structure.
+
+    Returns:
+        A `Model` whose outputs have the same structure as the outputs of
+        the stacked models, with a new axis of size `len(models)` after the
+        batch axis.
+    """
+    return StackedModel(models)
+
+
+class StackedModel(Model):
+    """Runs several structurally identical models as a single model.
+
+    Use `keras.models.stack_models()` to create a `StackedModel`.
+
+    Args:
+        models: A list of built `Model` instances with the same structure.
+    """
+
+    def __init__(self, models, **kwargs):
+        models = list(models)
+        if not models:
+            raise ValueError(
+                "`stack_models()` expects a non-empty list of models. "
+                f"Received: models={models}"
+            )
+        template = models[0]
+        for model in models:
+            if not model.built:
+                raise ValueError(
+                    "All the models passed to `stack_models()` must be "
+                    f"built. Model '{model.name}' is not built."
+                )
+
+        def signature(variables):
+            return [
+                (tuple(v.shape), backend.standardize_dtype(v.dtype))
+                for v in variables
+            ]
+
+        for model in models[1:]:
+            if (
+                type(model) is not type(template)
+                or signature(model.trainable_variables)
+                != signature(template.trainable_variables)
+                or signature(model.non_trainable_variables)
+                != signature(template.non_trainable_variables)
+            ):
+                raise ValueError(
+                    "All the models passed to `stack_models()` must have the "
+                    "same class and the same variable shapes and dtypes. "
+                    f"Model '{model.name}' does not match model "
+                    f"'{template.name}'."
+                )
+
+        super().__init__(**kwargs)
+        # The template is only used to run the stacked variables, so it is
+        # not tracked: its variables are not variables of this model.
+        with tracking.DotNotTrackScope():
+            self._template = template
+        self.num_models = len(models)
+        self._stacked_trainable_variables = [
+            self._stack_variables(
+                [model.trainable_variables[i] for model in models]
+            )
+            for i in range(len(template.trainable_variables))
+        ]
+        self._stacked_non_trainable_variables = [
+            self._stack_variables(
+                [model.non_trainable_variables[i] for model in models]
+            )
+            for i in range(len(template.non_trainable_variables))
+        ]
+        self.built = True
+
+    def _stack_variables(self, variables):
+        reference = variables[0]
+        variable = self.add_weight(
+            shape=(len(variables),) + tuple(reference.shape),
+            initializer="zeros",
+            dtype=reference.dtype,
+            trainable=reference.trainable,
+            autocast=False,
+            name=reference.name,
+        )
+        variable.assign(ops.stack([v.value for v in variables]))
+        return variable
+
+    def call(self, inputs, training=None):
+        trainable_values = [v.value for v in self._stacked_trainable_variables]
+        non_trainable_values = [
+            v.value for v in self._stacked_non_trainable_variables
+        ]
+        num_trainable = len(trainable_values)
+        output_structure = []
+
+        def call_template(values):
+            outputs, _ = self._template.stateless_call(
+                values[:num_trainable],
+                values[num_trainable:],
+                inputs,
+                training=training,
+            )
+            if not output_structure:
+                output_structure.append(outputs)
+            return tree.flatten(outputs)
+
+        outputs = ops.vectorized_map(
+            call_template, trainable_values + non_trainable_values
+        )
+        # Move the model axis after the batch axis.
+        outputs = [ops.moveaxis(output, 0, 1) for output in outputs]
+        return tree.pack_sequence_as(output_structure[0], outputs)
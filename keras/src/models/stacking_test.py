@@ -0,0 +1,66 @@
+import numpy as np
+
+from keras.src import layers
+from keras.src import models
+from keras.src import ops
+from keras.src import testing
+from keras.src.models.stacking import stack_models
+
+
+def get_functional_model(units=2):
+    inputs = layers.Input(shape=(4,))
+    x = layers.Dense(8, activation="relu")(inputs)
+    x = layers.BatchNormalization()(x)
+    outputs = {
+        "a": layers.Dense(units)(x),
+        "b": layers.Dense(1)(x),
+    }
+    return models.Model(inputs, outputs)
+
+
+def get_sequential_model():
+    return models.Sequential(
+        [layers.Input(shape=(4,)), layers.Dense(3), layers.Dense(2)]
+    )
+
+
+class StackModelsTest(testing.TestCase):
+    def test_stack_functional_models(self):
+        members = [get_functional_model() for _ in range(3)]
+        x = np.random.rand(10, 4).astype("float32")
+        stacked = stack_models(members)
+        self.assertEqual(stacked.num_models, 3)
+        self.assertLen(stacked.weights, len(members[0].weights))
+
+        outputs = stacked.predict(x, batch_size=4)
+        for key in ["a", "b"]:
+            expected = np.stack(
+                [member.predict(x)[key] for member in members], axis=1
+            )
+            self.assertAllClose(outputs[key], expected, atol=1e-5)
+
+    def test_stack_sequential_models(self):
+        members = [get_sequential_model() for _ in range(4)]
+        x = np.random.rand(5, 4).astype("float32")
+        outputs = stack_models(members)(x)
+        self.assertEqual(outputs.shape, (5, 4, 2))
+        expected = ops.stack([member(x) for member in members], axis=1)
+        self.assertAllClose(outputs, expected, atol=1e-5)
+
+    def test_stacked_variables_are_copies(self):
+        members = [get_sequential_model() for _ in range(2)]
+        x = np.random.rand(5, 4).astype("float32")
+        stacked = stack_models(members)
+        expected = stacked(x)
+        members[0].layers[0].kernel.assign(
+            np.zeros(members[0].layers[0].kernel.shape)
+        )
+        self.assertAllClose(stacked(x), expected)
+
+    def test_invalid_models(self):
+        with self.assertRaisesRegex(ValueError, "non-empty list"):
+            stack_models([])
+        with self.assertRaisesRegex(ValueError, "must be built"):
+            stack_models([models.Sequential([layers.Dense(2)])])
+        with self.assertRaisesRegex(ValueError, "same class"):
+            stack_models([get_functional_model(2), get_functional_model(3)])
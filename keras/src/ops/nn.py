@@ -1881,6 +1881,141 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     )
 
 
+class LinearSparseCategoricalCrossentropy(Operation):
+    def __init__(self, token_chunk_size=1024, vocab_chunk_size=32768):
+        super().__init__()
+        self.token_chunk_size = token_chunk_size
+        self.vocab_chunk_size = vocab_chunk_size
+
+    def call(self, target, inputs, kernel, bias=None):
+        return backend.nn.linear_sparse_categorical_crossentropy(
+            target,
+            inputs,
+            kernel,
+            bias=bias,
+            token_chunk_size=self.token_chunk_size,
+            vocab_chunk_size=self.vocab_chunk_size,
+        )
+
+    def compute_output_spec(self, target, inputs, kernel, bias=None):
+        _check_linear_crossentropy_shapes(target, inputs, kernel, bias)
+        dtype = backend.result_type(inputs.dtype, kernel.dtype)
+        return KerasTensor(inputs.shape[:-1], dtype=dtype)
+
+
+def _check_linear_crossentropy_shapes(target, inputs, kernel, bias):
+    if len(kernel.shape) != 2:
+        raise ValueError(
+            "Argument `kernel` must be rank 2. "
+            f"Received: kernel.shape={kernel.shape}"
+        )
+    if len(inputs.shape) < 1 or inputs.shape[-1] != kernel.shape[0]:
+        raise ValueError(
+            "The last dimension of `inputs` must match the first dimension "
+            f"of `kernel`. Received: inputs.shape={inputs.shape}, "
+            f"kernel.shape={kernel.shape}"
+        )
+    if bias is not None and tuple(bias.shape) != (kernel.shape[1],):
+        raise ValueError(
+            "Argument `bias` must have shape `(kernel.shape[1],)`. "
+            f"Received: bias.shape={bias.shape}, kernel.shape={kernel.shape}"
+        )
+    target_shape = target.shape
+    if len(target_shape) == len(inputs.shape) and target_shape[-1] == 1:
+        target_shape = target_shape[:-1]
+    if len(target_shape) != len(inputs.shape) - 1 or any(
+        e1 is not None and e2 is not None and e1 != e2
+        for e1, e2 in zip(target_shape, inputs.shape[:-1])
+    ):
+        raise ValueError(
+            "Arguments `target` and `inputs` must have the same shape "
+            "up until the last dimension: "
+            f"target.shape={target.shape}, inputs.shape={inputs.shape}"
+        )
+
+
+@keras_export(
+    [
+        "keras.ops.linear_sparse_categorical_crossentropy",
+        "keras.ops.nn.linear_sparse_categorical_crossentropy",
+    ]
+)
+def linear_sparse_categorical_crossentropy(
+    target,
+    inputs,
+    kernel,
+    bias=None,
+    token_chunk_size=1024,
+    vocab_chunk_size=32768,
+):
+    """Computes sparse categorical cross-entropy of a fused linear projection.
+
+    This is equivalent to
+
+    ```python
+    logits = ops.matmul(inputs, kernel) + bias
+    loss = ops.sparse_categorical_crossentropy(
+        target, logits, from_logits=True
+    )
+    ```
+
+    but the `(..., num_classes)` logits are never materialized. The tokens
+    are processed in chunks of `token_chunk_size` and, within each chunk, the
+    classes in chunks of `vocab_chunk_size` with an online log-sum-exp. The
+    gradient recomputes the logits chunk by chunk in the same way, so at most
+    `(token_chunk_size, vocab_chunk_size)` logits are alive at any time. This
+    makes the loss of language models with very large vocabularies fit in
+    memory.
+
+    Args:
+        target: The integer class labels, with the shape of `inputs` without
+            its last dimension.
+        inputs: The hidden states to project, of shape `(..., input_dim)`.
+        kernel: The projection kernel, of shape `(input_dim, num_classes)`.
+        bias: Optional bias of shape `(num_classes,)`.
+        token_chunk_size: Number of tokens processed at once. Defaults to
+            `1024`.
+        vocab_chunk_size: Number of classes processed at once. Defaults to
+            `32768`.
+
+    Returns:
+        The cross-entropy loss of each token, with the shape of `inputs`
+        without its last dimension.
+
+    Example:
+
+    >>> inputs = keras.random.normal((2, 8, 16))
+    >>> kernel = keras.random.normal((16, 1000))
+    >>> target = keras.random.randint((2, 8), 0, 1000)
+    >>> keras.ops.linear_sparse_categorical_crossentropy(
+    ...     target, inputs, kernel
+    ... ).shape
+    (2, 8)
+    """
+    for name, value in (
+        ("token_chunk_size", token_chunk_size),
+        ("vocab_chunk_size", vocab_chunk_size),
+    ):
+        if not isinstance(value, int) or value < 1:
+            raise ValueError(
+                f"Argument `{name}` must be a positive integer. "
+                f"Received: {name}={value}"
+            )
+    if any_symbolic_tensors((target, inputs, kernel, bias)):
+        return LinearSparseCategoricalCrossentropy(
+            token_chunk_size=token_chunk_size,
+            vocab_chunk_size=vocab_chunk_size,
+        ).symbolic_call(target, inputs, kernel, bias=bias)
+    return backend.nn.linear_sparse_categorical_crossentropy(
+        target,
+        inputs,
+        kernel,
+        bias=bias,
+        token_chunk_size=token_chunk_size,
+        vocab_chunk_size=vocab_chunk_size,
+    )
+
+
 class MultiHot(Operation):
     def __init__(
         self, num_classes=None, axis=-1, dtype=None, sparse=False, **kwargs
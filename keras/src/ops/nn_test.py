@@ -1197,6 +1197,30 @@ class NNOpsStaticShapeTest(testing.TestCase):
             knn.sparse_categorical_crossentropy(x1, x2).shape, (2, 3)
         )
 
+    def test_linear_sparse_categorical_crossentropy(self):
+        target = KerasTensor([2, 3], dtype="int32")
+        inputs = KerasTensor([2, 3, 4])
+        kernel = KerasTensor([4, 10])
+        bias = KerasTensor([10])
+        self.assertEqual(
+            knn.linear_sparse_categorical_crossentropy(
+                target, inputs, kernel, bias
+            ).shape,
+            (2, 3),
+        )
+        with self.assertRaisesRegex(ValueError, "last dimension of `inputs`"):
+            knn.linear_sparse_categorical_crossentropy(
+                target, inputs, KerasTensor([5, 10])
+            )
+        with self.assertRaisesRegex(ValueError, "`bias` must have shape"):
+            knn.linear_sparse_categorical_crossentropy(
+                target, inputs, kernel, KerasTensor([4])
+            )
+        with self.assertRaisesRegex(ValueError, "token_chunk_size"):
+            knn.linear_sparse_categorical_crossentropy(
+                target, inputs, kernel, token_chunk_size=0
+            )
+
     def test_moments(self):
         x = KerasTensor([2, 3, 4])
         self.assertEqual(knn.moments(x, axes=[0])[0].shape, (3, 4))
@@ -1991,6 +2015,38 @@ class NNOpsCorrectnessTest(testing.TestCase):
         )
         self.assertAllClose(result, [0.001822, 0.000459, 0.169846])
 
+    def test_linear_sparse_categorical_crossentropy(self):
+        rng = np.random.default_rng(0)
+        inputs = rng.normal(size=(3, 7, 16)).astype("float32")
+        kernel = rng.normal(size=(16, 50)).astype("float32")
+        bias = rng.normal(size=(50,)).astype("float32")
+        target = rng.integers(0, 50, size=(3, 7))
+        expected = knn.sparse_categorical_crossentropy(
+            target, np.matmul(inputs, kernel) + bias, from_logits=True
+        )
+        # Chunk sizes that do not divide the number of tokens and classes.
+        result = knn.linear_sparse_categorical_crossentropy(
+            target,
+            inputs,
+            kernel,
+            bias,
+            token_chunk_size=4,
+            vocab_chunk_size=12,
+        )
+        self.assertAllClose(result, expected, atol=1e-5)
+        result = knn.linear_sparse_categorical_crossentropy(
+            target[..., None], inputs, kernel, bias
+        )
+        self.assertAllClose(result, expected, atol=1e-5)
+
+        expected = knn.sparse_categorical_crossentropy(
+            target, np.matmul(inputs, kernel), from_logits=True
+        )
+        result = knn.linear_sparse_categorical_crossentropy(
+            target, inputs, kernel, vocab_chunk_size=7
+        )
+        self.assertAllClose(result, expected, atol=1e-5)
+
     @parameterized.named_parameters(
         [
             {"testcase_name": "dense", "sparse": False},
@@ -131,8 +131,19 @@ class Adafactor(optimizer.Optimizer):
                 )
             )
 
-    def _rms(self, x):
-        return ops.sqrt(ops.mean(ops.square(x)))
+    def _flat_bucket_key(self, variable):
+        # Factored variables keep their own shape.
+        if len(variable.shape) >= 2:
+            return None
+        return super()._flat_bucket_key(variable)
+
+    def _rms(self, x, variable=None):
+        if variable is None:
+            return ops.sqrt(ops.mean(ops.square(x)))
+        # With flat buffers, the RMS is computed per model variable
+        return ops.sqrt(
+            self._per_variable_reduce(ops.square(x), variable, "mean")
+        )
 
     def update_step(self, gradient, variable, learning_rate):
         """Update step given gradient and the associated model variable."""
@@ -150,7 +161,7 @@ class Adafactor(optimizer.Optimizer):
         v = self._v[self._get_variable_index(variable)]
 
         rho_t = ops.minimum(lr, 1 / ops.sqrt(local_step))
-        alpha_t = ops.maximum(epsilon_2, self._rms(variable)) * rho_t
+        alpha_t = ops.maximum(epsilon_2, self._rms(variable, variable)) * rho_t
         regulated_grad_square = ops.add(ops.square(gradient), self.epsilon_1)
         beta_2_t = 1 - ops.power(local_step, self.beta_2_decay)
 
@@ -184,7 +195,9 @@ class Adafactor(optimizer.Optimizer):
         u_t = ops.divide(gradient, ops.sqrt(v))
         u_t_hat = ops.divide(
             u_t,
-            ops.maximum(one, ops.divide(self._rms(u_t), self.clip_threshold)),
+            ops.maximum(
+                one, ops.divide(self._rms(u_t, variable), self.clip_threshold)
+            ),
         )
         self.assign_sub(variable, ops.multiply(alpha_t, u_t_hat))
 
@@ -89,6 +89,25 @@ class Adagrad(optimizer.Optimizer):
 
         accumulator = self._accumulators[self._get_variable_index(variable)]
 
+        sparse_gradient = self._get_row_sparse_gradient(gradient)
+        if sparse_gradient is not None:
+            # Rows with a zero gradient are not updated anyway, so only the
+            # touched rows are updated.
+            indices, gradient = sparse_gradient
+            accumulator_rows = ops.add(
+                self._gather_rows(accumulator, indices), ops.square(gradient)
+            )
+            self._assign_rows(accumulator, indices, accumulator_rows)
+            self._assign_sub_rows(
+                variable,
+                indices,
+                ops.divide(
+                    ops.multiply(lr, gradient),
+                    ops.sqrt(ops.add(accumulator_rows, self.epsilon)),
+                ),
+            )
+            return
+
         self.assign_add(accumulator, ops.square(gradient))
         self.assign_sub(
             variable,
@@ -98,6 +117,9 @@ class Adagrad(optimizer.Optimizer):
             ),
         )
 
+    def _supports_row_sparse_updates(self):
+        return True
+
     def get_config(self):
         config = super().get_config()
 
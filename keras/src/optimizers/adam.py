@@ -37,6 +37,21 @@ class Adam(optimizer.Optimizer):
         amsgrad: Boolean. Whether to apply AMSGrad variant of this algorithm
             from the paper "On the Convergence of Adam and beyond". Defaults
             to `False`.
+        use_8bit_states: Boolean. If `True`, the moment estimates are stored
+            as int8 values quantized in blocks of `state_block_size` values,
+            each block with its own float32 scale. They are dequantized in
+            `update_step()` and quantized back after the update, which
+            reduces the memory used by the optimizer state by about 4x.
+            Defaults to `False`.
+        state_block_size: Integer. The number of values sharing a scale when
+            `use_8bit_states=True`. Defaults to `256`.
+        lazy_updates: Boolean. If `True`, row-sparse gradients (such as
+            the gradients of an `Embedding` layer created with
+            `sparse_gradient=True`) only update the rows they touch, in the
+            model variable as well as in the moment estimates. This is much
+            faster for large embedding tables, but it differs from the
+            regular algorithm, in which the moments of all the rows decay
+            at every step. Defaults to `False`.
         {{base_optimizer_keyword_args}}
     """
 
@@ -47,6 +62,9 @@ class Adam(optimizer.Optimizer):
         beta_2=0.999,
         epsilon=1e-7,
         amsgrad=False,
+        use_8bit_states=False,
+        state_block_size=256,
+        lazy_updates=False,
         weight_decay=None,
         clipnorm=None,
         clipvalue=None,
@@ -77,6 +95,21 @@ class Adam(optimizer.Optimizer):
         self.beta_2 = beta_2
         self.epsilon = epsilon
         self.amsgrad = amsgrad
+        self.use_8bit_states = use_8bit_states
+        self.state_block_size = state_block_size
+        self.lazy_updates = lazy_updates
+        if use_8bit_states and lazy_updates:
+            raise ValueError(
+                "Arguments `use_8bit_states` and `lazy_updates` cannot be "
+                "used together."
+            )
+        if use_8bit_states and (
+            not isinstance(state_block_size, int) or state_block_size < 1
+        ):
+            raise ValueError(
+                "Argument `state_block_size` must be a positive integer. "
+                f"Received: state_block_size={state_block_size}"
+            )
 
     def build(self, var_list):
         """Initialize optimizer variables.
@@ -92,18 +125,54 @@ class Adam(optimizer.Optimizer):
         super().build(var_list)
         self._momentums = []
         self._velocities = []
-        for var in var_list:
-            self._momentums.append(
-                self.add_variable_from_reference(
-                    reference_variable=var, name="momentum"
+        if self.use_8bit_states:
+            self._momentum_absmaxes = []
+            self._velocity_absmaxes = []
+            for var in var_list:
+                momentum, momentum_absmax = (
+                    self.add_quantized_variable_from_reference(
+                        reference_variable=var,
+                        name="momentum",
+                        block_size=self.state_block_size,
+                    )
                 )
-            )
-            self._velocities.append(
-                self.add_variable_from_reference(
-                    reference_variable=var, name="velocity"
+                velocity, velocity_absmax = (
+                    self.add_quantized_variable_from_reference(
+                        reference_variable=var,
+                        name="velocity",
+                        block_size=self.state_block_size,
+                    )
                 )
-            )
-        if self.amsgrad:
+                self._momentums.append(momentum)
+                self._momentum_absmaxes.append(momentum_absmax)
+                self._velocities.append(velocity)
+                self._velocity_absmaxes.append(velocity_absmax)
+        else:
+            for var in var_list:
+                self._momentums.append(
+                    self.add_variable_from_reference(
+                        reference_variable=var, name="momentum"
+                    )
+                )
+                self._velocities.append(
+                    self.add_variable_from_reference(
+                        reference_variable=var, name="velocity"
+                    )
+                )
+        if self.amsgrad and self.use_8bit_states:
+            self._velocity_hats = []
+            self._velocity_hat_absmaxes = []
+            for var in var_list:
+                velocity_hat, velocity_hat_absmax = (
+                    self.add_quantized_variable_from_reference(
+                        reference_variable=var,
+                        name="velocity_hat",
+                        block_size=self.state_block_size,
+                    )
+                )
+                self._velocity_hats.append(velocity_hat)
+                self._velocity_hat_absmaxes.append(velocity_hat_absmax)
+        elif self.amsgrad:
             self._velocity_hats = []
             for var in var_list:
                 self._velocity_hats.append(
@@ -124,11 +193,19 @@ class Adam(optimizer.Optimizer):
             ops.cast(self.beta_2, variable.dtype), local_step
         )
 
+        alpha = lr * ops.sqrt(1 - beta_2_power) / (1 - beta_1_power)
+        if self.use_8bit_states:
+            self._update_step_8bit(gradient, variable, alpha)
+            return
+        if self.lazy_updates:
+            sparse_gradient = self._get_row_sparse_gradient(gradient)
+            if sparse_gradient is not None:
+                self._lazy_update_step(*sparse_gradient, variable, alpha)
+                return
+
         m = self._momentums[self._get_variable_index(variable)]
         v = self._velocities[self._get_variable_index(variable)]
 
-        alpha = lr * ops.sqrt(1 - beta_2_power) / (1 - beta_1_power)
-
         self.assign_add(
             m, ops.multiply(ops.subtract(gradient, m), 1 - self.beta_1)
         )
@@ -149,6 +226,90 @@ class Adam(optimizer.Optimizer):
             ),
         )
 
+    def _supports_row_sparse_updates(self):
+        return self.lazy_updates
+
+    def _lazy_update_step(self, indices, gradient, variable, alpha):
+        index = self._get_variable_index(variable)
+        m = self._momentums[index]
+        v = self._velocities[index]
+        m_rows = self._gather_rows(m, indices)
+        v_rows = self._gather_rows(v, indices)
+        m_rows = ops.add(
+            m_rows,
+            ops.multiply(ops.subtract(gradient, m_rows), 1 - self.beta_1),
+        )
+        v_rows = ops.add(
+            v_rows,
+            ops.multiply(
+                ops.subtract(ops.square(gradient), v_rows), 1 - self.beta_2
+            ),
+        )
+        self._assign_rows(m, indices, m_rows)
+        self._assign_rows(v, indices, v_rows)
+        if self.amsgrad:
+            v_hat = self._velocity_hats[index]
+            v_rows = ops.maximum(self._gather_rows(v_hat, indices), v_rows)
+            self._assign_rows(v_hat, indices, v_rows)
+        variable_rows = ops.subtract(
+            self._gather_rows(variable, indices),
+            ops.divide(
+                ops.multiply(m_rows, alpha),
+                ops.add(ops.sqrt(v_rows), self.epsilon),
+            ),
+        )
+        self._assign_rows(variable, indices, variable_rows)
+
+    def _update_step_8bit(self, gradient, variable, alpha):
+        index = self._get_variable_index(variable)
+        # The second moment spans a much larger range of values than the
+        # first one, so it is quantized with a stronger companding.
+        m = self._read_quantized_variable(
+            self._momentums[index],
+            self._momentum_absmaxes[index],
+            variable,
+            exponent=2,
+        )
+        v = self._read_quantized_variable(
+            self._velocities[index],
+            self._velocity_absmaxes[index],
+            variable,
+            exponent=4,
+        )
+        m = ops.add(m, ops.multiply(ops.subtract(gradient, m), 1 - self.beta_1))
+        v = ops.add(
+            v,
+            ops.multiply(
+                ops.subtract(ops.square(gradient), v), 1 - self.beta_2
+            ),
+        )
+        self._assign_quantized_variable(
+            self._momentums[index], self._momentum_absmaxes[index], m, 2
+        )
+        self._assign_quantized_variable(
+            self._velocities[index], self._velocity_absmaxes[index], v, 4
+        )
+        if self.amsgrad:
+            v_hat = self._read_quantized_variable(
+                self._velocity_hats[index],
+                self._velocity_hat_absmaxes[index],
+                variable,
+                exponent=4,
+            )
+            v = ops.maximum(v_hat, v)
+            self._assign_quantized_variable(
+                self._velocity_hats[index],
+                self._velocity_hat_absmaxes[index],
+                v,
+                4,
+            )
+        self.assign_sub(
+            variable,
+            ops.divide(
+                ops.multiply(m, alpha), ops.add(ops.sqrt(v), self.epsilon)
+            ),
+        )
+
     def get_config(self):
         config = super().get_config()
         config.update(
@@ -157,6 +318,9 @@ class Adam(optimizer.Optimizer):
                 "beta_2": self.beta_2,
                 "epsilon": self.epsilon,
                 "amsgrad": self.amsgrad,
+                "use_8bit_states": self.use_8bit_states,
+                "state_block_size": self.state_block_size,
+                "lazy_updates": self.lazy_updates,
             }
         )
         return config
@@ -40,6 +40,22 @@ class AdamW(adam.Adam):
         amsgrad: Boolean. Whether to apply AMSGrad variant of this algorithm
             from the paper "On the Convergence of Adam and beyond".
             Defaults to `False`.
+        use_8bit_states: Boolean. If `True`, the moment estimates are stored
+            as int8 values quantized in blocks of `state_block_size` values,
+            each block with its own float32 scale. They are dequantized in
+            `update_step()` and quantized back after the update, which
+            reduces the memory used by the optimizer state by about 4x.
+            Defaults to `False`.
+        state_block_size: Integer. The number of values sharing a scale when
+            `use_8bit_states=True`. Defaults to `256`.
+        lazy_updates: Boolean. If `True`, row-sparse gradients (such as
+            the gradients of an `Embedding` layer created with
+            `sparse_gradient=True`) only update the rows they touch, in the
+            model variable as well as in the moment estimates, and only
+            these rows are decayed by `weight_decay`. This is much faster for
+            large embedding tables, but it differs from the regular
+            algorithm, in which the moments and the weights of all the rows
+            decay at every step. Defaults to `False`.
         {{base_optimizer_keyword_args}}
 
     References:
@@ -58,6 +74,9 @@ class AdamW(adam.Adam):
         beta_2=0.999,
         epsilon=1e-7,
         amsgrad=False,
+        use_8bit_states=False,
+        state_block_size=256,
+        lazy_updates=False,
         clipnorm=None,
         clipvalue=None,
         global_clipnorm=None,
@@ -75,6 +94,9 @@ class AdamW(adam.Adam):
             beta_2=beta_2,
             epsilon=epsilon,
             amsgrad=amsgrad,
+            use_8bit_states=use_8bit_states,
+            state_block_size=state_block_size,
+            lazy_updates=lazy_updates,
             name=name,
             weight_decay=weight_decay,
             clipnorm=clipnorm,
@@ -1,10 +1,14 @@
 import re
 import warnings
+from functools import wraps
+
+import numpy as np
 
 from keras.src import backend
 from keras.src import initializers
 from keras.src import ops
 from keras.src.optimizers.schedules import learning_rate_schedule
+from keras.src.quantizers import quantizers
 from keras.src.saving import serialization_lib
 from keras.src.saving.keras_saveable import KerasSaveable
 from keras.src.utils import tracking
@@ -77,6 +81,7 @@ class BaseOptimizer(KerasSaveable):
         ema_overwrite_frequency=None,
         loss_scale_factor=None,
         gradient_accumulation_steps=None,
+        use_flat_buffers=False,
         name=None,
         **kwargs,
     ):
@@ -99,6 +104,7 @@ class BaseOptimizer(KerasSaveable):
         self.use_ema = use_ema
         self.loss_scale_factor = loss_scale_factor
         self.gradient_accumulation_steps = gradient_accumulation_steps
+        self.use_flat_buffers = use_flat_buffers
 
         if gradient_accumulation_steps:
             if not gradient_accumulation_steps >= 2:
@@ -150,6 +156,12 @@ class BaseOptimizer(KerasSaveable):
             }
         )
         self._trainable_variables_indices = {}
+        self._flat_buckets = None
+        # Whether the model variables are views into the flat buckets, in
+        # which case the buckets are not loaded and written back every step.
+        self._flat_buckets_alias_variables = False
+        if use_flat_buffers:
+            self._wrap_build_with_flat_buckets()
 
         # Create iteration variable
         # Note: dtype="int" will resolve to int32 in JAX
@@ -206,6 +218,14 @@ class BaseOptimizer(KerasSaveable):
 
     @tracking.no_automatic_dependency_tracking
     def build(self, variables):
+        if self._flat_buckets is not None:
+            # `variables` are the flat buckets the optimizer variables are
+            # created for; the rest of the state follows the model variables.
+            self._flat_variables_indices = {
+                self._var_key(variable): i
+                for i, variable in enumerate(variables)
+            }
+            variables = self._flat_model_variables
         if self.use_ema:
             self._model_variables_moving_average = []
         if self.gradient_accumulation_steps:
@@ -238,8 +258,173 @@ class BaseOptimizer(KerasSaveable):
         return self._variables[:]
 
     def _get_variable_index(self, variable):
+        if self._flat_buckets is not None:
+            return self._flat_variables_indices[self._var_key(variable)]
         return self._trainable_variables_indices[self._var_key(variable)]
 
+    def _wrap_build_with_flat_buckets(self):
+        # Wrap the class method, since `__init__` may run more than once
+        # (e.g. for the torch optimizers).
+        original_build = type(self).build
+
+        @wraps(original_build)
+        def build_wrapper(variables):
+            if self.built:
+                return
+            original_build(self, self._make_flat_buckets(variables))
+
+        self.build = build_wrapper
+
+    def _flat_bucket_key(self, variable):
+        """Returns the flat bucket of `variable`, `None` to keep it apart.
+
+        Variables with the same key are packed into the same flat bucket.
+        Optimizers whose updates are not elementwise can override this
+        method to keep some variables out of the buckets.
+
+        The embeddings of `Embedding(sparse_gradient=True)` are kept apart,
+        since their row-sparse gradients cannot be flattened.
+        """
+        if getattr(variable, "overwrite_with_gradient", False):
+            return None
+        if hasattr(variable, "_num_sparse_gradient_rows"):
+            return None
+        return backend.standardize_dtype(variable.dtype)
+
+    @tracking.no_automatic_dependency_tracking
+    def _make_flat_buckets(self, variables):
+        """Packs `variables` into flat buckets.
+
+        Returns the list of variables to create optimizer variables for:
+        one flat bucket per group of variables sharing a `_flat_bucket_key`,
+        and variables that are kept apart or alone in their group as is.
+        """
+        variables = list(variables)
+        groups = {}
+        for i, variable in enumerate(variables):
+            key = self._flat_bucket_key(variable)
+            groups.setdefault(("apart", i) if key is None else key, []).append(
+                variable
+            )
+        self._flat_model_variables = variables
+        self._flat_buckets = []
+        self._flat_bucket_members = []
+        self._flat_bucket_segments = {}
+        slot_variables = []
+        for members in groups.values():
+            if len(members) == 1:
+                slot_variables.append(members[0])
+                continue
+            sizes = [int(np.prod(v.shape)) for v in members]
+            with backend.name_scope(self.name, caller=self):
+                bucket = backend.Variable(
+                    initializer="zeros",
+                    shape=(sum(sizes),),
+                    dtype=members[0].dtype,
+                    trainable=False,
+                    name=f"flat_bucket_{len(self._flat_buckets)}",
+                )
+            self._flat_buckets.append(bucket)
+            self._flat_bucket_members.append(members)
+            self._flat_bucket_segments[self._var_key(bucket)] = (
+                np.repeat(np.arange(len(members), dtype="int32"), sizes),
+                np.array(sizes),
+            )
+            slot_variables.append(bucket)
+        return slot_variables
+
+    def _pack_flat_buckets(self, grads, trainable_variables):
+        """Loads the flat buckets and returns the matching gradients.
+
+        Members of a bucket without a gradient get a zero gradient.
+        """
+        if self._flat_buckets is None:
+            return grads, trainable_variables
+        bucket_keys = set()
+        for members in self._flat_bucket_members:
+            bucket_keys.update(self._var_key(v) for v in members)
+        grads_by_key = {}
+        packed_grads = []
+        packed_variables = []
+        for grad, variable in zip(grads, trainable_variables):
+            key = self._var_key(variable)
+            if key in bucket_keys:
+                grads_by_key[key] = grad
+            else:
+                packed_grads.append(grad)
+                packed_variables.append(variable)
+        for bucket, members in zip(
+            self._flat_buckets, self._flat_bucket_members
+        ):
+            flat_grads = []
+            for variable in members:
+                grad = grads_by_key.get(self._var_key(variable))
+                if grad is None:
+                    grad = ops.zeros(variable.shape, dtype=bucket.dtype)
+                grad = ops.cast(ops.convert_to_tensor(grad), bucket.dtype)
+                flat_grads.append(ops.reshape(grad, (-1,)))
+            if not self._flat_buckets_are_variables():
+                bucket.assign(
+                    ops.concatenate(
+                        [ops.reshape(variable, (-1,)) for variable in members]
+                    )
+                )
+            packed_grads.append(ops.concatenate(flat_grads))
+            packed_variables.append(bucket)
+        return packed_grads, packed_variables
+
+    def _unpack_flat_buckets(self):
+        """Writes the updated flat buckets back to the model variables."""
+        if self._flat_buckets is None or self._flat_buckets_are_variables():
+            return
+        for bucket, members in zip(
+            self._flat_buckets, self._flat_bucket_members
+        ):
+            sizes = self._flat_bucket_segments[self._var_key(bucket)][1]
+            values = ops.split(bucket, np.cumsum(sizes)[:-1].tolist())
+            for variable, value in zip(members, values):
+                variable.assign(ops.reshape(value, variable.shape))
+
+    def _flat_buckets_are_variables(self):
+        """Whether the model variables currently read from the buckets.
+
+        In a stateless scope, the model variables have their own values.
+        """
+        return (
+            self._flat_buckets_alias_variables
+            and not backend.in_stateless_scope()
+        )
+
+    def _update_step_with_flat_buckets(
+        self, grads, trainable_variables, learning_rate
+    ):
+        """Runs `_backend_update_step`, on the flat buckets if enabled."""
+        grads, trainable_variables = self._pack_flat_buckets(
+            grads, trainable_variables
+        )
+        self._backend_update_step(grads, trainable_variables, learning_rate)
+        self._unpack_flat_buckets()
+
+    def _per_variable_reduce(self, x, variable, reduction="sum"):
+        """Reduces `x` over each model variable packed in `variable`.
+
+        For a regular variable, this is a plain reduction to a scalar. For a
+        flat bucket, each element of the result holds the reduction over the
+        model variable it belongs to, so that it broadcasts against `x`.
+        """
+        segments = None
+        if self._flat_buckets is not None:
+            segments = self._flat_bucket_segments.get(self._var_key(variable))
+        if segments is None:
+            if reduction == "mean":
+                return ops.mean(x)
+            return ops.sum(x)
+        segment_ids, sizes = segments
+        result = ops.segment_sum(x, segment_ids, num_segments=len(sizes))
+        if reduction == "mean":
+            result = ops.divide(result, ops.cast(sizes, result.dtype))
+        return ops.take(result, segment_ids)
+
     def add_variable(
         self,
         shape,
@@ -268,22 +453,73 @@ class BaseOptimizer(KerasSaveable):
         """Add an all-zeros variable with the shape and dtype of a reference
         variable.
         """
-        name = name or "var"
-        if hasattr(reference_variable, "path"):
-            name = reference_variable.path.replace("/", "_") + "_" + name
-        else:
-            name = (
-                str(reference_variable.name).replace("/", "_").replace(":", "_")
-                + "_"
-                + name
-            )
         return self.add_variable(
             shape=reference_variable.shape,
             initializer=initializer,
             dtype=reference_variable.dtype,
-            name=name,
+            name=self._name_from_reference(reference_variable, name),
         )
 
+    def add_quantized_variable_from_reference(
+        self, reference_variable, name=None, block_size=256
+    ):
+        """Add an all-zeros int8 block-quantized counterpart of a reference
+        variable.
+
+        The values of the reference variable are flattened and quantized in
+        blocks of `block_size` values, each with its own float32 absolute
+        maximum. Use `_read_quantized_variable()` and
+        `_assign_quantized_variable()` to read and update it.
+
+        Returns:
+            A tuple `(values, absmax)` of an int8 variable of shape
+            `(num_blocks, block_size)` and a float32 variable of shape
+            `(num_blocks,)`.
+        """
+        name = self._name_from_reference(reference_variable, name)
+        num_blocks = quantizers.blockwise_num_blocks(
+            int(np.prod(reference_variable.shape)), block_size
+        )
+        values = self.add_variable(
+            shape=(num_blocks, block_size), dtype="int8", name=name
+        )
+        absmax = self.add_variable(
+            shape=(num_blocks,), dtype="float32", name=name + "_absmax"
+        )
+        return values, absmax
+
+    def _name_from_reference(self, reference_variable, name):
+        name = name or "var"
+        if hasattr(reference_variable, "path"):
+            return reference_variable.path.replace("/", "_") + "_" + name
+        return (
+            str(reference_variable.name).replace("/", "_").replace(":", "_")
+            + "_"
+            + name
+        )
+
+    def _read_quantized_variable(
+        self, values, absmax, reference_variable, exponent=1
+    ):
+        """Dequantizes a variable created by
+        `add_quantized_variable_from_reference()`."""
+        return quantizers.dequantize_blockwise(
+            values,
+            absmax,
+            reference_variable.shape,
+            exponent=exponent,
+            dtype=reference_variable.dtype,
+        )
+
+    def _assign_quantized_variable(self, values, absmax, value, exponent=1):
+        """Quantizes `value` into a variable created by
+        `add_quantized_variable_from_reference()`."""
+        new_values, new_absmax = quantizers.quantize_blockwise(
+            value, values.shape[1], exponent=exponent
+        )
+        self.assign(values, new_values)
+        self.assign(absmax, new_absmax)
+
     def _check_variables_are_known(self, variables):
         for v in variables:
             if self._var_key(v) not in self._trainable_variables_indices:
@@ -336,6 +572,52 @@ class BaseOptimizer(KerasSaveable):
         """
         variable.assign_sub(value)
 
+    def _supports_row_sparse_updates(self):
+        """Whether `update_step` has a path for row-sparse gradients.
+
+        Optimizers returning `True` only update the rows of the variables
+        (and of their slots) touched by a row-sparse gradient, see
+        `_get_row_sparse_gradient()`.
+        """
+        return False
+
+    def _get_row_sparse_gradient(self, gradient):
+        """Returns the `(indices, values)` of a row-sparse gradient.
+
+        The indices are unique. Returns `None` if `gradient` is dense. Row
+        sparse gradients are backend specific (e.g. `tf.IndexedSlices`).
+        """
+        return None
+
+    def _make_row_sparse_gradient(self, gradient, indices, values):
+        """Returns a row-sparse gradient like `gradient` with new rows.
+
+        Args:
+            gradient: The row-sparse gradient to take the shape from.
+            indices: The unique indices of the rows.
+            values: The values of the rows.
+        """
+        raise NotImplementedError
+
+    def _gather_rows(self, variable, indices):
+        """Gathers the rows of `variable` at `indices`."""
+        return ops.take(variable, indices, axis=0)
+
+    def _assign_rows(self, variable, indices, rows):
+        """Assigns `rows` to the rows of `variable` at `indices`."""
+        self.assign(
+            variable,
+            ops.scatter_update(variable, ops.expand_dims(indices, 1), rows),
+        )
+
+    def _assign_sub_rows(self, variable, indices, rows):
+        """Subtracts `rows` from the rows of `variable` at `indices`."""
+        self._assign_rows(
+            variable,
+            indices,
+            ops.subtract(self._gather_rows(variable, indices), rows),
+        )
+
     def update_step(self, gradient, variable, learning_rate):
         raise NotImplementedError
 
@@ -436,7 +718,9 @@ class BaseOptimizer(KerasSaveable):
             # processing steps, so we need to ensure the correct mapping between
             # `self._accumulated_gradients` and `trainable_variables`
             acc_grads = [
-                self._accumulated_gradients[self._get_variable_index(v)]
+                self._accumulated_gradients[
+                    self._trainable_variables_indices[self._var_key(v)]
+                ]
                 for v in trainable_variables
             ]
 
@@ -449,9 +733,11 @@ class BaseOptimizer(KerasSaveable):
 
                 # Apply clipping and weight decay.
                 grads = self._clip_gradients(grads)
-                self._apply_weight_decay(trainable_variables)
+                self._apply_weight_decay(
+                    self._apply_lazy_weight_decay(grads, trainable_variables)
+                )
 
-                self._backend_update_step(
+                self._update_step_with_flat_buckets(
                     grads, trainable_variables, self.learning_rate
                 )
                 self._backend_reset_gradient_accumulators()
@@ -466,10 +752,12 @@ class BaseOptimizer(KerasSaveable):
         else:
             # Apply clipping and weight decay.
             grads = self._clip_gradients(grads)
-            self._apply_weight_decay(trainable_variables)
+            self._apply_weight_decay(
+                self._apply_lazy_weight_decay(grads, trainable_variables)
+            )
 
             # Run update step.
-            self._backend_update_step(
+            self._update_step_with_flat_buckets(
                 grads, trainable_variables, self.learning_rate
             )
 
@@ -688,7 +976,7 @@ class BaseOptimizer(KerasSaveable):
                     steps = self.gradient_accumulation_steps
                     is_update_step = (self._iterations + 1) % steps == 0
                     acc_g = self._accumulated_gradients[
-                        self._get_variable_index(v)
+                        self._trainable_variables_indices[self._var_key(v)]
                     ]
                     # `ops.maximum` is utilized for gradient accumulation for
                     # `overwrite_with_gradient=True` variables
@@ -741,17 +1029,35 @@ class BaseOptimizer(KerasSaveable):
         return filtered_grads, filtered_vars
 
     def _clip_gradients(self, grads):
+        if not (
+            (self.clipnorm and self.clipnorm > 0)
+            or (self.global_clipnorm and self.global_clipnorm > 0)
+            or (self.clipvalue and self.clipvalue > 0)
+        ):
+            return grads
+        # Row-sparse gradients are clipped through the values of their rows.
+        row_sparse_grads = [self._get_row_sparse_gradient(g) for g in grads]
+        values = [
+            g if row_sparse is None else row_sparse[1]
+            for g, row_sparse in zip(grads, row_sparse_grads)
+        ]
         if self.clipnorm and self.clipnorm > 0:
-            return [
-                self._clip_by_norm(g) if g is not None else g for g in grads
+            values = [
+                self._clip_by_norm(v) if v is not None else v for v in values
             ]
         elif self.global_clipnorm and self.global_clipnorm > 0:
-            return clip_by_global_norm(grads, self.global_clipnorm)
-        elif self.clipvalue and self.clipvalue > 0:
-            v = self.clipvalue
-            return [ops.clip(g, -v, v) if g is not None else g for g in grads]
+            values = clip_by_global_norm(values, self.global_clipnorm)
         else:
-            return grads
+            c = self.clipvalue
+            values = [
+                ops.clip(v, -c, c) if v is not None else v for v in values
+            ]
+        return [
+            v
+            if row_sparse is None
+            else self._make_row_sparse_gradient(g, row_sparse[0], v)
+            for g, v, row_sparse in zip(grads, values, row_sparse_grads)
+        ]
 
     def exclude_from_weight_decay(self, var_list=None, var_names=None):
         """Exclude variables from weight decay.
@@ -831,6 +1137,33 @@ class BaseOptimizer(KerasSaveable):
                 wd = ops.cast(self.weight_decay, variable.dtype)
                 variable.assign(variable - variable * wd * lr)
 
+    def _apply_lazy_weight_decay(self, grads, variables):
+        """Applies weight decay to the touched rows of lazy variables.
+
+        With `lazy_updates`, a variable with a row-sparse gradient only has
+        the rows of the gradient decayed, like the rest of its update.
+
+        Returns:
+            The variables left to `_apply_weight_decay()`.
+        """
+        if self.weight_decay is None or not (
+            getattr(self, "lazy_updates", False)
+            and self._supports_row_sparse_updates()
+        ):
+            return variables
+        dense_variables = []
+        for grad, variable in zip(grads, variables):
+            sparse_gradient = self._get_row_sparse_gradient(grad)
+            if sparse_gradient is None:
+                dense_variables.append(variable)
+            elif self._use_weight_decay(variable):
+                indices = sparse_gradient[0]
+                lr = ops.cast(self.learning_rate, variable.dtype)
+                wd = ops.cast(self.weight_decay, variable.dtype)
+                rows = self._gather_rows(variable, indices)
+                self._assign_sub_rows(variable, indices, rows * wd * lr)
+        return dense_variables
+
     def _check_super_called(self):
         if not hasattr(self, "_lock"):
             raise RuntimeError(
@@ -850,7 +1183,7 @@ class BaseOptimizer(KerasSaveable):
                 momentum = (
                     ops.cast(not_first_step, var.dtype) * self.ema_momentum
                 )
-                average.assign(momentum * average + (1 - momentum) * var)
+                self.assign(average, momentum * average + (1 - momentum) * var)
 
     def _overwrite_model_variables_with_average_value(
         self, trainable_variables
@@ -933,6 +1266,7 @@ class BaseOptimizer(KerasSaveable):
             "ema_overwrite_frequency": self.ema_overwrite_frequency,
             "loss_scale_factor": self.loss_scale_factor,
             "gradient_accumulation_steps": self.gradient_accumulation_steps,
+            "use_flat_buffers": self.use_flat_buffers,
         }
         return config
 
@@ -1041,6 +1375,20 @@ base_optimizer_keyword_args = """name: String. The name to use
             iterations value (optimizer steps // gradient_accumulation_steps).
             Learning rate schedules will look at "real" iterations value
             (optimizer steps).
+        use_flat_buffers: Boolean, defaults to `False`. If `True`, model
+            variables of the same dtype are packed into contiguous flat
+            buckets, and the optimizer variables are created per bucket
+            rather than per model variable. Each training step then runs a
+            handful of vector operations per bucket instead of one set of
+            operations per variable, which speeds up models with many small
+            variables. Variables without a gradient in a step are updated
+            with a zero gradient. With the PyTorch backend, the model
+            variables become views into the buckets, so the buckets are
+            updated in place. With the other backends, a variable cannot
+            share its buffer, so the variables are concatenated into the
+            buckets and split back at every step (within the compiled step).
+            Note that the optimizer variables are flat, so they can only be
+            loaded into an optimizer also using `use_flat_buffers=True`.
 """
 
 
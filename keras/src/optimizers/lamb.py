@@ -129,8 +129,13 @@ class Lamb(optimizer.Optimizer):
         )
 
         update = ops.divide(m_t_hat, v_sqrt)
-        w_norm = ops.sqrt(ops.sum(ops.power(variable, 2)))
-        g_norm = ops.sqrt(ops.sum(ops.power(update, 2)))
+        # With flat buffers, the norms are computed per model variable
+        w_norm = ops.sqrt(
+            self._per_variable_reduce(ops.power(variable, 2), variable)
+        )
+        g_norm = ops.sqrt(
+            self._per_variable_reduce(ops.power(update, 2), variable)
+        )
 
         # ratio = w_norm / g_norm if w_norm > 0 and g_norm > 0 else 1
         ratio = ops.where(
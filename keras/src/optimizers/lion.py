@@ -31,6 +31,14 @@ class Lion(optimizer.Optimizer):
             that takes no arguments and returns the actual value to use. The
             exponential decay rate for the 1st moment estimate. Defaults to
             `0.99`.
+        use_8bit_states: Boolean. If `True`, the momentum is stored as int8
+            values quantized in blocks of `state_block_size` values, each
+            block with its own float32 scale. It is dequantized in
+            `update_step()` and quantized back after the update, which
+            reduces the memory used by the optimizer state by about 4x.
+            Defaults to `False`.
+        state_block_size: Integer. The number of values sharing a scale when
+            `use_8bit_states=True`. Defaults to `256`.
         {{base_optimizer_keyword_args}}
 
     References:
@@ -46,6 +54,8 @@ class Lion(optimizer.Optimizer):
         learning_rate=0.001,
         beta_1=0.9,
         beta_2=0.99,
+        use_8bit_states=False,
+        state_block_size=256,
         weight_decay=None,
         clipnorm=None,
         clipvalue=None,
@@ -74,6 +84,15 @@ class Lion(optimizer.Optimizer):
         )
         self.beta_1 = beta_1
         self.beta_2 = beta_2
+        self.use_8bit_states = use_8bit_states
+        self.state_block_size = state_block_size
+        if use_8bit_states and (
+            not isinstance(state_block_size, int) or state_block_size < 1
+        ):
+            raise ValueError(
+                "Argument `state_block_size` must be a positive integer. "
+                f"Received: state_block_size={state_block_size}"
+            )
         if beta_1 <= 0 or beta_1 > 1:
             raise ValueError(
                 "Argument `beta_1` must be in the [0, 1] range. Otherwise, the "
@@ -92,6 +111,19 @@ class Lion(optimizer.Optimizer):
             return
         super().build(var_list)
         self._momentums = []
+        if self.use_8bit_states:
+            self._momentum_absmaxes = []
+            for var in var_list:
+                momentum, momentum_absmax = (
+                    self.add_quantized_variable_from_reference(
+                        reference_variable=var,
+                        name="momentum",
+                        block_size=self.state_block_size,
+                    )
+                )
+                self._momentums.append(momentum)
+                self._momentum_absmaxes.append(momentum_absmax)
+            return
         for var in var_list:
             self._momentums.append(
                 self.add_variable_from_reference(
@@ -105,7 +137,16 @@ class Lion(optimizer.Optimizer):
         gradient = ops.cast(gradient, variable.dtype)
         beta_1 = ops.cast(self.beta_1, variable.dtype)
         beta_2 = ops.cast(self.beta_2, variable.dtype)
-        m = self._momentums[self._get_variable_index(variable)]
+        index = self._get_variable_index(variable)
+        if self.use_8bit_states:
+            m = self._read_quantized_variable(
+                self._momentums[index],
+                self._momentum_absmaxes[index],
+                variable,
+                exponent=2,
+            )
+        else:
+            m = self._momentums[index]
 
         self.assign_sub(
             variable,
@@ -119,12 +160,18 @@ class Lion(optimizer.Optimizer):
                 ),
             ),
         )
-        self.assign(
-            m,
-            ops.add(
-                ops.multiply(m, beta_2), ops.multiply(gradient, (1.0 - beta_2))
-            ),
+        new_m = ops.add(
+            ops.multiply(m, beta_2), ops.multiply(gradient, (1.0 - beta_2))
         )
+        if self.use_8bit_states:
+            self._assign_quantized_variable(
+                self._momentums[index],
+                self._momentum_absmaxes[index],
+                new_m,
+                exponent=2,
+            )
+        else:
+            self.assign(m, new_m)
 
     def get_config(self):
         config = super().get_config()
@@ -132,6 +179,8 @@ class Lion(optimizer.Optimizer):
             {
                 "beta_1": self.beta_1,
                 "beta_2": self.beta_2,
+                "use_8bit_states": self.use_8bit_states,
+                "state_block_size": self.state_block_size,
             }
         )
         return config
@@ -75,6 +75,32 @@ class LionTest(testing.TestCase):
         clipped_grad = optimizer._clip_gradients(grad)
         self.assertAllClose(clipped_grad[0], [1.0, 1.0])
 
+    def test_8bit_states(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=(20, 7)).astype("float32")
+        grads = [
+            ops.convert_to_tensor(rng.normal(size=(20, 7)).astype("float32"))
+            for _ in range(5)
+        ]
+        results = []
+        for use_8bit_states in (False, True):
+            variable = backend.Variable(values)
+            optimizer = Lion(
+                learning_rate=0.01,
+                use_8bit_states=use_8bit_states,
+                state_block_size=32,
+            )
+            for grad in grads:
+                optimizer.apply_gradients([(grad, variable)])
+            results.append(variable)
+        self.assertAllClose(results[0], results[1], atol=5e-3)
+        self.assertEqual(optimizer._momentums[0].dtype, "int8")
+        self.assertEqual(tuple(optimizer._momentums[0].shape), (5, 32))
+        self.assertEqual(tuple(optimizer._momentum_absmaxes[0].shape), (5,))
+
+        with self.assertRaisesRegex(ValueError, "must be a positive integer"):
+            Lion(use_8bit_states=True, state_block_size=0)
+
     @pytest.mark.requires_trainable_backend
     def test_ema(self):
         # TODO: test correctness
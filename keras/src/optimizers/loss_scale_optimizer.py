@@ -31,6 +31,11 @@ class LossScaleOptimizer(optimizer.Optimizer):
       was updated, and no nonfinite gradients have occurred, the loss scale
       is doubled.
 
+    With the PyTorch backend, a skipped step is still computed, but each
+    variable update keeps the old value with `ops.where()` instead of
+    branching on the check of the gradients. The train step therefore never
+    waits for the device to transfer the check to the host.
+
     Args:
         inner_optimizer: The `keras.optimizers.Optimizer` instance to wrap.
         initial_scale: Float. The initial loss scale. This scale will be updated
@@ -156,6 +161,28 @@ class LossScaleOptimizer(optimizer.Optimizer):
             new_optimizer_variables.append(scope.get_current_value(v))
         return trainable_variables, new_optimizer_variables
 
+    def _update_loss_scale(self, finite):
+        """Updates the loss scale after a step, without branching.
+
+        If a gradient is not finite, the loss scale is halved. Otherwise, it
+        is doubled every `dynamic_growth_steps` steps.
+        """
+        grow = ops.logical_and(
+            finite,
+            ops.equal(self.step_counter, self.dynamic_growth_steps - 1),
+        )
+        scale = self.dynamic_scale.value
+        new_scale = ops.where(
+            grow, scale * 2.0, ops.where(finite, scale, scale / 2.0)
+        )
+        new_step_counter = ops.where(
+            ops.logical_and(finite, ops.logical_not(grow)),
+            self.step_counter + 1,
+            0,
+        )
+        self.dynamic_scale.assign(new_scale)
+        self.step_counter.assign(new_step_counter)
+
     def apply(self, grads, trainable_variables=None):
         # Optionally build optimizer.
         if not self.built:
@@ -165,6 +192,8 @@ class LossScaleOptimizer(optimizer.Optimizer):
 
         if backend.backend() == "tensorflow":
             self._tf_apply(grads, trainable_variables)
+        elif backend.backend() == "torch":
+            self._select_apply(grads, trainable_variables)
         else:
             self._common_apply(grads, trainable_variables)
 
@@ -207,6 +236,37 @@ class LossScaleOptimizer(optimizer.Optimizer):
             self._stateful_handle_non_finite_grads,
         )
 
+    def _select_apply(self, grads, trainable_variables=None):
+        """Applies the gradients, and discards the update if not finite.
+
+        Unlike `ops.cond()`, this never reads the finiteness of the gradients
+        on the host, which would synchronize with the device at every step
+        with the PyTorch backend. Instead, the inner optimizer keeps the old
+        value of each variable it assigns if a gradient is not finite.
+        """
+        finite = self.check_finite(grads)
+        inner_optimizer = self.inner_optimizer
+        # Unscale gradients.
+        scale = self.dynamic_scale
+        unscaled_grads = [
+            g if g is None else ops.divide(g, scale) for g in grads
+        ]
+        if inner_optimizer.gradient_accumulation_steps:
+            # Keep the non-finite values out of the gradient accumulators.
+            unscaled_grads = [
+                g if g is None else ops.where(finite, g, 0)
+                for g in unscaled_grads
+            ]
+        iterations = ops.copy(inner_optimizer._iterations)
+        with inner_optimizer._conditional_updates(finite):
+            inner_optimizer.apply(
+                unscaled_grads, trainable_variables=trainable_variables
+            )
+        inner_optimizer._iterations.assign(
+            ops.where(finite, inner_optimizer._iterations, iterations)
+        )
+        self._update_loss_scale(finite)
+
     def _tf_apply(self, grads, trainable_variables=None):
         """Tensorflow specific logic for apply, which handles distribution."""
         from keras.src.utils.module_utils import tensorflow as tf
@@ -250,9 +310,38 @@ class LossScaleOptimizer(optimizer.Optimizer):
             )
 
     def check_finite(self, grads):
-        tensor_grads = [g for g in grads if g is not None]
-        finite_grads = [ops.all(ops.isfinite(g)) for g in tensor_grads]
-        return ops.all(ops.convert_to_tensor(finite_grads))
+        tensor_grads = []
+        for g in grads:
+            if g is None:
+                continue
+            # Only the values of a row-sparse gradient need to be checked.
+            row_sparse_gradient = self._get_row_sparse_gradient(g)
+            if row_sparse_gradient is not None:
+                g = row_sparse_gradient[1]
+            # Empty gradients have no maximum, and nothing to check.
+            if 0 in g.shape:
+                continue
+            tensor_grads.append(g)
+        if not tensor_grads:
+            return ops.convert_to_tensor(True)
+        if backend.backend() == "torch":
+            return self._torch_check_finite(tensor_grads)
+        # The largest absolute value of a gradient is not finite if the
+        # gradient has a non-finite value, so only the maxima are checked.
+        max_values = ops.stack(
+            [ops.cast(ops.max(ops.abs(g)), "float32") for g in tensor_grads]
+        )
+        return ops.all(ops.isfinite(max_values))
+
+    def _torch_check_finite(self, grads):
+        import torch
+
+        # A single fused kernel computes the largest absolute value of each
+        # gradient, which is not finite if the gradient has a non-finite
+        # value.
+        max_values = torch._foreach_norm(grads, float("inf"))
+        max_values = torch.stack([v.float() for v in max_values])
+        return torch.all(torch.isfinite(max_values))
 
     @property
     def learning_rate(self):
@@ -1,9 +1,11 @@
 import numpy as np
+import pytest
 from absl.testing import parameterized
 
 from keras.src import backend
 from keras.src import ops
 from keras.src import testing
+from keras.src.optimizers.adamw import AdamW
 from keras.src.optimizers.loss_scale_optimizer import LossScaleOptimizer
 from keras.src.optimizers.sgd import SGD
 
@@ -106,3 +108,69 @@ class LossScaleOptimizerTest(testing.TestCase):
             else:
                 optimizer.apply(grads, vars)
         self.assertAllClose(optimizer.scale_loss(1.0), 32.0)
+
+    @parameterized.named_parameters(("stateless", True), ("stateful", False))
+    def test_infinite_step_keeps_optimizer_variables(self, stateless):
+        self._skip_test_for_stateless(stateless)
+
+        inner_optimizer = SGD(learning_rate=0.5, momentum=0.9)
+        optimizer = LossScaleOptimizer(inner_optimizer, initial_scale=2.0)
+        vars = [
+            backend.Variable([1.0, 2.0, 3.0, 4.0]),
+            backend.Variable([[1.0], [2.0]]),
+        ]
+        optimizer.build(vars)
+
+        def apply(grads):
+            if stateless:
+                new_vars, new_opt_vars = optimizer.stateless_apply(
+                    optimizer.variables, grads, [v.value for v in vars]
+                )
+                for ref_v, v in zip(
+                    vars + optimizer.variables, new_vars + new_opt_vars
+                ):
+                    ref_v.assign(v)
+            else:
+                optimizer.apply(grads, vars)
+            return [
+                ops.convert_to_numpy(v)
+                for v in vars + inner_optimizer.variables
+            ]
+
+        values = apply([ops.ones((4,)), ops.ones((2, 1))])
+        # A single non-finite value discards the whole step.
+        new_values = apply([ops.ones((4,)), ops.array([[np.nan], [1.0]])])
+        for new_value, value in zip(new_values, values):
+            self.assertAllClose(new_value, value)
+        # The loss scale is halved and the step counter is reset.
+        self.assertAllClose(optimizer.scale_loss(1.0), 1.0)
+        self.assertAllClose(optimizer.step_counter, 0)
+
+    @pytest.mark.skipif(
+        backend.backend() == "jax",
+        reason="The stateful JAX `apply()` cannot update the EMA in a cond.",
+    )
+    def test_infinite_step_with_weight_decay_and_ema(self):
+        inner_optimizer = AdamW(weight_decay=0.1, use_ema=True)
+        optimizer = LossScaleOptimizer(inner_optimizer, initial_scale=2.0)
+        vars = [backend.Variable([1.0, 2.0, 3.0, 4.0])]
+        optimizer.build(vars)
+        optimizer.apply([ops.ones((4,))], vars)
+        values = [
+            ops.convert_to_numpy(v) for v in vars + inner_optimizer.variables
+        ]
+        optimizer.apply([ops.array([1.0, np.inf, 1.0, 1.0])], vars)
+        new_values = [
+            ops.convert_to_numpy(v) for v in vars + inner_optimizer.variables
+        ]
+        for new_value, value in zip(new_values, values):
+            self.assertAllClose(new_value, value)
+        self.assertAllClose(inner_optimizer.iterations, 1)
+
+    def test_check_finite(self):
+        optimizer = LossScaleOptimizer(SGD())
+        grads = [ops.ones((2, 3)), None, ops.zeros((0,)), ops.ones((4,))]
+        self.assertTrue(optimizer.check_finite(grads))
+        grads[3] = ops.array([1.0, np.inf, 1.0, 1.0])
+        self.assertFalse(optimizer.check_finite(grads))
+        self.assertTrue(optimizer.check_finite([None]))
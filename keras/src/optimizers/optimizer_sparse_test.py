@@ -55,6 +55,13 @@ TEST_CASES = [
         "optimizer_class": optimizers.Adam,
         "init_kwargs": {"amsgrad": True},
     },
+    {
+        "testcase_name": "adam_lazy",
+        "optimizer_class": optimizers.Adam,
+        "init_kwargs": {"lazy_updates": True},
+        "expect_model_sparse_variable_updates": True,
+        "expect_optimizer_sparse_variable_updates": True,
+    },
     {
         "testcase_name": "adamax",
         "optimizer_class": optimizers.Adamax,
@@ -112,6 +119,13 @@ TEST_CASES = [
         "optimizer_class": optimizers.SGD,
         "init_kwargs": {"momentum": 0.05},
     },
+    {
+        "testcase_name": "sgd_momentum_lazy",
+        "optimizer_class": optimizers.SGD,
+        "init_kwargs": {"momentum": 0.05, "lazy_updates": True},
+        "expect_model_sparse_variable_updates": True,
+        "expect_optimizer_sparse_variable_updates": True,
+    },
     {
         "testcase_name": "sgd_momentum_nesterov",
         "optimizer_class": optimizers.SGD,
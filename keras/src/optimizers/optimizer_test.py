@@ -11,6 +11,7 @@ from keras.src import layers
 from keras.src import models
 from keras.src import optimizers
 from keras.src import testing
+from keras.src.optimizers.lamb import Lamb
 
 
 class OptimizerTest(testing.TestCase):
@@ -402,6 +403,93 @@ class OptimizerTest(testing.TestCase):
 
         self.assertEqual(optimizer.get_config(), reloaded.get_config())
 
+    @parameterized.parameters(
+        [
+            (optimizers.Adam,),
+            (optimizers.SGD,),
+            (optimizers.AdamW,),
+            (optimizers.Adagrad,),
+            (optimizers.RMSprop,),
+            (optimizers.Adadelta,),
+            (optimizers.Adamax,),
+            (optimizers.Lion,),
+            (optimizers.Nadam,),
+            (optimizers.Ftrl,),
+            (Lamb,),
+            (optimizers.Adafactor,),
+        ]
+    )
+    def test_flat_buffers(self, optimizer_class):
+        optimizer1 = optimizer_class(weight_decay=0.05)
+        optimizer2 = optimizer_class(weight_decay=0.05, use_flat_buffers=True)
+        self.assertTrue(optimizer2.get_config()["use_flat_buffers"])
+        values = [
+            np.random.random((3, 2)),
+            np.random.random((4,)),
+            np.random.random((2,)),
+        ]
+        variables1 = [backend.Variable(v) for v in values]
+        variables2 = [backend.Variable(v) for v in values]
+
+        for _ in range(3):
+            grads = [
+                backend.convert_to_tensor(np.random.random(v.shape))
+                for v in values
+            ]
+            optimizer1.apply_gradients(zip(grads, variables1))
+            optimizer2.apply_gradients(zip(grads, variables2))
+
+        for v1, v2 in zip(variables1, variables2):
+            self.assertAllClose(v1, v2)
+        self.assertLen(optimizer2._flat_buckets, 1)
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Only the PyTorch variables are views into the buckets.",
+    )
+    def test_flat_buffers_alias_variables(self):
+        optimizer = optimizers.SGD(use_flat_buffers=True)
+        variables = [
+            backend.Variable(np.ones((3, 2))),
+            backend.Variable(np.ones((4,))),
+        ]
+        grads = [backend.convert_to_tensor(np.ones(v.shape)) for v in variables]
+        optimizer.apply_gradients(zip(grads, variables))
+        self.assertAllClose(variables[0], np.full((3, 2), 0.99))
+        self.assertAllClose(variables[1], np.full((4,), 0.99))
+
+        # The variables share the storage of the bucket.
+        (bucket,) = optimizer._flat_buckets
+        bucket.assign(np.arange(10, dtype="float32"))
+        self.assertAllClose(variables[0], np.arange(6).reshape((3, 2)))
+        self.assertAllClose(variables[1], np.arange(6, 10))
+        variables[1].assign(np.zeros((4,)))
+        self.assertAllClose(bucket[6:], np.zeros((4,)))
+
+    @pytest.mark.requires_trainable_backend
+    def test_flat_buffers_with_model_fit(self):
+        x = np.random.random((8, 3))
+        y = np.random.random((8, 2))
+        model = models.Sequential(
+            [layers.Input((3,)), layers.Dense(4), layers.Dense(2)]
+        )
+        weights = model.get_weights()
+
+        def fit(use_flat_buffers):
+            model.set_weights(weights)
+            optimizer = optimizers.Adam(
+                use_ema=True, use_flat_buffers=use_flat_buffers
+            )
+            model.compile(optimizer=optimizer, loss="mse")
+            model.fit(x, y, batch_size=4, epochs=2, shuffle=False, verbose=0)
+            return optimizer, model.get_weights()
+
+        _, reference_weights = fit(use_flat_buffers=False)
+        optimizer, flat_weights = fit(use_flat_buffers=True)
+        self.assertLen(optimizer._flat_buckets, 1)
+        for weight, reference_weight in zip(flat_weights, reference_weights):
+            self.assertAllClose(weight, reference_weight)
+
     @pytest.mark.skipif(
         backend.backend() != "tensorflow",
         reason="The tf.Variable test can only run with TensorFlow backend.",
@@ -37,6 +37,15 @@ class SGD(optimizer.Optimizer):
             gradient descent. Defaults to `0.0`.
         nesterov: boolean. Whether to apply Nesterov momentum.
             Defaults to `False`.
+        lazy_updates: Boolean. Only used if `momentum` is larger than 0. If
+            `True`, row-sparse gradients (such as the gradients of an
+            `Embedding` layer created with `sparse_gradient=True`) only
+            update the rows they touch, in the model variable as well as in
+            the velocity. This is much faster for large embedding tables,
+            but it differs from the regular algorithm, in which all the rows
+            keep moving with their velocity. Without momentum, the updates
+            of row-sparse gradients are always restricted to the touched
+            rows, as this does not change the results. Defaults to `False`.
         {{base_optimizer_keyword_args}}
     """
 
@@ -45,6 +54,7 @@ class SGD(optimizer.Optimizer):
         learning_rate=0.01,
         momentum=0.0,
         nesterov=False,
+        lazy_updates=False,
         weight_decay=None,
         clipnorm=None,
         clipvalue=None,
@@ -75,6 +85,7 @@ class SGD(optimizer.Optimizer):
             raise ValueError("`momentum` must be a float between [0, 1].")
         self.momentum = momentum
         self.nesterov = nesterov
+        self.lazy_updates = lazy_updates
 
     def build(self, variables):
         """Initialize optimizer variables.
@@ -101,6 +112,13 @@ class SGD(optimizer.Optimizer):
         """Update step given gradient and the associated model variable."""
         learning_rate = ops.cast(learning_rate, variable.dtype)
         gradient = ops.cast(gradient, variable.dtype)
+        if self._supports_row_sparse_updates():
+            sparse_gradient = self._get_row_sparse_gradient(gradient)
+            if sparse_gradient is not None:
+                self._lazy_update_step(
+                    *sparse_gradient, variable, learning_rate
+                )
+                return
         m = None
         if self.momentum != 0:
             m = self.momentums[self._get_variable_index(variable)]
@@ -127,12 +145,42 @@ class SGD(optimizer.Optimizer):
         else:
             self.assign_sub(variable, ops.multiply(gradient, learning_rate))
 
+    def _supports_row_sparse_updates(self):
+        return self.momentum == 0 or self.lazy_updates
+
+    def _lazy_update_step(self, indices, gradient, variable, learning_rate):
+        if self.momentum == 0:
+            self._assign_sub_rows(
+                variable, indices, ops.multiply(gradient, learning_rate)
+            )
+            return
+        variable_rows = self._gather_rows(variable, indices)
+        m = self.momentums[self._get_variable_index(variable)]
+        momentum = ops.cast(self.momentum, variable.dtype)
+        m_rows = ops.subtract(
+            ops.multiply(self._gather_rows(m, indices), momentum),
+            ops.multiply(gradient, learning_rate),
+        )
+        self._assign_rows(m, indices, m_rows)
+        if self.nesterov:
+            variable_rows = ops.add(
+                variable_rows,
+                ops.subtract(
+                    ops.multiply(m_rows, momentum),
+                    ops.multiply(gradient, learning_rate),
+                ),
+            )
+        else:
+            variable_rows = ops.add(variable_rows, m_rows)
+        self._assign_rows(variable, indices, variable_rows)
+
     def get_config(self):
         config = super().get_config()
         config.update(
             {
                 "momentum": self.momentum,
                 "nesterov": self.nesterov,
+                "lazy_updates": self.lazy_updates,
             }
         )
         return config
@@ -4,9 +4,18 @@ from keras.src.api_export import keras_export
 from keras.src.quantizers.quantizers import AbsMaxQuantizer
 from keras.src.quantizers.quantizers import Quantizer
 from keras.src.quantizers.quantizers import abs_max_quantize
+from keras.src.quantizers.quantizers import blockwise_num_blocks
 from keras.src.quantizers.quantizers import compute_float8_amax_history
 from keras.src.quantizers.quantizers import compute_float8_scale
+from keras.src.quantizers.quantizers import dequantize_blockwise
+from keras.src.quantizers.quantizers import dequantize_int4
+from keras.src.quantizers.quantizers import int4_num_groups
+from keras.src.quantizers.quantizers import pack_int4
 from keras.src.quantizers.quantizers import quantize_and_dequantize
+from keras.src.quantizers.quantizers import quantize_blockwise
+from keras.src.quantizers.quantizers import quantize_int4
+from keras.src.quantizers.quantizers import quantize_with_scale
+from keras.src.quantizers.quantizers import unpack_int4
 from keras.src.saving import serialization_lib
 from keras.src.utils.naming import to_snake_case
 
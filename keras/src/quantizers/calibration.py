@@ -0,0 +1,141 @@
+import numpy as np
+
+from keras.src import backend
+from keras.src import tree
+
+CALIBRATION_METHODS = ("minmax", "percentile", "mse")
+
+
+class ActivationCalibrator:
+    """Collects statistics about activations to derive a static range.
+
+    Args:
+        method: How to derive the range from the observed activations. One
+            of `"minmax"` (maximum absolute value), `"percentile"` (the
+            `percentile`-th percentile of absolute values) or `"mse"` (the
+            range minimizing the mean squared error of the int8
+            quantization).
+        num_bins: Number of bins of the histogram of absolute values used by
+            the `"percentile"` and `"mse"` methods.
+        percentile: The percentile used by the `"percentile"` method.
+    """
+
+    def __init__(self, method="minmax", num_bins=2048, percentile=99.99):
+        if method not in CALIBRATION_METHODS:
+            raise ValueError(
+                "Invalid calibration method. "
+                f"Expected one of {CALIBRATION_METHODS}. "
+                f"Received: method={method}"
+            )
+        self.method = method
+        self.num_bins = num_bins
+        self.percentile = percentile
+        self._amax = None
+        self._histogram = None
+
+    def update(self, x):
+        x = np.abs(np.asarray(x, dtype="float32")).ravel()
+        if x.size == 0:
+            return
+        batch_amax = float(np.max(x))
+        if self.method == "minmax":
+            self._amax = max(self._amax or 0.0, batch_amax)
+            return
+
+        if self._histogram is None:
+            self._amax = batch_amax
+            self._histogram = np.zeros((self.num_bins,), dtype="float64")
+        elif batch_amax > self._amax:
+            # Widen the range, redistributing the previous counts from the
+            # centers of their bins.
+            centers = self._bin_centers()
+            self._amax = batch_amax
+            self._histogram, _ = np.histogram(
+                centers,
+                bins=self.num_bins,
+                range=(0.0, self._amax),
+                weights=self._histogram,
+            )
+        histogram, _ = np.histogram(
+            x, bins=self.num_bins, range=(0.0, max(self._amax, 1e-12))
+        )
+        self._histogram += histogram
+
+    def result(self):
+        """Returns the calibrated absolute maximum, `None` if no data."""
+        if self._amax is None or self.method == "minmax":
+            return self._amax
+        total = np.sum(self._histogram)
+        if total == 0 or self._amax == 0:
+            return self._amax
+        edges = np.linspace(0.0, self._amax, self.num_bins + 1)
+        if self.method == "percentile":
+            cdf = np.cumsum(self._histogram) / total
+            index = np.searchsorted(cdf, self.percentile / 100.0)
+            return float(edges[min(index + 1, self.num_bins)])
+
+        # "mse": evaluate candidate ranges on the bin centers.
+        centers = self._bin_centers()
+        best_amax, best_error = self._amax, None
+        for index in np.linspace(
+            self.num_bins // 128, self.num_bins, 128, dtype="int64"
+        ):
+            amax = edges[index]
+            scale = 127.0 / amax
+            dequantized = np.clip(np.round(centers * scale), -127, 127) / scale
+            error = np.sum(self._histogram * np.square(dequantized - centers))
+            if best_error is None or error < best_error:
+                best_amax, best_error = float(amax), error
+        return best_amax
+
+    def _bin_centers(self):
+        edges = np.linspace(0.0, self._amax, self.num_bins + 1)
+        return (edges[:-1] + edges[1:]) / 2.0
+
+
+def calibrate_inputs_amax(model, layers, data, steps=None, method="minmax"):
+    """Runs `model` on `data` and collects the input range of `layers`.
+
+    Args:
+        model: The model to run.
+        layers: The layers whose inputs are observed.
+        data: Input data, in any format accepted by `Model.predict()`.
+        steps: Number of batches to run. Defaults to all of `data`.
+        method: The calibration method, see `ActivationCalibrator`.
+
+    Returns:
+        A list with the calibrated absolute maximum of the inputs of each
+        layer, `None` for layers that were never called.
+    """
+    from keras.src.trainers.data_adapters import data_adapter_utils
+    from keras.src.trainers.epoch_iterator import EpochIterator
+
+    if method not in CALIBRATION_METHODS:
+        raise ValueError(
+            "Invalid calibration method. "
+            f"Expected one of {CALIBRATION_METHODS}. Received: method={method}"
+        )
+    calibrators = [ActivationCalibrator(method) for _ in layers]
+
+    def make_calibrating_call(call, calibrator):
+        def calibrating_call(inputs, *args, **kwargs):
+            calibrator.update(backend.convert_to_numpy(inputs))
+            return call(inputs, *args, **kwargs)
+
+        return calibrating_call
+
+    for layer, calibrator in zip(layers, calibrators):
+        layer.call = make_calibrating_call(layer.call, calibrator)
+    try:
+        epoch_iterator = EpochIterator(
+            x=data, steps_per_epoch=steps, shuffle=False
+        )
+        for _, batch in epoch_iterator.enumerate_epoch():
+            x, _, _ = data_adapter_utils.unpack_x_y_sample_weight(batch[0])
+            x = tree.map_structure(backend.convert_to_tensor, x)
+            model(x, training=False)
+    finally:
+        for layer in layers:
+            # Restore the original (class) `call`.
+            del layer.call
+    return [calibrator.result() for calibrator in calibrators]
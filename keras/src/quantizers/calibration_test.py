@@ -0,0 +1,56 @@
+import numpy as np
+
+from keras.src import layers
+from keras.src import models
+from keras.src import ops
+from keras.src import testing
+from keras.src.quantizers.calibration import ActivationCalibrator
+from keras.src.quantizers.calibration import calibrate_inputs_amax
+
+
+class ActivationCalibratorTest(testing.TestCase):
+    def test_minmax(self):
+        calibrator = ActivationCalibrator("minmax")
+        self.assertIsNone(calibrator.result())
+        calibrator.update(np.array([0.5, -2.0]))
+        calibrator.update(np.array([1.5]))
+        self.assertAllClose(calibrator.result(), 2.0)
+
+    def test_percentile_clips_outliers(self):
+        calibrator = ActivationCalibrator("percentile", percentile=99.0)
+        values = np.random.uniform(-1.0, 1.0, size=(10000,))
+        calibrator.update(values)
+        # An outlier widens the histogram range but not the percentile
+        calibrator.update(np.array([100.0]))
+        self.assertLess(calibrator.result(), 1.2)
+        self.assertGreater(calibrator.result(), 0.9)
+
+    def test_mse(self):
+        calibrator = ActivationCalibrator("mse")
+        values = np.concatenate(
+            [np.random.normal(size=(10000,)), np.array([50.0])]
+        )
+        calibrator.update(values)
+        self.assertLess(calibrator.result(), 50.0)
+        self.assertGreater(calibrator.result(), 2.0)
+
+    def test_invalid_method(self):
+        with self.assertRaisesRegex(ValueError, "Invalid calibration method"):
+            ActivationCalibrator("kl")
+
+    def test_calibrate_inputs_amax(self):
+        dense_1 = layers.Dense(4)
+        dense_2 = layers.Dense(2)
+        unused_dense = layers.Dense(2)
+        model = models.Sequential([layers.Input((3,)), dense_1, dense_2])
+        x = np.random.uniform(-1.0, 1.0, size=(16, 3)).astype("float32")
+        amaxes = calibrate_inputs_amax(
+            model, [dense_1, dense_2, unused_dense], x, method="minmax"
+        )
+        self.assertAllClose(amaxes[0], np.max(np.abs(x)))
+        self.assertAllClose(
+            amaxes[1], np.max(np.abs(ops.convert_to_numpy(dense_1(x))))
+        )
+        self.assertIsNone(amaxes[2])
+        # The original `call` methods are restored
+        self.assertNotIn("call", dense_1.__dict__)
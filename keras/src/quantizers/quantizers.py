@@ -127,6 +127,19 @@ class AbsMaxQuantizer(Quantizer):
         }
 
 
+def quantize_with_scale(inputs, scale, value_range=(-127, 127), dtype="int8"):
+    """Quantizes `inputs` with a precomputed (e.g. calibrated) `scale`.
+
+    Unlike `abs_max_quantize`, no reduction over `inputs` is computed.
+    """
+    inputs = ops.convert_to_tensor(inputs)
+    scale = ops.cast(scale, backend.standardize_dtype(inputs.dtype))
+    outputs = ops.multiply(inputs, scale)
+    outputs = ops.clip(ops.round(outputs), value_range[0], value_range[1])
+    outputs = ops.cast(outputs, dtype)
+    return outputs, scale
+
+
 """Float8-related methods"""
 
 
@@ -167,3 +180,191 @@ def quantize_and_dequantize(inputs, scale, quantized_dtype, compute_dtype):
     # Dequantize
     x = ops.multiply(ops.cast(x, compute_dtype), ops.cast(scale, compute_dtype))
     return x
+
+
+"""Int4-related methods"""
+
+
+@keras_export("keras.quantizers.pack_int4")
+def pack_int4(inputs, axis=0):
+    """Packs int4 values into int8 bytes, two values per byte.
+
+    Pairs of consecutive values along `axis` are packed into one byte, the
+    first value in the low nibble and the second one in the high nibble. If
+    the size of `axis` is odd, the last byte is padded with a zero.
+
+    Args:
+        inputs: An int8 tensor with values in `[-8, 7]`.
+        axis: The axis along which to pack the values. Defaults to `0`.
+
+    Returns:
+        An int8 tensor where the size of `axis` is halved (rounded up).
+    """
+    inputs = ops.convert_to_tensor(inputs)
+    if backend.standardize_dtype(inputs.dtype) != "int8":
+        raise TypeError(
+            "Expected an int8 tensor. "
+            f"Received: inputs.dtype={backend.standardize_dtype(inputs.dtype)}"
+        )
+    rank = len(inputs.shape)
+    axis = axis % rank
+    if inputs.shape[axis] % 2 == 1:
+        paddings = [[0, 0]] * rank
+        paddings[axis] = [0, 1]
+        inputs = ops.pad(inputs, paddings)
+    shape = list(inputs.shape)
+    inputs = ops.reshape(
+        inputs, shape[:axis] + [shape[axis] // 2, 2] + shape[axis + 1 :]
+    )
+    inputs = ops.cast(inputs, "int32")
+    low = ops.bitwise_and(ops.take(inputs, 0, axis=axis + 1), 15)
+    high = ops.left_shift(ops.take(inputs, 1, axis=axis + 1), 4)
+    return ops.cast(ops.bitwise_or(low, high), "int8")
+
+
+@keras_export("keras.quantizers.unpack_int4")
+def unpack_int4(inputs, orig_len, axis=0):
+    """Unpacks int8 bytes created by `pack_int4` into int4 values.
+
+    Args:
+        inputs: An int8 tensor of packed values.
+        orig_len: The size of `axis` before packing.
+        axis: The axis along which the values were packed. Defaults to `0`.
+
+    Returns:
+        An int8 tensor with values in `[-8, 7]` where the size of `axis` is
+        `orig_len`.
+    """
+    inputs = ops.convert_to_tensor(inputs)
+    if backend.standardize_dtype(inputs.dtype) != "int8":
+        raise TypeError(
+            "Expected an int8 tensor. "
+            f"Received: inputs.dtype={backend.standardize_dtype(inputs.dtype)}"
+        )
+    rank = len(inputs.shape)
+    axis = axis % rank
+    shape = list(ops.shape(inputs))
+    inputs = ops.cast(inputs, "int32")
+    # Arithmetic right shifts restore the sign of both nibbles.
+    low = ops.right_shift(ops.left_shift(inputs, 28), 28)
+    high = ops.right_shift(inputs, 4)
+    outputs = ops.stack([low, high], axis=axis + 1)
+    outputs = ops.reshape(outputs, shape[:axis] + [-1] + shape[axis + 1 :])
+    if orig_len % 2 == 1:
+        outputs = outputs[(slice(None),) * axis + (slice(0, orig_len),)]
+    return ops.cast(outputs, "int8")
+
+
+def int4_num_groups(length, group_size=None):
+    """Returns the number of int4 scales along an axis of size `length`."""
+    if group_size is None:
+        return 1
+    if length % group_size != 0:
+        raise ValueError(
+            "The size of the quantized axis must be divisible by "
+            f"`group_size`. Received: size={length}, group_size={group_size}"
+        )
+    return length // group_size
+
+
+def quantize_int4(inputs, axis, group_size=None):
+    """Quantizes `inputs` to packed int4 values with abs-max scales.
+
+    The values are quantized symmetrically to `[-7, 7]`, with one scale per
+    group of `group_size` consecutive values along `axis` (or a single group
+    if `group_size` is `None`), and then packed along `axis`.
+
+    Returns:
+        A tuple `(packed_values, scale)`. `scale` has the shape of `inputs`,
+        with the size of `axis` replaced by the number of groups. Dequantize
+        with `dequantize_int4`.
+    """
+    # Save memory on the device using numpy
+    original_dtype = backend.standardize_dtype(inputs.dtype)
+    inputs = ops.convert_to_numpy(inputs)
+    axis = axis % inputs.ndim
+    shape = inputs.shape
+    num_groups = int4_num_groups(shape[axis], group_size)
+    inputs = np.reshape(
+        inputs, shape[:axis] + (num_groups, -1) + shape[axis + 1 :]
+    )
+    scale = np.divide(
+        7, np.add(np.max(np.abs(inputs), axis=axis + 1), backend.epsilon())
+    )
+    outputs = np.multiply(inputs, np.expand_dims(scale, axis + 1))
+    outputs = np.clip(np.round(outputs), -8, 7).astype("int8")
+    outputs = np.reshape(outputs, shape)
+    return pack_int4(outputs, axis=axis), ops.convert_to_tensor(
+        scale, dtype=original_dtype
+    )
+
+
+def dequantize_int4(inputs, scale, orig_len, axis, dtype="float32"):
+    """Unpacks and dequantizes the outputs of `quantize_int4`."""
+    outputs = ops.cast(unpack_int4(inputs, orig_len, axis=axis), dtype)
+    rank = len(outputs.shape)
+    axis = axis % rank
+    num_groups = scale.shape[axis]
+    scale = ops.cast(scale, dtype)
+    if num_groups == 1:
+        return ops.divide(outputs, scale)
+    shape = list(ops.shape(outputs))
+    outputs = ops.reshape(
+        outputs, shape[:axis] + [num_groups, -1] + shape[axis + 1 :]
+    )
+    outputs = ops.divide(outputs, ops.expand_dims(scale, axis + 1))
+    return ops.reshape(outputs, shape)
+
+
+"""Blockwise-related methods"""
+
+
+def blockwise_num_blocks(size, block_size):
+    """Returns the number of blocks used to quantize `size` values."""
+    return max(-(-size // block_size), 1)
+
+
+def quantize_blockwise(inputs, block_size, exponent=1):
+    """Quantizes `inputs` to int8 with one abs-max scale per block.
+
+    `inputs` is flattened, zero-padded to a multiple of `block_size` and
+    split into blocks of `block_size` consecutive values, each normalized by
+    its absolute maximum. With `exponent > 1`, a normalized value `x` is
+    stored as `sign(x) * |x| ** (1 / exponent)`, which spends more of the
+    int8 codes on values close to zero. This is useful for tensors with a
+    large dynamic range, such as optimizer moments.
+
+    Returns:
+        A tuple `(values, absmax)` of an int8 tensor of shape
+        `(num_blocks, block_size)` and a float32 tensor of shape
+        `(num_blocks,)`. Dequantize with `dequantize_blockwise`.
+    """
+    inputs = ops.reshape(ops.cast(inputs, "float32"), (-1,))
+    size = inputs.shape[0]
+    num_blocks = blockwise_num_blocks(size, block_size)
+    padding = num_blocks * block_size - size
+    if padding:
+        inputs = ops.pad(inputs, [[0, padding]])
+    inputs = ops.reshape(inputs, (num_blocks, block_size))
+    absmax = ops.max(ops.abs(inputs), axis=1)
+    safe_absmax = ops.where(ops.equal(absmax, 0.0), 1.0, absmax)
+    outputs = ops.divide(inputs, ops.expand_dims(safe_absmax, 1))
+    if exponent != 1:
+        outputs = ops.multiply(
+            ops.sign(outputs), ops.power(ops.abs(outputs), 1.0 / exponent)
+        )
+    outputs = ops.clip(ops.round(ops.multiply(outputs, 127.0)), -127, 127)
+    return ops.cast(outputs, "int8"), absmax
+
+
+def dequantize_blockwise(inputs, absmax, shape, exponent=1, dtype="float32"):
+    """Dequantizes the outputs of `quantize_blockwise` to `shape`."""
+    outputs = ops.divide(ops.cast(inputs, "float32"), 127.0)
+    if exponent != 1:
+        outputs = ops.multiply(
+            ops.sign(outputs), ops.power(ops.abs(outputs), exponent)
+        )
+    outputs = ops.multiply(outputs, ops.expand_dims(absmax, 1))
+    size = int(np.prod(shape))
+    outputs = ops.reshape(outputs, (-1,))[:size]
+    return ops.cast(ops.reshape(outputs, shape), dtype)
@@ -1,3 +1,6 @@
+import numpy as np
+from absl.testing import parameterized
+
 from keras.src import ops
 from keras.src import quantizers
 from keras.src import random
@@ -100,3 +103,79 @@ class QuantizersTest(testing.TestCase):
         )
         # A loose assertion due to an expected quantization error
         self.assertAllClose(qdq_values, values, atol=5e-1)
+
+    @parameterized.named_parameters(
+        ("axis_0", 0, (7, 4)),
+        ("axis_1", 1, (3, 6)),
+        ("axis_-1", -1, (2, 3, 5)),
+    )
+    def test_pack_unpack_int4(self, axis, shape):
+        values = np.random.randint(-8, 8, size=shape).astype("int8")
+        packed = quantizers.pack_int4(values, axis=axis)
+        self.assertDType(packed, "int8")
+        expected_shape = list(shape)
+        expected_shape[axis] = (shape[axis] + 1) // 2
+        self.assertEqual(tuple(packed.shape), tuple(expected_shape))
+
+        # NumPy reference: first value in the low nibble
+        ref = np.moveaxis(values, axis, 0).astype("int32")
+        if ref.shape[0] % 2 == 1:
+            ref = np.concatenate([ref, np.zeros_like(ref[:1])])
+        ref = np.bitwise_or(ref[0::2] & 15, np.left_shift(ref[1::2], 4))
+        ref = np.moveaxis(ref.astype("int8"), 0, axis)
+        self.assertAllClose(packed, ref)
+
+        unpacked = quantizers.unpack_int4(packed, shape[axis], axis=axis)
+        self.assertDType(unpacked, "int8")
+        self.assertAllClose(unpacked, values)
+
+        with self.assertRaisesRegex(TypeError, "Expected an int8 tensor"):
+            quantizers.pack_int4(values.astype("int32"), axis=axis)
+
+    def test_quantize_int4(self):
+        values = random.uniform([16, 6], minval=-1, maxval=1, dtype="float32")
+
+        # Per-channel
+        packed, scale = quantizers.quantize_int4(values, axis=0)
+        self.assertEqual(tuple(packed.shape), (8, 6))
+        self.assertEqual(tuple(scale.shape), (1, 6))
+        dequantized = quantizers.dequantize_int4(packed, scale, 16, axis=0)
+        # The rounding error is at most half a quantization step
+        self.assertLess(ops.max(ops.abs(values - dequantized)), 0.5 / 7 + 1e-6)
+
+        # Group-wise
+        packed, scale = quantizers.quantize_int4(values, axis=0, group_size=4)
+        self.assertEqual(tuple(packed.shape), (8, 6))
+        self.assertEqual(tuple(scale.shape), (4, 6))
+        dequantized = quantizers.dequantize_int4(packed, scale, 16, axis=0)
+        self.assertLess(ops.max(ops.abs(values - dequantized)), 0.5 / 7 + 1e-6)
+
+        with self.assertRaisesRegex(ValueError, "must be divisible"):
+            quantizers.quantize_int4(values, axis=0, group_size=5)
+
+    @parameterized.parameters(1, 2, 4)
+    def test_quantize_blockwise(self, exponent):
+        values = random.uniform([10, 7], minval=-1, maxval=1, dtype="float32")
+        quantized, absmax = quantizers.quantize_blockwise(
+            values, block_size=16, exponent=exponent
+        )
+        self.assertEqual(tuple(quantized.shape), (5, 16))
+        self.assertEqual(tuple(absmax.shape), (5,))
+        self.assertEqual(ops.dtype(quantized), "int8")
+        dequantized = quantizers.dequantize_blockwise(
+            quantized, absmax, (10, 7), exponent=exponent
+        )
+        self.assertEqual(tuple(dequantized.shape), (10, 7))
+        # The companding stretches the quantization steps by up to `exponent`
+        self.assertLess(
+            ops.max(ops.abs(values - dequantized)), exponent * 0.5 / 127 + 1e-6
+        )
+
+        # All-zeros blocks are preserved
+        quantized, absmax = quantizers.quantize_blockwise(
+            ops.zeros((20,)), block_size=16, exponent=exponent
+        )
+        self.assertAllClose(
+            quantizers.dequantize_blockwise(quantized, absmax, (20,)),
+            np.zeros((20,)),
+        )
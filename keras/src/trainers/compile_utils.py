@@ -5,6 +5,8 @@ from keras.src import metrics as metrics_module
 from keras.src import ops
 from keras.src import tree
 from keras.src.backend.common.keras_tensor import KerasTensor
+from keras.src.metrics import metrics_utils
+from keras.src.metrics import reduction_metrics
 from keras.src.utils.naming import get_object_name
 from keras.src.utils.tracking import Tracker
 
@@ -14,10 +16,27 @@ class MetricsList(metrics_module.Metric):
         super().__init__(name=name)
         self.metrics = metrics
         self.output_name = output_name
+        self._update_plan = plan_metric_updates(metrics)
 
     def update_state(self, y_true, y_pred, sample_weight=None):
-        for m in self.metrics:
-            m.update_state(y_true, y_pred, sample_weight=sample_weight)
+        for kind, metrics, args in self._update_plan:
+            if kind == "confusion_matrix":
+                variables, kwargs = args
+                metrics_utils.update_confusion_matrix_variables(
+                    variables,
+                    y_true,
+                    y_pred,
+                    sample_weight=sample_weight,
+                    **kwargs,
+                )
+            elif kind == "mean":
+                reduction_metrics.update_mean_metric_wrappers(
+                    metrics, y_true, y_pred, sample_weight=sample_weight
+                )
+            else:
+                metrics[0].update_state(
+                    y_true, y_pred, sample_weight=sample_weight
+                )
 
     def reset_state(self):
         for m in self.metrics:
@@ -34,6 +53,94 @@ class MetricsList(metrics_module.Metric):
         raise NotImplementedError
 
 
+def plan_metric_updates(metrics):
+    """Groups metrics that can share the computation of their update.
+
+    Metrics of the confusion matrix family (e.g. `Precision`, `Recall` or
+    `AUC`) that use the same thresholds and options are updated with a single
+    confusion matrix computation, and `MeanMetricWrapper` metrics (e.g. the
+    accuracy metrics) of the same dtype share their mask and sample count
+    computations. Other metrics are updated one by one.
+
+    Args:
+        metrics: A list of metric instances.
+
+    Returns:
+        A list of `(kind, metrics, args)` tuples, in the order of the first
+        metric of each group. `kind` is one of `"confusion_matrix"` (in which
+        case `args` holds the arguments of
+        `update_confusion_matrix_variables()`), `"mean"` or `"single"`.
+    """
+    plan = []
+    groups = {}
+    for metric in metrics:
+        if _is_fusable_mean_metric(metric):
+            key = ("mean", metric.dtype)
+        else:
+            args = _get_confusion_matrix_update_args(metric)
+            key = _get_confusion_matrix_key(metric, args)
+        if key is None:
+            plan.append(("single", [metric], None))
+        elif key in groups:
+            groups[key][1].append(metric)
+            if key[0] == "confusion_matrix":
+                variables = groups[key][2][0]
+                for condition, variable in args[0].items():
+                    variables.setdefault(condition, []).append(variable)
+        else:
+            if key[0] == "confusion_matrix":
+                variables = {c: [v] for c, v in args[0].items()}
+                args = (variables, args[1])
+            else:
+                args = None
+            groups[key] = (key[0], [metric], args)
+            plan.append(groups[key])
+    return plan
+
+
+def _get_method_owner(metric, method_name):
+    for cls in type(metric).__mro__:
+        if method_name in cls.__dict__:
+            return cls
+    return None
+
+
+def _is_fusable_mean_metric(metric):
+    return (
+        _get_method_owner(metric, "update_state")
+        is reduction_metrics.MeanMetricWrapper
+    )
+
+
+def _get_confusion_matrix_update_args(metric):
+    # Only fuse metrics whose `update_state()` does nothing but update their
+    # confusion matrix.
+    owner = _get_method_owner(metric, "_confusion_matrix_update_args")
+    if owner is None or owner is not _get_method_owner(metric, "update_state"):
+        return None
+    if isinstance(metric, metrics_module.AUC) and (
+        not metric._built
+        or metric._from_logits
+        or metric.label_weights is not None
+    ):
+        return None
+    return metric._confusion_matrix_update_args()
+
+
+def _get_confusion_matrix_key(metric, args):
+    if args is None:
+        return None
+    variables, kwargs = args
+    kwargs = {"top_k": None, "class_id": None, "multi_label": False, **kwargs}
+    key = []
+    for name, value in sorted(kwargs.items()):
+        if name == "thresholds":
+            value = tuple(float(t) for t in value)
+        key.append((name, value))
+    shape = tuple(list(variables.values())[0].shape)
+    return ("confusion_matrix", metric.dtype, shape, tuple(key))
+
+
 def is_function_like(value):
     if value is None:
         return True
@@ -147,6 +254,10 @@ class CompileMetrics(metrics_module.Metric):
         self.built = False
         self.name = "compile_metrics"
         self.output_names = output_names
+        # Validity mask of the rows of a padded batch, set by the trainer
+        # while updating the metrics. Unweighted metrics use it as their
+        # sample weights.
+        self._valid_rows = None
 
     @property
     def metrics(self):
@@ -329,7 +440,9 @@ class CompileMetrics(metrics_module.Metric):
         y_true = self._flatten_y(y_true)
         y_pred = self._flatten_y(y_pred)
         for m, y_t, y_p in zip(self._flat_metrics, y_true, y_pred):
-            if m:
+            if m and self._valid_rows is not None:
+                m.update_state(y_t, y_p, self._valid_rows)
+            elif m:
                 m.update_state(y_t, y_p)
         if sample_weight is not None:
             sample_weight = self._flatten_y(sample_weight)
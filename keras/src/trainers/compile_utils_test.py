@@ -235,6 +235,75 @@ class TestCompileMetrics(testing.TestCase):
         self.assertEqual(len(result), 1)
         self.assertTrue("my_custom_metric" in result)
 
+    def test_fused_metric_updates(self):
+        def get_metrics():
+            return [
+                metrics_module.Precision(),
+                metrics_module.Recall(),
+                metrics_module.Precision(thresholds=0.3, name="precision_3"),
+                metrics_module.FalsePositives(),
+                metrics_module.AUC(),
+                metrics_module.AUC(curve="PR", name="pr_auc"),
+                metrics_module.AUC(from_logits=True, name="logits_auc"),
+                metrics_module.BinaryAccuracy(),
+                metrics_module.BinaryAccuracy(name="binary_accuracy_2"),
+                metrics_module.BinaryAccuracy(threshold=0.3, name="acc_3"),
+                metrics_module.MeanSquaredError(),
+                metrics_module.PearsonCorrelation(),
+                metrics_module.R2Score(),
+            ]
+
+        compile_metrics = CompileMetrics(
+            metrics=get_metrics(), weighted_metrics=get_metrics()
+        )
+        y_true = np.array([[1.0], [0.0], [1.0], [1.0], [0.0]])
+        y_pred = np.array([[0.7], [0.4], [0.2], [0.9], [0.6]])
+        sample_weight = np.array([1.0, 0.5, 1.0, 0.0, 2.0])
+        compile_metrics.build(y_true, y_pred)
+
+        # Precision, Recall and FalsePositives share a confusion matrix, as
+        # do the two AUCs. The accuracies and the MSE are updated together.
+        plan = compile_metrics._flat_metrics[0]._update_plan
+        self.assertEqual(
+            [(kind, [m.name for m in ms]) for kind, ms, _ in plan],
+            [
+                (
+                    "confusion_matrix",
+                    ["precision", "recall", "false_positives"],
+                ),
+                ("confusion_matrix", ["precision_3"]),
+                ("confusion_matrix", ["auc", "pr_auc"]),
+                ("single", ["logits_auc"]),
+                (
+                    "mean",
+                    [
+                        "binary_accuracy",
+                        "binary_accuracy_2",
+                        "acc_3",
+                        "mean_squared_error",
+                        "pearson_correlation",
+                    ],
+                ),
+                ("single", ["r2_score"]),
+            ],
+        )
+
+        expected_metrics = get_metrics()
+        expected_weighted_metrics = get_metrics()
+        for _ in range(2):
+            compile_metrics.update_state(y_true, y_pred, sample_weight)
+            for m, weighted_m in zip(
+                expected_metrics, expected_weighted_metrics
+            ):
+                m.update_state(y_true, y_pred)
+                weighted_m.update_state(y_true, y_pred, sample_weight)
+            y_pred = 1.0 - y_pred
+        for m, expected_m in zip(
+            compile_metrics.metrics,
+            expected_metrics + expected_weighted_metrics,
+        ):
+            self.assertAllClose(m.result(), expected_m.result())
+
 
 class TestCompileLoss(testing.TestCase):
     def test_single_output_case(self):
@@ -1,5 +1,6 @@
 import types
 
+from keras.src import backend
 from keras.src.distribution import distribution_lib
 from keras.src.trainers.data_adapters import array_data_adapter
 from keras.src.trainers.data_adapters import data_adapter
@@ -29,18 +30,32 @@ def get_data_adapter(
         return x
 
     # Check for multi-process/worker distribution. Since only tf.dataset
-    # is supported at the moment, we will raise error if the inputs fail
-    # the type check
+    # is supported at the moment (as well as arrays and torch DataLoader for
+    # data parallelism with the PyTorch backend), we will raise error if the
+    # inputs fail the type check
     distribution = distribution_lib.distribution()
-    if getattr(distribution, "_is_multi_process", False) and not is_tf_dataset(
-        x
-    ):
-        raise ValueError(
-            "When using multi-worker distribution, the data must be provided "
-            f"as a `tf.data.Dataset` instance. Received: type(x)={type(x)}."
-        )
+    is_multi_process = getattr(distribution, "_is_multi_process", False)
+    if is_multi_process and not is_tf_dataset(x):
+        if not (
+            backend.backend() == "torch"
+            and isinstance(distribution, distribution_lib.DataParallel)
+            and (
+                is_torch_dataloader(x)
+                or array_data_adapter.can_convert_arrays((x, y, sample_weight))
+            )
+        ):
+            raise ValueError(
+                "When using multi-worker distribution, the data must be "
+                "provided as a `tf.data.Dataset` instance, or as arrays or a "
+                "`torch.utils.data.DataLoader` for data parallelism with the "
+                f"PyTorch backend. Received: type(x)={type(x)}."
+            )
 
     if array_data_adapter.can_convert_arrays((x, y, sample_weight)):
+        if is_multi_process:
+            (x, y, sample_weight), batch_size = distribution._distribute_arrays(
+                (x, y, sample_weight), batch_size
+            )
         return ArrayDataAdapter(
             x,
             y,
@@ -95,7 +110,9 @@ def get_data_adapter(
                 "Argument `class_weight` is not supported for torch "
                 f"DataLoader inputs. Received: class_weight={class_weight}"
             )
-        return TorchDataLoaderAdapter(x)
+        return TorchDataLoaderAdapter(
+            x, distribution=distribution if is_multi_process else None
+        )
         # TODO: should we warn or not?
         # warnings.warn(
         #     "`shuffle=True` was passed, but will be ignored since the "
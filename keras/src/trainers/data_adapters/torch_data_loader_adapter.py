@@ -10,7 +10,15 @@ from keras.src.trainers.data_adapters.data_adapter import DataAdapter
 class TorchDataLoaderAdapter(DataAdapter):
     """Adapter that handles `torch.utils.data.DataLoader`."""
 
-    def __init__(self, dataloader):
+    def __init__(self, dataloader, distribution=None):
+        """Initialize the TorchDataLoaderAdapter.
+
+        Args:
+            dataloader: The input `torch.utils.data.DataLoader` instance.
+            distribution: A `keras.distribution.Distribution` instance. Used
+                to shard the input dataloader into per worker/process
+                dataloader instance.
+        """
         import torch
 
         if not isinstance(dataloader, torch.utils.data.DataLoader):
@@ -19,7 +27,10 @@ class TorchDataLoaderAdapter(DataAdapter):
                 f"`torch.utils.data.DataLoader`. Received: {dataloader}"
             )
 
+        if distribution is not None:
+            dataloader = distribution.distribute_dataset(dataloader)
         self._dataloader = dataloader
+        self._epoch = 0
         self._output_signature = None
         self._batch_size = dataloader.batch_size
         self._num_batches = None
@@ -27,9 +38,12 @@ class TorchDataLoaderAdapter(DataAdapter):
         if hasattr(dataloader.dataset, "__len__"):
             self._num_batches = len(dataloader)
             if self._batch_size is not None:
-                self._partial_batch_size = (
-                    len(dataloader.dataset) % self._batch_size
-                )
+                num_samples = len(dataloader.dataset)
+                if isinstance(
+                    dataloader.sampler, torch.utils.data.DistributedSampler
+                ):
+                    num_samples = len(dataloader.sampler)
+                self._partial_batch_size = num_samples % self._batch_size
 
     def get_numpy_iterator(self):
         for batch in self._dataloader:
@@ -63,6 +77,12 @@ class TorchDataLoaderAdapter(DataAdapter):
     def get_torch_dataloader(self):
         return self._dataloader
 
+    def on_epoch_end(self):
+        # A `DistributedSampler` draws a new permutation at each epoch.
+        self._epoch += 1
+        if hasattr(self._dataloader.sampler, "set_epoch"):
+            self._dataloader.sampler.set_epoch(self._epoch)
+
     @property
     def num_batches(self):
         return self._num_batches
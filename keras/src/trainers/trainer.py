@@ -1,7 +1,10 @@
 import inspect
 import platform
+import struct
 import warnings
 
+import numpy as np
+
 from keras.src import backend
 from keras.src import metrics as metrics_module
 from keras.src import ops
@@ -25,6 +28,11 @@ class Trainer:
         self.compiled = False
         self.loss = None
         self.steps_per_execution = 1
+        self.log_every_n_steps = 1
+        self.fused_steps_per_execution = False
+        self.pad_batches = False
+        self.defer_state_sync = False
+        self._micro_batch_size = None
         # Can be set by callbacks in on_train_begin
         self._initial_epoch = None
         self._compute_loss_has_training_arg = (
@@ -49,6 +57,10 @@ class Trainer:
         steps_per_execution=1,
         jit_compile="auto",
         auto_scale_loss=True,
+        log_every_n_steps=1,
+        fused_steps_per_execution=False,
+        pad_batches=False,
+        defer_state_sync=False,
     ):
         """Configures the model for training.
 
@@ -139,7 +151,57 @@ class Trainer:
                 `"mixed_float16"`, the passed optimizer will be automatically
                 wrapped in a `LossScaleOptimizer`, which will dynamically
                 scale the loss to prevent underflow.
+            log_every_n_steps: Int. The interval, in batches, at which
+                `Callback.on_train_batch_end` is called during `fit()`. The
+                last batch of each epoch is always reported.
+                Batch logs are only converted to Python floats when a
+                callback reads them, which requires waiting for the device.
+                Calling the callbacks less often lets the host run ahead of
+                the device. The epoch logs are not affected. Defaults to `1`.
+            fused_steps_per_execution: Bool. If `True` and
+                `steps_per_execution > 1`, the batches of an execution are
+                stacked and all its steps run in a single compiled
+                `lax.scan`, which removes the per-step dispatch overhead.
+                Executions with batches of different shapes fall back to one
+                dispatch per step. Only supported with the JAX backend.
+                Defaults to `False`.
+            pad_batches: Bool. If `True`, the batches of `fit()`,
+                `evaluate()` and `predict()` are padded to the largest batch
+                size seen so far, so that a last partial batch does not
+                retrace and recompile the step functions. The padded rows
+                are masked out of the losses, of the metrics that support
+                masking or sample weights, and of the predictions. They
+                still go through the forward pass, so `fit()` rejects models
+                with layers that mix the rows of a batch in training, such
+                as `BatchNormalization`. Custom layers doing so are not
+                detected. Only supported with the JAX backend. Defaults to
+                `False`.
+            defer_state_sync: Bool. If `True`, `train_on_batch()`,
+                `test_on_batch()` and `predict_on_batch()` keep the model
+                state on device from one call to the next instead of reading
+                it from the variables and writing it back at every call. The
+                state is only written back to the variables by
+                `jax_state_sync()`, which `fit()`, `evaluate()`, `predict()`
+                and `Callback.model` call. Until then, the variables hold the
+                values from before the deferred calls. Only supported with
+                the JAX backend. Defaults to `False`.
         """
+        if not isinstance(log_every_n_steps, int) or log_every_n_steps < 1:
+            raise ValueError(
+                "Argument `log_every_n_steps` must be a positive integer. "
+                f"Received: log_every_n_steps={log_every_n_steps}"
+            )
+        for name, value in (
+            ("fused_steps_per_execution", fused_steps_per_execution),
+            ("pad_batches", pad_batches),
+            ("defer_state_sync", defer_state_sync),
+        ):
+            if value and backend.backend() != "jax":
+                raise ValueError(
+                    f"Argument `{name}` is only supported with the JAX "
+                    f"backend. Received: {name}={value} with the "
+                    f"{backend.backend()} backend"
+                )
         self._clear_previous_trainer_metrics()
         optimizer = optimizers.get(optimizer)
         self.optimizer = optimizer
@@ -184,6 +246,10 @@ class Trainer:
         self.compiled = True
         self._loss_tracker = metrics_module.Mean(name="loss")
         self.steps_per_execution = steps_per_execution
+        self.log_every_n_steps = log_every_n_steps
+        self.fused_steps_per_execution = fused_steps_per_execution
+        self.pad_batches = pad_batches
+        self.defer_state_sync = defer_state_sync
 
         self.train_function = None
         self.test_function = None
@@ -198,6 +264,10 @@ class Trainer:
             run_eagerly=run_eagerly,
             steps_per_execution=steps_per_execution,
             jit_compile=jit_compile,
+            log_every_n_steps=log_every_n_steps,
+            fused_steps_per_execution=fused_steps_per_execution,
+            pad_batches=pad_batches,
+            defer_state_sync=defer_state_sync,
         )
 
     @property
@@ -529,6 +599,7 @@ class Trainer:
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        micro_batch_size=None,
     ):
         """Trains the model for a fixed number of epochs (dataset iterations).
 
@@ -678,6 +749,16 @@ class Trainer:
                 Specifies how many training epochs to run
                 before a new validation run is performed,
                 e.g. `validation_freq=2` runs validation every 2 epochs.
+            micro_batch_size: Integer or `None`. If set, each training batch
+                larger than `micro_batch_size` is split into micro-batches
+                of (at most) `micro_batch_size` samples inside the train
+                step. Their gradients are accumulated, weighted by the size
+                of each micro-batch, and the optimizer is applied once per
+                batch. This reduces the memory used by the activations while
+                keeping the effective batch size of the data pipeline.
+                The metrics are updated once per micro-batch. Defaults to
+                `None`, which computes the gradients of the whole batch at
+                once.
 
         Unpacking behavior for iterator-like inputs:
             A common pattern is to pass an iterator like object such as a
@@ -801,7 +882,13 @@ class Trainer:
         raise NotImplementedError
 
     def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
     ):
         """Generates output predictions for the input samples.
 
@@ -852,12 +939,52 @@ class Trainer:
                 repeating dataset, it will run indefinitely.
             callbacks: List of `keras.callbacks.Callback` instances.
                 List of callbacks to apply during prediction.
+            output_path: Optional path of a `.npy` file, or a nested structure
+                of paths matching the outputs of the model. When set, the
+                predictions are written to the file(s) batch by batch instead
+                of being accumulated in memory, and memory-mapped arrays of the
+                files are returned. Useful when the predictions do not fit in
+                memory. Defaults to `None`.
 
         Returns:
             NumPy array(s) of predictions.
         """
         raise NotImplementedError
 
+    def predict_iter(
+        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+    ):
+        """Yields output predictions for the input samples batch by batch.
+
+        Unlike `predict()`, the predictions are not accumulated: each batch
+        of outputs is yielded as soon as it is computed, so the memory used
+        does not grow with the number of samples. The arguments are the same
+        as those of `predict()`.
+
+        Example:
+
+        ```python
+        for batch_predictions in model.predict_iter(x, batch_size=64):
+            process(batch_predictions)
+        ```
+
+        Yields:
+            NumPy array(s) of predictions for one batch of samples.
+        """
+        for batch_outputs in self._predict_batches(
+            x,
+            batch_size=batch_size,
+            verbose=verbose,
+            steps=steps,
+            callbacks=callbacks,
+        ):
+            yield tree.map_structure(backend.convert_to_numpy, batch_outputs)
+
+    def _predict_batches(
+        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+    ):
+        raise NotImplementedError
+
     def train_on_batch(
         self,
         x,
@@ -936,6 +1063,114 @@ class Trainer:
         """
         raise NotImplementedError
 
+    def warmup(self, input_spec, batch_sizes=None, target_spec=None):
+        """Compiles the functions of the model for the given input shapes.
+
+        Calling the train, test or predict function of the model with a new
+        input shape compiles it, which can be slow for large models. `warmup()`
+        runs these functions once on dummy batches of each of the given
+        shapes, so that the first real batches do not pay the compilation
+        latency. The state of the model (weights, optimizer and metrics) is
+        left unchanged.
+
+        The train and test functions are only compiled if the model is
+        compiled. Combined with `keras.config.enable_compilation_cache()`,
+        the compiled functions are also reused by the next processes.
+
+        Example:
+
+        ```python
+        model.compile(optimizer="adam", loss="mse")
+        model.warmup(keras.InputSpec(shape=(None, 128)), batch_sizes=[1, 32])
+        ```
+
+        Args:
+            input_spec: A `keras.InputSpec`, `keras.KerasTensor` or shape
+                tuple, or a nested structure of them matching the inputs of
+                the model. The first dimension is the batch dimension.
+            batch_sizes: Integer or list of integers, the batch sizes to
+                compile the functions for. Defaults to `None`, which uses
+                the batch dimension of `input_spec`.
+            target_spec: Optional structure, in the same format as
+                `input_spec`, of the targets used to compile the train and
+                test functions. Defaults to `None`, which uses targets of the
+                same shapes and dtypes as the predictions of the model. If
+                the losses do not accept such targets (e.g.
+                `SparseCategoricalCrossentropy`), the train and test
+                functions are not compiled and a warning is issued: pass
+                `target_spec` in this case.
+        """
+        if batch_sizes is None or isinstance(batch_sizes, int):
+            batch_sizes = [batch_sizes]
+
+        def make_batch(spec, batch_size):
+            if isinstance(spec, (tuple, list)):
+                shape, dtype = tuple(spec), None
+            else:
+                shape, dtype = spec.shape, spec.dtype
+            if shape is None or any(d is None for d in shape[1:]):
+                raise ValueError(
+                    "All the dimensions of the specs passed to `warmup()`, "
+                    f"except the batch dimension, must be known. Received: "
+                    f"spec={spec}"
+                )
+            if batch_size is None:
+                batch_size = shape[0]
+            if batch_size is None:
+                raise ValueError(
+                    "The batch dimension of the specs passed to `warmup()` "
+                    "is unknown. Pass `batch_sizes` to set it. Received: "
+                    f"spec={spec}"
+                )
+            return ops.zeros((batch_size,) + tuple(shape[1:]), dtype=dtype)
+
+        batches = []
+        for batch_size in batch_sizes:
+            x = tree.map_shape_structure(
+                lambda spec: make_batch(spec, batch_size), input_spec
+            )
+            y_pred = self.predict_on_batch(x)
+            if target_spec is None:
+                y = tree.map_structure(np.zeros_like, y_pred)
+            else:
+                y = tree.map_shape_structure(
+                    lambda spec: make_batch(spec, tree.flatten(x)[0].shape[0]),
+                    target_spec,
+                )
+            batches.append((x, y))
+        if not self.compiled:
+            return
+
+        # Run the train and test functions on the dummy batches, then restore
+        # the state of the model.
+        try:
+            self._symbolic_build(data_batch=batches[0] + (None,))
+        except Exception as e:
+            if target_spec is not None:
+                raise
+            warnings.warn(
+                "`warmup()` did not compile the train and test functions, "
+                "since the losses do not accept targets of the same shapes "
+                "and dtypes as the predictions of the model. Pass "
+                f"`target_spec` to compile them. Error: {e}",
+                stacklevel=2,
+            )
+            return
+        variables = self.variables + self.metrics_variables
+        if self.optimizer is not None:
+            variables += self.optimizer.variables
+        variables = list({id(v): v for v in variables}.values())
+        values = [v.numpy() for v in variables]
+        try:
+            for x, y in batches:
+                # The NumPy backend does not support training.
+                if backend.backend() != "numpy":
+                    self.train_on_batch(x, y)
+                self.test_on_batch(x, y)
+        finally:
+            for v, value in zip(variables, values):
+                v.assign(value)
+
     def get_compile_config(self):
         """Returns a serialized config with information for compiling the model.
 
@@ -976,6 +1211,63 @@ class Trainer:
             # Create optimizer variables.
             self.optimizer.build(self.trainable_variables)
 
+    def _write_predict_outputs(self, batches, output_path):
+        writers = None
+        try:
+            for batch_outputs in batches:
+                batch_outputs = tree.map_structure(
+                    backend.convert_to_numpy, batch_outputs
+                )
+                if writers is None:
+                    if isinstance(output_path, str):
+                        output_path = tree.map_structure(
+                            lambda _: output_path, batch_outputs
+                        )
+                        if len(tree.flatten(output_path)) != 1:
+                            raise ValueError(
+                                "When the model has several outputs, "
+                                "`output_path` should be a structure of paths "
+                                "matching the outputs of the model. "
+                                f"Received: output_path={output_path}"
+                            )
+                    try:
+                        tree.assert_same_structure(
+                            output_path, batch_outputs, check_types=False
+                        )
+                    except ValueError:
+                        raise ValueError(
+                            "`output_path` should be a path or a structure of "
+                            "paths matching the outputs of the model. "
+                            f"Received: output_path={output_path}"
+                        )
+                    writers = tree.map_structure(_NpyBatchWriter, output_path)
+                tree.map_structure(
+                    lambda writer, batch_output: writer.write(batch_output),
+                    writers,
+                    batch_outputs,
+                )
+        finally:
+            if writers is not None:
+                tree.map_structure(lambda writer: writer.close(), writers)
+        if writers is None:
+            return None
+        return tree.map_structure(
+            lambda path: np.load(path, mmap_mode="r"), output_path
+        )
+
+    def _set_micro_batch_size(self, micro_batch_size):
+        if micro_batch_size is not None and (
+            not isinstance(micro_batch_size, int) or micro_batch_size < 1
+        ):
+            raise ValueError(
+                "Argument `micro_batch_size` should be a positive integer or "
+                f"`None`. Received: micro_batch_size={micro_batch_size}"
+            )
+        if micro_batch_size != self._micro_batch_size:
+            self._micro_batch_size = micro_batch_size
+            # The micro-batching is traced into the train function.
+            self.train_function = None
+
     def _should_eval(self, epoch, validation_freq):
         epoch = epoch + 1  # one-index the user-facing epoch.
         if isinstance(validation_freq, int):
@@ -1126,6 +1418,62 @@ class Trainer:
         self._post_build()
 
 
+class _NpyBatchWriter:
+    """Streams batches of rows to a `.npy` file.
+
+    The number of rows is only known once all the batches are written, so
+    the header reserves room for it and is rewritten when the file is closed.
+    """
+
+    _MAGIC = b"\x93NUMPY\x01\x00"
+
+    def __init__(self, path):
+        self.path = path
+        self.dtype = None
+        self.row_shape = None
+        self.num_rows = 0
+        self._file = open(path, "wb")
+
+    def _header(self):
+        # The row count is padded to a fixed width so that the header keeps
+        # the same length when it is rewritten.
+        shape = (str(self.num_rows).rjust(20),) + tuple(
+            str(d) for d in self.row_shape
+        )
+        shape = "(" + ", ".join(shape) + ("," if len(shape) == 1 else "") + ")"
+        header = (
+            f"{{'descr': {np.lib.format.dtype_to_descr(self.dtype)!r}, "
+            f"'fortran_order': False, 'shape': {shape}, }}"
+        )
+        # The magic string, the header length and the header are aligned on
+        # 64 bytes, as in `np.save()`.
+        padding = -(len(self._MAGIC) + 2 + len(header) + 1) % 64
+        header = (header + " " * padding + "\n").encode("latin1")
+        return self._MAGIC + struct.pack("<H", len(header)) + header
+
+    def write(self, batch):
+        batch = np.ascontiguousarray(batch)
+        if self.dtype is None:
+            self.dtype = batch.dtype
+            self.row_shape = batch.shape[1:]
+            self._file.write(self._header())
+        elif batch.shape[1:] != self.row_shape:
+            raise ValueError(
+                "Cannot write predictions of varying shapes to "
+                f"'{self.path}'. Expected batches of shape "
+                f"(None,) + {self.row_shape}, received a batch of shape "
+                f"{batch.shape}."
+            )
+        self._file.write(batch.astype(self.dtype, copy=False).tobytes())
+        self.num_rows += batch.shape[0]
+
+    def close(self):
+        if self.dtype is not None:
+            self._file.seek(0)
+            self._file.write(self._header())
+        self._file.close()
+
+
 def model_supports_jit(model):
     # XLA not supported with TF on MacOS GPU
     if platform.system() == "Darwin" and "arm" in platform.processor().lower():
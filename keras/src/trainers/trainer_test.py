@@ -1,3 +1,4 @@
+import os
 from unittest import mock
 
 import numpy as np
@@ -663,6 +664,55 @@ class TestTrainer(testing.TestCase):
         self.assertIn("mean_squared_error", history)
         self.assertAllClose(history["my_custom_metric"], 10.0)
 
+    @parameterized.named_parameters(
+        [
+            ("eager", True, False),
+            ("graph_fn", False, False),
+            ("jit", False, True),
+        ]
+    )
+    def test_predict_iter(self, run_eagerly, jit_compile):
+        model = ExampleModel(units=3)
+        model.run_eagerly = run_eagerly
+        model.jit_compile = jit_compile
+
+        x = np.random.rand(100, 4)
+        batches = list(model.predict_iter(x, batch_size=16))
+        self.assertLen(batches, 7)
+        for batch in batches:
+            self.assertIsInstance(batch, np.ndarray)
+        self.assertEqual(batches[-1].shape, (4, 3))
+        self.assertAllClose(
+            np.concatenate(batches), model.predict(x, batch_size=16)
+        )
+
+    def test_predict_with_output_path(self):
+        model = ExampleModel(units=3)
+        x = np.random.rand(100, 4)
+        path = os.path.join(self.get_temp_dir(), "predictions.npy")
+        outputs = model.predict(x, batch_size=16, output_path=path)
+        self.assertIsInstance(outputs, np.memmap)
+        self.assertAllClose(outputs, model.predict(x, batch_size=16))
+        self.assertAllClose(np.load(path), outputs)
+
+    def test_predict_struct_with_output_path(self):
+        model = StructModel(units=3)
+        x = {
+            "x_one": np.random.rand(100, 4),
+            "x_two": np.random.rand(100, 4),
+        }
+        paths = {
+            "y_one": os.path.join(self.get_temp_dir(), "y_one.npy"),
+            "y_two": os.path.join(self.get_temp_dir(), "y_two.npy"),
+        }
+        outputs = model.predict(x, batch_size=16, output_path=paths)
+        expected = model.predict(x, batch_size=16)
+        self.assertAllClose(outputs["y_one"], expected["y_one"])
+        self.assertAllClose(outputs["y_two"], expected["y_two"])
+
+        with self.assertRaisesRegex(ValueError, "several outputs"):
+            model.predict(x, batch_size=16, output_path=paths["y_one"])
+
     @parameterized.named_parameters(
         named_product(
             generator_type=["tf", "jax", "scipy"], mode=["eager", "graph"]
@@ -1037,6 +1087,367 @@ class TestTrainer(testing.TestCase):
         )
         self.assertAllClose(model.evaluate(x, y), model_2.evaluate(x, y))
 
+    @parameterized.named_parameters(
+        named_product(steps_per_execution=[3, 8, 32])
+    )
+    @pytest.mark.requires_trainable_backend
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="`fused_steps_per_execution` is only "
+        "available with the jax backend.",
+    )
+    def test_fused_steps_per_execution_steps_count(self, steps_per_execution):
+        data_size = 100
+        batch_size = 16
+        epochs = 2
+
+        batches_indices = list(
+            range(0, data_size, steps_per_execution * batch_size)
+        )
+
+        x = np.random.rand(data_size, 4)
+        y = np.random.rand(data_size, 1)
+
+        def build_model(fused):
+            model = ExampleModel(units=1)
+            model.compile(
+                loss="mse",
+                optimizer="sgd",
+                metrics=["mae"],
+                steps_per_execution=steps_per_execution,
+                jit_compile=True,
+                fused_steps_per_execution=fused,
+            )
+            return model
+
+        model = build_model(fused=True)
+        step_count = StepCount(batches_indices, batch_size)
+        history = model.fit(
+            x=x,
+            y=y,
+            batch_size=batch_size,
+            epochs=epochs,
+            shuffle=False,
+            callbacks=[step_count],
+            verbose=0,
+        )
+
+        self.assertEqual(step_count.begin_count, len(batches_indices))
+        self.assertEqual(step_count.end_count, step_count.begin_count)
+        self.assertEqual(step_count.epoch_begin_count, epochs)
+        self.assertEqual(
+            step_count.epoch_end_count, step_count.epoch_begin_count
+        )
+
+        model_2 = build_model(fused=False)
+        history_2 = model_2.fit(
+            x=x,
+            y=y,
+            batch_size=batch_size,
+            epochs=epochs,
+            shuffle=False,
+            verbose=0,
+        )
+
+        self.assertAllClose(history.history["loss"], history_2.history["loss"])
+        self.assertAllClose(history.history["mae"], history_2.history["mae"])
+        self.assertAllClose(model.get_weights(), model_2.get_weights())
+        self.assertAllClose(
+            model.predict(x, batch_size=batch_size),
+            model_2.predict(x, batch_size=batch_size),
+        )
+        self.assertAllClose(model.evaluate(x, y), model_2.evaluate(x, y))
+
+    @pytest.mark.requires_trainable_backend
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="`pad_batches` is only available with the jax backend.",
+    )
+    def test_pad_batches(self):
+        x = np.random.rand(100, 4).astype("float32")
+        y = (np.random.rand(100, 1) > 0.5).astype("float32")
+
+        def fit(pad_batches):
+            model = ExampleModel(units=1)
+            model.compile(
+                optimizer="sgd",
+                loss="binary_crossentropy",
+                metrics=["accuracy", metrics.AUC(name="auc")],
+                weighted_metrics=["mae"],
+                jit_compile=True,
+                pad_batches=pad_batches,
+            )
+            train_step = model.train_step
+            num_traces = []
+
+            def counting_train_step(state, data):
+                num_traces.append(1)
+                return train_step(state, data)
+
+            model.train_step = counting_train_step
+            history = model.fit(
+                x, y, batch_size=16, epochs=2, shuffle=False, verbose=0
+            )
+            return model, history.history, len(num_traces)
+
+        model, history, num_traces = fit(pad_batches=False)
+        padded_model, padded_history, padded_num_traces = fit(pad_batches=True)
+        self.assertEqual(num_traces, 2)
+        self.assertEqual(padded_num_traces, 1)
+        for key in ["loss", "accuracy", "auc", "mae"]:
+            self.assertAllClose(padded_history[key], history[key])
+        self.assertAllClose(padded_model.get_weights(), model.get_weights())
+        self.assertAllClose(
+            padded_model.evaluate(x, y, batch_size=16),
+            model.evaluate(x, y, batch_size=16),
+        )
+        self.assertAllClose(
+            padded_model.predict(x, batch_size=16),
+            model.predict(x, batch_size=16),
+        )
+
+    @pytest.mark.requires_trainable_backend
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="`pad_batches` is only available with the jax backend.",
+    )
+    def test_pad_batches_with_batch_normalization(self):
+        x = np.random.rand(100, 4).astype("float32")
+        y = np.random.rand(100, 1).astype("float32")
+        model = models.Sequential(
+            [
+                layers.Input((4,)),
+                layers.Dense(3),
+                layers.BatchNormalization(),
+                layers.Dense(1),
+            ]
+        )
+        model.compile(optimizer="sgd", loss="mse", pad_batches=True)
+        with self.assertRaisesRegex(ValueError, "BatchNormalization"):
+            model.fit(x, y, batch_size=16, verbose=0)
+
+        # In inference, the padded rows do not affect the other rows.
+        loss = model.evaluate(x, y, batch_size=16, verbose=0)
+        predictions = model.predict(x, batch_size=16, verbose=0)
+        model.pad_batches = False
+        self.assertAllClose(loss, model.evaluate(x, y, batch_size=16))
+        self.assertAllClose(predictions, model.predict(x, batch_size=16))
+
+    @parameterized.parameters(
+        "fused_steps_per_execution", "pad_batches", "defer_state_sync"
+    )
+    @pytest.mark.skipif(
+        backend.backend() == "jax",
+        reason="The option is supported with the jax backend.",
+    )
+    def test_jax_only_compile_options(self, name):
+        model = ExampleModel(units=1)
+        with self.assertRaisesRegex(ValueError, "only supported with the JAX"):
+            model.compile(optimizer="sgd", loss="mse", **{name: True})
+
+    @parameterized.named_parameters(
+        [
+            ("eager", True),
+            ("graph_fn", False),
+        ]
+    )
+    def test_warmup(self, run_eagerly):
+        model = ExampleModel(units=3)
+        model.compile(
+            optimizer="adam",
+            loss="mse",
+            metrics=["mae"],
+            run_eagerly=run_eagerly,
+        )
+        model.build((None, 4))
+        weights = model.get_weights()
+        model.warmup((None, 4), batch_sizes=[2, 16])
+        self.assertAllClose(model.get_weights(), weights)
+        self.assertEqual(int(model.optimizer.iterations.numpy()), 0)
+        self.assertAllClose(
+            [v.numpy() for v in model.metrics_variables],
+            [np.zeros(v.shape) for v in model.metrics_variables],
+        )
+
+        x = np.ones((16, 4))
+        self.assertAllClose(model.predict(x), 4 * np.ones((16, 3)))
+
+        with self.assertRaisesRegex(ValueError, "batch dimension"):
+            model.warmup((None, 4))
+        with self.assertRaisesRegex(ValueError, "must be known"):
+            model.warmup((None, None), batch_sizes=2)
+
+    def test_warmup_with_sparse_targets(self):
+        model = models.Sequential([layers.Input((4,)), layers.Dense(3)])
+        model.compile(
+            optimizer="adam",
+            loss=losses.SparseCategoricalCrossentropy(from_logits=True),
+        )
+        with self.assertWarnsRegex(UserWarning, "target_spec"):
+            model.warmup(keras.InputSpec(shape=(None, 4)), batch_sizes=[8])
+        model.warmup(
+            keras.InputSpec(shape=(None, 4)),
+            batch_sizes=[8],
+            target_spec=keras.InputSpec(shape=(None,), dtype="int32"),
+        )
+        self.assertEqual(int(model.optimizer.iterations.numpy()), 0)
+
+    @pytest.mark.requires_trainable_backend
+    def test_warmup_restores_state_on_error(self):
+        model = ExampleModel(units=3)
+        model.compile(optimizer="adam", loss="mse")
+        model.build((None, 4))
+        weights = model.get_weights()
+
+        def test_on_batch(x, y):
+            raise RuntimeError("test_on_batch failed")
+
+        model.test_on_batch = test_on_batch
+        with self.assertRaisesRegex(RuntimeError, "test_on_batch failed"):
+            model.warmup((None, 4), batch_sizes=[2])
+        self.assertAllClose(model.get_weights(), weights)
+        self.assertEqual(int(model.optimizer.iterations.numpy()), 0)
+
+    def test_compilation_cache(self):
+        cache_dir = os.path.join(self.get_temp_dir(), "compilation_cache")
+        keras.config.enable_compilation_cache(cache_dir)
+        try:
+            self.assertTrue(keras.config.is_compilation_cache_enabled())
+            self.assertTrue(os.path.isdir(cache_dir))
+            if backend.backend() == "jax":
+                import jax
+
+                self.assertEqual(
+                    jax.config.jax_compilation_cache_dir, cache_dir
+                )
+        finally:
+            keras.config.disable_compilation_cache()
+        self.assertFalse(keras.config.is_compilation_cache_enabled())
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="Only the JAX trainer exposes its step function to count traces",
+    )
+    def test_warmup_avoids_retracing(self):
+        model = ExampleModel(units=3)
+        model.compile(optimizer="sgd", loss="mse", jit_compile=True)
+        train_step = model.train_step
+        num_traces = []
+
+        def counting_train_step(state, data):
+            num_traces.append(1)
+            return train_step(state, data)
+
+        model.train_step = counting_train_step
+        model.warmup(keras.InputSpec(shape=(None, 4)), batch_sizes=[16, 4])
+        self.assertLen(num_traces, 2)
+        model.fit(np.ones((100, 4)), np.ones((100, 3)), batch_size=16)
+        self.assertLen(num_traces, 2)
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="`defer_state_sync` is only supported by the JAX trainer",
+    )
+    def test_defer_state_sync(self):
+        x = np.random.rand(8, 4).astype("float32")
+        y = np.random.rand(8, 3).astype("float32")
+
+        def run(defer_state_sync):
+            model = ExampleModel(units=3)
+            model.compile(
+                optimizer="adam",
+                loss="mse",
+                metrics=["mae"],
+                defer_state_sync=defer_state_sync,
+            )
+            logs = [model.train_on_batch(x, y) for _ in range(3)]
+            logs.append(model.test_on_batch(x, y))
+            predictions = model.predict_on_batch(x)
+            return model, logs, predictions
+
+        model, logs, predictions = run(defer_state_sync=False)
+        deferred_model, deferred_logs, deferred_predictions = run(
+            defer_state_sync=True
+        )
+        self.assertAllClose(deferred_logs, logs)
+        self.assertAllClose(deferred_predictions, predictions)
+
+        # The variables are only updated by `jax_state_sync()`.
+        self.assertAllClose(deferred_model.kernel, np.ones((4, 3)))
+        deferred_model.jax_state_sync()
+        self.assertAllClose(deferred_model.get_weights(), model.get_weights())
+        self.assertEqual(int(deferred_model.optimizer.iterations.numpy()), 3)
+
+        # `fit()` picks up the deferred state.
+        deferred_model.train_on_batch(x, y)
+        deferred_model.fit(x, y, batch_size=8, verbose=0)
+        model.train_on_batch(x, y)
+        model.fit(x, y, batch_size=8, verbose=0)
+        self.assertAllClose(deferred_model.get_weights(), model.get_weights())
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="`defer_state_sync` is only supported by the JAX trainer",
+    )
+    def test_defer_state_sync_keeps_variables_readable(self):
+        x = np.random.rand(8, 4).astype("float32")
+        y = np.random.rand(8, 3).astype("float32")
+        model = models.Sequential([layers.Input((4,)), layers.Dense(3)])
+        model.compile(optimizer="adam", loss="mse", defer_state_sync=True)
+        initial_weights = model.get_weights()
+        model.train_on_batch(x, y)
+        model.train_on_batch(x, y)
+
+        # The variables still hold their values from before the deferred
+        # calls, and can be read and saved.
+        for weight, initial_weight in zip(model.get_weights(), initial_weights):
+            self.assertAllClose(weight, initial_weight)
+        self.assertAllClose(
+            model(x), x @ initial_weights[0] + initial_weights[1]
+        )
+        model.save(os.path.join(self.get_temp_dir(), "model.keras"))
+
+        model.jax_state_sync()
+        self.assertNotAllClose(model.get_weights()[0], initial_weights[0])
+        self.assertEqual(int(model.optimizer.iterations.numpy()), 2)
+        model.train_on_batch(x, y)
+        model.jax_state_sync()
+        self.assertEqual(int(model.optimizer.iterations.numpy()), 3)
+
+    @pytest.mark.requires_trainable_backend
+    def test_log_every_n_steps(self):
+        class BatchEndCounter(Callback):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def on_train_batch_end(self, batch, logs=None):
+                self.batches.append(batch)
+                self.logs = logs
+
+        model = ExampleModel(units=3)
+        model.compile(
+            optimizer="sgd",
+            loss="mse",
+            metrics=["mae"],
+            log_every_n_steps=4,
+        )
+        counter = BatchEndCounter()
+        history = model.fit(
+            np.ones((100, 4)),
+            np.ones((100, 3)),
+            batch_size=10,
+            epochs=2,
+            callbacks=[counter],
+            verbose=0,
+        )
+        self.assertEqual(counter.batches, [3, 7, 9, 3, 7, 9])
+        self.assertIsInstance(counter.logs["loss"], float)
+        self.assertLen(history.history["loss"], 2)
+
+        with self.assertRaisesRegex(ValueError, "log_every_n_steps"):
+            model.compile(optimizer="sgd", loss="mse", log_every_n_steps=0)
+
     @parameterized.named_parameters(
         named_product(
             steps_per_execution=[1, 50], mode=["eager", "non_jit", "jit"]
@@ -1618,6 +2029,57 @@ class TestTrainer(testing.TestCase):
         loss2 = model.fit(x, y, batch_size=100).history["loss"]
         self.assertAllClose(loss1, loss2)
 
+    @parameterized.named_parameters(
+        [
+            ("divisible", 25, False),
+            ("remainder", 30, False),
+            ("larger_than_batch", 128, False),
+            ("eager", 30, True),
+        ]
+    )
+    @pytest.mark.requires_trainable_backend
+    def test_fit_with_micro_batch_size(self, micro_batch_size, run_eagerly):
+        x = np.random.rand(200, 4).astype("float32")
+        y = np.random.rand(200, 1).astype("float32")
+        sample_weight = np.random.rand(200).astype("float32")
+
+        def fit(micro_batch_size):
+            model = ExampleModel(units=1)
+            model.compile(
+                optimizer=optimizers.SGD(learning_rate=0.1),
+                loss="mse",
+                metrics=["mae"],
+                run_eagerly=run_eagerly,
+            )
+            history = model.fit(
+                x,
+                y,
+                sample_weight=sample_weight,
+                batch_size=100,
+                epochs=2,
+                shuffle=False,
+                micro_batch_size=micro_batch_size,
+                verbose=0,
+            )
+            return model, history.history
+
+        model, history = fit(None)
+        micro_batch_model, micro_batch_history = fit(micro_batch_size)
+        self.assertAllClose(
+            micro_batch_model.get_weights(), model.get_weights(), atol=1e-5
+        )
+        for key in ["loss", "mae"]:
+            self.assertAllClose(
+                micro_batch_history[key], history[key], atol=1e-5
+            )
+
+    @pytest.mark.requires_trainable_backend
+    def test_fit_with_invalid_micro_batch_size(self):
+        model = ExampleModel(units=1)
+        model.compile(loss="mse")
+        with self.assertRaisesRegex(ValueError, "micro_batch_size"):
+            model.fit(np.ones((4, 4)), np.ones((4, 1)), micro_batch_size=0)
+
     def test_evaluate_with_different_batch_size_same_loss(self):
         x = np.random.rand(100, 4)
         y = np.ones((100, 1))
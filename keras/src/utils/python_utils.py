@@ -175,3 +175,99 @@ def pythonify_logs(logs):
                 pass
             result[key] = value
     return result
+
+
+class LazyLogs(dict):
+    """Flattened logs whose values are converted to Python-native types lazily.
+
+    This is the lazy counterpart of `pythonify_logs()`: nested dicts are
+    flattened the same way, but a value is only converted with
+    `float(value)` when it is read. Logs holding device arrays therefore do
+    not force a synchronization with the device unless they are read.
+
+    It is a `dict`, so callbacks can use it like the logs returned by
+    `pythonify_logs()`. `copy()` returns a plain `dict` of converted values.
+
+    Args:
+        logs: A dict containing log values.
+    """
+
+    def __init__(self, logs):
+        super().__init__()
+        self._unconverted = set()
+        self._flatten(logs or {})
+
+    def _flatten(self, logs):
+        for key, value in sorted(logs.items()):
+            if isinstance(value, dict):
+                self._flatten(value)
+            else:
+                super().__setitem__(key, value)
+                self._unconverted.add(key)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if key in self._unconverted:
+            try:
+                value = float(value)
+            except:
+                pass
+            super().__setitem__(key, value)
+            self._unconverted.discard(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._unconverted.discard(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._unconverted.discard(key)
+
+    def __iter__(self):
+        # Overriding `__iter__` also makes `dict(logs)` and `{**logs}` read
+        # the values with `__getitem__` instead of copying the raw values.
+        return iter(self.keys())
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *args)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self):
+        return dict(self.items())
+
+    def __reduce__(self):
+        # Pickle as the plain `dict` of converted values.
+        return (dict, (self.copy(),))
@@ -1,5 +1,6 @@
 import base64
 import marshal
+import pickle
 
 from keras.src import testing
 from keras.src.utils import python_utils
@@ -99,3 +100,50 @@ class PythonUtilsTest(testing.TestCase):
         bad_encoded_code = "This isn't valid base64!"
         with self.assertRaises(AttributeError):
             python_utils.func_load(bad_encoded_code)
+
+    def test_lazy_logs(self):
+        num_conversions = []
+
+        class DeviceValue:
+            def __float__(self):
+                num_conversions.append(1)
+                return 2.0
+
+        logs = python_utils.LazyLogs(
+            {"loss": DeviceValue(), "nested": {"acc": DeviceValue()}}
+        )
+        self.assertEqual(list(logs.keys()), ["loss", "acc"])
+        self.assertEqual(len(num_conversions), 0)
+        self.assertEqual(logs["loss"], 2.0)
+        self.assertEqual(logs["loss"], 2.0)
+        self.assertEqual(len(num_conversions), 1)
+        self.assertEqual(dict(logs), {"loss": 2.0, "acc": 2.0})
+        self.assertEqual(len(num_conversions), 2)
+        self.assertEqual(
+            dict(logs), python_utils.pythonify_logs({"loss": 2, "acc": 2})
+        )
+
+        logs["name"] = "value"
+        self.assertEqual(logs["name"], "value")
+        del logs["acc"]
+        self.assertEqual(len(logs), 2)
+
+    def test_lazy_logs_is_dict(self):
+        class DeviceValue:
+            def __float__(self):
+                return 2.0
+
+        logs = python_utils.LazyLogs({"loss": DeviceValue()})
+        self.assertIsInstance(logs, dict)
+        self.assertEqual({**logs}, {"loss": 2.0})
+        self.assertEqual(list(logs.values()), [2.0])
+        self.assertEqual(logs.get("loss"), 2.0)
+        self.assertIsNone(logs.get("acc"))
+        copy = logs.copy()
+        self.assertIs(type(copy), dict)
+        self.assertEqual(copy, {"loss": 2.0})
+        self.assertEqual(logs, {"loss": 2.0})
+        logs = python_utils.LazyLogs({"loss": DeviceValue()})
+        reloaded = pickle.loads(pickle.dumps(logs))
+        self.assertIs(type(reloaded), dict)
+        self.assertEqual(reloaded, {"loss": 2.0})